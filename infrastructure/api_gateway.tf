@@ -19,6 +19,30 @@ resource "aws_api_gateway_resource" "triage" {
   path_part   = "triage"
 }
 
+resource "aws_api_gateway_resource" "triage_batch" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  parent_id   = aws_api_gateway_resource.triage.id
+  path_part   = "batch"
+}
+
+resource "aws_api_gateway_resource" "triage_mci" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  parent_id   = aws_api_gateway_resource.triage.id
+  path_part   = "mci"
+}
+
+resource "aws_api_gateway_resource" "triage_history" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  parent_id   = aws_api_gateway_resource.triage.id
+  path_part   = "history"
+}
+
+resource "aws_api_gateway_resource" "emergency" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  parent_id   = aws_api_gateway_rest_api.main.root_resource_id
+  path_part   = "emergency"
+}
+
 resource "aws_api_gateway_resource" "health" {
   rest_api_id = aws_api_gateway_rest_api.main.id
   parent_id   = aws_api_gateway_rest_api.main.root_resource_id
@@ -128,6 +152,78 @@ resource "aws_api_gateway_integration" "triage_post" {
   uri                     = aws_lambda_function.triage.invoke_arn
 }
 
+# POST /triage/batch (RMP auth required) - mass-casualty batch, same Lambda (routed on resource path)
+resource "aws_api_gateway_method" "triage_batch_post" {
+  rest_api_id   = aws_api_gateway_rest_api.main.id
+  resource_id   = aws_api_gateway_resource.triage_batch.id
+  http_method   = "POST"
+  authorization = "COGNITO_USER_POOLS"
+  authorizer_id = aws_api_gateway_authorizer.rmp.id
+}
+
+resource "aws_api_gateway_integration" "triage_batch_post" {
+  rest_api_id             = aws_api_gateway_rest_api.main.id
+  resource_id             = aws_api_gateway_resource.triage_batch.id
+  http_method             = aws_api_gateway_method.triage_batch_post.http_method
+  type                    = "AWS_PROXY"
+  integration_http_method = "POST"
+  uri                     = aws_lambda_function.triage.invoke_arn
+}
+
+# POST /triage/mci (RMP auth required) - rule-based START/JumpSTART sort, same Lambda (routed on resource path)
+resource "aws_api_gateway_method" "triage_mci_post" {
+  rest_api_id   = aws_api_gateway_rest_api.main.id
+  resource_id   = aws_api_gateway_resource.triage_mci.id
+  http_method   = "POST"
+  authorization = "COGNITO_USER_POOLS"
+  authorizer_id = aws_api_gateway_authorizer.rmp.id
+}
+
+resource "aws_api_gateway_integration" "triage_mci_post" {
+  rest_api_id             = aws_api_gateway_rest_api.main.id
+  resource_id             = aws_api_gateway_resource.triage_mci.id
+  http_method             = aws_api_gateway_method.triage_mci_post.http_method
+  type                    = "AWS_PROXY"
+  integration_http_method = "POST"
+  uri                     = aws_lambda_function.triage.invoke_arn
+}
+
+# GET /triage/history (RMP auth required) - keyset-paginated assessment history, same Lambda (routed on resource path)
+resource "aws_api_gateway_method" "triage_history_get" {
+  rest_api_id   = aws_api_gateway_rest_api.main.id
+  resource_id   = aws_api_gateway_resource.triage_history.id
+  http_method   = "GET"
+  authorization = "COGNITO_USER_POOLS"
+  authorizer_id = aws_api_gateway_authorizer.rmp.id
+}
+
+resource "aws_api_gateway_integration" "triage_history_get" {
+  rest_api_id             = aws_api_gateway_rest_api.main.id
+  resource_id             = aws_api_gateway_resource.triage_history.id
+  http_method             = aws_api_gateway_method.triage_history_get.http_method
+  type                    = "AWS_PROXY"
+  integration_http_method = "POST"
+  uri                     = aws_lambda_function.triage.invoke_arn
+}
+
+# POST /emergency (RMP auth required) - triage -> hospitals -> routes in one buffered SSE-formatted response, triage Lambda
+resource "aws_api_gateway_method" "emergency_post" {
+  rest_api_id   = aws_api_gateway_rest_api.main.id
+  resource_id   = aws_api_gateway_resource.emergency.id
+  http_method   = "POST"
+  authorization = "COGNITO_USER_POOLS"
+  authorizer_id = aws_api_gateway_authorizer.rmp.id
+}
+
+resource "aws_api_gateway_integration" "emergency_post" {
+  rest_api_id             = aws_api_gateway_rest_api.main.id
+  resource_id             = aws_api_gateway_resource.emergency.id
+  http_method             = aws_api_gateway_method.emergency_post.http_method
+  type                    = "AWS_PROXY"
+  integration_http_method = "POST"
+  uri                     = aws_lambda_function.triage.invoke_arn
+}
+
 # POST /route (RMP auth required)
 resource "aws_api_gateway_method" "route_post" {
   rest_api_id   = aws_api_gateway_rest_api.main.id
@@ -230,6 +326,18 @@ resource "aws_api_gateway_deployment" "main" {
       aws_api_gateway_integration.health_mock.id,
       aws_api_gateway_method.triage_post.id,
       aws_api_gateway_integration.triage_post.id,
+      aws_api_gateway_resource.triage_batch.id,
+      aws_api_gateway_method.triage_batch_post.id,
+      aws_api_gateway_integration.triage_batch_post.id,
+      aws_api_gateway_resource.triage_mci.id,
+      aws_api_gateway_method.triage_mci_post.id,
+      aws_api_gateway_integration.triage_mci_post.id,
+      aws_api_gateway_resource.triage_history.id,
+      aws_api_gateway_method.triage_history_get.id,
+      aws_api_gateway_integration.triage_history_get.id,
+      aws_api_gateway_resource.emergency.id,
+      aws_api_gateway_method.emergency_post.id,
+      aws_api_gateway_integration.emergency_post.id,
       aws_api_gateway_method.hospitals_post.id,
       aws_api_gateway_integration.hospitals_post.id,
       aws_api_gateway_method.route_post.id,
@@ -1,9 +1,22 @@
 # Config API Lambda - Returns frontend configuration (Google Maps API key, etc.)
 
+resource "null_resource" "build_config_lambda" {
+  triggers = {
+    handler = filesha256("${path.module}/config_lambda_src/lambda_handler.py")
+    common  = local.lambda_common_sha
+    script  = filesha256("${path.module}/../scripts/build_stdlib_lambda.sh")
+  }
+  provisioner "local-exec" {
+    command     = "bash ${path.module}/../scripts/build_stdlib_lambda.sh config"
+    working_dir = path.module
+  }
+}
+
 data "archive_file" "config_lambda_zip" {
   type        = "zip"
   source_dir  = "${path.module}/config_lambda_src"
   output_path = "${path.module}/.terraform/archives/config_lambda.zip"
+  depends_on  = [null_resource.build_config_lambda]
 }
 
 resource "aws_iam_role" "config_lambda" {
@@ -14,22 +14,31 @@ import json
 import logging
 import os
 
+from lambda_common.credentials import secret_json
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+_secrets_client = None
+
+
+def _get_secrets_client():
+    global _secrets_client
+    if _secrets_client is None:
+        import boto3
+        _secrets_client = boto3.client("secretsmanager")
+    return _secrets_client
+
 
 def _get_google_maps_api_key() -> str | None:
-    """Fetch Google Maps API key from Secrets Manager."""
+    """Google Maps API key from Secrets Manager (TTL-cached, see lambda_common/credentials.py)."""
     secret_name = os.environ.get("GOOGLE_MAPS_CONFIG_SECRET_NAME", "").strip()
     if not secret_name:
         logger.warning("GOOGLE_MAPS_CONFIG_SECRET_NAME not set")
         return None
     
     try:
-        import boto3
-        client = boto3.client("secretsmanager")
-        response = client.get_secret_value(SecretId=secret_name)
-        secret_data = json.loads(response["SecretString"])
+        secret_data = secret_json(_get_secrets_client(), secret_name)
         api_key = secret_data.get("api_key", "").strip()
         
         if not api_key:
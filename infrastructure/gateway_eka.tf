@@ -3,10 +3,12 @@
 
 resource "null_resource" "build_gateway_eka_lambda" {
   triggers = {
-    handler = filesha256("${path.module}/gateway_eka_lambda_src/lambda_handler.py")
+    handler     = filesha256("${path.module}/gateway_eka_lambda_src/lambda_handler.py")
+    common      = local.lambda_common_sha
+    script      = filesha256("${path.module}/../scripts/build_stdlib_lambda.sh")
   }
   provisioner "local-exec" {
-    command     = "true"
+    command     = "bash ${path.module}/../scripts/build_stdlib_lambda.sh gateway_eka"
     working_dir = path.module
   }
 }
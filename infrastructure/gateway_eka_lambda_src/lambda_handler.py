@@ -17,6 +17,9 @@ import urllib.parse
 import urllib.request
 from typing import Any
 
+from lambda_common.credentials import secret_json
+from lambda_common.warmup import is_warmup_event, run_warmup
+
 logger = logging.getLogger(__name__)
 
 DELIMITER = "___"
@@ -27,6 +30,7 @@ EKA_CONFIG_SECRET_NAME = os.environ.get("EKA_CONFIG_SECRET_NAME", "").strip()
 _access_token: str | None = None
 _refresh_token: str | None = None
 _client_id: str | None = None
+_secrets_client = None
 
 
 def _strip_tool_prefix(full_name: str) -> str:
@@ -35,15 +39,20 @@ def _strip_tool_prefix(full_name: str) -> str:
     return full_name[full_name.index(DELIMITER) + len(DELIMITER) :]
 
 
+def _get_secrets_client():
+    global _secrets_client
+    if _secrets_client is None:
+        import boto3
+        _secrets_client = boto3.client("secretsmanager")
+    return _secrets_client
+
+
 def _load_eka_credentials() -> tuple[str | None, str | None]:
-    """Load client_id and client_secret from Secrets Manager. Returns (client_id, client_secret)."""
+    """client_id and client_secret from Secrets Manager (TTL-cached, see lambda_common/credentials.py)."""
     if not EKA_CONFIG_SECRET_NAME:
         return None, None
     try:
-        import boto3
-        client = boto3.client("secretsmanager")
-        resp = client.get_secret_value(SecretId=EKA_CONFIG_SECRET_NAME)
-        data = json.loads(resp["SecretString"])
+        data = secret_json(_get_secrets_client(), EKA_CONFIG_SECRET_NAME)
         cid = (data.get("client_id") or data.get("api_key") or "").strip() or None
         secret = (data.get("client_secret") or "").strip() or None
         return cid, secret
@@ -255,6 +264,9 @@ def handler(event: dict, context: object) -> dict:
     Gateway Lambda target. Event has tool args; context has bedrockAgentCoreToolName (TARGET___tool_name).
     For direct Lambda invoke, event may include "tool": "search_medications" | "search_protocols" | "get_protocol_publishers" | "search_pharmacology".
     """
+    if is_warmup_event(event):
+        # Eka login (secret + access token), so the first tool call skips it
+        return run_warmup("gateway_eka", [("eka_token", _get_eka_token)] if EKA_CONFIG_SECRET_NAME else [])
     tool_name = "search_medications"
     allowed = ("search_medications", "search_protocols", "get_protocol_publishers", "search_pharmacology")
     if event.get("tool") in allowed:
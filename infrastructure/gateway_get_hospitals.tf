@@ -6,11 +6,12 @@
 
 resource "null_resource" "build_gateway_get_hospitals_lambda" {
   triggers = {
-    handler = filesha256("${path.module}/gateway_get_hospitals_lambda_src/lambda_handler.py")
-    script  = filesha256("${path.module}/../scripts/build_gateway_get_hospitals_lambda.sh")
+    handler     = filesha256("${path.module}/gateway_get_hospitals_lambda_src/lambda_handler.py")
+    common      = local.lambda_common_sha
+    script      = filesha256("${path.module}/../scripts/build_stdlib_lambda.sh")
   }
   provisioner "local-exec" {
-    command     = "bash ${path.module}/../scripts/build_gateway_get_hospitals_lambda.sh"
+    command     = "bash ${path.module}/../scripts/build_stdlib_lambda.sh gateway_get_hospitals"
     working_dir = path.module
   }
 }
@@ -10,6 +10,8 @@ import json
 import logging
 import os
 
+from lambda_common.warmup import is_warmup_event, run_warmup
+
 logger = logging.getLogger(__name__)
 
 DELIMITER = "___"
@@ -99,6 +101,8 @@ def handler(event: dict, context: object) -> dict:
     Event: {severity: str, limit?: int}
     Context: client_context.custom has bedrockAgentCoreToolName (e.g. TARGET___get_hospitals)
     """
+    if is_warmup_event(event):
+        return run_warmup("gateway_get_hospitals", [("seed_hospitals", _load_seed_hospitals)])
     tool_name = "get_hospitals"
     try:
         custom = getattr(context, "client_context", None)
@@ -16,20 +16,30 @@ import urllib.error
 import urllib.parse
 import urllib.request
 
+from lambda_common.credentials import secret_json
+from lambda_common.warmup import is_warmup_event, run_warmup
+
 logger = logging.getLogger(__name__)
 
 DELIMITER = "___"
+_secrets_client = None
+
+
+def _get_secrets_client():
+    global _secrets_client
+    if _secrets_client is None:
+        import boto3
+        _secrets_client = boto3.client("secretsmanager")
+    return _secrets_client
 
 
 def _get_api_key() -> str | None:
+    """Google Maps API key from Secrets Manager (TTL-cached, see lambda_common/credentials.py)."""
     secret_name = os.environ.get("GOOGLE_MAPS_CONFIG_SECRET_NAME", "").strip()
     if not secret_name:
         return None
     try:
-        import boto3
-        client = boto3.client("secretsmanager")
-        resp = client.get_secret_value(SecretId=secret_name)
-        data = json.loads(resp["SecretString"])
+        data = secret_json(_get_secrets_client(), secret_name)
         return (data.get("api_key") or "").strip() or None
     except Exception as e:
         logger.warning("Could not read Google Maps secret: %s", e)
@@ -134,6 +144,8 @@ def handler(event: dict, context: object) -> dict:
     Tools: get_directions(origin_lat, origin_lon, dest_lat, dest_lon | origin_address, dest_address),
           geocode_address(address).
     """
+    if is_warmup_event(event):
+        return run_warmup("gateway_maps", [("api_key", _get_api_key)])
     tool_name = "get_directions"
     try:
         custom = getattr(context, "client_context", None)
@@ -10,10 +10,28 @@ import logging
 import os
 import uuid
 
+from lambda_common.sse import first_valid_payload
+from lambda_common.warmup import is_warmup_event, run_warmup
+
 logger = logging.getLogger(__name__)
 
 REGION = os.environ.get("AWS_REGION", "us-east-1")
 ROUTING_AGENT_RUNTIME_ARN = os.environ.get("ROUTING_AGENT_RUNTIME_ARN", "").strip()
+_client = None
+
+
+def _get_client():
+    """bedrock-agentcore client, created once per container."""
+    global _client
+    if _client is None:
+        import boto3
+        _client = boto3.client("bedrock-agentcore", region_name=REGION)
+    return _client
+
+
+def _route_payload(data: dict) -> dict | None:
+    """SSE payloads count only when they carry a route result or error."""
+    return data if "distance_km" in data or "directions_url" in data or "error" in data else None
 
 
 def handler(event: dict, context: object) -> dict:
@@ -21,6 +39,8 @@ def handler(event: dict, context: object) -> dict:
     Gateway tool handler. Event: { origin_lat, origin_lon, dest_lat, dest_lon } or origin_address, dest_address.
     Invokes the Routing agent on the Runtime and returns { distance_km, duration_minutes, directions_url }.
     """
+    if is_warmup_event(event):
+        return run_warmup("gateway_routing", [("client", _get_client)])
     if not ROUTING_AGENT_RUNTIME_ARN:
         logger.warning("ROUTING_AGENT_RUNTIME_ARN not set; returning stub")
         return {"distance_km": None, "duration_minutes": None, "directions_url": None, "stub": True}
@@ -45,9 +65,7 @@ def handler(event: dict, context: object) -> dict:
     session_id = str(uuid.uuid4())
 
     try:
-        import boto3
-        client = boto3.client("bedrock-agentcore", region_name=REGION)
-        response = client.invoke_agent_runtime(
+        response = _get_client().invoke_agent_runtime(
             agentRuntimeArn=ROUTING_AGENT_RUNTIME_ARN,
             runtimeSessionId=session_id,
             payload=json.dumps(payload).encode("utf-8"),
@@ -56,28 +74,8 @@ def handler(event: dict, context: object) -> dict:
         logger.exception("Routing agent invoke failed: %s", e)
         return {"error": str(e), "distance_km": None, "duration_minutes": None, "directions_url": None}
 
-    content_type = response.get("contentType", "")
-    body_parts = []
-    for chunk in response.get("response") or []:
-        if chunk:
-            body_parts.append(chunk.decode("utf-8"))
-    raw = "".join(body_parts)
-
-    try:
-        if "text/event-stream" in content_type:
-            for line in raw.splitlines():
-                if line.startswith("data: ") and line != "data: [DONE]":
-                    try:
-                        data = json.loads(line[6:])
-                        if isinstance(data, dict) and ("distance_km" in data or "directions_url" in data or "error" in data):
-                            return data
-                    except json.JSONDecodeError:
-                        pass
-        else:
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                return data
-    except json.JSONDecodeError as e:
-        logger.warning("Routing agent response not JSON: %s", e)
+    data = first_valid_payload(response, _route_payload, parse_body=lambda d: d)
+    if data is not None:
+        return data
 
     return {"error": "No route result", "distance_km": None, "duration_minutes": None, "directions_url": None}
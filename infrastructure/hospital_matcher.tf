@@ -6,6 +6,10 @@ resource "null_resource" "build_hospital_matcher_lambda" {
     src_tools        = filesha256("${path.module}/../src/hospital_matcher/core/tools.py")
     src_instructions = filesha256("${path.module}/../src/hospital_matcher/core/instructions.py")
     src_models       = filesha256("${path.module}/../src/hospital_matcher/models/hospital.py")
+    src_handler      = filesha256("${path.module}/../src/hospital_matcher/api/handler.py")
+    src_speculative  = filesha256("${path.module}/../src/hospital_matcher/core/speculative.py")
+    src_db           = filesha256("${path.module}/../src/hospital_matcher/core/db.py")
+    src_common       = local.lambda_common_sha
     script           = filesha256("${path.module}/../scripts/build_hospital_matcher_lambda.sh")
   }
   provisioner "local-exec" {
@@ -44,6 +48,59 @@ resource "aws_iam_role_policy_attachment" "hospital_matcher_bedrock" {
   policy_arn = aws_iam_policy.bedrock_invoke.arn
 }
 
+resource "aws_iam_role_policy_attachment" "hospital_matcher_vpc" {
+  role       = aws_iam_role.hospital_matcher_lambda.name
+  policy_arn = "arn:aws:iam::aws:policy/service-role/AWSLambdaVPCAccessExecutionRole"
+}
+
+# Match results are written to hospital_matches (hospital_matcher.core.db)
+resource "aws_iam_role_policy" "hospital_matcher_rds" {
+  name   = "${local.name_prefix}-hospital-matcher-rds"
+  role   = aws_iam_role.hospital_matcher_lambda.id
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["secretsmanager:GetSecretValue"]
+        Resource = aws_secretsmanager_secret.rds_config.arn
+      },
+      {
+        Effect   = "Allow"
+        Action   = ["rds-db:connect"]
+        Resource = "arn:aws:rds-db:${var.aws_region}:${data.aws_caller_identity.current.account_id}:dbuser:${aws_rds_cluster.aurora.cluster_resource_id}/${var.db_username}"
+      }
+    ]
+  })
+}
+
+resource "aws_security_group" "hospital_matcher_lambda" {
+  name        = "${local.name_prefix}-hospital-matcher-lambda-sg"
+  description = "Hospital Matcher Lambda - egress to Aurora"
+  vpc_id      = aws_vpc.main.id
+
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name = "${local.name_prefix}-hospital-matcher-lambda-sg"
+  }
+}
+
+resource "aws_security_group_rule" "aurora_from_hospital_matcher_lambda" {
+  type                     = "ingress"
+  from_port                = 5432
+  to_port                  = 5432
+  protocol                 = "tcp"
+  security_group_id        = aws_security_group.aurora.id
+  source_security_group_id = aws_security_group.hospital_matcher_lambda.id
+  description              = "Hospital Matcher Lambda to Aurora"
+}
+
 resource "aws_lambda_function" "hospital_matcher" {
   filename         = data.archive_file.hospital_matcher_lambda.output_path
   function_name    = "${local.name_prefix}-hospital-matcher"
@@ -53,6 +110,11 @@ resource "aws_lambda_function" "hospital_matcher" {
   runtime          = "python3.12"
   timeout          = 60
 
+  vpc_config {
+    subnet_ids         = [aws_subnet.private_a.id, aws_subnet.private_b.id]
+    security_group_ids = [aws_security_group.hospital_matcher_lambda.id]
+  }
+
   environment {
     variables = {
       BEDROCK_HOSPITAL_MATCHER_AGENT_ID       = var.bedrock_hospital_matcher_agent_id
@@ -60,6 +122,52 @@ resource "aws_lambda_function" "hospital_matcher" {
       BEDROCK_MODEL_ID                        = var.bedrock_model_id
       USE_AGENTCORE                           = tostring(var.use_agentcore)
       AGENT_RUNTIME_ARN                       = var.agent_runtime_arn
+      SPECULATIVE_MATCH_BUCKET                = var.speculative_hospital_match ? aws_s3_bucket.main.id : ""
+      PERSIST_HOSPITAL_MATCHES                = tostring(var.persist_hospital_matches)
+      RDS_CONFIG_SECRET                       = aws_secretsmanager_secret.rds_config.name
+    }
+  }
+}
+
+# Speculative matches (POST /triage invokes this Lambda asynchronously; results stored per session in S3)
+resource "aws_iam_role_policy" "hospital_matcher_speculative_match" {
+  count = var.speculative_hospital_match ? 1 : 0
+  name  = "${local.name_prefix}-hospital-matcher-speculative-match"
+  role  = aws_iam_role.hospital_matcher_lambda.id
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect   = "Allow"
+      Action   = ["s3:GetObject", "s3:PutObject"]
+      Resource = "${aws_s3_bucket.main.arn}/speculative-matches/*"
+    }]
+  })
+}
+
+# A failed speculation is not worth retrying: POST /hospitals computes fresh on a miss
+resource "aws_lambda_function_event_invoke_config" "hospital_matcher" {
+  function_name                = aws_lambda_function.hospital_matcher.function_name
+  maximum_retry_attempts       = 0
+  maximum_event_age_in_seconds = 300
+}
+
+resource "aws_s3_bucket_lifecycle_configuration" "speculative_matches" {
+  bucket = aws_s3_bucket.main.id
+
+  rule {
+    id     = "expire-speculative-matches"
+    status = "Enabled"
+
+    filter {
+      prefix = "speculative-matches/"
+    }
+
+    expiration {
+      days = 1
+    }
+
+    noncurrent_version_expiration {
+      noncurrent_days = 1
     }
   }
 }
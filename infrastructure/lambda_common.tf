@@ -0,0 +1,9 @@
+# Shared Lambda modules (src/lambda_common): one copy in the repo, copied into every deployment package by
+# the scripts/build_*_lambda.sh scripts. Each build null_resource re-runs when any shared module changes.
+
+locals {
+  lambda_common_dir = "${path.module}/../src/lambda_common"
+  lambda_common_sha = sha256(join("", [
+    for f in sort(fileset(local.lambda_common_dir, "*.py")) : filesha256("${local.lambda_common_dir}/${f}")
+  ]))
+}
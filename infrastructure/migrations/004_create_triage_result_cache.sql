@@ -0,0 +1,12 @@
+-- Shared tier for the triage result cache (triage.core.cache, TRIAGE_CACHE_SHARED_TIER=postgres).
+-- cache_key = sha256 of the canonical request (symptoms, vitals bands, age band, sex).
+-- Expired rows are ignored on read and overwritten on write; prune periodically if needed.
+
+CREATE TABLE IF NOT EXISTS triage_result_cache (
+  cache_key   VARCHAR(64) PRIMARY KEY,
+  result      JSONB NOT NULL,
+  created_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+  expires_at  TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_triage_result_cache_expires_at ON triage_result_cache (expires_at);
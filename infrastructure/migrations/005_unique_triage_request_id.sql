@@ -0,0 +1,7 @@
+-- Idempotent bulk inserts (triage.core.db.bulk_insert_triage_assessments): a replayed backfill or
+-- offline sync skips rows whose request_id is already stored (ON CONFLICT (request_id) ... DO NOTHING).
+-- Partial: rows written without a request_id are unaffected.
+-- Fails if existing rows share a request_id; deduplicate those first.
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_triage_assessments_request_id
+  ON triage_assessments (request_id) WHERE request_id IS NOT NULL;
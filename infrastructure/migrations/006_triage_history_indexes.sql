@@ -0,0 +1,24 @@
+-- GET /triage/history (triage.core.db.list_triage_assessments): keyset pagination on (created_at, id),
+-- newest first, over rows that are not soft-deleted.
+-- Each index matches one common filter with the sort order as trailing keys, so a page is an index range
+-- scan that stops after LIMIT rows however deep the cursor is. INCLUDE covers the default projection
+-- (HISTORY_DEFAULT_FIELDS), so default pages are index-only scans once the visibility map is current.
+-- On a large live table, run each statement as CREATE INDEX CONCURRENTLY (outside a transaction).
+
+-- All recent assessments (admin dashboard), optionally within a time range
+CREATE INDEX IF NOT EXISTS idx_triage_history_recent
+  ON triage_assessments (created_at DESC, id DESC)
+  INCLUDE (severity, confidence, force_high_priority, submitted_by)
+  WHERE deleted_at IS NULL;
+
+-- "My recent assessments" (submitted_by, optionally with severity / time range)
+CREATE INDEX IF NOT EXISTS idx_triage_history_submitted_by
+  ON triage_assessments (submitted_by, created_at DESC, id DESC)
+  INCLUDE (severity, confidence, force_high_priority)
+  WHERE deleted_at IS NULL AND submitted_by IS NOT NULL;
+
+-- "All recent critical cases" (severity, optionally with a time range)
+CREATE INDEX IF NOT EXISTS idx_triage_history_severity
+  ON triage_assessments (severity, created_at DESC, id DESC)
+  INCLUDE (confidence, force_high_priority, submitted_by)
+  WHERE deleted_at IS NULL;
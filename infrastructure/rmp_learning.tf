@@ -2,10 +2,11 @@
 
 resource "null_resource" "build_rmp_learning_lambda" {
   triggers = {
-    src_agent = filesha256("${path.module}/../src/rmp_learning/core/agent.py")
-    src_api   = filesha256("${path.module}/../src/rmp_learning/api/handler.py")
-    src_db    = filesha256("${path.module}/../src/rmp_learning/core/db.py")
-    script    = filesha256("${path.module}/../scripts/build_rmp_learning_lambda.sh")
+    src_agent  = filesha256("${path.module}/../src/rmp_learning/core/agent.py")
+    src_api    = filesha256("${path.module}/../src/rmp_learning/api/handler.py")
+    src_db     = filesha256("${path.module}/../src/rmp_learning/core/db.py")
+    src_common = local.lambda_common_sha
+    script     = filesha256("${path.module}/../scripts/build_rmp_learning_lambda.sh")
   }
   provisioner "local-exec" {
     command     = "bash ${path.module}/../scripts/build_rmp_learning_lambda.sh"
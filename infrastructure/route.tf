@@ -2,10 +2,12 @@
 
 resource "null_resource" "build_route_lambda" {
   triggers = {
-    handler = filesha256("${path.module}/route_lambda_src/lambda_handler.py")
+    handler     = filesha256("${path.module}/route_lambda_src/lambda_handler.py")
+    common      = local.lambda_common_sha
+    script      = filesha256("${path.module}/../scripts/build_stdlib_lambda.sh")
   }
   provisioner "local-exec" {
-    command     = "true"
+    command     = "bash ${path.module}/../scripts/build_stdlib_lambda.sh route"
     working_dir = path.module
   }
 }
@@ -15,6 +15,9 @@ import urllib.parse
 import http.client
 import ssl
 
+from lambda_common.credentials import secret_json
+from lambda_common.warmup import is_warmup_event, run_warmup
+
 logger = logging.getLogger(__name__)
 
 # G1: Input validation
@@ -25,17 +28,24 @@ MAPS_TOOL_NAME = "maps-target___get_directions"
 ROUTING_TOOL_NAME = "routing-target___get_route"
 _token: str | None = None
 _token_expires_at: float = 0
+_secrets_client = None
+
+
+def _get_secrets_client():
+    global _secrets_client
+    if _secrets_client is None:
+        import boto3
+        _secrets_client = boto3.client("secretsmanager")
+    return _secrets_client
 
 
 def _get_gateway_config() -> dict | None:
+    """Gateway URL and OAuth client from Secrets Manager (TTL-cached, see lambda_common/credentials.py)."""
     secret_name = os.environ.get("GATEWAY_CONFIG_SECRET_NAME", "").strip()
     if not secret_name:
         return None
     try:
-        import boto3
-        client = boto3.client("secretsmanager")
-        resp = client.get_secret_value(SecretId=secret_name)
-        return json.loads(resp["SecretString"])
+        return secret_json(_get_secrets_client(), secret_name)
     except Exception as e:
         logger.warning("Could not load gateway config: %s", e)
         return None
@@ -150,11 +160,20 @@ def _rmp_from_event(event: dict) -> str | None:
         return None
 
 
+def _prime() -> None:
+    """Secrets Manager client, gateway config and Gateway OAuth token."""
+    config = _get_gateway_config()
+    if config:
+        _get_token(config)
+
+
 def handler(event: dict, context: object) -> dict:
     """
     API Gateway Lambda for POST /route. RMP auth required.
     Body: { "origin": { "lat", "lon" } or { "address": "..." }, "destination": { "lat", "lon" } or { "address": "..." } }
     """
+    if is_warmup_event(event):
+        return _response(200, run_warmup("route", [("gateway_token", _prime)]))
     start = time.perf_counter()
     try:
         if event.get("httpMethod") != "POST":
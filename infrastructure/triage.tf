@@ -7,7 +7,11 @@ resource "null_resource" "build_triage_lambda" {
     src_agent      = filesha256("${path.module}/../src/triage/core/agent.py")
     src_tools      = filesha256("${path.module}/../src/triage/core/tools.py")
     src_gw         = filesha256("${path.module}/../src/triage/core/gateway_client.py")
+    src_handler    = filesha256("${path.module}/../src/triage/api/handler.py")
+    src_emergency  = filesha256("${path.module}/../src/triage/core/emergency.py")
+    src_spool      = filesha256("${path.module}/../src/triage/core/spool.py")
     src_instructions = filesha256("${path.module}/../src/triage/core/instructions.py")
+    src_common     = local.lambda_common_sha
     script        = filesha256("${path.module}/../scripts/build_triage_lambda.sh")
   }
   provisioner "local-exec" {
@@ -69,6 +73,12 @@ resource "aws_iam_role_policy" "triage_lambda_rds" {
         Action   = ["secretsmanager:GetSecretValue"]
         Resource = aws_secretsmanager_secret.gateway_config.arn
       },
+      {
+        # Warmup prefetches both configs in one call; GetSecretValue above still scopes which secrets
+        Effect   = "Allow"
+        Action   = ["secretsmanager:BatchGetSecretValue"]
+        Resource = "*"
+      },
       {
         Effect   = "Allow"
         Action   = ["rds-db:connect"]
@@ -105,6 +115,20 @@ resource "aws_security_group_rule" "aurora_from_triage_lambda" {
   description              = "Triage Lambda to Aurora"
 }
 
+# Hospital Matcher invocations: synchronous from POST /emergency, async for speculative matching
+resource "aws_iam_role_policy" "triage_lambda_invoke_hospital_matcher" {
+  name = "${local.name_prefix}-triage-invoke-hospital-matcher"
+  role = aws_iam_role.triage_lambda.id
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect   = "Allow"
+      Action   = ["lambda:InvokeFunction"]
+      Resource = aws_lambda_function.hospital_matcher.arn
+    }]
+  })
+}
+
 resource "aws_lambda_function" "triage" {
   filename         = data.archive_file.triage_lambda.output_path
   function_name    = "${local.name_prefix}-triage"
@@ -121,13 +145,17 @@ resource "aws_lambda_function" "triage" {
 
   environment {
     variables = {
-      BEDROCK_AGENT_ID            = var.bedrock_agent_id
-      BEDROCK_AGENT_ALIAS_ID      = var.bedrock_agent_alias_id
-      BEDROCK_MODEL_ID            = var.bedrock_model_id
-      RDS_CONFIG_SECRET           = aws_secretsmanager_secret.rds_config.name
-      GATEWAY_CONFIG_SECRET_NAME  = aws_secretsmanager_secret.gateway_config.name
-      USE_AGENTCORE_TRIAGE        = tostring(var.use_agentcore_triage)
-      TRIAGE_AGENT_RUNTIME_ARN    = var.triage_agent_runtime_arn
+      BEDROCK_AGENT_ID               = var.bedrock_agent_id
+      BEDROCK_AGENT_ALIAS_ID         = var.bedrock_agent_alias_id
+      BEDROCK_MODEL_ID               = var.bedrock_model_id
+      TRIAGE_MODEL_TIERS             = var.triage_model_tiers
+      RDS_CONFIG_SECRET              = aws_secretsmanager_secret.rds_config.name
+      GATEWAY_CONFIG_SECRET_NAME     = aws_secretsmanager_secret.gateway_config.name
+      USE_AGENTCORE_TRIAGE           = tostring(var.use_agentcore_triage)
+      TRIAGE_AGENT_RUNTIME_ARN       = var.triage_agent_runtime_arn
+      TRIAGE_WRITE_BEHIND            = tostring(var.triage_write_behind)
+      SPECULATIVE_HOSPITAL_MATCH     = tostring(var.speculative_hospital_match)
+      HOSPITAL_MATCHER_FUNCTION_NAME = aws_lambda_function.hospital_matcher.function_name
     }
   }
 }
@@ -139,3 +167,35 @@ resource "aws_lambda_permission" "triage_api_gateway" {
   principal     = "apigateway.amazonaws.com"
   source_arn    = "${aws_api_gateway_rest_api.main.execution_arn}/*/*/triage"
 }
+
+resource "aws_lambda_permission" "triage_batch_api_gateway" {
+  statement_id  = "AllowAPIGatewayInvokeTriageBatch"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.triage.function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${aws_api_gateway_rest_api.main.execution_arn}/*/*/triage/batch"
+}
+
+resource "aws_lambda_permission" "triage_mci_api_gateway" {
+  statement_id  = "AllowAPIGatewayInvokeTriageMci"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.triage.function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${aws_api_gateway_rest_api.main.execution_arn}/*/*/triage/mci"
+}
+
+resource "aws_lambda_permission" "triage_history_api_gateway" {
+  statement_id  = "AllowAPIGatewayInvokeTriageHistory"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.triage.function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${aws_api_gateway_rest_api.main.execution_arn}/*/*/triage/history"
+}
+
+resource "aws_lambda_permission" "emergency_api_gateway" {
+  statement_id  = "AllowAPIGatewayInvokeEmergency"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.triage.function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${aws_api_gateway_rest_api.main.execution_arn}/*/*/emergency"
+}
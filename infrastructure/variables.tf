@@ -66,6 +66,36 @@ variable "bedrock_model_id" {
   default     = "us.anthropic.claude-3-5-sonnet-v2:0"
 }
 
+variable "triage_model_tiers" {
+  description = "Comma-separated Converse model cascade, cheapest first (empty = bedrock_model_id only)"
+  type        = string
+  default     = ""
+}
+
+variable "triage_write_behind" {
+  description = "Triage handlers spool assessments to /tmp and write them to Aurora in the background (id returned immediately; rows not yet written are retried by later invocations of the same environment)"
+  type        = bool
+  default     = true
+}
+
+variable "speculative_hospital_match" {
+  description = "POST /triage starts hospital matching in the background; POST /hospitals reuses it per session_id"
+  type        = bool
+  default     = false
+}
+
+variable "persist_hospital_matches" {
+  description = "POST /hospitals stores each match in hospital_matches and links it to triage_assessment_id"
+  type        = bool
+  default     = true
+}
+
+variable "warmup_schedule_expression" {
+  description = "EventBridge schedule that sends {\"warmup\": true} to every Python Lambda (empty = no warmup)"
+  type        = string
+  default     = "rate(5 minutes)"
+}
+
 # Hospital Matcher (leave empty to use Converse API; migrating to AgentCore)
 variable "bedrock_hospital_matcher_agent_id" {
   description = "Bedrock Agent ID for Hospital Matcher (empty = use Converse API)"
@@ -0,0 +1,40 @@
+# Scheduled warmup: invokes each Python Lambda with {"warmup": true} so a cold container primes boto3 clients,
+# secrets, OAuth tokens and Aurora before a real request arrives. Handlers answer without calling a model.
+
+locals {
+  warmup_functions = var.warmup_schedule_expression == "" ? {} : merge(
+    {
+      triage                = aws_lambda_function.triage.arn
+      hospital_matcher      = aws_lambda_function.hospital_matcher.arn
+      route                 = aws_lambda_function.route.arn
+      gateway_eka           = aws_lambda_function.gateway_eka.arn
+      gateway_get_hospitals = aws_lambda_function.gateway_get_hospitals.arn
+      gateway_maps          = aws_lambda_function.gateway_maps.arn
+      gateway_routing       = aws_lambda_function.gateway_routing.arn
+    },
+    var.rmp_quiz_agent_runtime_arn != "" ? { rmp_learning = aws_lambda_function.rmp_learning[0].arn } : {},
+  )
+}
+
+resource "aws_cloudwatch_event_rule" "warmup" {
+  count               = var.warmup_schedule_expression == "" ? 0 : 1
+  name                = "${local.name_prefix}-lambda-warmup"
+  description         = "Keep Lambda containers warm (clients, secrets, tokens, Aurora)"
+  schedule_expression = var.warmup_schedule_expression
+}
+
+resource "aws_cloudwatch_event_target" "warmup" {
+  for_each = local.warmup_functions
+  rule     = aws_cloudwatch_event_rule.warmup[0].name
+  arn      = each.value
+  input    = jsonencode({ warmup = true })
+}
+
+resource "aws_lambda_permission" "warmup" {
+  for_each      = local.warmup_functions
+  statement_id  = "AllowEventBridgeWarmup"
+  action        = "lambda:InvokeFunction"
+  function_name = each.value
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.warmup[0].arn
+}
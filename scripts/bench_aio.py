@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hundreds of concurrent simulated triage requests through the asyncio core (triage.core.aio)
+against stubbed downstreams: a local asyncio HTTP server stands in for the Gateway MCP (OAuth token +
+tools/call with --tool-ms latency) and a fake Bedrock client answers Converse after --model-ms (round 1 asks
+for two Eka tools, round 2 submits). Compares one event loop driving every request (assess_triage_async)
+with the sync path on a thread pool (assess_triage, one thread per in-flight request).
+
+  python scripts/bench_aio.py
+  python scripts/bench_aio.py -n 500 --tool-ms 150 --model-ms 40 --threads 16
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+TOOL_ROUND = {
+    "stopReason": "tool_use",
+    "output": {"message": {"content": [
+        {"toolUse": {"toolUseId": "m1", "name": "search_indian_medications", "input": {"drug_name": "paracetamol"}}},
+        {"toolUse": {"toolUseId": "p1", "name": "search_treatment_protocols",
+                     "input": {"queries": [{"query": "fever", "tag": "fever", "publisher": "ICMR"}]}}},
+    ]}},
+}
+SUBMIT_ROUND = {
+    "stopReason": "tool_use",
+    "output": {"message": {"content": [{"toolUse": {
+        "toolUseId": "s1",
+        "name": "submit_triage_result",
+        "input": {"severity": "medium", "confidence": 0.9, "recommendations": ["Paracetamol 500 mg"],
+                  "safety_disclaimer": "Seek professional medical care."},
+    }}]}},
+}
+
+
+class FakeBedrock:
+    """Blocking Converse stub (like boto3): sleeps model_ms, then tool round or submit depending on history."""
+
+    def __init__(self, model_ms: float):
+        self.delay = model_ms / 1000
+
+    def converse(self, **kwargs):
+        time.sleep(self.delay)
+        return SUBMIT_ROUND if len(kwargs["messages"]) > 1 else TOOL_ROUND
+
+
+def _start_gateway(tool_ms: float) -> str:
+    """Serve a fake Gateway (token endpoint + MCP tools/call) on a background loop; returns its base URL."""
+    ready = threading.Event()
+    base = []
+    payload = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"content": [
+        {"type": "text", "text": json.dumps({"results": [{"name": "Paracetamol 500mg Tablet", "form": "tablet"}]})}
+    ]}}).encode()
+
+    async def on_connect(reader, writer):
+        request_line = await reader.readline()
+        length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            key, _, value = line.decode().partition(":")
+            if key.strip().lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+        if b"/token" in request_line:
+            body = json.dumps({"access_token": "bench", "expires_in": 3600}).encode()
+        else:
+            await asyncio.sleep(tool_ms / 1000)
+            body = payload
+        writer.write(f"HTTP/1.1 200 OK\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        writer.close()
+
+    async def serve():
+        server = await asyncio.start_server(on_connect, "127.0.0.1", 0, backlog=1024)
+        base.append(f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}")
+        ready.set()
+        await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    ready.wait()
+    return base[0]
+
+
+def _report(label: str, latencies: list[float], elapsed: float) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"  {label:<28} wall={elapsed * 1000:8.1f} ms  {len(latencies) / elapsed:8.1f} req/s  "
+          f"p50={statistics.median(latencies) * 1000:.1f} ms  p95={p95 * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=300, help="concurrent simulated requests (default 300)")
+    parser.add_argument("--tool-ms", type=float, default=120, help="Gateway tools/call latency (default 120)")
+    parser.add_argument("--model-ms", type=float, default=30, help="Converse latency per round (default 30)")
+    parser.add_argument("--workers", type=int, default=64, help="AIO_MAX_WORKERS for blocking boto3 calls")
+    parser.add_argument("--threads", type=int, default=32, help="thread pool size for the sync baseline")
+    parser.add_argument("--skip-sync", action="store_true", help="only run the asyncio path")
+    args = parser.parse_args()
+
+    os.environ["AIO_MAX_WORKERS"] = str(args.workers)
+    base = _start_gateway(args.tool_ms)
+    os.environ.update({
+        "GATEWAY_MCP_URL": base,
+        "GATEWAY_TOKEN_ENDPOINT": f"{base}/token",
+        "GATEWAY_CLIENT_ID": "bench",
+        "GATEWAY_CLIENT_SECRET": "bench",
+    })
+    logging.basicConfig(level=logging.ERROR)
+
+    from triage.core import agent
+    from triage.models.triage import TriageRequest
+
+    requests = [TriageRequest(symptoms=["fever", f"day {i % 7}"], age_years=30) for i in range(args.n)]
+
+    async def timed_async(request):
+        t0 = time.perf_counter()
+        result = await agent.assess_triage_async(request)
+        return time.perf_counter() - t0, result
+
+    def timed_sync(request):
+        t0 = time.perf_counter()
+        result = agent.assess_triage(request)
+        return time.perf_counter() - t0, result
+
+    async def run_all():
+        return await asyncio.gather(*(timed_async(r) for r in requests))
+
+    print(f"  requests={args.n}  per request: 2 Converse rounds x {args.model_ms:.0f} ms + "
+          f"2 Eka calls x {args.tool_ms:.0f} ms")
+    with patch.object(agent, "get_client", return_value=FakeBedrock(args.model_ms)):
+        t0 = time.perf_counter()
+        out = asyncio.run(run_all())
+        elapsed = time.perf_counter() - t0
+        assert all(r.severity == "medium" for _, r in out), "unexpected degraded results"
+        _report("asyncio (one loop)", [lat for lat, _ in out], elapsed)
+
+        if not args.skip_sync:
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.threads) as pool:
+                out = list(pool.map(timed_sync, requests))
+            elapsed = time.perf_counter() - t0
+            _report(f"sync ({args.threads} threads)", [lat for lat, _ in out], elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: triage_assessments insert throughput, single-row vs bulk (triage.core.db), against a local Postgres.
+
+- single: insert_triage_assessment per row (one INSERT + commit each, pooled connection)
+- values: bulk_insert_triage_assessments(method="values"), one multi-row INSERT per chunk
+- copy:   bulk_insert_triage_assessments(method="copy"), COPY FROM STDIN per chunk
+- replay: the "values" input again; every row is skipped on request_id (idempotency cost)
+
+Creates triage_assessments with migrations 001 and 005 in the target database (IF NOT EXISTS) and
+deletes the rows it wrote afterwards. Requires a reachable server:
+
+  docker run --rm -d -p 5432:5432 -e POSTGRES_PASSWORD=bench postgres:16
+  python scripts/bench_bulk_insert.py --dsn "host=127.0.0.1 user=postgres password=bench dbname=postgres"
+  python scripts/bench_bulk_insert.py -n 100000 --single 2000 --chunk 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import psycopg2
+
+from triage.core import db
+
+MIGRATIONS = os.path.join(os.path.dirname(__file__), "..", "infrastructure", "migrations")
+BENCH_MODEL_ID = "bench-bulk-insert"
+
+
+def _assessments(n: int):
+    """Generator: memory stays flat however large n is."""
+    for i in range(n):
+        yield {
+            "symptoms": ["chest pain", "shortness of breath"] if i % 7 == 0 else ["cough", "fever"],
+            "vitals": {"heart_rate": 60 + i % 60, "spo2": 90 + i % 10},
+            "age_years": 18 + i % 70,
+            "sex": "female" if i % 2 else "male",
+            "severity": ("low", "medium", "high", "critical")[i % 4],
+            "confidence": 0.5 + (i % 50) / 100,
+            "recommendations": ["Seek care within 24 hours"],
+            "force_high_priority": i % 7 == 0,
+            "safety_disclaimer": None,
+            "request_id": uuid.UUID(int=i + 1),
+            "model_id": BENCH_MODEL_ID,
+            "submitted_by": f"rmp-{i % 200}",
+        }
+
+
+def _report(label: str, rows: int, seconds: float, extra: str = "") -> float:
+    rate = rows / seconds if seconds else 0.0
+    print(f"  {label:<7} rows={rows:>8}  {seconds:8.3f} s  {rate:10.0f} rows/s  {extra}")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.environ.get("BENCH_PG_DSN", "host=127.0.0.1 user=postgres dbname=postgres"))
+    parser.add_argument("-n", type=int, default=20000, help="rows per bulk mode (default 20000)")
+    parser.add_argument("--single", type=int, default=1000, help="rows for the single-row mode (default 1000)")
+    parser.add_argument("--chunk", type=int, default=db.BULK_INSERT_CHUNK_ROWS, help="rows per bulk chunk")
+    args = parser.parse_args()
+
+    setup = psycopg2.connect(args.dsn)
+    with setup.cursor() as cur:
+        for name in ("001_create_triage_assessments.sql", "005_unique_triage_request_id.sql"):
+            with open(os.path.join(MIGRATIONS, name)) as f:
+                cur.execute(f.read())
+        cur.execute("DELETE FROM triage_assessments WHERE model_id = %s", (BENCH_MODEL_ID,))
+    setup.commit()
+
+    # Same pooled code path as the Lambda; the pool resolves db._connect at call time
+    db._connect = lambda connect_timeout=15: psycopg2.connect(args.dsn, connect_timeout=connect_timeout)
+    print(f"bulk rows={args.n} single rows={args.single} chunk={args.chunk}\n")
+    try:
+        start = time.perf_counter()
+        for a in _assessments(args.single):
+            db.insert_triage_assessment(**{**a, "request_id": uuid.uuid4()})
+        single = _report("single", args.single, time.perf_counter() - start)
+
+        results = {}
+        for method in ("values", "copy"):
+            with setup.cursor() as cur:
+                cur.execute("DELETE FROM triage_assessments WHERE model_id = %s", (BENCH_MODEL_ID,))
+            setup.commit()
+            stats = db.bulk_insert_triage_assessments(_assessments(args.n), method=method, chunk_rows=args.chunk)
+            results[method] = _report(method, stats["rows"], stats["seconds"], f"inserted={stats['inserted']}")
+
+        stats = db.bulk_insert_triage_assessments(_assessments(args.n), chunk_rows=args.chunk)
+        _report("replay", stats["rows"], stats["seconds"], f"skipped={stats['skipped']}")
+
+        print(f"\n  speedup vs single-row: values x{results['values'] / single:.1f}  copy x{results['copy'] / single:.1f}")
+    finally:
+        db.reset_pool()
+        with setup.cursor() as cur:
+            cur.execute("DELETE FROM triage_assessments WHERE model_id = %s", (BENCH_MODEL_ID,))
+        setup.commit()
+        setup.close()
+
+
+if __name__ == "__main__":
+    main()
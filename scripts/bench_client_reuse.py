@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-request overhead of a fresh boto3 client vs the shared client registry.
+
+Runs a local stub Bedrock Converse endpoint (no AWS, no network) and times N converse calls:
+- fresh: boto3.client(...) per request (previous behaviour)
+- reused: one client from lambda_common.clients config, reused for every request
+
+  python scripts/bench_client_reuse.py
+  python scripts/bench_client_reuse.py -n 500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import boto3
+
+from lambda_common.clients import CLIENT_CONFIG
+
+STUB_RESPONSE = json.dumps({
+    "output": {"message": {"role": "assistant", "content": [{"text": "OK"}]}},
+    "stopReason": "end_turn",
+    "usage": {"inputTokens": 1, "outputTokens": 1, "totalTokens": 2},
+    "metrics": {"latencyMs": 1},
+}).encode("utf-8")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(STUB_RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def _make_client(endpoint: str):
+    return boto3.client(
+        "bedrock-runtime",
+        region_name="us-east-1",
+        endpoint_url=endpoint,
+        aws_access_key_id="bench",
+        aws_secret_access_key="bench",
+        config=CLIENT_CONFIG,
+    )
+
+
+def _call(client) -> None:
+    client.converse(modelId="stub", messages=[{"role": "user", "content": [{"text": "hi"}]}])
+
+
+def _run(label: str, n: int, get) -> list[float]:
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        _call(get())
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<8} median={statistics.median(samples):8.3f} ms  p95={p95:8.3f} ms  mean={statistics.mean(samples):8.3f} ms")
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="requests per mode (default 200)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"Stub Converse endpoint {endpoint}, {args.n} requests per mode\n")
+
+    shared = _make_client(endpoint)
+    _call(shared)  # warm the pool so both modes measure steady state
+    fresh = _run("fresh", args.n, lambda: _make_client(endpoint))
+    reused = _run("reused", args.n, lambda: shared)
+    saved = statistics.median(fresh) - statistics.median(reused)
+    print(f"\n  saved per request (median): {saved:.3f} ms")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
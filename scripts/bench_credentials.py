@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: credential cost per request with and without the TTL cache (lambda_common.credentials).
+
+Each simulated request reads the RDS config secret, the gateway config secret and signs an RDS IAM token,
+like a triage request that persists its assessment and calls the gateway. Secrets Manager and token
+signing are stubbed with a fixed delay (--secret-ms, --token-ms) standing in for the network round trip
+and SigV4 signing, so the numbers show what the cache saves, not AWS latency.
+
+- uncached: GetSecretValue x2 + generate_db_auth_token per request (previous behaviour)
+- cached:   secret_json x2 + rds_auth_token per request
+
+  python scripts/bench_credentials.py
+  python scripts/bench_credentials.py -n 500 --secret-ms 25 --token-ms 3
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from lambda_common import credentials
+
+SECRET_IDS = ("triage/rds-config", "triage/gateway-config")
+
+
+class StubSecretsManager:
+    def __init__(self, delay_ms: float):
+        self.delay = delay_ms / 1000
+        self.calls = 0
+
+    def get_secret_value(self, SecretId):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"SecretString": json.dumps({"secret_id": SecretId, "host": "db.local", "username": "triage"})}
+
+
+class StubRds:
+    def __init__(self, delay_ms: float):
+        self.delay = delay_ms / 1000
+        self.calls = 0
+
+    def generate_db_auth_token(self, DBHostname, Port, DBUsername, Region):
+        self.calls += 1
+        time.sleep(self.delay)
+        return f"{DBHostname}:{Port}/?Action=connect&DBUser={DBUsername}&X-Amz-Signature={self.calls}"
+
+
+def _uncached(sm: StubSecretsManager, rds: StubRds) -> None:
+    for secret_id in SECRET_IDS:
+        json.loads(sm.get_secret_value(SecretId=secret_id)["SecretString"])
+    rds.generate_db_auth_token(DBHostname="db.local", Port=5432, DBUsername="triage", Region="us-east-1")
+
+
+def _cached(sm: StubSecretsManager, rds: StubRds) -> None:
+    for secret_id in SECRET_IDS:
+        credentials.secret_json(sm, secret_id)
+    credentials.rds_auth_token(rds, "db.local", 5432, "triage", "us-east-1")
+
+
+def _run(label: str, n: int, call) -> list[float]:
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<9} median={statistics.median(samples):8.3f} ms  p95={p95:8.3f} ms  "
+          f"mean={statistics.mean(samples):8.3f} ms")
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200, help="requests per mode (default 200)")
+    parser.add_argument("--secret-ms", type=float, default=20.0, help="stubbed GetSecretValue latency (default 20)")
+    parser.add_argument("--token-ms", type=float, default=2.0, help="stubbed IAM token signing cost (default 2)")
+    args = parser.parse_args()
+
+    print(f"{args.n} requests per mode, secret_ms={args.secret_ms}, token_ms={args.token_ms}\n")
+    sm_before, rds_before = StubSecretsManager(args.secret_ms), StubRds(args.token_ms)
+    sm_after, rds_after = StubSecretsManager(args.secret_ms), StubRds(args.token_ms)
+    before = _run("uncached", args.n, lambda: _uncached(sm_before, rds_before))
+    after = _run("cached", args.n, lambda: _cached(sm_after, rds_after))
+
+    print(f"\n  saved per request (mean): {statistics.mean(before) - statistics.mean(after):.3f} ms")
+    print(f"  backend calls: uncached={sm_before.calls + rds_before.calls}  cached={sm_after.calls + rds_after.calls}")
+    print(f"  cache: {credentials.credential_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call latency of connect-per-call vs the pooled connection (lambda_common.pool) against a
+local Postgres. Each call inserts one row into a scratch table and commits, like insert_triage_assessment.
+
+- connect: psycopg2.connect + insert + commit + close per call (previous behaviour)
+- pooled:  ConnectionPool.connection() + insert + commit
+
+--auth-ms adds a fixed delay to every new connection to stand in for the Secrets Manager read and IAM token
+signing the Lambda pays on each connect (0 = pure Postgres connect cost). Requires a reachable server:
+
+  docker run --rm -d -p 5432:5432 -e POSTGRES_PASSWORD=bench postgres:16
+  python scripts/bench_db_pool.py --dsn "host=127.0.0.1 user=postgres password=bench dbname=postgres"
+  python scripts/bench_db_pool.py -n 500 --auth-ms 40 --threads 4
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import psycopg2
+
+from lambda_common.pool import ConnectionPool
+
+TABLE = "bench_db_pool"
+
+
+def _connector(dsn: str, auth_ms: float):
+    def connect(connect_timeout: int):
+        if auth_ms:
+            time.sleep(auth_ms / 1000)
+        return psycopg2.connect(dsn, connect_timeout=connect_timeout)
+
+    return connect
+
+
+def _insert(conn, i: int) -> None:
+    with conn.cursor() as cur:
+        cur.execute(f"INSERT INTO {TABLE} (payload) VALUES (%s)", (f"row-{i}",))
+    conn.commit()
+
+
+def _connect_per_call(connect, i: int) -> None:
+    conn = connect(15)
+    try:
+        _insert(conn, i)
+    finally:
+        conn.close()
+
+
+def _pooled(pool: ConnectionPool, i: int) -> None:
+    with pool.connection() as conn:
+        _insert(conn, i)
+
+
+def _run(label: str, n: int, threads: int, call) -> list[float]:
+    samples: list[float] = []
+    lock = threading.Lock()
+    counter = iter(range(n))
+
+    def worker():
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            t0 = time.perf_counter()
+            call(i)
+            elapsed = (time.perf_counter() - t0) * 1000
+            with lock:
+                samples.append(elapsed)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    wall = time.perf_counter() - start
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<8} median={statistics.median(samples):8.3f} ms  p95={p95:8.3f} ms  "
+          f"mean={statistics.mean(samples):8.3f} ms  {n / wall:8.0f} calls/s")
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.environ.get("BENCH_PG_DSN", "host=127.0.0.1 user=postgres dbname=postgres"))
+    parser.add_argument("-n", type=int, default=200, help="calls per mode (default 200)")
+    parser.add_argument("--threads", type=int, default=1, help="concurrent callers (default 1)")
+    parser.add_argument("--auth-ms", type=float, default=0.0, help="simulated credential cost per new connection")
+    args = parser.parse_args()
+
+    setup = psycopg2.connect(args.dsn)
+    with setup.cursor() as cur:
+        cur.execute(f"CREATE TABLE IF NOT EXISTS {TABLE} (id bigserial PRIMARY KEY, payload text)")
+    setup.commit()
+    print(f"{args.n} calls per mode, threads={args.threads}, auth_ms={args.auth_ms}\n")
+
+    connect = _connector(args.dsn, args.auth_ms)
+    pool = ConnectionPool(connect, max_size=max(1, args.threads))
+    try:
+        before = _run("connect", args.n, args.threads, lambda i: _connect_per_call(connect, i))
+        after = _run("pooled", args.n, args.threads, lambda i: _pooled(pool, i))
+        print(f"\n  saved per call (median): {statistics.median(before) - statistics.median(after):.3f} ms")
+        print(f"  pool: {pool.stats()}")
+    finally:
+        pool.close()
+        with setup.cursor() as cur:
+            cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        setup.commit()
+        setup.close()
+
+
+if __name__ == "__main__":
+    main()
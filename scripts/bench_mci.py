@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: START/JumpSTART tagging of a synthetic mass-casualty list, vectorized NumPy path vs the
+per-patient pure-Python rules (triage.core.mci). Without NumPy only the pure-Python path runs.
+
+  python scripts/bench_mci.py
+  python scripts/bench_mci.py --patients 1000000 --repeat 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from triage.core import mci
+
+
+def _patients(n: int, seed: int = 7) -> dict[str, list]:
+    rng = random.Random(seed)
+    cols: dict[str, list] = {field: [] for field in mci.PATIENT_FIELDS}
+    for _ in range(n):
+        cols["respiratory_rate"].append(rng.choice([0, 8, 12, 16, 22, 28, 34, 50, None]))
+        cols["ambulatory"].append(rng.random() < 0.4)
+        cols["mental_status"].append(rng.randrange(5))
+        cols["capillary_refill_s"].append(rng.choice([1.0, 1.5, 2.0, 3.0, None]))
+        cols["radial_pulse"].append(rng.random() < 0.85)
+        cols["age_years"].append(rng.choice([1, 4, 7, 12, 30, 55, 80, None]))
+        cols["breathes_after_airway"].append(rng.random() < 0.3)
+        cols["rescue_breaths_effective"].append(rng.random() < 0.5)
+    return cols
+
+
+def _time(fn, repeat: int) -> tuple[float, object]:
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--patients", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cols = _patients(args.patients)
+    numpy = mci.np
+    mci.np = None
+    try:
+        python_ms, python_codes = _time(lambda: mci.start_jumpstart(**cols), max(1, args.repeat // 2))
+    finally:
+        mci.np = numpy
+    print(f"  pure Python : {python_ms:9.2f} ms  ({args.patients / python_ms * 1000:,.0f} patients/s)")
+    if numpy is None:
+        print("  numpy not installed (pip install .[mci]); vectorized path skipped")
+        return
+
+    # Arrays as an upstream system would hold them: NaN for unknown, 0/1 for flags
+    arrays = {k: numpy.array([numpy.nan if v is None else float(v) for v in vals]) for k, vals in cols.items()}
+    numpy_ms, numpy_codes = _time(lambda: mci.start_jumpstart(**arrays), args.repeat)
+    order_ms, _ = _time(lambda: mci.priority_order(numpy_codes), args.repeat)
+    print(f"  numpy       : {numpy_ms:9.2f} ms  ({args.patients / numpy_ms * 1000:,.0f} patients/s)  "
+          f"speedup={python_ms / numpy_ms:.1f}x  priority sort={order_ms:.2f} ms")
+    assert numpy_codes.tolist() == python_codes, "vectorized and per-patient tags differ"
+    print(f"  tags: {mci.tag_counts(numpy_codes)}")
+
+
+if __name__ == "__main__":
+    main()
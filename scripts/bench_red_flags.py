@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: red-flag pre-triage throughput over synthetic TriageRequests (no AWS, no LLM).
+
+Requests are built up front; only evaluate_red_flags is timed (rule match + TriageResult for hits).
+
+  python scripts/bench_red_flags.py
+  python scripts/bench_red_flags.py -n 100000 --seed 7
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from triage.core.red_flags import CompiledRules, RED_FLAG_RULES, evaluate_red_flags
+from triage.models.triage import TriageRequest
+
+SYMPTOM_POOL = [
+    "fever", "body ache", "headache", "cough", "vomiting", "diarrhoea", "chest pain", "abdominal pain",
+    "dizziness", "shortness of breath", "rash", "back pain", "sore throat", "Unconscious", "seizure",
+    "patient fainted at home", "mild burn on hand", "swelling in leg",
+]
+
+
+def _synthetic_requests(n: int, rng: random.Random) -> list[TriageRequest]:
+    out = []
+    for _ in range(n):
+        vitals = {}
+        if rng.random() < 0.9:
+            vitals["spo2"] = rng.gauss(95, 4)
+            vitals["heart_rate"] = rng.gauss(90, 25)
+            vitals["blood_pressure_systolic"] = rng.gauss(120, 20)
+            vitals["respiratory_rate"] = rng.gauss(18, 6)
+            vitals["temp_c"] = rng.gauss(37.5, 1)
+        symptoms = rng.sample(SYMPTOM_POOL, rng.randint(1, 4))
+        out.append(TriageRequest(symptoms=symptoms, vitals=vitals, age_years=rng.randint(0, 90)))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=100_000, help="synthetic requests (default 100000)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Building {args.n} synthetic requests...")
+    requests = _synthetic_requests(args.n, random.Random(args.seed))
+    rules = CompiledRules(RED_FLAG_RULES)
+
+    t0 = time.perf_counter()
+    flagged = sum(1 for r in requests if evaluate_red_flags(r, rules) is not None)
+    elapsed = time.perf_counter() - t0
+
+    print(f"  evaluated:   {args.n}")
+    print(f"  red-flagged: {flagged} ({100 * flagged / args.n:.1f}%)")
+    print(f"  total:       {elapsed * 1000:.1f} ms")
+    print(f"  per request: {elapsed / args.n * 1e6:.2f} us")
+    print(f"  throughput:  {args.n / elapsed:,.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
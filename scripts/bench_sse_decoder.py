@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: AgentCore SSE response decoding, buffered (previous join + splitlines + json.loads per line)
+vs the incremental decoder in lambda_common.sse, on a large multi-event body delivered in 1 KB chunks.
+
+  python scripts/bench_sse_decoder.py
+  python scripts/bench_sse_decoder.py --events 20000 --position middle
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from lambda_common.sse import first_valid_payload
+
+RESULT = {
+    "severity": "medium",
+    "confidence": 0.9,
+    "recommendations": ["Oral rehydration", "Monitor vitals"],
+    "force_high_priority": False,
+    "safety_disclaimer": "This is AI-assisted guidance. Seek professional medical care.",
+}
+
+
+def _body(events: int, position: str) -> bytes:
+    """Text-delta events and tool-trace objects with the structured result at start/middle/end."""
+    frames = []
+    for i in range(events):
+        if i % 10 == 0:
+            frames.append("data: " + json.dumps({"event": {"trace": {"step": i, "detail": "x" * 80}}}) + "\n\n")
+        else:
+            frames.append("data: " + json.dumps(f"token {i} of the streamed model text ") + "\n\n")
+    idx = {"start": 1, "middle": events // 2, "end": events}[position]
+    frames.insert(idx, "data: " + json.dumps(RESULT) + "\n\n")
+    frames.append("data: [DONE]\n\n")
+    return "".join(frames).encode("utf-8")
+
+
+def _chunks(body: bytes, size: int = 1024) -> list[bytes]:
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _accept(d: dict):
+    return d if "severity" in d else None
+
+
+def _buffered(chunks: list[bytes]):
+    """Previous call-site logic."""
+    body_parts = []
+    for chunk in chunks:
+        if chunk:
+            body_parts.append(chunk.decode("utf-8"))
+    raw = "".join(body_parts)
+    for line in raw.splitlines():
+        if line.startswith("data: ") and line != "data: [DONE]":
+            try:
+                data = json.loads(line[6:])
+                if isinstance(data, dict) and _accept(data):
+                    return data
+            except json.JSONDecodeError:
+                pass
+    return None
+
+
+def _incremental(chunks: list[bytes]):
+    return first_valid_payload({"contentType": "text/event-stream", "response": iter(chunks)}, _accept)
+
+
+def _time(fn, chunks, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(chunks)
+        best = min(best, time.perf_counter() - t0)
+        assert out == RESULT
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10_000, help="SSE events in the body (default 10000)")
+    parser.add_argument("--position", choices=["start", "middle", "end", "all"], default="all")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    positions = ["start", "middle", "end"] if args.position == "all" else [args.position]
+    for position in positions:
+        chunks = _chunks(_body(args.events, position))
+        size_kb = sum(len(c) for c in chunks) / 1024
+        buffered = _time(_buffered, chunks, args.repeat)
+        incremental = _time(_incremental, chunks, args.repeat)
+        print(
+            f"  result at {position:<6} body={size_kb:8.1f} KB  buffered={buffered:8.2f} ms  "
+            f"incremental={incremental:8.2f} ms  speedup={buffered / incremental:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
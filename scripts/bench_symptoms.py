@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: symptom canonicalization throughput (triage.core.symptoms trie) over a synthetic corpus of
+lexicon phrases with case/hyphen noise, misspellings, regional terms and free-text modifiers. Also shows
+how many distinct strings collapse to one canonical form (cache key reuse) and the prompt characters saved.
+
+  python scripts/bench_symptoms.py
+  python scripts/bench_symptoms.py -n 500000 --seed 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from triage.core.symptoms import SYMPTOM_LEXICON, get_symptom_index, prompt_symptoms
+
+MODIFIERS = ["", "", "severe", "mild", "since 2 days", "since morning", "on and off", "with sweating"]
+
+
+def _noisy(phrase: str, rng: random.Random) -> str:
+    if rng.random() < 0.3:
+        phrase = phrase.title()
+    if rng.random() < 0.2:
+        phrase = phrase.replace(" ", "-")
+    modifier = rng.choice(MODIFIERS)
+    if modifier:
+        phrase = f"{modifier} {phrase}" if rng.random() < 0.5 else f"{phrase} {modifier}"
+    return phrase
+
+
+def _corpus(n: int, rng: random.Random) -> list[str]:
+    phrases = [p for code, variants in SYMPTOM_LEXICON.items() for p in [code.replace("_", " "), *variants]]
+    return [_noisy(rng.choice(phrases), rng) for _ in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=200_000, help="symptom strings (default 200000)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = _corpus(args.n, random.Random(args.seed))
+    index = get_symptom_index()
+    chars = sum(len(s) for s in corpus)
+
+    t0 = time.perf_counter()
+    canonical = [index.canonicalize(s) for s in corpus]
+    elapsed = time.perf_counter() - t0
+
+    print(f"  symptoms={args.n}  chars={chars}  lexicon codes={len(index.codes)}")
+    print(f"  canonicalize: {elapsed * 1000:.1f} ms  {args.n / elapsed:,.0f} symptoms/s  "
+          f"{chars / elapsed / 1e6:.2f} MB/s  {elapsed / args.n * 1e6:.2f} us/symptom")
+    print(f"  distinct strings: raw={len(set(corpus))} canonical={len(set(canonical))}")
+
+    # Prompt size for requests of 6 symptoms each (duplicates and synonyms collapse)
+    requests = [corpus[i:i + 6] for i in range(0, min(args.n, 60_000), 6)]
+    raw_chars = sum(len(", ".join(r)) for r in requests)
+    prompt_chars = sum(len(", ".join(prompt_symptoms(r))) for r in requests)
+    print(f"  prompt symptom chars: raw={raw_chars} canonical={prompt_chars} "
+          f"({(1 - prompt_chars / raw_chars) * 100:.1f}% smaller)")
+
+
+if __name__ == "__main__":
+    main()
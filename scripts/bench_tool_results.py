@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Eka tool-result size fed back into the Converse loop, previous json.dumps(indent=2) of the
+full result vs triage.core.tool_results compaction, and the input tokens that saves over later rounds.
+
+  python scripts/bench_tool_results.py
+  python scripts/bench_tool_results.py --hits 100 --rounds 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from triage.core.tool_results import EKA_ROUND_TOKEN_BUDGET, compact_tool_result, estimate_tokens
+
+
+def _medications(hits: int) -> dict:
+    generics = ["Paracetamol", "Ibuprofen", "Cetirizine", "Amoxicillin"]
+    return {
+        "medications": [
+            {
+                "name": f"Brand {i % (hits // 2 or 1)} {500 + i % 3 * 125}mg Tablet",
+                "generic_name": generics[i % len(generics)],
+                "manufacturer_name": f"Manufacturer {i} Pharmaceuticals Private Limited",
+                "product_type": "Tablet",
+                "source_url": f"https://example.invalid/drugs/{i}",
+            }
+            for i in range(hits)
+        ]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hits", type=int, default=50, help="medications returned by Eka (default 50)")
+    parser.add_argument("--rounds", type=int, default=3, help="Converse rounds after the tool round (default 3)")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    out = _medications(args.hits)
+    tool_input = {"generic_names": "Paracetamol"}
+    raw = json.dumps(out["medications"], indent=2)
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        compact = compact_tool_result("search_indian_medications", out, tool_input, EKA_ROUND_TOKEN_BUDGET)
+    per_call_ms = (time.perf_counter() - t0) * 1000 / args.repeat
+
+    raw_tokens, compact_tokens = estimate_tokens(raw), estimate_tokens(compact)
+    print(f"  hits={args.hits}  raw={len(raw)} chars (~{raw_tokens} tokens)  "
+          f"compact={len(compact)} chars (~{compact_tokens} tokens)  compaction={per_call_ms:.3f} ms")
+    print(f"  input tokens saved over {args.rounds} later rounds: ~{(raw_tokens - compact_tokens) * args.rounds}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GET /triage/history queries (triage.core.db._history_query) on a triage_assessments table with
+millions of rows in a local Postgres, with the migration 006 indexes.
+
+Loads --rows synthetic assessments (server-side generate_series: --rmps submitters, 1% soft-deleted,
+spread over a year) into a scratch schema, VACUUM ANALYZEs it, then for each common filter prints the
+plan's scan node and index, buffers touched and execution time for:
+
+- the first page and a page --depth rows deep via the keyset cursor (what the API does)
+- the same deep page with OFFSET (what the cursor replaces)
+
+Keyset pages should be Index Only Scan / Index Scan on idx_triage_history_* with flat cost at any depth;
+OFFSET grows with depth. Requires a reachable server:
+
+  docker run --rm -d -p 5432:5432 -e POSTGRES_PASSWORD=bench postgres:16
+  python scripts/bench_triage_history.py --dsn "host=127.0.0.1 user=postgres password=bench dbname=postgres"
+  python scripts/bench_triage_history.py --rows 5000000 --depth 100000 --keep
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import psycopg2
+
+from triage.core import db
+from triage.models.triage import HISTORY_DEFAULT_FIELDS
+
+MIGRATIONS = os.path.join(os.path.dirname(__file__), "..", "infrastructure", "migrations")
+SCHEMA = "bench_triage_history"
+
+
+def _load(cur, rows: int, rmps: int) -> None:
+    cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    cur.execute(f"CREATE SCHEMA {SCHEMA}")
+    cur.execute(f"SET search_path TO {SCHEMA}, public")
+    with open(os.path.join(MIGRATIONS, "001_create_triage_assessments.sql")) as f:
+        cur.execute(f.read())
+    cur.execute(
+        """
+        INSERT INTO triage_assessments
+          (created_at, deleted_at, symptoms, vitals, severity, confidence, recommendations,
+           force_high_priority, request_id, submitted_by)
+        SELECT
+          now() - (g * interval '1 year' / %(rows)s),
+          CASE WHEN g %% 100 = 0 THEN now() END,
+          ARRAY['cough', 'fever'],
+          '{"heart_rate": 88}'::jsonb,
+          (ARRAY['low', 'low', 'medium', 'medium', 'high', 'critical'])[1 + g %% 6],
+          0.5 + (g %% 50) / 100.0,
+          ARRAY['Seek care within 24 hours'],
+          g %% 6 = 5,
+          gen_random_uuid(),
+          'rmp-' || (g %% %(rmps)s)
+        FROM generate_series(1, %(rows)s) AS g
+        """,
+        {"rows": rows, "rmps": rmps},
+    )
+    with open(os.path.join(MIGRATIONS, "006_triage_history_indexes.sql")) as f:
+        cur.execute(f.read())
+
+
+def _keyset_after(cur, filters: dict, depth: int) -> tuple[str, str] | None:
+    """(created_at, id) of the row just before a page depth rows deep (what the cursor would carry)."""
+    sql, params = db._history_query(["created_at", "id"], **filters, limit=depth)
+    cur.execute(f"SELECT created_at::text, id::text FROM ({sql}) AS page ORDER BY created_at, id LIMIT 1", params)
+    row = cur.fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def _explain(cur, sql: str, params: list) -> tuple[str, float, int]:
+    cur.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}", params)
+    plan = cur.fetchone()[0][0]
+    node = plan["Plan"]
+    while node.get("Plans") and node["Node Type"] in ("Limit", "Sort", "Incremental Sort"):
+        node = node["Plans"][0]
+    scan = node["Node Type"] + (f" {node['Index Name']}" if node.get("Index Name") else "")
+    buffers = plan["Plan"].get("Shared Hit Blocks", 0) + plan["Plan"].get("Shared Read Blocks", 0)
+    return scan, plan["Execution Time"], buffers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.environ.get("BENCH_PG_DSN", "host=127.0.0.1 user=postgres dbname=postgres"))
+    parser.add_argument("--rows", type=int, default=2_000_000, help="rows to load (default 2,000,000)")
+    parser.add_argument("--rmps", type=int, default=500, help="distinct submitted_by values (default 500)")
+    parser.add_argument("--limit", type=int, default=20, help="page size (default 20)")
+    parser.add_argument("--depth", type=int, default=50_000, help="rows skipped for the deep page (default 50,000)")
+    parser.add_argument("--keep", action="store_true", help=f"keep the {SCHEMA} schema afterwards")
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.dsn)
+    conn.autocommit = True
+    cur = conn.cursor()
+    print(f"loading {args.rows:,} rows into {SCHEMA} ...")
+    _load(cur, args.rows, args.rmps)
+    cur.execute("VACUUM ANALYZE triage_assessments")
+
+    fields = list(HISTORY_DEFAULT_FIELDS)
+    cur.execute("SELECT now() - interval '30 days'")
+    month_ago = cur.fetchone()[0]
+    scenarios = {
+        "recent": {},
+        "mine": {"submitted_by": "rmp-7"},
+        "critical": {"severity": "critical"},
+        "mine+critical": {"submitted_by": "rmp-7", "severity": "critical"},
+        "last 30 days": {"since": month_ago},
+    }
+    results = {}
+    try:
+        print(f"page size {args.limit}, deep page after {args.depth:,} rows\n")
+        for name, filters in scenarios.items():
+            print(f"  {name}")
+            sql, params = db._history_query(fields, **filters, limit=args.limit + 1)
+            first = _explain(cur, sql, params)
+            print(f"    first page   {first[0]:<48} {first[1]:9.3f} ms  buffers={first[2]}")
+            after = _keyset_after(cur, filters, args.depth)
+            sql, params = db._history_query(fields, **filters, after=after, limit=args.limit + 1)
+            deep = _explain(cur, sql, params)
+            print(f"    keyset deep  {deep[0]:<48} {deep[1]:9.3f} ms  buffers={deep[2]}")
+            sql, params = db._history_query(fields, **filters, limit=args.limit + 1)
+            offset = _explain(cur, f"{sql} OFFSET %s", [*params, args.depth])
+            print(f"    offset deep  {offset[0]:<48} {offset[1]:9.3f} ms  buffers={offset[2]}")
+            results[name] = {"first": first, "keyset_deep": deep, "offset_deep": offset}
+        not_index = [n for n, r in results.items() if not r["keyset_deep"][0].startswith(("Index Only Scan", "Index Scan"))]
+        print("\n  keyset plans all index scans:", "yes" if not not_index else f"no ({', '.join(not_index)})")
+        print(json.dumps({n: {k: round(v[1], 3) for k, v in r.items()} for n, r in results.items()}, indent=2))
+    finally:
+        if not args.keep:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
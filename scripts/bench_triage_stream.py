@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Measure time-to-first-severity (TTFS) vs total time for streaming triage, using a local fake
+converse_stream that emits submit_triage_result input as small deltas at a fixed token rate.
+
+  python scripts/bench_triage_stream.py
+  python scripts/bench_triage_stream.py --delta-ms 15 --chunk 6 -n 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from triage.core.streaming import assess_triage_stream
+from triage.models.triage import TriageRequest
+
+TOOL_INPUT = json.dumps({
+    "severity": "medium",
+    "confidence": 0.87,
+    "recommendations": [
+        "Oral rehydration solution; monitor urine output",
+        "Paracetamol for fever as per local protocol",
+        "Transport to PHC within 60 minutes if vomiting persists",
+        "Re-check vitals every 30 minutes",
+    ],
+    "force_high_priority": False,
+    "safety_disclaimer": "This is AI-assisted guidance. Seek professional medical care.",
+})
+
+
+class _PacedStreamClient:
+    def __init__(self, delta_s: float, chunk: int):
+        self.delta_s = delta_s
+        self.chunk = chunk
+
+    def converse_stream(self, **kwargs):
+        def stream():
+            yield {"contentBlockStart": {"contentBlockIndex": 0, "start": {"toolUse": {"toolUseId": "t1", "name": "submit_triage_result"}}}}
+            for i in range(0, len(TOOL_INPUT), self.chunk):
+                time.sleep(self.delta_s)
+                yield {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"toolUse": {"input": TOOL_INPUT[i:i + self.chunk]}}}}
+            yield {"messageStop": {"stopReason": "tool_use"}}
+
+        return {"stream": stream()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=3, help="runs (default 3)")
+    parser.add_argument("--delta-ms", type=float, default=20.0, help="delay per stream delta (default 20 ms)")
+    parser.add_argument("--chunk", type=int, default=8, help="characters per delta (default 8)")
+    args = parser.parse_args()
+
+    client = _PacedStreamClient(args.delta_ms / 1000, args.chunk)
+    ttfs, total = [], []
+    for _ in range(args.n):
+        for ev in assess_triage_stream(TriageRequest(symptoms=["vomiting", "fever"]), client=client):
+            if ev["event"] == "severity":
+                ttfs.append(ev["elapsed_ms"])
+            elif ev["event"] == "result":
+                total.append(ev["elapsed_ms"])
+
+    print(f"Fake stream: {len(TOOL_INPUT)} chars, {args.chunk} chars/delta, {args.delta_ms} ms/delta, {args.n} runs\n")
+    print(f"  time to first severity: {statistics.median(ttfs):8.1f} ms (median)")
+    print(f"  time to full result:    {statistics.median(total):8.1f} ms (median)")
+    print(f"  severity earlier by:    {statistics.median(total) - statistics.median(ttfs):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
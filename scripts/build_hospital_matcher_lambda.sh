@@ -1,5 +1,5 @@
 #!/usr/bin/env bash
-# Build Hospital Matcher Lambda deployment package.
+# Build Hospital Matcher Lambda deployment package (psycopg2 for persisting matches to Aurora).
 set -e
 ROOT="$(cd "$(dirname "$0")/.." && pwd)"
 OUT_DIR="${ROOT}/infrastructure/hospital_matcher_lambda_src"
@@ -12,10 +12,14 @@ python3 -m pip install --target "$OUT_DIR" \
   --python-version 3.12 \
   --only-binary=:all: \
   pydantic \
+  psycopg2-binary \
   --quiet
 
 cp -r "${ROOT}/src/hospital_matcher" "$OUT_DIR/"
 
+# Shared modules (breaker, clients, credentials, pool, sse, warmup)
+cp -r "${ROOT}/src/lambda_common" "$OUT_DIR/"
+
 cat > "$OUT_DIR/lambda_handler.py" << 'EOF'
 """Lambda entry point for POST /hospitals."""
 from hospital_matcher.api.handler import handler
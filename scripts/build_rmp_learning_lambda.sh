@@ -17,6 +17,9 @@ python3 -m pip install --target "$OUT_DIR" \
 
 cp -r "${ROOT}/src/rmp_learning" "$OUT_DIR/"
 
+# Shared modules (breaker, clients, credentials, pool, sse, warmup)
+cp -r "${ROOT}/src/lambda_common" "$OUT_DIR/"
+
 cat > "$OUT_DIR/lambda_handler.py" << 'EOF'
 """Lambda entry point for RMP Learning (POST /rmp/learning, GET /rmp/learning/me, GET /rmp/learning/leaderboard)."""
 from rmp_learning.api.handler import handler
@@ -0,0 +1,16 @@
+#!/usr/bin/env bash
+# Build a stdlib-only Lambda deployment package (config, gateway_eka, gateway_get_hospitals, gateway_maps,
+# gateway_routing, route).
+# The handler lives in infrastructure/<name>_lambda_src/; this adds the shared lambda_common package next to it.
+# Usage: scripts/build_stdlib_lambda.sh <name>
+set -e
+ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+NAME="${1:?usage: build_stdlib_lambda.sh <name>}"
+OUT_DIR="${ROOT}/infrastructure/${NAME}_lambda_src"
+[ -f "$OUT_DIR/lambda_handler.py" ] || { echo "No handler at ${OUT_DIR}/lambda_handler.py" >&2; exit 1; }
+
+# Shared modules (breaker, clients, credentials, pool, sse, warmup)
+rm -rf "$OUT_DIR/lambda_common"
+cp -r "${ROOT}/src/lambda_common" "$OUT_DIR/"
+
+echo "Built infrastructure/${NAME}_lambda_src/"
@@ -15,17 +15,21 @@ python3 -m pip install --target "$OUT_DIR" \
   --only-binary=:all: \
   pydantic \
   psycopg2-binary \
+  numpy \
   --quiet
 
 # Copy triage package
 cp -r "${ROOT}/src/triage" "$OUT_DIR/"
 
+# Shared modules (breaker, clients, credentials, pool, sse, warmup)
+cp -r "${ROOT}/src/lambda_common" "$OUT_DIR/"
+
 # Lambda entry point
 cat > "$OUT_DIR/lambda_handler.py" << 'EOF'
-"""Lambda entry point for POST /triage."""
-from triage.api.handler import handler
+"""Lambda entry point for POST /triage, /triage/batch, /triage/mci, /emergency and GET /triage/history (handler) and the SSE streaming mode (stream_handler)."""
+from triage.api.handler import batch_handler, emergency_handler, handler, history_handler, mci_handler, stream_handler
 
-__all__ = ["handler"]
+__all__ = ["batch_handler", "emergency_handler", "handler", "history_handler", "mci_handler", "stream_handler"]
 EOF
 
 echo "Built infrastructure/triage_lambda_src/"
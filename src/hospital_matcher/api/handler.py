@@ -4,7 +4,11 @@ import json
 import logging
 
 from hospital_matcher.core.agent import match_hospitals
+from hospital_matcher.core.db import record_match
+from hospital_matcher.core.speculative import load_match, store_match
+from hospital_matcher.core.warmup import warm_hospital_matcher
 from hospital_matcher.models.hospital import HospitalMatchRequest
+from lambda_common.warmup import is_warmup_event
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +27,16 @@ def _rmp_from_event(event: dict) -> str | None:
 
 
 def handler(event: dict, context: object) -> dict:
-    """API Gateway Lambda proxy for POST /hospitals. RMP auth required (Cognito)."""
+    """
+    API Gateway Lambda proxy for POST /hospitals. RMP auth required (Cognito). Answers warmup events.
+    With a session_id, a matching speculative result (hospital_matcher.core.speculative) is returned at once.
+    The result is stored in hospital_matches and linked to triage_assessment_id before the response returns,
+    under a short timeout (hospital_matcher.core.db, PERSIST_HOSPITAL_MATCHES).
+    """
+    if is_warmup_event(event):
+        return _response(200, warm_hospital_matcher())
+    if "speculative_match" in event:
+        return speculative_handler(event, context)
     try:
         if event.get("httpMethod") != "POST":
             return _response(405, {"error": "Method not allowed"})
@@ -42,7 +55,8 @@ def handler(event: dict, context: object) -> dict:
         rmp = _rmp_from_event(event)
         if rmp:
             logger.info("HospitalMatcher rmp_sub=%s", rmp)
-        result = match_hospitals(request)
+        result = load_match(request) or match_hospitals(request)
+        record_match(result, request.triage_assessment_id)
         if request_id:
             logger.info("HospitalMatcher success request_id=%s", request_id)
         return _response(200, result.model_dump(mode="json"))
@@ -51,6 +65,28 @@ def handler(event: dict, context: object) -> dict:
         return _response(500, {"error": "Hospital matching failed", "detail": str(e)})
 
 
+def speculative_handler(event: dict, context: object) -> dict:
+    """
+    Async invocation from the triage Lambda: {"speculative_match": HospitalMatchRequest with session_id}.
+    Computes the match and stores it for the POST /hospitals that usually follows. Never raises.
+    """
+    try:
+        request = HospitalMatchRequest.model_validate(event["speculative_match"])
+        if not request.session_id:
+            raise ValueError("speculative_match requires session_id")
+    except Exception as e:
+        logger.warning("Invalid speculative match: %s", e)
+        return {"stored": False, "error": str(e)}
+    try:
+        result = match_hospitals(request)
+    except Exception as e:
+        logger.exception("Speculative hospital matching failed")
+        return {"stored": False, "error": str(e)}
+    stored = store_match(request, result)
+    logger.info("HospitalMatcher speculative stored=%s hospitals=%d", stored, len(result.hospitals))
+    return {"stored": stored}
+
+
 def _response(status_code: int, body: dict) -> dict:
     headers = {
         "Content-Type": "application/json",
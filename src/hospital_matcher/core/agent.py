@@ -6,11 +6,13 @@ import os
 import time
 import uuid
 
-import boto3
-
 from hospital_matcher.core.instructions import HOSPITAL_MATCHER_SYSTEM_PROMPT
+from hospital_matcher.core.prompt_cache import cached_tool_config, log_usage, system_blocks
 from hospital_matcher.core.tools import get_hospital_matcher_tool_config
 from hospital_matcher.models.hospital import HospitalMatchRequest, HospitalMatchResult, MatchedHospital
+from lambda_common.breaker import get_breaker, would_allow
+from lambda_common.clients import get_client
+from lambda_common.sse import first_valid_payload
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,11 @@ def _tool_input_to_result(tool_input: dict) -> HospitalMatchResult | None:
         return None
 
 
+def _payload_to_result(data: dict) -> HospitalMatchResult | None:
+    """AgentCore payload -> result, only for payloads that carry hospitals."""
+    return _tool_input_to_result(data) if "hospitals" in data else None
+
+
 def _fallback_result(reason: str) -> HospitalMatchResult:
     """Return stub when agent fails."""
     return HospitalMatchResult(
@@ -63,19 +70,32 @@ def _fallback_result(reason: str) -> HospitalMatchResult:
 
 
 def match_hospitals(req: HospitalMatchRequest) -> HospitalMatchResult:
-    """Invoke AgentCore, Bedrock Agent, or Converse API for hospital matching."""
+    """
+    Invoke AgentCore, Bedrock Agent, or Converse API for hospital matching.
+    A backend whose circuit would reject the call (open, or half-open with its probe in flight) is skipped for
+    Converse; if that would too, the stub is returned at once.
+    """
     start = time.perf_counter()
     if USE_AGENTCORE and AGENT_RUNTIME_ARN:
-        result = _match_via_agentcore(req)
-        _log_trace("agentcore", start)
-        return result
-    if AGENT_ID:
-        result = _match_via_agent(req)
-        _log_trace("bedrock_agent", start)
+        primary = "agentcore"
+    elif AGENT_ID:
+        primary = "bedrock_agent"
+    else:
+        primary = "converse"
+    for source in dict.fromkeys((primary, "converse")):
+        if not would_allow(source):
+            continue
+        if source != primary:
+            logger.warning("HospitalMatcher failover from=%s to=%s reason=circuit_open", primary, source)
+        result = {
+            "agentcore": _match_via_agentcore,
+            "bedrock_agent": _match_via_agent,
+            "converse": _match_via_converse,
+        }[source](req)
+        _log_trace(source, start)
         return result
-    result = _match_via_converse(req)
-    _log_trace("converse", start)
-    return result
+    _log_trace("circuit_open", start)
+    return _fallback_result("All matching backends unavailable (circuit open)")
 
 
 def _log_trace(source: str, start: float) -> None:
@@ -86,7 +106,7 @@ def _log_trace(source: str, start: float) -> None:
 
 def _match_via_agentcore(req: HospitalMatchRequest) -> HospitalMatchResult:
     """Invoke AgentCore Runtime agent. Uses req.session_id for memory continuity (AC-3)."""
-    client = boto3.client("bedrock-agentcore", region_name=REGION)
+    client = get_client("bedrock-agentcore", REGION)
     # AgentCore requires runtimeSessionId length >= 33 (e.g. UUID); use client's if valid else generate
     raw_session = req.session_id or ""
     session_id = raw_session if len(raw_session) >= 33 else str(uuid.uuid4())
@@ -104,58 +124,34 @@ def _match_via_agentcore(req: HospitalMatchRequest) -> HospitalMatchResult:
         payload["patient_id"] = req.patient_id
 
     try:
-        response = client.invoke_agent_runtime(
-            agentRuntimeArn=AGENT_RUNTIME_ARN,
-            runtimeSessionId=session_id,
-            payload=json.dumps(payload).encode("utf-8"),
-        )
+        with get_breaker("agentcore").guard():
+            response = client.invoke_agent_runtime(
+                agentRuntimeArn=AGENT_RUNTIME_ARN,
+                runtimeSessionId=session_id,
+                payload=json.dumps(payload).encode("utf-8"),
+            )
+            # Parse response (streaming or JSON); stops at the first payload with hospitals
+            result = first_valid_payload(response, _payload_to_result)
     except Exception as e:
         logger.error("AgentCore invocation failed: %s", e)
         return _fallback_result(str(e))
 
-    # Parse response (streaming or JSON)
-    content_type = response.get("contentType", "")
-    body_parts = []
-    resp_stream = response.get("response")
-    if resp_stream:
-        for chunk in resp_stream:
-            if chunk:
-                body_parts.append(chunk.decode("utf-8"))
-
-    if "text/event-stream" in content_type:
-        full_text = "".join(body_parts)
-        for line in full_text.splitlines():
-            if line.startswith("data: ") and line != "data: [DONE]":
-                try:
-                    data = json.loads(line[6:])
-                    if isinstance(data, dict) and "hospitals" in data:
-                        result = _tool_input_to_result(data)
-                        if result:
-                            return result
-                except json.JSONDecodeError:
-                    pass
-    else:
-        try:
-            data = json.loads("".join(body_parts))
-            if isinstance(data, dict) and "hospitals" in data:
-                result = _tool_input_to_result(data)
-                if result:
-                    return result
-        except json.JSONDecodeError as e:
-            logger.warning("AgentCore response not valid JSON: %s", e)
+    if result:
+        return result
 
     return _fallback_result("AgentCore did not return structured matches")
 
 
 def _match_via_agent(req: HospitalMatchRequest) -> HospitalMatchResult:
     """Invoke Bedrock Agent (Return Control)."""
-    client = boto3.client("bedrock-agent-runtime", region_name=REGION)
+    client = get_client("bedrock-agent-runtime", REGION)
     session_id = str(uuid.uuid4())
     user_prompt = _build_user_prompt(req)
     full_prompt = f"{HOSPITAL_MATCHER_SYSTEM_PROMPT}\n\n{user_prompt}"
 
     try:
-        response = client.invoke_agent(
+        response = get_breaker("bedrock_agent").call(
+            client.invoke_agent,
             agentId=AGENT_ID,
             agentAliasId=AGENT_ALIAS_ID,
             sessionId=session_id,
@@ -186,24 +182,26 @@ def _match_via_agent(req: HospitalMatchRequest) -> HospitalMatchResult:
 
 def _match_via_converse(req: HospitalMatchRequest) -> HospitalMatchResult:
     """Use Converse API with tool use."""
-    client = boto3.client("bedrock-runtime", region_name=REGION)
+    client = get_client("bedrock-runtime", REGION)
     tool_config = get_hospital_matcher_tool_config()
     user_prompt = _build_user_prompt(req)
 
     messages = [{"role": "user", "content": [{"text": user_prompt}]}]
 
     try:
-        response = client.converse(
+        response = get_breaker("converse").call(
+            client.converse,
             modelId=MODEL_ID,
             messages=messages,
-            system=[{"text": HOSPITAL_MATCHER_SYSTEM_PROMPT}],
-            toolConfig=tool_config,
+            system=system_blocks(HOSPITAL_MATCHER_SYSTEM_PROMPT),
+            toolConfig=cached_tool_config(tool_config),
             inferenceConfig={"maxTokens": 1024},
         )
     except Exception as e:
         logger.error("Converse invocation failed: %s", e)
         return _fallback_result(str(e))
 
+    log_usage("converse", response.get("usage"))
     output = response.get("output", {})
     stop_reason = response.get("stopReason", "")  # top-level, not in output
     msg = output.get("message", {})
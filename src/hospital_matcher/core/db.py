@@ -0,0 +1,179 @@
+"""Aurora persistence for hospital matches (hospital_matches, migration 002). Uses IAM auth.
+
+Each POST /hospitals result is stored as JSONB and linked to its triage assessment with one statement:
+a data-modifying CTE inserts the hospital_matches row and sets triage_assessments.hospital_match_id, so
+the write costs one round trip and is atomic. Connections come from the per-container pool
+(lambda_common.pool). record_match() runs the write before the response returns, under a short connect
+and statement timeout: Lambda freezes the process once the handler returns, so a write left on a
+background thread could be lost.
+
+A match whose triage_assessment_id was supplied but matched no assessment row (for example, the row is
+still in the triage Lambda's write-behind spool) is stored unlinked; it is logged and counted in
+match_stats() so the gap stays visible.
+"""
+
+import logging
+import os
+import threading
+import uuid
+
+from hospital_matcher.models.hospital import HospitalMatchResult
+from lambda_common.breaker import get_breaker
+from lambda_common.clients import get_client
+from lambda_common.credentials import invalidate_rds_credentials, rds_auth_token, secret_json
+from lambda_common.pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+PERSIST_HOSPITAL_MATCHES = os.environ.get("PERSIST_HOSPITAL_MATCHES", "").lower() in ("1", "true", "yes")
+RDS_CONFIG_SECRET = os.environ.get(
+    "RDS_CONFIG_SECRET",
+    "emergency-medical-triage-dev/rds-config",
+)
+# The write is on the response path, so keep it short (libpq connect_timeout takes whole seconds)
+MATCH_WRITE_CONNECT_TIMEOUT = int(os.environ.get("MATCH_WRITE_CONNECT_TIMEOUT", "2"))
+MATCH_WRITE_STATEMENT_TIMEOUT_MS = int(os.environ.get("MATCH_WRITE_STATEMENT_TIMEOUT_MS", "1000"))
+
+# The sub-select keeps the match when the assessment id is unknown (not persisted yet, or foreign):
+# triage_assessment_id is then NULL and no assessment is updated, instead of failing the foreign key.
+# SET LOCAL is sent in the same round trip and only lasts for this transaction.
+_INSERT_MATCH_SQL = f"""
+SET LOCAL statement_timeout = {MATCH_WRITE_STATEMENT_TIMEOUT_MS};
+WITH match AS (
+  INSERT INTO hospital_matches (id, triage_assessment_id, hospitals, safety_disclaimer)
+  VALUES (%s, (SELECT id FROM triage_assessments WHERE id = %s), %s, %s)
+  RETURNING id, triage_assessment_id
+)
+UPDATE triage_assessments AS t
+SET hospital_match_id = match.id
+FROM match
+WHERE t.id = match.triage_assessment_id
+"""
+
+
+def _get_rds_config() -> dict:
+    """RDS connection config from Secrets Manager (TTL-cached, lambda_common.credentials)."""
+    return secret_json(get_client("secretsmanager", os.environ.get("AWS_REGION", "us-east-1")), RDS_CONFIG_SECRET)
+
+
+def _get_iam_token(host: str, port: int, username: str, region: str) -> str:
+    """IAM database auth token (TTL-cached well inside its 15-minute validity)."""
+    return rds_auth_token(get_client("rds", region), host, port, username, region)
+
+
+def _connect(connect_timeout: int = 15):
+    """Open a new connection to Aurora (the pool calls this). Fails fast while the "aurora" circuit is open."""
+    import psycopg2
+
+    with get_breaker("aurora").guard():
+        config = _get_rds_config()
+        host = config["host"]
+        port = int(config.get("port", 5432))
+        database = config["database"]
+        username = config["username"]
+        region = config.get("region", os.environ.get("AWS_REGION", "us-east-1"))
+        token = _get_iam_token(host, port, username, region)
+        return psycopg2.connect(
+            host=host,
+            port=port,
+            dbname=database,
+            user=username,
+            password=token,
+            connect_timeout=connect_timeout,
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
+        )
+
+
+# Late-bound so _connect can be patched in tests. An auth rejection drops the cached token and config.
+_pool = ConnectionPool(
+    lambda connect_timeout: _connect(connect_timeout),
+    on_auth_failure=lambda: invalidate_rds_credentials(RDS_CONFIG_SECRET),
+)
+_stats_lock = threading.Lock()
+_stats = {"stored": 0, "linked": 0, "unlinked": 0, "failed": 0}
+
+
+def connection(connect_timeout: int = 15):
+    """Context manager: a pooled, health-checked Aurora connection, returned to the pool after the block."""
+    return _pool.connection(connect_timeout)
+
+
+def pool_stats() -> dict[str, int]:
+    return _pool.stats()
+
+
+def reset_pool() -> None:
+    """Close idle pooled connections (tests, or after the RDS config secret changes)."""
+    _pool.close()
+
+
+def match_stats() -> dict[str, int]:
+    """Counters: stored, linked, unlinked (assessment id supplied but not found) and failed writes."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def _assessment_uuid(triage_assessment_id: str | None) -> str | None:
+    if not triage_assessment_id:
+        return None
+    try:
+        return str(uuid.UUID(triage_assessment_id))
+    except ValueError:
+        return None
+
+
+def insert_hospital_match(
+    result: HospitalMatchResult, triage_assessment_id: str | None, connect_timeout: int = 15
+) -> uuid.UUID:
+    """
+    Store result in hospital_matches and point the assessment's hospital_match_id at it, in one round trip.
+    Returns the match id. Raises on DB/network errors.
+    """
+    from psycopg2.extras import Json
+
+    match_id = uuid.uuid4()
+    hospitals = result.model_dump(mode="json")["hospitals"]
+    with connection(connect_timeout) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                _INSERT_MATCH_SQL,
+                (str(match_id), _assessment_uuid(triage_assessment_id), Json(hospitals), result.safety_disclaimer),
+            )
+            linked = cur.rowcount > 0
+        conn.commit()
+    _count("stored")
+    logger.info("Persisted hospital match id=%s hospitals=%d linked=%d", match_id, len(hospitals), int(linked))
+    if linked:
+        _count("linked")
+    elif triage_assessment_id:
+        _count("unlinked")
+        logger.warning(
+            "Hospital match id=%s stored unlinked: triage_assessment_id=%s not found (not persisted yet?)",
+            match_id,
+            triage_assessment_id,
+        )
+    return match_id
+
+
+def record_match(result: HospitalMatchResult, triage_assessment_id: str | None) -> uuid.UUID | None:
+    """
+    insert_hospital_match under MATCH_WRITE_CONNECT_TIMEOUT / MATCH_WRITE_STATEMENT_TIMEOUT_MS, before the
+    response returns. Returns the match id, or None on failure or when PERSIST_HOSPITAL_MATCHES is off.
+    Never raises.
+    """
+    if not PERSIST_HOSPITAL_MATCHES:
+        return None
+    try:
+        return insert_hospital_match(result, triage_assessment_id, connect_timeout=MATCH_WRITE_CONNECT_TIMEOUT)
+    except Exception as e:
+        _count("failed")
+        logger.warning("Hospital match persist failed (response unaffected): %s", type(e).__name__)
+        return None
@@ -0,0 +1,57 @@
+"""Bedrock prompt caching for Hospital Matcher Converse calls (cachePoint blocks).
+Mirrors triage.core.prompt_cache (each Lambda package ships standalone).
+
+The system prompt and tool schemas are identical on every call. With BEDROCK_PROMPT_CACHE_ENABLED,
+checkpoints are placed after the system prompt and after the tool list (cached_messages also marks the
+end of prior turns for multi-round loops), so Bedrock reads those prefixes from its cache instead of
+re-processing them. The model must support prompt caching; off by default.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+BEDROCK_PROMPT_CACHE_ENABLED = os.environ.get("BEDROCK_PROMPT_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+
+def system_blocks(prompt: str) -> list[dict]:
+    """system= for Converse: the prompt, followed by a checkpoint when caching is enabled."""
+    if not BEDROCK_PROMPT_CACHE_ENABLED:
+        return [{"text": prompt}]
+    return [{"text": prompt}, CACHE_POINT]
+
+
+def cached_tool_config(tool_config: dict) -> dict:
+    """toolConfig with a checkpoint after the last tool spec. The input is not modified."""
+    if not BEDROCK_PROMPT_CACHE_ENABLED:
+        return tool_config
+    return {**tool_config, "tools": [*tool_config.get("tools", []), CACHE_POINT]}
+
+
+def cached_messages(messages: list[dict]) -> list[dict]:
+    """
+    messages with a checkpoint at the end of the last turn, so the next round reads everything up to here
+    from cache. Only from the second round on (a lone user prompt is below the cacheable minimum).
+    Returns a copy; the conversation history itself never accumulates checkpoints.
+    """
+    if not BEDROCK_PROMPT_CACHE_ENABLED or len(messages) < 2:
+        return messages
+    last = messages[-1]
+    return [*messages[:-1], {**last, "content": [*last.get("content", []), CACHE_POINT]}]
+
+
+def log_usage(source: str, usage: dict | None) -> None:
+    """Log cached vs uncached input tokens from a Converse usage block (CloudWatch Logs Insights)."""
+    if not usage:
+        return
+    logger.info(
+        "Bedrock usage source=%s input_tokens=%d cache_read_tokens=%d cache_write_tokens=%d output_tokens=%d",
+        source,
+        usage.get("inputTokens", 0),
+        usage.get("cacheReadInputTokens", 0),
+        usage.get("cacheWriteInputTokens", 0),
+        usage.get("outputTokens", 0),
+    )
@@ -0,0 +1,101 @@
+"""Speculative hospital matches: computed while the RMP is still reading the triage result.
+
+When SPECULATIVE_HOSPITAL_MATCH is on, the triage Lambda invokes this Lambda asynchronously with
+{"speculative_match": HospitalMatchRequest} as soon as severity is known. The match is stored in S3
+(SPECULATIVE_MATCH_BUCKET, one object per session_id) next to a fingerprint of the inputs that shape it:
+severity, recommendations, patient location (rounded to ~100 m) and limit. POST /hospitals with the same
+session_id returns the stored match when the fingerprint agrees and it is younger than
+SPECULATIVE_MATCH_TTL_SECONDS; otherwise (different inputs, not ready yet, expired) it computes fresh.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+
+from hospital_matcher.models.hospital import HospitalMatchRequest, HospitalMatchResult
+from lambda_common.clients import get_client
+
+logger = logging.getLogger(__name__)
+
+SPECULATIVE_MATCH_BUCKET = os.environ.get("SPECULATIVE_MATCH_BUCKET", "").strip()
+SPECULATIVE_MATCH_PREFIX = "speculative-matches/"
+SPECULATIVE_MATCH_TTL_SECONDS = int(os.environ.get("SPECULATIVE_MATCH_TTL_SECONDS", "900"))
+# Decimal places kept for patient location in the fingerprint (3 ~ 110 m)
+LOCATION_DECIMALS = 3
+
+
+def request_fingerprint(req: HospitalMatchRequest) -> str:
+    """sha256 hex of the inputs that change the match (ids such as triage_assessment_id are ignored)."""
+    canonical = {
+        "severity": req.severity,
+        "recommendations": [r.strip().casefold() for r in req.recommendations],
+        "lat": round(req.patient_location_lat, LOCATION_DECIMALS) if req.patient_location_lat is not None else None,
+        "lon": round(req.patient_location_lon, LOCATION_DECIMALS) if req.patient_location_lon is not None else None,
+        "limit": req.limit,
+    }
+    blob = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _object_key(session_id: str) -> str:
+    return SPECULATIVE_MATCH_PREFIX + hashlib.sha256(session_id.encode("utf-8")).hexdigest() + ".json"
+
+
+def is_enabled() -> bool:
+    return bool(SPECULATIVE_MATCH_BUCKET)
+
+
+def store_match(req: HospitalMatchRequest, result: HospitalMatchResult) -> bool:
+    """Store result for req.session_id. Returns False (logged) when disabled, session-less or S3 fails."""
+    if not is_enabled() or not req.session_id:
+        return False
+    body = {
+        "fingerprint": request_fingerprint(req),
+        "created_at": time.time(),
+        "result": result.model_dump(mode="json"),
+    }
+    try:
+        get_client("s3").put_object(
+            Bucket=SPECULATIVE_MATCH_BUCKET,
+            Key=_object_key(req.session_id),
+            Body=json.dumps(body).encode("utf-8"),
+            ContentType="application/json",
+        )
+    except Exception as e:
+        logger.warning("Speculative match store failed: %s", e)
+        return False
+    return True
+
+
+def load_match(req: HospitalMatchRequest) -> HospitalMatchResult | None:
+    """
+    The stored match for req.session_id when its fingerprint equals req's and it has not expired; else None.
+    Logs the outcome (hit, miss, mismatch, expired) so the speculation hit rate shows in CloudWatch.
+    """
+    if not is_enabled() or not req.session_id:
+        return None
+    try:
+        obj = get_client("s3").get_object(Bucket=SPECULATIVE_MATCH_BUCKET, Key=_object_key(req.session_id))
+        stored = json.loads(obj["Body"].read())
+    except Exception as e:
+        # botocore ClientError: NoSuchKey when the speculative match has not been stored (yet)
+        if (getattr(e, "response", None) or {}).get("Error", {}).get("Code") == "NoSuchKey":
+            logger.info("Speculative match outcome=miss")
+        else:
+            logger.warning("Speculative match load failed: %s", e)
+        return None
+    age = time.time() - float(stored.get("created_at", 0))
+    if age > SPECULATIVE_MATCH_TTL_SECONDS:
+        outcome, result = "expired", None
+    elif stored.get("fingerprint") != request_fingerprint(req):
+        outcome, result = "mismatch", None
+    else:
+        try:
+            result = HospitalMatchResult.model_validate({**(stored.get("result") or {}), "precomputed": True})
+            outcome = "hit"
+        except Exception:
+            outcome, result = "invalid", None
+    logger.info("Speculative match outcome=%s age_s=%.1f", outcome, age)
+    return result
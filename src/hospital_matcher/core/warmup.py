@@ -0,0 +1,23 @@
+"""Warmup steps for the Hospital Matcher Lambda.
+
+Event detection and timing live in lambda_common.warmup."""
+
+from lambda_common.warmup import run_warmup
+
+
+def _warm_clients() -> None:
+    from hospital_matcher.core import agent, speculative
+    from lambda_common.clients import REGION, get_client
+
+    if agent.USE_AGENTCORE and agent.AGENT_RUNTIME_ARN:
+        get_client("bedrock-agentcore", REGION)
+    if agent.AGENT_ID:
+        get_client("bedrock-agent-runtime", REGION)
+    get_client("bedrock-runtime", REGION)
+    if speculative.is_enabled():
+        get_client("s3")
+
+
+def warm_hospital_matcher() -> dict:
+    """Warmup for the Hospital Matcher Lambda (POST /hospitals)."""
+    return run_warmup("hospital_matcher", [("clients", _warm_clients)])
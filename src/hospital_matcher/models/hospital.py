@@ -55,6 +55,10 @@ class HospitalMatchResult(BaseModel):
 
     hospitals: list[MatchedHospital] = Field(default_factory=list, max_length=HOSPITALS_MAX_ITEMS)
     safety_disclaimer: str | None = Field(default=None, max_length=SAFETY_DISCLAIMER_MAX_LENGTH)
+    precomputed: bool = Field(
+        default=False,
+        description="True when served from the speculative match started by POST /triage (no model call).",
+    )
 
     @field_validator("hospitals", mode="before")
     @classmethod
@@ -0,0 +1,6 @@
+"""Modules shared by every Lambda package: boto3 clients, credentials cache, circuit breakers, Aurora pool, SSE,
+warmup events.
+
+There is one copy of each, here; the scripts/build_*_lambda.sh scripts copy this package into every
+deployment package next to the Lambda's own code.
+"""
@@ -0,0 +1,223 @@
+"""Per-downstream circuit breakers (closed / open / half-open).
+
+Without a breaker every request to a degraded AgentCore runtime, Gateway or Aurora waits out its full
+timeout before falling back. Each breaker keeps a rolling window of recent calls; when the error rate or
+the slow-call rate crosses its threshold it opens and calls fail immediately with CircuitOpenError, so
+callers skip to the next backend or their fallback. After BREAKER_OPEN_SECONDS one probe call is let
+through (half-open): success closes the circuit, failure re-opens it.
+
+State transitions are logged ("Circuit name=... state=..."); breaker_states() returns a snapshot of every
+breaker for logs, metrics or tests.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BREAKER_ENABLED = os.environ.get("BREAKER_ENABLED", "true").lower() in ("1", "true", "yes")
+BREAKER_WINDOW_SIZE = int(os.environ.get("BREAKER_WINDOW_SIZE", "20"))
+BREAKER_WINDOW_SECONDS = float(os.environ.get("BREAKER_WINDOW_SECONDS", "60"))
+BREAKER_MIN_CALLS = int(os.environ.get("BREAKER_MIN_CALLS", "5"))
+BREAKER_FAILURE_RATE = float(os.environ.get("BREAKER_FAILURE_RATE", "0.5"))
+BREAKER_SLOW_CALL_SECONDS = float(os.environ.get("BREAKER_SLOW_CALL_SECONDS", "15"))
+BREAKER_SLOW_RATE = float(os.environ.get("BREAKER_SLOW_RATE", "0.8"))
+BREAKER_OPEN_SECONDS = float(os.environ.get("BREAKER_OPEN_SECONDS", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a downstream whose circuit is open."""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit {name} is open")
+        self.name = name
+
+
+class CircuitBreaker:
+    """Rolling-window breaker. Thread-safe; clock is injectable for tests."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_size: int = BREAKER_WINDOW_SIZE,
+        window_seconds: float = BREAKER_WINDOW_SECONDS,
+        min_calls: int = BREAKER_MIN_CALLS,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        slow_call_seconds: float = BREAKER_SLOW_CALL_SECONDS,
+        slow_rate: float = BREAKER_SLOW_RATE,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+        self._clock = clock
+        # (finished_at, failed, slow)
+        self._calls: deque[tuple[float, bool, bool]] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        failure_rate, slow_rate = self._rates()
+        logger.warning(
+            "Circuit name=%s state=%s previous=%s failure_rate=%.2f slow_rate=%.2f calls=%d",
+            self.name,
+            state,
+            self._state,
+            failure_rate,
+            slow_rate,
+            len(self._calls),
+        )
+        self._state = state
+        self._probe_in_flight = False
+        if state == OPEN:
+            self._opened_at = self._clock()
+        elif state == CLOSED:
+            self._calls.clear()
+
+    def _rates(self) -> tuple[float, float]:
+        if not self._calls:
+            return 0.0, 0.0
+        n = len(self._calls)
+        return sum(c[1] for c in self._calls) / n, sum(c[2] for c in self._calls) / n
+
+    def allow(self) -> bool:
+        """True if a call may proceed. In half-open, only one probe call is allowed at a time."""
+        if not BREAKER_ENABLED:
+            return True
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def would_allow(self) -> bool:
+        """
+        True if allow() would let a call through right now, without claiming the half-open probe. Half-open
+        with the probe already in flight counts as unavailable, so callers fail over instead of being rejected.
+        """
+        if not BREAKER_ENABLED:
+            return True
+        with self._lock:
+            state = self._current_state()
+            return state == CLOSED or (state == HALF_OPEN and not self._probe_in_flight)
+
+    def record(self, duration: float, failed: bool) -> None:
+        """Record the outcome of a call that allow() let through."""
+        if not BREAKER_ENABLED:
+            return
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            now = self._clock()
+            if self._state == HALF_OPEN:
+                self._transition(OPEN if failed or slow else CLOSED)
+                return
+            self._calls.append((now, failed, slow))
+            while self._calls and now - self._calls[0][0] > self.window_seconds:
+                self._calls.popleft()
+            if self._state == CLOSED and len(self._calls) >= self.min_calls:
+                failure_rate, slow_rate = self._rates()
+                if failure_rate >= self.failure_rate or slow_rate >= self.slow_rate:
+                    self._transition(OPEN)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Wrap a block as one call: raises CircuitOpenError if not allowed, records failure on exception."""
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        start = self._clock()
+        try:
+            yield
+        except BaseException:
+            # Includes asyncio cancellation (a timed-out awaited call), so a half-open probe is always released
+            self.record(self._clock() - start, failed=True)
+            raise
+        self.record(self._clock() - start, failed=False)
+
+    def call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        with self.guard():
+            return fn(*args, **kwargs)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            failure_rate, slow_rate = self._rates()
+            return {
+                "state": self._current_state(),
+                "calls": len(self._calls),
+                "failure_rate": round(failure_rate, 3),
+                "slow_rate": round(slow_rate, 3),
+                "rejected": self.rejected,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Shared breaker for a downstream (agentcore, bedrock_agent, converse, gateway, aurora)."""
+    breaker = _breakers.get(name)
+    if breaker is not None:
+        return breaker
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+    return breaker
+
+
+def is_open(name: str) -> bool:
+    """True when calls to name would be rejected right now (half-open counts as available)."""
+    return BREAKER_ENABLED and get_breaker(name).state == OPEN
+
+
+def would_allow(name: str) -> bool:
+    """True when a call to name would be let through right now (see CircuitBreaker.would_allow)."""
+    return get_breaker(name).would_allow()
+
+
+def breaker_states() -> dict[str, dict]:
+    return {name: b.snapshot() for name, b in list(_breakers.items())}
+
+
+def reset_breakers() -> None:
+    """Drop all breakers (tests)."""
+    with _registry_lock:
+        _breakers.clear()
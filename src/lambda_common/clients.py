@@ -0,0 +1,50 @@
+"""Shared boto3 client registry. Clients are created once per container and reused across warm invocations.
+
+Creating a client per request pays credential resolution, endpoint resolution and a new TLS handshake
+inside the 29 s API Gateway budget. Clients are thread-safe, so one per (service, region) is enough.
+"""
+
+import os
+import threading
+
+import boto3
+from botocore.config import Config
+
+REGION = os.environ.get("AWS_REGION", "us-east-1")
+
+# Tuned for Lambda: small pool, keep-alive, fail fast on connect, read bounded by the API Gateway limit.
+BOTO_MAX_POOL_CONNECTIONS = int(os.environ.get("BOTO_MAX_POOL_CONNECTIONS", "10"))
+BOTO_CONNECT_TIMEOUT = float(os.environ.get("BOTO_CONNECT_TIMEOUT", "3"))
+BOTO_READ_TIMEOUT = float(os.environ.get("BOTO_READ_TIMEOUT", "25"))
+BOTO_MAX_ATTEMPTS = int(os.environ.get("BOTO_MAX_ATTEMPTS", "3"))
+
+CLIENT_CONFIG = Config(
+    max_pool_connections=BOTO_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    connect_timeout=BOTO_CONNECT_TIMEOUT,
+    read_timeout=BOTO_READ_TIMEOUT,
+    retries={"mode": "adaptive", "max_attempts": BOTO_MAX_ATTEMPTS},
+)
+
+_clients: dict[tuple[str, str | None], object] = {}
+_lock = threading.Lock()
+
+
+def get_client(service: str, region: str | None = REGION):
+    """Return the shared client for service/region, creating it on first use."""
+    key = (service, region)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = boto3.client(service, region_name=region, config=CLIENT_CONFIG)
+            _clients[key] = client
+    return client
+
+
+def reset_clients() -> None:
+    """Drop all cached clients (tests, or after credentials rotate)."""
+    with _lock:
+        _clients.clear()
@@ -0,0 +1,225 @@
+"""TTL cache for Secrets Manager configs and RDS IAM auth tokens.
+
+Calling GetSecretValue on every invocation adds a network round trip to each request, and signing a new RDS IAM
+token per connection repeats work whose result is valid for 15 minutes. CredentialCache keeps each value
+with its own TTL:
+
+- a hit inside the TTL returns the cached value; a miss (first use or expired) loads it inline, once per
+  key even when several threads ask at the same moment;
+- in the last CREDENTIAL_REFRESH_AHEAD fraction of the TTL a hit still returns the cached value and
+  starts one background refresh, so after the first load callers rarely wait;
+- a failed refresh keeps serving the old value until it expires; invalidate() drops entries that were
+  rejected (Aurora refused the IAM token, a rotated secret);
+- prefetch_secrets() loads several secrets with one BatchGetSecretValue call at init, falling back to
+  GetSecretValue per secret when the batch API is unavailable or denied.
+
+credential_stats() reports hits, misses, refreshes, errors and the mean load time (what each hit saves).
+Secrets live SECRETS_CACHE_TTL_SECONDS (rotation is picked up within it); RDS tokens RDS_TOKEN_TTL_SECONDS.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SECRETS_CACHE_TTL_SECONDS = float(os.environ.get("SECRETS_CACHE_TTL_SECONDS", "300"))
+# RDS IAM tokens are valid for 15 minutes; refresh well before that
+RDS_TOKEN_TTL_SECONDS = float(os.environ.get("RDS_TOKEN_TTL_SECONDS", "600"))
+CREDENTIAL_REFRESH_AHEAD = 0.2
+# BatchGetSecretValue accepts at most 20 ids per call
+_BATCH_MAX_IDS = 20
+
+
+class CredentialCache:
+    """Thread-safe per-key TTL cache with single-flight loads and refresh-ahead. Clock injectable for tests."""
+
+    def __init__(
+        self,
+        *,
+        refresh_ahead: float = CREDENTIAL_REFRESH_AHEAD,
+        background: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.refresh_ahead = refresh_ahead
+        self.background = background
+        self._clock = clock
+        # key -> (value, expires_at, ttl)
+        self._entries: dict[str, tuple[object, float, float]] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+        self._load_ms = 0.0
+        self._loads = 0
+
+    def get(self, key: str, loader: Callable[[], T], ttl: float) -> T:
+        """Cached value for key, calling loader() on a miss. Loader exceptions propagate (nothing cached)."""
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() < entry[1]:
+            self._count("hits")
+            if self._clock() >= entry[1] - entry[2] * self.refresh_ahead:
+                self._refresh(key, loader, ttl)
+            return entry[0]
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() < entry[1]:
+                self._count("hits")
+                return entry[0]
+            self._count("misses")
+            return self._load(key, loader, ttl)
+
+    def put(self, key: str, value: object, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl, ttl)
+
+    def fresh(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and self._clock() < entry[1]
+
+    def invalidate(self, prefix: str) -> int:
+        """Drop every entry whose key starts with prefix. Returns how many were dropped."""
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for k in keys:
+                del self._entries[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+            self._load_ms = 0.0
+            self._loads = 0
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            mean_load_ms = self._load_ms / self._loads if self._loads else 0.0
+            return {**self._stats, "entries": len(self._entries), "mean_load_ms": round(mean_load_ms, 3)}
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _load(self, key: str, loader: Callable[[], T], ttl: float) -> T:
+        t0 = time.perf_counter()
+        try:
+            value = loader()
+        except Exception:
+            self._count("errors")
+            raise
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl, ttl)
+            self._load_ms += elapsed_ms
+            self._loads += 1
+        return value
+
+    def _refresh(self, key: str, loader: Callable[[], object], ttl: float) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._load(key, loader, ttl)
+                self._count("refreshes")
+            except Exception as e:
+                logger.warning("Credential refresh failed key=%s, serving cached value: %s", key, type(e).__name__)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        if self.background:
+            threading.Thread(target=run, name="credential-refresh", daemon=True).start()
+        else:
+            run()
+
+
+_cache = CredentialCache()
+
+
+def get_credential_cache() -> CredentialCache:
+    return _cache
+
+
+def credential_stats() -> dict[str, float]:
+    return _cache.stats()
+
+
+def reset_credentials() -> None:
+    """Drop every cached secret and token (tests, or after a rotation)."""
+    _cache.clear()
+
+
+def _secret_key(secret_id: str) -> str:
+    return f"secret:{secret_id}"
+
+
+def secret_json(client, secret_id: str, ttl: float = SECRETS_CACHE_TTL_SECONDS) -> dict:
+    """SecretString of secret_id parsed as JSON, cached for ttl seconds. client: a Secrets Manager client."""
+
+    def load() -> dict:
+        return json.loads(client.get_secret_value(SecretId=secret_id)["SecretString"])
+
+    return _cache.get(_secret_key(secret_id), load, ttl)
+
+
+def prefetch_secrets(client, secret_ids: Iterable[str], ttl: float = SECRETS_CACHE_TTL_SECONDS) -> int:
+    """
+    Load the secrets not cached yet, batched with BatchGetSecretValue (ids may be names or ARNs). Secrets the
+    batch did not return are loaded one by one. Never raises; returns how many missing secrets were loaded.
+    """
+    wanted = [s for s in dict.fromkeys(secret_ids) if s and not _cache.fresh(_secret_key(s))]
+    for i in range(0, len(wanted), _BATCH_MAX_IDS):
+        chunk = wanted[i : i + _BATCH_MAX_IDS]
+        try:
+            resp = client.batch_get_secret_value(SecretIdList=chunk)
+        except Exception as e:
+            logger.info("BatchGetSecretValue unavailable, loading secrets one by one: %s", type(e).__name__)
+            continue
+        for item in resp.get("SecretValues") or []:
+            try:
+                value = json.loads(item["SecretString"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            for secret_id in chunk:
+                if secret_id in (item.get("Name"), item.get("ARN")):
+                    _cache.put(_secret_key(secret_id), value, ttl)
+    loaded = 0
+    for secret_id in wanted:
+        if _cache.fresh(_secret_key(secret_id)):
+            loaded += 1
+            continue
+        try:
+            secret_json(client, secret_id, ttl)
+            loaded += 1
+        except Exception as e:
+            logger.warning("Could not prefetch secret %s: %s", secret_id, type(e).__name__)
+    return loaded
+
+
+def rds_auth_token(client, host: str, port: int, username: str, region: str, ttl: float = RDS_TOKEN_TTL_SECONDS) -> str:
+    """RDS IAM auth token for username@host:port, cached for ttl seconds. client: an RDS client."""
+
+    def load() -> str:
+        return client.generate_db_auth_token(DBHostname=host, Port=port, DBUsername=username, Region=region)
+
+    return _cache.get(f"rds-token:{username}@{host}:{port}", load, ttl)
+
+
+def invalidate_rds_credentials(secret_id: str) -> None:
+    """Forget cached RDS tokens and the RDS config secret (Aurora rejected the credentials)."""
+    _cache.invalidate("rds-token:")
+    _cache.invalidate(_secret_key(secret_id))
@@ -0,0 +1,166 @@
+"""Per-container Aurora connection pool shared by every DB call of the Lambda.
+
+Opening a connection pays a Secrets Manager read, an IAM token, TCP + TLS and Postgres auth inside the
+request budget, and some requests need several. ConnectionPool keeps up to DB_POOL_MAX_SIZE live
+connections across calls and warm invocations:
+
+- LIFO reuse, so the most recently used (least likely stale) connection goes out first;
+- health check before reuse: a closed connection is dropped, and one idle for more than
+  DB_POOL_PING_IDLE_SECONDS must answer SELECT 1 first (a frozen container's socket may be gone);
+- connections older than DB_POOL_MAX_AGE_SECONDS are retired, so rotated credentials and Aurora failover
+  are picked up without a cold start;
+- a new connection rejected for authentication (expired IAM token) is retried once after on_auth_failure()
+  (which drops any cached credentials);
+- at most DB_POOL_MAX_SIZE connections are checked out at once; other threads wait up to connect_timeout.
+
+A connection goes back to the pool rolled back (a no-op unless a transaction is open, so an error inside
+the block never leaks a half-done transaction); one that cannot roll back or is closed is dropped instead.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+DB_POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", "4"))
+DB_POOL_MAX_AGE_SECONDS = float(os.environ.get("DB_POOL_MAX_AGE_SECONDS", "900"))
+DB_POOL_PING_IDLE_SECONDS = float(os.environ.get("DB_POOL_PING_IDLE_SECONDS", "10"))
+
+
+class PoolExhaustedError(RuntimeError):
+    """No pooled connection became free within the wait timeout."""
+
+
+def is_auth_failure(exc: BaseException) -> bool:
+    """True for a Postgres authentication rejection (RDS IAM reports expired tokens as PAM failures)."""
+    text = str(exc).lower()
+    return "authentication failed" in text or "pam authentication" in text
+
+
+class ConnectionPool:
+    """Thread-safe LIFO pool over connect(connect_timeout) -> DB-API connection. Clock injectable for tests."""
+
+    def __init__(
+        self,
+        connect: Callable[[int], object],
+        *,
+        max_size: int = DB_POOL_MAX_SIZE,
+        max_age_seconds: float = DB_POOL_MAX_AGE_SECONDS,
+        ping_idle_seconds: float = DB_POOL_PING_IDLE_SECONDS,
+        on_auth_failure: Callable[[], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._connect = connect
+        self.max_size = max(1, max_size)
+        self.max_age_seconds = max_age_seconds
+        self.ping_idle_seconds = ping_idle_seconds
+        self._on_auth_failure = on_auth_failure
+        self._clock = clock
+        # (connection, opened_at, last_used_at); the end of the list is the most recently used
+        self._idle: list[tuple[object, float, float]] = []
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "reused": 0, "pinged": 0, "discarded": 0, "auth_retries": 0}
+
+    @contextmanager
+    def connection(self, connect_timeout: int = 15) -> Iterator:
+        """Check out a healthy connection for the block; it returns to the pool afterwards."""
+        if not self._slots.acquire(timeout=max(0, connect_timeout)):
+            raise PoolExhaustedError(f"No Aurora connection free within {connect_timeout}s")
+        try:
+            conn, opened_at = self._checkout(connect_timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            yield conn
+        finally:
+            self._checkin(conn, opened_at)
+            self._slots.release()
+
+    def _checkout(self, connect_timeout: int) -> tuple[object, float]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, opened_at, last_used = self._idle.pop()
+            if self._usable(conn, opened_at, last_used):
+                with self._lock:
+                    self._stats["reused"] += 1
+                return conn, opened_at
+            self._discard(conn)
+        return self._open(connect_timeout), self._clock()
+
+    def _usable(self, conn, opened_at: float, last_used: float) -> bool:
+        now = self._clock()
+        if getattr(conn, "closed", 0) or now - opened_at > self.max_age_seconds:
+            return False
+        if now - last_used <= self.ping_idle_seconds:
+            return True
+        with self._lock:
+            self._stats["pinged"] += 1
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+            conn.rollback()
+            return True
+        except Exception as e:
+            logger.info("Aurora pooled connection failed health check: %s", type(e).__name__)
+            return False
+
+    def _open(self, connect_timeout: int):
+        try:
+            conn = self._connect(connect_timeout)
+        except Exception as e:
+            if not is_auth_failure(e):
+                raise
+            logger.warning("Aurora auth rejected, reconnecting with fresh credentials")
+            with self._lock:
+                self._stats["auth_retries"] += 1
+            if self._on_auth_failure is not None:
+                self._on_auth_failure()
+            conn = self._connect(connect_timeout)
+        with self._lock:
+            self._stats["opened"] += 1
+        return conn
+
+    def _checkin(self, conn, opened_at: float) -> None:
+        # psycopg2 rollback() sends nothing when no transaction is open, so this is free after a commit
+        try:
+            conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+        if getattr(conn, "closed", 0):
+            self._discard(conn)
+            return
+        with self._lock:
+            self._idle.append((conn, opened_at, self._clock()))
+
+    def _discard(self, conn) -> None:
+        with self._lock:
+            self._stats["discarded"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def stats(self) -> dict[str, int]:
+        """Counters (opened, reused, pinged, discarded, auth_retries) plus the current idle count."""
+        with self._lock:
+            return {**self._stats, "idle": len(self._idle)}
+
+    def close(self) -> None:
+        """Close every idle connection (tests, or before credentials change)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _, _ in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
@@ -0,0 +1,95 @@
+"""Incremental decoder for AgentCore invoke_agent_runtime responses (SSE or plain JSON).
+
+Parses SSE frames chunk-by-chunk as the stream arrives instead of buffering the whole body, only
+JSON-decodes payloads that can be objects, and stops reading (closing the stream) at the first payload
+the caller accepts.
+"""
+
+import codecs
+import json
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def iter_sse_data(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Yield the data of each SSE event as soon as its terminating blank line arrives.
+    Multi-line data fields are joined with newlines; comments and other fields are ignored.
+    Only the unterminated tail of the previous chunk is carried over (no whole-body concatenation).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    data: list[str] = []
+    for chunk in chunks:
+        if not chunk:
+            continue
+        text = decoder.decode(chunk)
+        if tail:
+            text = tail + text
+        lines = text.split("\n")
+        tail = lines.pop()
+        for line in lines:
+            if line.endswith("\r"):
+                line = line[:-1]
+            if not line:
+                if data:
+                    yield "\n".join(data)
+                    data = []
+            elif line.startswith("data:"):
+                data.append(line[6:] if line.startswith("data: ") else line[5:])
+    tail += decoder.decode(b"", final=True)
+    if tail.startswith("data:"):
+        data.append(tail[6:] if tail.startswith("data: ") else tail[5:])
+    if data:
+        yield "\n".join(data)
+
+
+def _json_objects(data: str) -> Iterator[dict]:
+    """JSON objects in one SSE data field. Falls back to per-line parsing when producers omit blank lines."""
+    if not data.lstrip().startswith("{"):
+        return  # "[DONE]", text deltas, etc.
+    try:
+        obj = json.loads(data)
+    except json.JSONDecodeError:
+        if "\n" in data:
+            for line in data.split("\n"):
+                yield from _json_objects(line)
+        return
+    if isinstance(obj, dict):
+        yield obj
+
+
+def first_valid_payload(
+    response: dict,
+    parse: Callable[[dict], T | None],
+    parse_body: Callable[[dict], T | None] | None = None,
+) -> T | None:
+    """
+    Return the first parse(obj) that is not None, where obj is a JSON object from the AgentCore response.
+    SSE responses are decoded incrementally; plain JSON bodies use parse_body (defaults to parse).
+    """
+    stream = response.get("response") or ()
+    try:
+        if "text/event-stream" in response.get("contentType", ""):
+            for data in iter_sse_data(stream):
+                for obj in _json_objects(data):
+                    out = parse(obj)
+                    if out is not None:
+                        return out
+            return None
+        raw = b"".join(chunk for chunk in stream if chunk)
+        try:
+            obj = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning("AgentCore response not valid JSON: %s", e)
+            return None
+        return (parse_body or parse)(obj) if isinstance(obj, dict) else None
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
@@ -0,0 +1,62 @@
+"""Warmup events: prime lazily initialized state so the first request after a cold start skips it.
+
+A scheduled rule (infrastructure/warmup.tf) invokes each Lambda with {"warmup": true}; EventBridge
+"Scheduled Event" payloads and serverless-plugin-warmup events are recognized too. The handler
+answers before any request parsing and never calls a model: it runs its own warmup steps through
+run_warmup, which records how long each took and logs the total init time the warmup absorbed. A
+failing step is reported, not raised, so one unconfigured dependency does not hide the others.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_cold = True
+
+
+def is_warmup_event(event: object) -> bool:
+    """True for {"warmup": true}, EventBridge scheduled events and serverless-plugin-warmup."""
+    if not isinstance(event, dict):
+        return False
+    if event.get("warmup") is True or event.get("source") == "serverless-plugin-warmup":
+        return True
+    return event.get("source") == "aws.events" and event.get("detail-type") == "Scheduled Event"
+
+
+def run_warmup(handler_name: str, steps: list[tuple[str, Callable[[], object]]]) -> dict:
+    """
+    Run each (name, fn) step in order.
+
+    Returns {"warmup", "cold_start", "duration_ms", "steps", "errors"}: per-step milliseconds, and
+    "ExcType: message" for each step that raised.
+    """
+    global _cold
+    cold, _cold = _cold, False
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
+    errors: dict[str, str] = {}
+    for name, fn in steps:
+        t0 = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+        timings[name] = round((time.perf_counter() - t0) * 1000, 2)
+    duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    logger.info(
+        "Warmup handler=%s cold_start=%s duration_ms=%.2f steps=%s errors=%s",
+        handler_name,
+        cold,
+        duration_ms,
+        timings,
+        sorted(errors) or "-",
+    )
+    return {
+        "warmup": True,
+        "cold_start": cold,
+        "duration_ms": duration_ms,
+        "steps": timings,
+        "errors": errors,
+    }
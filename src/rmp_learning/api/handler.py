@@ -3,8 +3,10 @@
 import json
 import logging
 
+from lambda_common.warmup import is_warmup_event
 from rmp_learning.core.agent import invoke_rmp_quiz
 from rmp_learning.core.db import get_leaderboard, get_my_score, insert_learning_answer, upsert_rmp_score
+from rmp_learning.core.warmup import warm_rmp_learning
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +29,10 @@ def handler(event: dict, context: object) -> dict:
     - GET .../rmp/learning/me -> current user's total_points and rank
     - GET .../rmp/learning/leaderboard -> top N (query limit, default 20)
     - POST .../rmp/learning -> get_question or score_answer (body)
-    RMP auth required (Cognito) for all.
+    RMP auth required (Cognito) for all. A warmup event primes clients and Aurora instead.
     """
+    if is_warmup_event(event):
+        return _response(200, warm_rmp_learning())
     try:
         method = (event.get("httpMethod") or "").upper()
         path = (event.get("path") or event.get("resource") or "").lower()
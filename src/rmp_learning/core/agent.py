@@ -5,7 +5,9 @@ import logging
 import os
 import uuid
 
-import boto3
+from lambda_common.breaker import get_breaker
+from lambda_common.clients import get_client
+from lambda_common.sse import first_valid_payload
 
 logger = logging.getLogger(__name__)
 
@@ -23,48 +25,33 @@ def invoke_rmp_quiz(payload: dict) -> dict:
     if not RMP_QUIZ_AGENT_RUNTIME_ARN:
         return _fallback_response(payload, "RMP_QUIZ_AGENT_RUNTIME_ARN not set")
 
-    client = boto3.client("bedrock-agentcore", region_name=REGION)
+    client = get_client("bedrock-agentcore", REGION)
     session_id = str(uuid.uuid4())
 
     try:
-        response = client.invoke_agent_runtime(
-            agentRuntimeArn=RMP_QUIZ_AGENT_RUNTIME_ARN,
-            runtimeSessionId=session_id,
-            payload=json.dumps(payload).encode("utf-8"),
-        )
+        # Open circuit: CircuitOpenError here returns the fallback question without waiting for a timeout
+        with get_breaker("agentcore").guard():
+            response = client.invoke_agent_runtime(
+                agentRuntimeArn=RMP_QUIZ_AGENT_RUNTIME_ARN,
+                runtimeSessionId=session_id,
+                payload=json.dumps(payload).encode("utf-8"),
+            )
+            data = first_valid_payload(response, _quiz_payload, parse_body=lambda d: d)
     except Exception as e:
         logger.exception("RMP Quiz AgentCore invocation failed: %s", e)
         return _fallback_response(payload, str(e))
 
-    content_type = response.get("contentType", "")
-    body_parts = []
-    resp_stream = response.get("response")
-    if resp_stream:
-        for chunk in resp_stream:
-            if chunk:
-                body_parts.append(chunk.decode("utf-8"))
-
-    raw = "".join(body_parts)
-    if "text/event-stream" in content_type:
-        for line in raw.splitlines():
-            if line.startswith("data: ") and line != "data: [DONE]":
-                try:
-                    data = json.loads(line[6:])
-                    if isinstance(data, dict) and (data.get("question") or "points" in data):
-                        return data
-                except json.JSONDecodeError:
-                    pass
-    else:
-        try:
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                return data
-        except json.JSONDecodeError as e:
-            logger.warning("RMP Quiz response not valid JSON: %s", e)
+    if data is not None:
+        return data
 
     return _fallback_response(payload, "Agent did not return structured response")
 
 
+def _quiz_payload(data: dict) -> dict | None:
+    """SSE payloads count only when they carry a question or points."""
+    return data if data.get("question") or "points" in data else None
+
+
 def _fallback_response(payload: dict, reason: str) -> dict:
     action = (payload.get("action") or "get_question").strip().lower()
     if action == "score_answer":
@@ -1,11 +1,17 @@
-"""Aurora persistence for RMP Learning: scores and answer history. Uses IAM auth."""
+"""Aurora persistence for RMP Learning: scores and answer history. Uses IAM auth.
+
+Every call borrows a live connection from the per-container pool (lambda_common.pool); a request that
+records an answer, updates the score and reads the rank reuses one connection instead of opening three.
+"""
 
-import json
 import logging
 import os
 import uuid
 
-import boto3
+from lambda_common.breaker import get_breaker
+from lambda_common.clients import get_client
+from lambda_common.credentials import invalidate_rds_credentials, rds_auth_token, secret_json
+from lambda_common.pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -16,42 +22,60 @@ RDS_CONFIG_SECRET = os.environ.get(
 
 
 def _get_rds_config() -> dict:
-    """Fetch RDS connection config from Secrets Manager."""
-    client = boto3.client("secretsmanager", region_name=os.environ.get("AWS_REGION", "us-east-1"))
-    response = client.get_secret_value(SecretId=RDS_CONFIG_SECRET)
-    return json.loads(response["SecretString"])
+    """RDS connection config from Secrets Manager (TTL-cached, lambda_common.credentials)."""
+    return secret_json(get_client("secretsmanager", os.environ.get("AWS_REGION", "us-east-1")), RDS_CONFIG_SECRET)
 
 
 def _get_iam_token(host: str, port: int, username: str, region: str) -> str:
-    """Generate IAM database auth token."""
-    client = boto3.client("rds", region_name=region)
-    return client.generate_db_auth_token(
-        DBHostname=host,
-        Port=port,
-        DBUsername=username,
-        Region=region,
-    )
-
-
-def _conn():
-    """Open a connection to Aurora. Caller must close."""
+    """IAM database auth token (TTL-cached well inside its 15-minute validity)."""
+    return rds_auth_token(get_client("rds", region), host, port, username, region)
+
+
+def _conn(connect_timeout: int = 15):
+    """Open a new connection to Aurora (the pool calls this). Fails fast while the "aurora" circuit is open."""
     import psycopg2
 
-    config = _get_rds_config()
-    host = config["host"]
-    port = int(config.get("port", 5432))
-    database = config["database"]
-    username = config["username"]
-    region = config.get("region", os.environ.get("AWS_REGION", "us-east-1"))
-    token = _get_iam_token(host, port, username, region)
-    return psycopg2.connect(
-        host=host,
-        port=port,
-        dbname=database,
-        user=username,
-        password=token,
-        connect_timeout=15,
-    )
+    with get_breaker("aurora").guard():
+        config = _get_rds_config()
+        host = config["host"]
+        port = int(config.get("port", 5432))
+        database = config["database"]
+        username = config["username"]
+        region = config.get("region", os.environ.get("AWS_REGION", "us-east-1"))
+        token = _get_iam_token(host, port, username, region)
+        return psycopg2.connect(
+            host=host,
+            port=port,
+            dbname=database,
+            user=username,
+            password=token,
+            connect_timeout=connect_timeout,
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
+        )
+
+
+# Late-bound so _conn can be patched in tests. An auth rejection drops the cached token and config.
+_pool = ConnectionPool(
+    lambda connect_timeout: _conn(connect_timeout),
+    on_auth_failure=lambda: invalidate_rds_credentials(RDS_CONFIG_SECRET),
+)
+
+
+def connection(connect_timeout: int = 15):
+    """Context manager: a pooled, health-checked Aurora connection, returned to the pool after the block."""
+    return _pool.connection(connect_timeout)
+
+
+def pool_stats() -> dict[str, int]:
+    return _pool.stats()
+
+
+def reset_pool() -> None:
+    """Close idle pooled connections (tests, or after the RDS config secret changes)."""
+    _pool.close()
 
 
 def upsert_rmp_score(rmp_id: str, add_points: int) -> int:
@@ -61,8 +85,7 @@ def upsert_rmp_score(rmp_id: str, add_points: int) -> int:
     """
     import psycopg2
 
-    conn = _conn()
-    try:
+    with connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -78,8 +101,6 @@ def upsert_rmp_score(rmp_id: str, add_points: int) -> int:
             row = cur.fetchone()
         conn.commit()
         return row[0] if row else 0
-    finally:
-        conn.close()
 
 
 def insert_learning_answer(
@@ -92,8 +113,7 @@ def insert_learning_answer(
     import psycopg2
 
     row_id = uuid.uuid4()
-    conn = _conn()
-    try:
+    with connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -103,8 +123,6 @@ def insert_learning_answer(
                 (str(row_id), rmp_id, (question_ref or "")[:2000], (user_answer or "")[:5000], max(0, min(10, points))),
             )
         conn.commit()
-    finally:
-        conn.close()
     return row_id
 
 
@@ -112,8 +130,7 @@ def get_leaderboard(limit: int = 20) -> list[dict]:
     """Return top RMPs by total_points. Each item: { rmp_id, total_points, rank }."""
     import psycopg2
 
-    conn = _conn()
-    try:
+    with connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -130,8 +147,6 @@ def get_leaderboard(limit: int = 20) -> list[dict]:
             {"rmp_id": r[0], "total_points": r[1], "rank": r[2]}
             for r in rows
         ]
-    finally:
-        conn.close()
 
 
 def get_my_score(rmp_id: str) -> dict | None:
@@ -141,8 +156,7 @@ def get_my_score(rmp_id: str) -> dict | None:
     """
     import psycopg2
 
-    conn = _conn()
-    try:
+    with connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT total_points FROM rmp_scores WHERE rmp_id = %s",
@@ -163,5 +177,3 @@ def get_my_score(rmp_id: str) -> dict | None:
             rank_row = cur.fetchone()
         rank = rank_row[0] if rank_row else None
         return {"total_points": total, "rank": rank}
-    finally:
-        conn.close()
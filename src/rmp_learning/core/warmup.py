@@ -0,0 +1,31 @@
+"""Warmup steps for the RMP Learning Lambda.
+
+Event detection and timing live in lambda_common.warmup."""
+
+import os
+
+from lambda_common.warmup import run_warmup
+
+# Bounds the Aurora step so a warmup returns quickly even when the cluster is unreachable (libpq minimum 2)
+WARMUP_DB_CONNECT_TIMEOUT = int(os.environ.get("WARMUP_DB_CONNECT_TIMEOUT", "3"))
+
+
+def _warm_clients() -> None:
+    from lambda_common.clients import REGION, get_client
+
+    get_client("bedrock-agentcore", REGION)
+    get_client("secretsmanager", REGION)
+    get_client("rds", REGION)
+
+
+def _warm_aurora() -> None:
+    """Open (or health-check) a pooled connection and leave it in the pool for the next request."""
+    from rmp_learning.core.db import connection
+
+    with connection(WARMUP_DB_CONNECT_TIMEOUT):
+        pass
+
+
+def warm_rmp_learning() -> dict:
+    """Warmup for the RMP Learning Lambda (POST /rmp/learning, GET /rmp/learning/me and /leaderboard)."""
+    return run_warmup("rmp_learning", [("clients", _warm_clients), ("aurora", _warm_aurora)])
@@ -1,16 +1,35 @@
-"""Lambda handler for POST /triage."""
+"""Lambda handler for POST /triage, POST /triage/batch, POST /triage/mci, POST /emergency and GET /triage/history."""
 
+import base64
+import functools
 import json
 import logging
 import os
+import time
 import uuid
+from datetime import datetime
 
+from lambda_common.warmup import is_warmup_event
+from triage.core import aio
 from triage.core.agent import assess_triage
-from triage.core.db import insert_triage_assessment
-from triage.models.triage import TriageRequest
+from triage.core.batch import TRIAGE_BATCH_MAX_ITEMS, assess_batch
+from triage.core.db import insert_triage_assessment, insert_triage_assessments, list_triage_assessments
+from triage.core.deadline import Deadline
+from triage.core.emergency import emergency_events
+from triage.core.mci import MCI_MAX_PATIENTS, SEVERITY_BY_TAG, TAG_NAMES, patient_codes, priority_order, tag_counts
+from triage.core.speculative import start_speculative_match
+from triage.core.spool import TRIAGE_WRITE_BEHIND, flush_spool, get_spool, resume_spool
+from triage.core.streaming import assess_triage_stream, format_sse
+from triage.core.warmup import warm_triage
+from triage.models.triage import TriageBatchItem, TriageHistoryQuery, TriageRequest, TriageResult
 
 logger = logging.getLogger(__name__)
 
+# Skip the Aurora insert when less than this is left on the request deadline (the response matters more)
+PERSIST_MIN_SECONDS = float(os.environ.get("TRIAGE_PERSIST_MIN_SECONDS", "2"))
+# Cognito group whose members may read every RMP's history; everyone else only sees their own rows
+TRIAGE_HISTORY_ADMIN_GROUP = os.environ.get("TRIAGE_HISTORY_ADMIN_GROUP", "admin")
+
 
 def _rmp_from_event(event: dict) -> str | None:
     """Extract RMP identifier from API Gateway Cognito authorizer. Returns sub or email for audit."""
@@ -26,65 +45,137 @@ def _rmp_from_event(event: dict) -> str | None:
         return None
 
 
+def _groups_from_event(event: dict) -> set[str]:
+    """Cognito groups of the caller (cognito:groups claim; API Gateway passes it as "[a b]" or "a,b")."""
+    try:
+        auth = (event.get("requestContext") or {}).get("authorizer") or {}
+        if not isinstance(auth, dict):
+            return set()
+        groups = auth.get("cognito:groups") or (auth.get("claims") or {}).get("cognito:groups") or []
+        if isinstance(groups, str):
+            groups = groups.strip("[]").replace(",", " ").split()
+        return {str(g) for g in groups}
+    except Exception:
+        return set()
+
+
+def _parse_body(event: dict):
+    """JSON body of the event. Raises on invalid JSON."""
+    body = event.get("body") or "{}"
+    return json.loads(body) if isinstance(body, str) else body
+
+
+def _parse_request(event: dict) -> TriageRequest:
+    """Parse and validate the POST body. Raises on invalid JSON or schema."""
+    return _validate_request(_parse_body(event), event)
+
+
+def _validate_request(body: dict, event: dict) -> TriageRequest:
+    """Validate one triage request body, filling submitted_by from rmp_id or the Cognito identity."""
+    if not isinstance(body, dict):
+        raise ValueError("Triage request must be a JSON object")
+    # Accept rmp_id as alias for submitted_by
+    if "rmp_id" in body and "submitted_by" not in body:
+        body = {**body, "submitted_by": body["rmp_id"]}
+    # RMP auth: use Cognito identity when submitted_by not in body
+    if body.get("submitted_by") is None:
+        rmp = _rmp_from_event(event)
+        if rmp:
+            body = {**body, "submitted_by": rmp}
+    return TriageRequest.model_validate(body)
+
+
+def _assessment_row(request: TriageRequest, result: TriageResult, request_id: uuid.UUID) -> dict:
+    """triage_assessments row in insert_triage_assessment keyword names."""
+    return {
+        "symptoms": request.symptoms,
+        "vitals": request.vitals,
+        "age_years": request.age_years,
+        "sex": request.sex,
+        "severity": result.severity,
+        "confidence": result.confidence,
+        "recommendations": result.recommendations,
+        "force_high_priority": result.force_high_priority,
+        "safety_disclaimer": result.safety_disclaimer,
+        "request_id": request_id,
+        "model_id": result.model_id,
+        "submitted_by": request.submitted_by,
+    }
+
+
+def _persist_assessment(
+    request: TriageRequest, result: TriageResult, context: object, deadline: Deadline | None = None
+) -> uuid.UUID | None:
+    """
+    Write the assessment to Aurora. Returns row id, or None when persistence fails or is skipped because
+    the deadline is nearly spent (non-fatal). With TRIAGE_WRITE_BEHIND the row is spooled locally and
+    written in the background (triage.core.spool); the id is returned before it reaches Aurora (unless
+    TRIAGE_SPOOL_SYNC_FLUSH opts into a bounded flush before the response).
+    """
+    request_id = uuid.uuid4()  # for DB and response correlation
+    row = _assessment_row(request, result, request_id)
+    if TRIAGE_WRITE_BEHIND:
+        try:
+            row_id = get_spool().enqueue(row)
+            logger.info("Queued triage assessment id=%s request_id=%s", row_id, request_id)
+            flush_spool(deadline)
+            return row_id
+        except Exception as spool_err:
+            logger.exception("Spool enqueue failed, persisting inline: %s", spool_err)
+    connect_timeout = 15
+    if deadline is not None:
+        remaining = deadline.remaining()
+        if remaining < PERSIST_MIN_SECONDS:
+            logger.warning("Skipping DB persist: %.2fs left on request deadline", remaining)
+            return None
+        connect_timeout = max(2, int(deadline.timeout(15, reserve=1.0)))
+    lambda_request_id = getattr(context, "aws_request_id", None) if context else None
+    if lambda_request_id:
+        logger.info("Triage success request_id=%s aws_request_id=%s", request_id, lambda_request_id)
+    try:
+        row_id = insert_triage_assessment(**row, connect_timeout=connect_timeout)
+        logger.info("Persisted triage assessment id=%s", row_id)
+        return row_id
+    except Exception as db_err:
+        logger.exception("DB persist failed (assessment succeeded): %s", db_err)
+        # Return 200 with result; persistence failure is logged but not fatal
+        return None
+
+
 def handler(event: dict, context: object) -> dict:
     """
     API Gateway Lambda proxy handler for POST /triage.
     RMP auth: Cognito User Pool authorizer; claims available in event.requestContext.authorizer.claims.
     Expects body: {"symptoms": ["..."], "vitals": {...}, "age_years": int?, "sex": str?, "submitted_by": str?, "session_id": str?, "patient_id": str?}
+    (plus patient_location_lat/lon for speculative hospital matching, see triage.core.speculative).
     If submitted_by omitted, uses Cognito sub (or email) from token for audit.
+    A warmup event (triage.core.warmup) primes clients, secrets, the Gateway token and Aurora instead.
     """
+    resume_spool()  # flush assessments spooled by earlier invocations (triage.core.spool)
+    if is_warmup_event(event):
+        return _response(200, warm_triage())
+    route = (event.get("resource") or event.get("path") or "").rstrip("/")
+    if route.endswith("/triage/history"):
+        return history_handler(event, context)
+    if event.get("httpMethod") != "POST":
+        return _response(405, {"error": "Method not allowed"})
+    if route.endswith("/triage/batch"):
+        return batch_handler(event, context)
+    if route.endswith("/triage/mci"):
+        return mci_handler(event, context)
+    if route.endswith("/emergency"):
+        return emergency_handler(event, context)
     try:
-        if event.get("httpMethod") != "POST":
-            return _response(405, {"error": "Method not allowed"})
-
-        body = event.get("body") or "{}"
-        if isinstance(body, str):
-            body = json.loads(body)
-        # Accept rmp_id as alias for submitted_by
-        if "rmp_id" in body and "submitted_by" not in body:
-            body = {**body, "submitted_by": body["rmp_id"]}
-        # RMP auth: use Cognito identity when submitted_by not in body
-        if body.get("submitted_by") is None:
-            rmp = _rmp_from_event(event)
-            if rmp:
-                body = {**body, "submitted_by": rmp}
-
-        request = TriageRequest.model_validate(body)
+        request = _parse_request(event)
     except Exception as e:
         logger.warning("Invalid request: %s", type(e).__name__)
         return _response(400, {"error": str(e)})
 
+    deadline = Deadline.from_context(context)
     try:
-        result = assess_triage(request)
-        request_id = uuid.uuid4()  # for DB and response correlation
-        lambda_request_id = getattr(context, "aws_request_id", None) if context else None
-        if lambda_request_id:
-            logger.info("Triage success request_id=%s aws_request_id=%s", request_id, lambda_request_id)
-        model_id = os.environ.get("BEDROCK_MODEL_ID")
-
-        row_id = None
-        try:
-            row_id = insert_triage_assessment(
-                symptoms=request.symptoms,
-                vitals=request.vitals,
-                age_years=request.age_years,
-                sex=request.sex,
-                severity=result.severity,
-                confidence=result.confidence,
-                recommendations=result.recommendations,
-                force_high_priority=result.force_high_priority,
-                safety_disclaimer=result.safety_disclaimer,
-                request_id=request_id,
-                bedrock_trace_id=None,
-                model_id=model_id,
-                submitted_by=request.submitted_by,
-                hospital_match_id=None,
-            )
-            logger.info("Persisted triage assessment id=%s", row_id)
-        except Exception as db_err:
-            logger.exception("DB persist failed (assessment succeeded): %s", db_err)
-            # Return 200 with result; persistence failure is logged but not fatal
-
+        result = assess_triage(request, deadline=deadline)
+        start_speculative_match(request, result, deadline)
+        row_id = _persist_assessment(request, result, context, deadline)
         response_body = result.model_dump(mode="json")
         if row_id:
             response_body["id"] = str(row_id)
@@ -94,13 +185,277 @@ def handler(event: dict, context: object) -> dict:
         return _response(500, {"error": "Triage assessment failed", "detail": str(e)})
 
 
-def _response(status_code: int, body: dict) -> dict:
-    headers = {
-        "Content-Type": "application/json",
+def stream_handler(event: dict, context: object) -> dict:
+    """
+    POST /triage streaming mode: same request as handler, SSE-formatted body (text/event-stream).
+    Emits `event: severity` as soon as severity/confidence are parsed from the model stream, then
+    `event: result` with the validated TriageResult (plus id when persisted). The frames are collected
+    into one proxy response (Python Lambdas have no response streaming), so they all arrive together
+    when the result is ready; elapsed_ms on each frame records when it was produced.
+    """
+    resume_spool()
+    if is_warmup_event(event):
+        return _response(200, warm_triage())
+    if event.get("httpMethod") != "POST":
+        return _response(405, {"error": "Method not allowed"})
+    try:
+        request = _parse_request(event)
+    except Exception as e:
+        logger.warning("Invalid request: %s", type(e).__name__)
+        return _response(400, {"error": str(e)})
+
+    deadline = Deadline.from_context(context)
+    frames = []
+    try:
+        for ev in assess_triage_stream(request, deadline=deadline):
+            if ev["event"] == "result":
+                result = TriageResult.model_validate({k: v for k, v in ev.items() if k in TriageResult.model_fields})
+                start_speculative_match(request, result, deadline)
+                row_id = _persist_assessment(request, result, context, deadline)
+                if row_id:
+                    ev = {**ev, "id": str(row_id)}
+            frames.append(format_sse(ev))
+    except Exception as e:
+        logger.exception("Triage stream failed")
+        frames.append(format_sse({"event": "error", "error": "Triage assessment failed", "detail": str(e)}))
+    return {
+        "statusCode": 200,
+        "headers": {**_cors_headers(), "Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+        "body": "".join(frames),
+    }
+
+
+def emergency_handler(event: dict, context: object) -> dict:
+    """
+    POST /emergency: one request for triage -> hospitals -> routes (triage.core.emergency). Same body as
+    POST /triage; with patient_location_lat/lon the top hospitals are routed. SSE body (text/event-stream):
+    `event: triage`, `event: hospitals`, one `event: route` per hospital, then `event: done` (with id when
+    the assessment was persisted). A failing stage ends the body with `event: error` after the frames
+    already produced. The frames are collected into one buffered proxy response (API Gateway REST; Python
+    Lambdas have no response streaming), so every stage arrives together at the end, not stage by stage;
+    elapsed_ms / timings_ms record when each stage finished.
+    """
+    resume_spool()
+    if is_warmup_event(event):
+        return _response(200, warm_triage())
+    if event.get("httpMethod") != "POST":
+        return _response(405, {"error": "Method not allowed"})
+    try:
+        request = _parse_request(event)
+    except Exception as e:
+        logger.warning("Invalid request: %s", type(e).__name__)
+        return _response(400, {"error": str(e)})
+
+    deadline = Deadline.from_context(context)
+    frames = []
+
+    async def collect():
+        persist = functools.partial(_persist_assessment, request, context=context, deadline=deadline)
+        async for ev in emergency_events(request, deadline, persist=persist):
+            frames.append(format_sse(ev))
+
+    try:
+        aio.run(collect())
+    except Exception as e:
+        logger.exception("Emergency pipeline failed")
+        frames.append(format_sse({"event": "error", "error": "Emergency pipeline failed", "detail": str(e)}))
+    return {
+        "statusCode": 200,
+        "headers": {**_cors_headers(), "Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+        "body": "".join(frames),
+    }
+
+
+def batch_handler(event: dict, context: object) -> dict:
+    """
+    POST /triage/batch (mass-casualty): body {"items": [TriageRequest, ...]} (max TRIAGE_BATCH_MAX_ITEMS).
+    Items are validated individually, assessed with bounded concurrency under one deadline, persisted in
+    one bulk insert, and returned most-urgent first with a per-item status (ok, degraded, invalid, error).
+    A bad item never fails the batch; only a malformed body or too many items returns 400.
+    """
+    resume_spool()
+    if is_warmup_event(event):
+        return _response(200, warm_triage())
+    if event.get("httpMethod") != "POST":
+        return _response(405, {"error": "Method not allowed"})
+    try:
+        body = _parse_body(event)
+        raw_items = body.get("items") if isinstance(body, dict) else body
+        if not isinstance(raw_items, list) or not raw_items:
+            raise ValueError("Body must be {\"items\": [...]} with at least one triage request")
+        if len(raw_items) > TRIAGE_BATCH_MAX_ITEMS:
+            raise ValueError(f"At most {TRIAGE_BATCH_MAX_ITEMS} items per batch")
+    except Exception as e:
+        logger.warning("Invalid batch request: %s", type(e).__name__)
+        return _response(400, {"error": str(e)})
+
+    requests: list[TriageRequest | str] = []
+    for raw in raw_items:
+        try:
+            requests.append(_validate_request(raw, event))
+        except Exception as e:
+            requests.append(str(e))
+
+    deadline = Deadline.from_context(context)
+    try:
+        items = assess_batch(requests, deadline=deadline)
+    except Exception as e:
+        logger.exception("Triage batch failed")
+        return _response(500, {"error": "Triage batch failed", "detail": str(e)})
+    items = _persist_batch(requests, items, deadline)
+    summary = {status: sum(1 for i in items if i.status == status) for status in ("ok", "degraded", "invalid", "error")}
+    return _response(
+        200,
+        {
+            "items": [i.model_dump(mode="json", exclude_none=True) for i in items],
+            "summary": {"total": len(items), **summary},
+        },
+    )
+
+
+def mci_handler(event: dict, context: object) -> dict:
+    """
+    POST /triage/mci (incident command): body {"patients": [{respiratory_rate, ambulatory, mental_status,
+    capillary_refill_s?, radial_pulse?, age_years?, breathes_after_airway?, rescue_breaths_effective?,
+    patient_id?}, ...]} (max MCI_MAX_PATIENTS). Rule-based START/JumpSTART, no model call and no DB write:
+    returns every patient's tag and severity in treatment order (red, yellow, green, black) plus counts.
+    """
+    resume_spool()
+    if is_warmup_event(event):
+        return _response(200, warm_triage())
+    if event.get("httpMethod") != "POST":
+        return _response(405, {"error": "Method not allowed"})
+    start = time.perf_counter()
+    try:
+        body = _parse_body(event)
+        patients = body.get("patients") if isinstance(body, dict) else body
+        if not isinstance(patients, list) or not patients or not all(isinstance(p, dict) for p in patients):
+            raise ValueError("Body must be {\"patients\": [...]} with at least one patient object")
+        if len(patients) > MCI_MAX_PATIENTS:
+            raise ValueError(f"At most {MCI_MAX_PATIENTS} patients per request")
+        codes = patient_codes(patients)
+    except Exception as e:
+        logger.warning("Invalid MCI request: %s", type(e).__name__)
+        return _response(400, {"error": str(e)})
+
+    out = []
+    for index in priority_order(codes):
+        code = int(codes[index])
+        item = {"index": index, "tag": TAG_NAMES[code], "severity": SEVERITY_BY_TAG[code]}
+        if patients[index].get("patient_id") is not None:
+            item["patient_id"] = patients[index]["patient_id"]
+        out.append(item)
+    counts = tag_counts(codes)
+    logger.info(
+        "Triage MCI patients=%d counts=%s duration_ms=%.2f", len(patients), counts, (time.perf_counter() - start) * 1000
+    )
+    return _response(200, {"patients": out, "counts": counts})
+
+
+def history_handler(event: dict, context: object) -> dict:
+    """
+    GET /triage/history: assessments newest first, one page at a time. Query: submitted_by ("me" = the
+    caller's Cognito identity), severity, since / until (ISO 8601, created_at range), fields (comma-separated
+    projection, id and created_at always included), limit (default 20, max 100) and cursor (next_cursor of
+    the previous page). Keyset pagination on (created_at, id): every page costs the same however deep it is.
+    An RMP only ever sees their own assessments (submitted_by is forced to the caller; naming another RMP
+    is 403); members of the TRIAGE_HISTORY_ADMIN_GROUP Cognito group may read anyone's, or all when
+    submitted_by is omitted. No Cognito identity is 401.
+    Returns {"items": [...], "next_cursor": str | null}.
+    """
+    resume_spool()
+    if event.get("httpMethod") != "GET":
+        return _response(405, {"error": "Method not allowed"})
+    caller = _rmp_from_event(event)
+    if not caller:
+        return _response(401, {"error": "Triage history requires a Cognito identity"})
+    is_admin = TRIAGE_HISTORY_ADMIN_GROUP in _groups_from_event(event)
+    try:
+        query = TriageHistoryQuery.model_validate(event.get("queryStringParameters") or {})
+        after = _decode_cursor(query.cursor) if query.cursor else None
+    except Exception as e:
+        logger.warning("Invalid history query: %s", type(e).__name__)
+        return _response(400, {"error": str(e)})
+    submitted_by = caller if query.submitted_by == "me" else query.submitted_by
+    if not is_admin:
+        if submitted_by not in (None, caller):
+            logger.warning("Triage history denied: caller=%s asked for another RMP's assessments", caller)
+            return _response(403, {"error": "You can only read your own triage history"})
+        submitted_by = caller
+
+    start = time.perf_counter()
+    try:
+        # One extra row tells whether another page exists
+        rows = list_triage_assessments(
+            query.fields,
+            submitted_by=submitted_by,
+            severity=query.severity,
+            since=query.since,
+            until=query.until,
+            after=after,
+            limit=query.limit + 1,
+        )
+    except Exception as e:
+        logger.exception("Triage history query failed")
+        return _response(500, {"error": "Failed to load triage history", "detail": str(e)})
+    next_cursor = None
+    if len(rows) > query.limit:
+        rows = rows[: query.limit]
+        next_cursor = _encode_cursor(rows[-1])
+    logger.info(
+        "Triage history rows=%d more=%s duration_ms=%.2f", len(rows), next_cursor is not None,
+        (time.perf_counter() - start) * 1000,
+    )
+    return _response(200, {"items": rows, "next_cursor": next_cursor})
+
+
+def _encode_cursor(row: dict) -> str:
+    """Opaque page cursor: the (created_at, id) of the last row returned."""
+    raw = json.dumps([row["created_at"], row["id"]], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at).isoformat(), str(uuid.UUID(str(row_id)))
+    except Exception:
+        raise ValueError("Invalid cursor") from None
+
+
+def _persist_batch(
+    requests: list[TriageRequest | str], items: list[TriageBatchItem], deadline: Deadline | None
+) -> list[TriageBatchItem]:
+    """One bulk insert for every assessed item; returns items with ids set. Failure is logged, not fatal."""
+    assessed = [i for i in items if i.result is not None]
+    if not assessed:
+        return items
+    if deadline is not None and deadline.remaining() < PERSIST_MIN_SECONDS:
+        logger.warning("Skipping batch DB persist: %.2fs left on request deadline", deadline.remaining())
+        return items
+    rows = [_assessment_row(requests[item.index], item.result, uuid.uuid4()) for item in assessed]
+    connect_timeout = 15 if deadline is None else max(2, int(deadline.timeout(15, reserve=1.0)))
+    try:
+        row_ids = insert_triage_assessments(rows, connect_timeout=connect_timeout)
+    except Exception as db_err:
+        logger.exception("Batch DB persist failed (assessments succeeded): %s", db_err)
+        return items
+    logger.info("Persisted triage batch rows=%d", len(row_ids))
+    ids = {item.index: str(row_id) for item, row_id in zip(assessed, row_ids)}
+    return [i.model_copy(update={"id": ids[i.index]}) if i.index in ids else i for i in items]
+
+
+def _cors_headers() -> dict:
+    return {
         "Access-Control-Allow-Origin": "*",
         "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization",
         "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
     }
+
+
+def _response(status_code: int, body: dict) -> dict:
+    headers = {"Content-Type": "application/json", **_cors_headers()}
     return {
         "statusCode": status_code,
         "headers": headers,
@@ -7,15 +7,28 @@ Uses best practices from:
 - AC-2: AgentCore Runtime when USE_AGENTCORE_TRIAGE and TRIAGE_AGENT_RUNTIME_ARN set
 """
 
+import asyncio
 import json
 import logging
 import os
 import time
 import uuid
-
-import boto3
-
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from lambda_common.breaker import get_breaker, is_open, would_allow
+from lambda_common.clients import get_client
+from lambda_common.sse import first_valid_payload
+from triage.core import aio
+from triage.core.cache import get_result_cache
+from triage.core.cascade import escalation_reason, model_tiers, record_tier, replaces_answer
+from triage.core.deadline import Deadline, stage_timeout
+from triage.core.hedging import hedged_call
 from triage.core.instructions import TRIAGE_SYSTEM_PROMPT, TRIAGE_SYSTEM_PROMPT_WITH_EKA
+from triage.core.prompt_cache import cached_messages, cached_tool_config, log_usage, system_blocks
+from triage.core.red_flags import evaluate_red_flags
+from triage.core.symptoms import prompt_symptoms
+from triage.core.tool_results import EKA_ROUND_TOKEN_BUDGET, compact_tool_result, estimate_tokens
 from triage.core.tools import get_triage_tool_config, get_triage_tool_config_with_eka
 from triage.models.triage import TriageRequest, TriageResult
 
@@ -26,6 +39,33 @@ AGENT_ALIAS_ID = os.environ.get("BEDROCK_AGENT_ALIAS_ID", "TSTALIASID")
 USE_AGENTCORE_TRIAGE = os.environ.get("USE_AGENTCORE_TRIAGE", "").lower() in ("1", "true", "yes")
 TRIAGE_AGENT_RUNTIME_ARN = os.environ.get("TRIAGE_AGENT_RUNTIME_ARN", "")
 REGION = os.environ.get("AWS_REGION", "us-east-1")
+# Red-flag pre-triage: answer obvious critical cases from rules before calling the LLM
+RED_FLAG_PRETRIAGE = os.environ.get("RED_FLAG_PRETRIAGE", "true").lower() in ("1", "true", "yes")
+# When > 0, still run the LLM for red-flag patients and merge its recommendations if it answers within this budget
+RED_FLAG_ENRICH_TIMEOUT_MS = int(os.environ.get("RED_FLAG_ENRICH_TIMEOUT_MS", "0"))
+
+# Eka toolUse blocks within one Converse round run concurrently (at most this many in flight)
+TOOL_CALL_MAX_WORKERS = int(os.environ.get("TOOL_CALL_MAX_WORKERS", "4"))
+TOOL_CALL_TIMEOUT_SECONDS = float(os.environ.get("TOOL_CALL_TIMEOUT_SECONDS", "12"))
+EKA_TOOL_NAMES = ("search_indian_medications", "search_treatment_protocols")
+
+# Hedging: if the primary backend has no valid result after TRIAGE_HEDGE_DELAY_MS, also start the secondary
+TRIAGE_HEDGE_ENABLED = os.environ.get("TRIAGE_HEDGE_ENABLED", "").lower() in ("1", "true", "yes")
+TRIAGE_HEDGE_DELAY_MS = int(os.environ.get("TRIAGE_HEDGE_DELAY_MS", "6000"))
+TRIAGE_HEDGE_SECONDARY = os.environ.get("TRIAGE_HEDGE_SECONDARY", "converse").strip().lower()
+
+# Deadline handling (see triage.core.deadline): force submit below FORCE_SUBMIT_SECONDS, skip model calls below MIN
+FORCE_SUBMIT_SECONDS = float(os.environ.get("TRIAGE_FORCE_SUBMIT_SECONDS", "8"))
+MIN_MODEL_CALL_SECONDS = float(os.environ.get("TRIAGE_MIN_MODEL_CALL_SECONDS", "2"))
+# Send symptoms to the model with synonyms and regional terms rewritten to canonical words and duplicates dropped
+# (triage.core.symptoms.prompt_symptoms); all other text, numbers included, is kept as written
+TRIAGE_PROMPT_CANONICAL_SYMPTOMS = os.environ.get("TRIAGE_PROMPT_CANONICAL_SYMPTOMS", "true").lower() in ("1", "true", "yes")
+
+# Threads for deadline-bounded blocking model calls (AgentCore, ConverseStream); see _call_within_deadline
+MODEL_CALL_MAX_WORKERS = int(os.environ.get("TRIAGE_MODEL_CALL_MAX_WORKERS", "16"))
+
+_enrich_executor: ThreadPoolExecutor | None = None
+_model_call_executor: ThreadPoolExecutor | None = None
 
 
 def _build_user_prompt(request: TriageRequest) -> str:
@@ -33,7 +73,8 @@ def _build_user_prompt(request: TriageRequest) -> str:
     parts = [
         "Assess this patient and call submit_triage_result with your assessment.",
         "",
-        "Symptoms: " + ", ".join(request.symptoms),
+        "Symptoms: "
+        + ", ".join(prompt_symptoms(request.symptoms) if TRIAGE_PROMPT_CANONICAL_SYMPTOMS else request.symptoms),
         "Vitals: " + (json.dumps(request.vitals) if request.vitals else "No vitals provided."),
     ]
     if request.age_years is not None:
@@ -85,35 +126,228 @@ def _safety_fallback(reason: str) -> TriageResult:
     )
 
 
-def assess_triage(request: TriageRequest) -> TriageResult:
+def assess_triage(request: TriageRequest, deadline: Deadline | None = None) -> TriageResult:
     """
     Invoke AgentCore (AC-2), Bedrock Agent, or Converse API for triage assessment.
     Uses tool use / Return Control for structured output; validates with Pydantic.
     When Gateway is configured, Converse can use Eka tools (search_medications, search_protocols) before submitting.
+    Red-flag vitals/symptoms short-circuit to a rule-based critical/high result (see triage.core.red_flags).
+    When TRIAGE_CACHE_ENABLED, near-identical requests are served from triage.core.cache (result.cached=True).
+    deadline (from the handler) bounds every downstream stage; when it runs out a degraded-but-valid result is returned.
     """
     start = time.perf_counter()
+    early = _pretriage(request, start, deadline)
+    if early:
+        return early
+    result = _assess_via_backend(request, start, deadline)
+    _remember(request, result)
+    return result
+
+
+async def assess_triage_async(request: TriageRequest, deadline: Deadline | None = None) -> TriageResult:
+    """
+    assess_triage for event-loop callers (async agent runtimes, scripts/bench_aio.py). The plain Converse path
+    (no hedge) runs natively on the loop, so one process can drive many assessments at once. Pre-triage (red-flag
+    enrichment may call a backend), hedging and the AgentCore / Bedrock Agent backends may call aio.run
+    themselves, so they run via aio.run_reentrant; the cache write via aio.run_blocking.
+    """
+    start = time.perf_counter()
+    early = await aio.run_reentrant(_pretriage, request, start, deadline)
+    if early:
+        return early
+    primary = _available_backend(_primary_backend())
+    if primary == "converse" and _hedge_secondary(primary) is None:
+        result = await _assess_via_converse_async(request, deadline)
+        _log_trace(primary, start)
+    else:
+        result = await aio.run_reentrant(_assess_via_backend, request, start, deadline)
+    await aio.run_blocking(_remember, request, result)
+    return result
+
+
+def _pretriage(request: TriageRequest, start: float, deadline: Deadline | None = None) -> TriageResult | None:
+    """Red-flag short-circuit or cache hit, whichever answers first; None when a backend must be asked."""
+    if RED_FLAG_PRETRIAGE:
+        flagged = evaluate_red_flags(request)
+        if flagged:
+            if RED_FLAG_ENRICH_TIMEOUT_MS > 0:
+                flagged = _enrich_red_flag_result(flagged, request, deadline)
+            _log_trace("red_flag", start)
+            return flagged
+    cache = get_result_cache()
+    if cache is not None:
+        hit = cache.get(request)
+        if hit:
+            result, tier = hit
+            _log_trace(f"cache_{tier}", start)
+            return result
+    return None
+
+
+def _remember(request: TriageRequest, result: TriageResult) -> None:
+    cache = get_result_cache()
+    if cache is not None:
+        cache.put(request, result)
+
+
+def _primary_backend() -> str:
+    """Name of the configured backend: agentcore, bedrock_agent, or converse."""
     if USE_AGENTCORE_TRIAGE and TRIAGE_AGENT_RUNTIME_ARN:
-        result = _assess_via_agentcore(request)
-        _log_trace("agentcore", start)
-        return result
+        return "agentcore"
     if AGENT_ID:
-        result = _assess_via_agent(request)
-        _log_trace("bedrock_agent", start)
-        return result
-    result = _assess_via_converse(request)
-    _log_trace("converse", start)
+        return "bedrock_agent"
+    return "converse"
+
+
+def _backend_fn(name: str):
+    return {
+        "agentcore": _assess_via_agentcore,
+        "bedrock_agent": _assess_via_agent,
+        "converse": _assess_via_converse,
+    }[name]
+
+
+def _available_backend(primary: str) -> str | None:
+    """
+    primary, or converse when primary's circuit would reject the call (open, or half-open with its probe in
+    flight); None when every candidate would.
+    """
+    for name in dict.fromkeys((primary, "converse")):
+        if would_allow(name):
+            if name != primary:
+                logger.warning("Triage failover from=%s to=%s reason=circuit_open", primary, name)
+            return name
+    return None
+
+
+def _is_safety_fallback(result: TriageResult) -> bool:
+    """_safety_fallback results carry confidence 0.0; no real assessment does."""
+    return result.confidence == 0.0
+
+
+def _hedge_secondary(primary: str) -> str | None:
+    """Backend to hedge primary with, or None when hedging is off, misconfigured or its circuit would reject it."""
+    if TRIAGE_HEDGE_ENABLED and TRIAGE_HEDGE_SECONDARY in ("agentcore", "bedrock_agent", "converse") and (
+        TRIAGE_HEDGE_SECONDARY != primary
+    ) and would_allow(TRIAGE_HEDGE_SECONDARY):
+        return TRIAGE_HEDGE_SECONDARY
+    return None
+
+
+def _assess_via_backend(request: TriageRequest, start: float, deadline: Deadline | None = None) -> TriageResult:
+    """
+    Dispatch to the configured LLM backend (AgentCore, Bedrock Agent, or Converse), hedged when enabled.
+    Backends whose circuit is open (lambda_common.breaker) are skipped without waiting for a timeout.
+    """
+    primary = _available_backend(_primary_backend())
+    if primary is None:
+        _log_trace("circuit_open", start)
+        return _safety_fallback("All triage backends unavailable (circuit open)")
+    secondary = _hedge_secondary(primary)
+    if secondary:
+        return _assess_hedged(request, primary, secondary, start, deadline)
+    result = _backend_fn(primary)(request, deadline=deadline)
+    _log_trace(primary, start)
+    return result
+
+
+def _assess_hedged(
+    request: TriageRequest, primary: str, secondary: str, start: float, deadline: Deadline | None = None
+) -> TriageResult:
+    """First result that validates as a real TriageResult wins (see triage.core.hedging)."""
+    result, winner, invalid = hedged_call(
+        (primary, lambda: _backend_fn(primary)(request, deadline=deadline)),
+        (secondary, lambda: _backend_fn(secondary)(request, deadline=deadline)),
+        TRIAGE_HEDGE_DELAY_MS / 1000,
+        is_valid=lambda r: isinstance(r, TriageResult) and not _is_safety_fallback(r),
+    )
+    if result is None:
+        result = invalid or _safety_fallback("No triage backend returned a valid result")
+        winner = "none"
+    _log_trace(f"hedge_{winner}", start)
     return result
 
 
+def _enrich_red_flag_result(
+    flagged: TriageResult, request: TriageRequest, deadline: Deadline | None = None
+) -> TriageResult:
+    """
+    Run the LLM in the background for a red-flag patient; merge its recommendations if it answers in time.
+    Severity never drops below the rule result and force_high_priority stays True.
+    """
+    global _enrich_executor
+    if _enrich_executor is None:
+        _enrich_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="red-flag-enrich")
+    future = _enrich_executor.submit(_assess_via_backend, request, time.perf_counter(), deadline)
+    try:
+        llm = future.result(timeout=stage_timeout(deadline, RED_FLAG_ENRICH_TIMEOUT_MS / 1000))
+    except FutureTimeoutError:
+        logger.info("Red-flag enrichment timed out after %d ms; returning rule result", RED_FLAG_ENRICH_TIMEOUT_MS)
+        return flagged
+    except Exception as e:
+        logger.warning("Red-flag enrichment failed: %s", e)
+        return flagged
+    if _is_safety_fallback(llm):
+        return flagged
+    recommendations = list(flagged.recommendations)
+    for rec in llm.recommendations:
+        if rec not in recommendations:
+            recommendations.append(rec)
+    severity = "critical" if "critical" in (flagged.severity, llm.severity) else flagged.severity
+    return flagged.model_copy(
+        update={
+            "severity": severity,
+            "recommendations": TriageResult.recommendations_truncate(recommendations),
+            "session_id": llm.session_id or flagged.session_id,
+        }
+    )
+
+
+def _get_model_call_executor() -> ThreadPoolExecutor:
+    global _model_call_executor
+    if _model_call_executor is None:
+        _model_call_executor = ThreadPoolExecutor(max_workers=MODEL_CALL_MAX_WORKERS, thread_name_prefix="model-call")
+    return _model_call_executor
+
+
+def _call_within_deadline(deadline: Deadline | None, fn, *args, **kwargs):
+    """
+    Run a blocking model call (AgentCore invoke, ConverseStream open) bounded by the deadline. The shared
+    client allows read_timeout x max_attempts per call, far past API Gateway's 29 s, so the deadline decides:
+    TimeoutError once it passes. The abandoned call ends on its own thread at botocore's read timeout.
+    """
+    if deadline is None:
+        return fn(*args, **kwargs)
+    timeout = deadline.remaining()
+    future = _get_model_call_executor().submit(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        raise TimeoutError(f"Model call exceeded the remaining time budget ({timeout:.1f}s)") from None
+
+
+async def _await_within_deadline(deadline: Deadline | None, awaitable):
+    """Await a run_blocking model call, raising TimeoutError once the deadline passes (see _call_within_deadline)."""
+    if deadline is None:
+        return await awaitable
+    timeout = deadline.remaining()
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Model call exceeded the remaining time budget ({timeout:.1f}s)") from None
+
+
 def _log_trace(source: str, start: float) -> None:
     """Emit trace log for observability (CloudWatch Logs Insights)."""
     duration_ms = (time.perf_counter() - start) * 1000
     logger.info("Triage source=%s duration_ms=%.2f", source, duration_ms)
 
 
-def _assess_via_agentcore(request: TriageRequest) -> TriageResult:
+def _assess_via_agentcore(request: TriageRequest, deadline: Deadline | None = None) -> TriageResult:
     """Invoke AgentCore Runtime triage agent (AC-2). Uses request.session_id for memory continuity (AC-3)."""
-    client = boto3.client("bedrock-agentcore", region_name=REGION)
+    if deadline is not None and deadline.remaining() < MIN_MODEL_CALL_SECONDS:
+        return _safety_fallback("Time budget exhausted before AgentCore call")
+    client = get_client("bedrock-agentcore", REGION)
     # AgentCore requires runtimeSessionId length >= 33 (e.g. UUID); use client's if valid else generate
     raw_session = request.session_id or ""
     session_id = raw_session if len(raw_session) >= 33 else str(uuid.uuid4())
@@ -126,64 +360,46 @@ def _assess_via_agentcore(request: TriageRequest) -> TriageResult:
     if request.patient_id:
         payload["patient_id"] = request.patient_id
 
+    def invoke() -> TriageResult | None:
+        # Stream read errors count against the breaker as well as the invoke call
+        with get_breaker("agentcore").guard():
+            response = client.invoke_agent_runtime(
+                agentRuntimeArn=TRIAGE_AGENT_RUNTIME_ARN,
+                runtimeSessionId=session_id,
+                payload=json.dumps(payload).encode("utf-8"),
+            )
+            return first_valid_payload(response, _tool_input_to_result)
+
     try:
-        response = client.invoke_agent_runtime(
-            agentRuntimeArn=TRIAGE_AGENT_RUNTIME_ARN,
-            runtimeSessionId=session_id,
-            payload=json.dumps(payload).encode("utf-8"),
-        )
+        # Invoke and response read together end by the deadline
+        result = _call_within_deadline(deadline, invoke)
     except Exception as e:
         logger.error("AgentCore triage invocation failed: %s", e)
         out = _safety_fallback(str(e))
         out.session_id = session_id
         return out
 
-    content_type = response.get("contentType", "")
-    body_parts = []
-    resp_stream = response.get("response")
-    if resp_stream:
-        for chunk in resp_stream:
-            if chunk:
-                body_parts.append(chunk.decode("utf-8"))
-
-    raw = "".join(body_parts)
-    if "text/event-stream" in content_type:
-        for line in raw.splitlines():
-            if line.startswith("data: ") and line != "data: [DONE]":
-                try:
-                    data = json.loads(line[6:])
-                    if isinstance(data, dict):
-                        result = _tool_input_to_result(data)
-                        if result:
-                            result.session_id = session_id
-                            return result
-                except json.JSONDecodeError:
-                    pass
-    else:
-        try:
-            data = json.loads(raw)
-            if isinstance(data, dict):
-                result = _tool_input_to_result(data)
-                if result:
-                    result.session_id = session_id
-                    return result
-        except json.JSONDecodeError as e:
-            logger.warning("AgentCore triage response not valid JSON: %s", e)
+    if result:
+        result.session_id = session_id
+        return result
 
     out = _safety_fallback("AgentCore did not return structured triage result")
     out.session_id = session_id
     return out
 
 
-def _assess_via_agent(request: TriageRequest) -> TriageResult:
+def _assess_via_agent(request: TriageRequest, deadline: Deadline | None = None) -> TriageResult:
     """Invoke Bedrock Agent; extract structured result from Return Control or tool use."""
-    client = boto3.client("bedrock-agent-runtime", region_name=REGION)
+    if deadline is not None and deadline.remaining() < MIN_MODEL_CALL_SECONDS:
+        return _safety_fallback("Time budget exhausted before Bedrock Agent call")
+    client = get_client("bedrock-agent-runtime", REGION)
     session_id = str(uuid.uuid4())
     user_prompt = _build_user_prompt(request)
     full_prompt = f"{TRIAGE_SYSTEM_PROMPT}\n\n{user_prompt}"
 
-    try:
-        response = client.invoke_agent(
+    def invoke() -> TriageResult | None:
+        response = get_breaker("bedrock_agent").call(
+            client.invoke_agent,
             agentId=AGENT_ID,
             agentAliasId=AGENT_ALIAS_ID,
             sessionId=session_id,
@@ -191,123 +407,271 @@ def _assess_via_agent(request: TriageRequest) -> TriageResult:
             enableTrace=True,
             endSession=True,
         )
+        for event in response.get("completion", []):
+            if "returnControl" in event:
+                rc = event["returnControl"]
+                for inv in rc.get("invocationInputs", []):
+                    fi = inv.get("functionInvocationInput", {})
+                    if fi.get("function") == "submit_triage_result":
+                        result = _params_to_triage_result(fi.get("parameters", []))
+                        if result:
+                            return result
+        return None
+
+    try:
+        result = _call_within_deadline(deadline, invoke)
+    except TimeoutError as e:
+        logger.error("Agent invocation timed out: %s", e)
+        return _safety_fallback(str(e))
     except Exception as e:
         logger.error("Agent invocation failed: %s", e)
         raise
-
-    for event in response.get("completion", []):
-        if "returnControl" in event:
-            rc = event["returnControl"]
-            for inv in rc.get("invocationInputs", []):
-                fi = inv.get("functionInvocationInput", {})
-                if fi.get("function") == "submit_triage_result":
-                    params = fi.get("parameters", [])
-                    result = _params_to_triage_result(params)
-                    if result:
-                        result.session_id = request.session_id
-                        return result
+    if result:
+        result.session_id = request.session_id
+        return result
 
     return _safety_fallback("Agent did not return structured triage result")
 
 
-def _assess_via_converse(request: TriageRequest) -> TriageResult:
+async def _run_eka_tool_async(
+    name: str, tool_input: dict, timeout: float = 15, token_budget: int = EKA_ROUND_TOKEN_BUDGET
+) -> tuple[str, int]:
+    """
+    Execute one Eka tool via Gateway. Returns (text for the toolResult block, tokens saved by compaction
+    versus the full pretty-printed result); see triage.core.tool_results.
     """
-    Use Converse API with tool use (Claude Cookbook pattern).
+    from triage.core.gateway_client import asearch_medications, asearch_protocols
+
+    try:
+        logger.info("Triage calling Eka: %s", name)
+        with get_breaker("eka").guard():
+            if name == "search_indian_medications":
+                out = await asearch_medications(
+                    drug_name=tool_input.get("drug_name"),
+                    form=tool_input.get("form"),
+                    generic_names=tool_input.get("generic_names"),
+                    timeout=timeout,
+                )
+            else:
+                out = await asearch_protocols(queries=tool_input.get("queries", []), timeout=timeout)
+    except Exception as e:
+        return f"Error: {e}", 0
+    text = compact_tool_result(name, out, tool_input, token_budget)
+    raw_tokens = estimate_tokens(json.dumps(out, indent=2, default=str))
+    return text, max(0, raw_tokens - estimate_tokens(text))
+
+
+async def _run_tool_uses_async(
+    tool_uses: list[dict], gateway_ok: bool, deadline: Deadline | None = None
+) -> list[dict]:
+    """
+    Run the non-submit toolUse blocks of one Converse round. Eka calls run concurrently on the event loop
+    (at most TOOL_CALL_MAX_WORKERS at once), the round limited to TOOL_CALL_TIMEOUT_SECONDS (less when the
+    deadline is closer, keeping FORCE_SUBMIT_SECONDS for the final round); results keep toolUseId order.
+    """
+    timeout = stage_timeout(deadline, TOOL_CALL_TIMEOUT_SECONDS, reserve=FORCE_SUBMIT_SECONDS)
+    eka_calls = sum(1 for tool in tool_uses if tool.get("name") in EKA_TOOL_NAMES) if gateway_ok else 0
+    token_budget = EKA_ROUND_TOKEN_BUDGET // max(1, eka_calls)
+    semaphore = asyncio.Semaphore(TOOL_CALL_MAX_WORKERS)
+
+    async def limited(name: str, tool_input: dict) -> tuple[str, int]:
+        async with semaphore:
+            return await _run_eka_tool_async(name, tool_input, timeout, token_budget)
+
+    tool_results: list[dict] = []
+    pending = []
+    for tool in tool_uses:
+        name = tool.get("name", "")
+        tool_id = tool.get("toolUseId", "")
+        if name == "submit_triage_result":
+            # Reached only when validation failed (valid submits return before this)
+            tool_results.append({"toolUseId": tool_id, "text": "Invalid tool input."})
+        elif name in EKA_TOOL_NAMES and gateway_ok:
+            task = asyncio.ensure_future(limited(name, tool.get("input", {}) or {}))
+            pending.append((len(tool_results), name, task))
+            tool_results.append({"toolUseId": tool_id, "text": ""})
+        else:
+            tool_results.append({"toolUseId": tool_id, "text": "Tool not available."})
+    if pending:
+        start = time.perf_counter()
+        await asyncio.wait([task for _, _, task in pending], timeout=timeout)
+        for idx, name, task in pending:
+            if task.done():
+                text, saved = task.result()
+                tool_results[idx].update(text=text, tokens_saved=saved)
+            else:
+                task.cancel()
+                logger.warning("Triage tool %s timed out after %.1fs", name, timeout)
+                tool_results[idx]["text"] = f"Error: {name} timed out"
+        logger.info(
+            "Triage tools round tool_count=%d duration_ms=%.2f tokens=%d tokens_saved=%d",
+            len(pending),
+            (time.perf_counter() - start) * 1000,
+            sum(estimate_tokens(tool_results[idx]["text"]) for idx, _, _ in pending),
+            sum(tool_results[idx].get("tokens_saved", 0) for idx, _, _ in pending),
+        )
+    return tool_results
+
+
+def _run_tool_uses(tool_uses: list[dict], gateway_ok: bool, deadline: Deadline | None = None) -> list[dict]:
+    """Sync adapter for _run_tool_uses_async (streaming path)."""
+    return aio.run(_run_tool_uses_async(tool_uses, gateway_ok, deadline))
+
+
+def _eka_available() -> bool:
+    """Gateway configured and neither the gateway nor the eka circuit is open."""
+    from triage.core.gateway_client import is_gateway_configured
+
+    if not is_gateway_configured():
+        logger.warning(
+            "Eka tools disabled: Gateway not configured. Ensure GATEWAY_CONFIG_SECRET_NAME is set on this Lambda and "
+            "the gateway-config secret (from setup_agentcore_gateway.py) contains gateway_url and client_info."
+        )
+        return False
+    if is_open("gateway") or is_open("eka"):
+        logger.warning("Eka tools skipped: circuit open (gateway=%s eka=%s)", is_open("gateway"), is_open("eka"))
+        return False
+    return True
+
+
+def _round_tool_config(tool_config: dict, deadline: Deadline | None, round_no: int) -> dict | None:
+    """
+    toolConfig for the next Converse round given the deadline. Forces submit_triage_result when less than
+    FORCE_SUBMIT_SECONDS remain; None when less than MIN_MODEL_CALL_SECONDS remain (caller degrades).
+    """
+    if deadline is None:
+        return tool_config
+    remaining = deadline.remaining()
+    if remaining < MIN_MODEL_CALL_SECONDS:
+        logger.warning("Triage deadline: %.2fs left before round %d; returning degraded result", remaining, round_no)
+        return None
+    if remaining < FORCE_SUBMIT_SECONDS and len(tool_config.get("tools", [])) > 1:
+        logger.info("Triage deadline: %.2fs left; forcing submit_triage_result in round %d", remaining, round_no)
+        return {**tool_config, "toolChoice": {"tool": {"name": "submit_triage_result"}}}
+    return tool_config
+
+
+def _assess_via_converse(request: TriageRequest, deadline: Deadline | None = None) -> TriageResult:
+    """Sync adapter for _assess_via_converse_async."""
+    return aio.run(_assess_via_converse_async(request, deadline))
+
+
+async def _assess_via_converse_async(request: TriageRequest, deadline: Deadline | None = None) -> TriageResult:
+    """
+    Converse triage through the model cascade (triage.core.cascade): each tier in TRIAGE_MODEL_TIERS answers in
+    turn until one needs no escalation. A tier that fails validation never replaces an earlier valid answer, an
+    escalated tier never lowers the severity of one (the most severe valid answer is kept), and no escalation
+    starts with less than MIN_MODEL_CALL_SECONDS left on the deadline.
+    """
+    tiers = model_tiers()
+    gateway_ok = await aio.run_blocking(_eka_available)
+    best = None
+    best_valid = False
+    for tier, model_id in enumerate(tiers):
+        if best is not None and deadline is not None and deadline.remaining() < MIN_MODEL_CALL_SECONDS:
+            logger.warning("Triage cascade: %.2fs left; not escalating to tier=%d", deadline.remaining(), tier)
+            break
+        start = time.perf_counter()
+        result = await _converse_with_model_async(request, model_id, gateway_ok, deadline)
+        result.model_id = model_id
+        fallback = _is_safety_fallback(result)
+        reason = escalation_reason(result, fallback) if tier < len(tiers) - 1 else None
+        record_tier(tier, model_id, (time.perf_counter() - start) * 1000, reason)
+        if best is None or (not fallback and (not best_valid or replaces_answer(best, result))):
+            best, best_valid = result, not fallback
+        if reason is None:
+            break
+    return best
+
+
+async def _converse_with_model_async(
+    request: TriageRequest, model_id: str, gateway_ok: bool, deadline: Deadline | None = None
+) -> TriageResult:
+    """
+    Use Converse API with tool use (Claude Cookbook pattern). The boto3 call runs on the aio executor; Eka
+    tool rounds are awaited natively, so one event loop can drive many of these loops at once.
     When Gateway/Eka is configured, model may call search_indian_medications or search_treatment_protocols
     before submit_triage_result; we execute those via Gateway and loop until submit_triage_result.
+    With a deadline, the last round(s) force submit_triage_result once less than FORCE_SUBMIT_SECONDS remain,
+    and no round starts with less than MIN_MODEL_CALL_SECONDS (degraded safety result instead of a 504). A
+    round still running when the deadline passes is abandoned for the same safety result.
     """
-    from triage.core.gateway_client import is_gateway_configured, search_medications, search_protocols
-
-    gateway_ok = is_gateway_configured()
-    tool_config = get_triage_tool_config_with_eka()
+    tool_config = get_triage_tool_config_with_eka() if gateway_ok else get_triage_tool_config()
     num_tools = len(tool_config.get("tools", []))
     system_prompt = TRIAGE_SYSTEM_PROMPT_WITH_EKA if gateway_ok else TRIAGE_SYSTEM_PROMPT
 
     logger.info(
-        "Triage Converse: gateway_configured=%s tool_count=%d system_prompt=%s",
+        "Triage Converse: model=%s gateway_configured=%s tool_count=%d system_prompt=%s",
+        model_id,
         gateway_ok,
         num_tools,
         "with_eka" if gateway_ok else "base",
     )
-    if not gateway_ok:
-        logger.warning(
-            "Eka tools disabled: Gateway not configured. Ensure GATEWAY_CONFIG_SECRET_NAME is set on this Lambda and "
-            "the gateway-config secret (from setup_agentcore_gateway.py) contains gateway_url and client_info."
-        )
 
-    model_id = os.environ.get("BEDROCK_MODEL_ID", "us.anthropic.claude-3-5-sonnet-v2:0")
-    client = boto3.client("bedrock-runtime", region_name=REGION)
+    client = get_client("bedrock-runtime", REGION)
     user_prompt = _build_user_prompt(request)
 
     messages = [
         {"role": "user", "content": [{"text": user_prompt}]},
     ]
     max_rounds = 8
-    for _ in range(max_rounds):
-        try:
-            response = client.converse(
-                modelId=model_id,
-                messages=messages,
-                system=[{"text": system_prompt}],
-                toolConfig=tool_config,
-                inferenceConfig={"maxTokens": 1024},
-            )
-        except Exception as e:
-            logger.error("Converse invocation failed: %s", e)
-            return _safety_fallback(str(e))
-        output = response.get("output", {})
-        stop_reason = response.get("stopReason", "")
-        msg = output.get("message", {})
-
-        if stop_reason == "tool_use":
-            content = msg.get("content", [])
-            tool_results = []
-            for block in content:
-                if "toolUse" in block:
-                    tool = block["toolUse"]
-                    name = tool.get("name", "")
-                    tool_id = tool.get("toolUseId", "")
-                    tool_input = tool.get("input", {}) or {}
-                    if name == "submit_triage_result":
-                        result = _tool_input_to_result(tool_input)
+    # Compaction savings (triage.core.tool_results), counted once per round the results are re-sent
+    resent_saved = 0
+    input_tokens_saved = 0
+    try:
+        for round_no in range(max_rounds):
+            round_tool_config = _round_tool_config(tool_config, deadline, round_no)
+            if round_tool_config is None:
+                return _safety_fallback("Time budget exhausted before assessment completed")
+            # Every compacted tool result is re-sent on each later round
+            input_tokens_saved += resent_saved
+            try:
+                response = await _await_within_deadline(
+                    deadline,
+                    aio.run_blocking(
+                        get_breaker("converse").call,
+                        client.converse,
+                        modelId=model_id,
+                        messages=cached_messages(messages),
+                        system=system_blocks(system_prompt),
+                        toolConfig=cached_tool_config(round_tool_config),
+                        inferenceConfig={"maxTokens": 1024},
+                    ),
+                )
+            except Exception as e:
+                logger.error("Converse invocation failed: %s", e)
+                return _safety_fallback(str(e))
+            log_usage("converse", response.get("usage"))
+            output = response.get("output", {})
+            stop_reason = response.get("stopReason", "")
+            msg = output.get("message", {})
+
+            if stop_reason == "tool_use":
+                content = msg.get("content", [])
+                tool_uses = [block["toolUse"] for block in content if "toolUse" in block]
+                for tool in tool_uses:
+                    if tool.get("name") == "submit_triage_result":
+                        result = _tool_input_to_result(tool.get("input", {}) or {})
                         if result:
                             result.session_id = request.session_id
                             return result
-                        tool_results.append({"toolUseId": tool_id, "text": "Invalid tool input."})
-                    elif name == "search_indian_medications" and is_gateway_configured():
-                        try:
-                            logger.info("Triage calling Eka: search_indian_medications")
-                            out = search_medications(
-                                drug_name=tool_input.get("drug_name"),
-                                form=tool_input.get("form"),
-                                generic_names=tool_input.get("generic_names"),
-                            )
-                            text = json.dumps(out.get("medications", out), indent=2)
-                        except Exception as e:
-                            text = f"Error: {e}"
-                        tool_results.append({"toolUseId": tool_id, "text": text})
-                    elif name == "search_treatment_protocols" and is_gateway_configured():
-                        try:
-                            logger.info("Triage calling Eka: search_treatment_protocols")
-                            out = search_protocols(queries=tool_input.get("queries", []))
-                            text = json.dumps(out.get("protocols", out), indent=2)
-                        except Exception as e:
-                            text = f"Error: {e}"
-                        tool_results.append({"toolUseId": tool_id, "text": text})
-                    else:
-                        tool_results.append({"toolUseId": tool_id, "text": "Tool not available."})
-            if tool_results:
-                messages.append({"role": "assistant", "content": content})
-                messages.append({
-                    "role": "user",
-                    "content": [
-                        {"toolResult": {"toolUseId": tr["toolUseId"], "content": [{"text": tr["text"]}]}}
-                        for tr in tool_results
-                    ],
-                })
+                tool_results = await _run_tool_uses_async(tool_uses, gateway_ok, deadline)
+                resent_saved += sum(tr.get("tokens_saved", 0) for tr in tool_results)
+                if tool_results:
+                    messages.append({"role": "assistant", "content": content})
+                    messages.append({
+                        "role": "user",
+                        "content": [
+                            {"toolResult": {"toolUseId": tr["toolUseId"], "content": [{"text": tr["text"]}]}}
+                            for tr in tool_results
+                        ],
+                    })
+                else:
+                    break
             else:
                 break
-        else:
-            break
+    finally:
+        if input_tokens_saved:
+            logger.info("Triage tool results input_tokens_saved=%d", input_tokens_saved)
 
     return _safety_fallback("Model did not call submit_triage_result tool")
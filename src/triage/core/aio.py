@@ -0,0 +1,123 @@
+"""Asyncio orchestration core: one event loop waits on many downstreams at once.
+
+The Converse loop, Eka tool rounds and Gateway MCP calls are coroutines. boto3 (Bedrock, Secrets Manager),
+psycopg2 and urllib (Gateway HTTP, via http_request) are blocking, so they run on a shared bounded executor
+via run_blocking(). Sync callers (Lambda handlers, tests) go through run(), a thin adapter that keeps every
+existing signature unchanged. Sync code that calls run() again is awaited with run_reentrant(), on a separate
+executor, so nesting never starves or deadlocks the run_blocking pool.
+"""
+
+import asyncio
+import functools
+import os
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Threads for leaf blocking calls (boto3, psycopg2, urllib) awaited from the event loop
+AIO_MAX_WORKERS = int(os.environ.get("AIO_MAX_WORKERS", "32"))
+# Threads for sync code that may call run() itself (run_reentrant, and run() from inside a running loop)
+AIO_MAX_REENTRANT_WORKERS = int(os.environ.get("AIO_MAX_REENTRANT_WORKERS", "16"))
+HTTP_MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+
+_executor: ThreadPoolExecutor | None = None
+_reentrant_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=AIO_MAX_WORKERS, thread_name_prefix="triage-aio")
+    return _executor
+
+
+def _get_reentrant_executor() -> ThreadPoolExecutor:
+    global _reentrant_executor
+    if _reentrant_executor is None:
+        _reentrant_executor = ThreadPoolExecutor(
+            max_workers=AIO_MAX_REENTRANT_WORKERS, thread_name_prefix="triage-aio-reentrant"
+        )
+    return _reentrant_executor
+
+
+async def run_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a leaf blocking call (boto3, psycopg2, urllib) on the shared executor without blocking the event
+    loop. fn must not call run() or wait on other run_blocking work; use run_reentrant for that.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+async def run_reentrant(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Await sync code that may call run() itself (the sync triage backends, hedging, red-flag enrichment). It
+    runs on its own executor, so it never holds a run_blocking worker while its inner calls queue behind it.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_reentrant_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Sync adapter: run coro to completion and return its result. Inside a thread that already runs an event
+    loop (e.g. an async agent runtime) the coroutine runs on a fresh loop in a reentrant-executor thread
+    instead, never on a run_blocking worker.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return _get_reentrant_executor().submit(asyncio.run, coro).result()
+
+
+async def gather_limited(factories: Iterable[Callable[[], Awaitable[T]]], limit: int) -> list[T]:
+    """Await each factory() with at most limit in flight; results keep input order (exceptions propagate)."""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def one(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*(one(f) for f in factories))
+
+
+def _urlopen(method: str, url: str, body: bytes, headers: dict[str, str], timeout: float) -> tuple[int, bytes]:
+    request = urllib.request.Request(url, data=body or None, headers=headers, method=method)
+    try:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.fp is None:
+            return e.code, b""
+        response = e
+    except urllib.error.URLError as e:
+        if isinstance(e.reason, TimeoutError):
+            raise TimeoutError(f"{method} {urllib.parse.urlsplit(url).hostname} timed out after {timeout:.1f}s") from e
+        raise
+    with response:
+        # Reads to EOF (or Content-Length / last chunk), whichever framing the server used
+        data = response.read(HTTP_MAX_RESPONSE_BYTES + 1)
+        if len(data) > HTTP_MAX_RESPONSE_BYTES:
+            raise ValueError("HTTP response too large")
+        return response.getcode(), data
+
+
+async def http_request(
+    method: str, url: str, body: bytes = b"", headers: dict[str, str] | None = None, timeout: float = 15
+) -> tuple[int, bytes]:
+    """
+    HTTP request awaited from the event loop: urllib on the shared executor, so proxies (HTTPS_PROXY /
+    NO_PROXY), redirects and every response framing are handled by the standard library. Returns (status,
+    body) for any status; raises TimeoutError when the whole exchange exceeds timeout seconds.
+    """
+    if timeout <= 0:
+        raise TimeoutError(f"No time budget left for {method} {url}")
+    try:
+        return await asyncio.wait_for(run_blocking(_urlopen, method, url, body, headers or {}, timeout), timeout)
+    except asyncio.TimeoutError as e:
+        raise TimeoutError(f"{method} {urllib.parse.urlsplit(url).hostname} timed out after {timeout:.1f}s") from e
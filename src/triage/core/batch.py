@@ -0,0 +1,71 @@
+"""Batch triage for mass-casualty incidents: bounded fan-out over assess_triage, results ordered by severity.
+
+Thirty separate POST /triage calls each pay their own 29 s budget and hit Bedrock at once. A batch shares
+one request deadline, runs at most TRIAGE_BATCH_CONCURRENCY assessments at a time (the shared boto3
+client retries throttling adaptively on top of that), and never lets one patient's failure fail the batch.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from triage.core.agent import _is_safety_fallback, assess_triage
+from triage.core.deadline import Deadline
+from triage.models.triage import SEVERITY_ORDER, TriageBatchItem, TriageRequest
+
+logger = logging.getLogger(__name__)
+
+TRIAGE_BATCH_MAX_ITEMS = int(os.environ.get("TRIAGE_BATCH_MAX_ITEMS", "50"))
+TRIAGE_BATCH_CONCURRENCY = int(os.environ.get("TRIAGE_BATCH_CONCURRENCY", "6"))
+
+
+def _sort_key(item: TriageBatchItem) -> tuple:
+    """Most urgent first. Items without an assessment sort as high severity (treat as high priority)."""
+    if item.result is None:
+        return (SEVERITY_ORDER["high"], 0, item.index)
+    return (SEVERITY_ORDER[item.result.severity], 0 if item.result.force_high_priority else 1, item.index)
+
+
+def _assess_one(index: int, request: TriageRequest, deadline: Deadline | None) -> TriageBatchItem:
+    try:
+        result = assess_triage(request, deadline=deadline)
+    except Exception as e:
+        logger.exception("Batch triage item %d failed", index)
+        return TriageBatchItem(index=index, status="error", error=str(e))
+    return TriageBatchItem(index=index, status="degraded" if _is_safety_fallback(result) else "ok", result=result)
+
+
+def assess_batch(
+    items: list[TriageRequest | str],
+    deadline: Deadline | None = None,
+    max_workers: int = TRIAGE_BATCH_CONCURRENCY,
+) -> list[TriageBatchItem]:
+    """
+    Assess each TriageRequest with at most max_workers in flight; a str entry is that item's validation
+    error and becomes an invalid item. Returns one TriageBatchItem per input (index = input position),
+    sorted by severity, then force_high_priority, then input order.
+    """
+    start = time.perf_counter()
+    out: list[TriageBatchItem] = []
+    futures = []
+    workers = max(1, min(max_workers, len(items)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="triage-batch") as pool:
+        for index, item in enumerate(items):
+            if isinstance(item, TriageRequest):
+                futures.append(pool.submit(_assess_one, index, item, deadline))
+            else:
+                out.append(TriageBatchItem(index=index, status="invalid", error=item))
+        out.extend(future.result() for future in futures)
+    out.sort(key=_sort_key)
+    counts: dict[str, int] = {}
+    for item in out:
+        counts[item.status] = counts.get(item.status, 0) + 1
+    logger.info(
+        "Triage batch items=%d concurrency=%d statuses=%s duration_ms=%.2f",
+        len(items),
+        workers,
+        counts,
+        (time.perf_counter() - start) * 1000,
+    )
+    return out
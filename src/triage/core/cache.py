@@ -0,0 +1,244 @@
+"""Triage result cache keyed on a canonical form of the request.
+
+Near-identical cases ("Fever, body ache" with similar vitals) map to the same key: symptoms are
+canonicalized (triage.core.symptoms: synonyms, misspellings, regional terms), de-duplicated and sorted; vitals are bucketed into clinical bands; age into bands; sex to
+one letter. Two tiers: a bounded in-process LRU (per warm container) and an optional shared tier
+(TRIAGE_CACHE_SHARED_TIER=postgres|file). Critical results, safety fallbacks and requests carrying a
+patient_id (history-dependent) are never cached.
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+from triage.core.symptoms import canonical_symptoms
+from triage.models.triage import TriageRequest, TriageResult
+
+logger = logging.getLogger(__name__)
+
+TRIAGE_CACHE_ENABLED = os.environ.get("TRIAGE_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+TRIAGE_CACHE_TTL_SECONDS = int(os.environ.get("TRIAGE_CACHE_TTL_SECONDS", "900"))
+TRIAGE_CACHE_MAX_ENTRIES = int(os.environ.get("TRIAGE_CACHE_MAX_ENTRIES", "512"))
+TRIAGE_CACHE_BYPASS_CRITICAL = os.environ.get("TRIAGE_CACHE_BYPASS_CRITICAL", "true").lower() in ("1", "true", "yes")
+TRIAGE_CACHE_SHARED_TIER = os.environ.get("TRIAGE_CACHE_SHARED_TIER", "").strip().lower()
+TRIAGE_CACHE_FILE_DIR = os.environ.get("TRIAGE_CACHE_FILE_DIR", "/tmp/triage-result-cache")
+
+# Canonical vital name for each VITALS_RANGES key, and band edges (value < edge[i] -> band i).
+_VITAL_ALIASES = {
+    "heartRateBpm": "heart_rate",
+    "bp": "blood_pressure_systolic",
+}
+VITAL_BANDS = {
+    "spo2": [90, 94, 96],
+    "heart_rate": [50, 60, 101, 121, 131],
+    "blood_pressure_systolic": [90, 100, 140, 160, 180],
+    "blood_pressure_diastolic": [60, 90, 100, 110],
+    "respiratory_rate": [12, 21, 25, 31],
+    "temp_c": [35, 37.5, 38.5, 39.5],
+}
+AGE_BANDS = [1, 5, 12, 18, 40, 65]
+
+
+def _vital_bands(vitals: dict[str, float]) -> dict[str, int]:
+    out = {}
+    for key, val in vitals.items():
+        if key == "temperature_f":
+            key, val = "temp_c", (val - 32) * 5 / 9
+        key = _VITAL_ALIASES.get(key, key)
+        edges = VITAL_BANDS.get(key)
+        out[key] = bisect.bisect_right(edges, val) if edges else round(val)
+    return out
+
+
+def canonical_request(request: TriageRequest) -> dict:
+    """Canonical, order-independent view of the clinically relevant request fields."""
+    symptoms = sorted(canonical_symptoms(request.symptoms))
+    return {
+        "symptoms": symptoms,
+        "vitals": _vital_bands(request.vitals),
+        "age_band": bisect.bisect_right(AGE_BANDS, request.age_years) if request.age_years is not None else None,
+        "sex": (request.sex or "").strip().lower()[:1] or None,
+    }
+
+
+def cache_key(request: TriageRequest) -> str:
+    """sha256 hex of the canonical request."""
+    blob = json.dumps(canonical_request(request), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SharedCacheTier(Protocol):
+    """Pluggable shared tier: stores TriageResult dicts by key with a TTL."""
+
+    name: str
+
+    def get(self, key: str) -> dict | None: ...
+
+    def put(self, key: str, value: dict, ttl_seconds: int) -> None: ...
+
+
+class PostgresCacheTier:
+    """Shared tier on Aurora (triage_result_cache, migration 004)."""
+
+    name = "postgres"
+
+    def get(self, key: str) -> dict | None:
+        from triage.core.db import get_cached_triage_result
+
+        return get_cached_triage_result(key)
+
+    def put(self, key: str, value: dict, ttl_seconds: int) -> None:
+        from triage.core.db import put_cached_triage_result
+
+        put_cached_triage_result(key, value, ttl_seconds)
+
+
+class FileCacheTier:
+    """Local file-backed stand-in for the shared tier (one JSON file per key; e.g. /tmp or a mounted volume)."""
+
+    name = "file"
+
+    def __init__(self, directory: str = TRIAGE_CACHE_FILE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> dict | None:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry.get("result")
+
+    def put(self, key: str, value: dict, ttl_seconds: int) -> None:
+        path = self._path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"expires_at": time.time() + ttl_seconds, "result": value}, f)
+        os.replace(tmp, path)
+
+
+class TriageResultCache:
+    """Two-tier cache: bounded in-process LRU with TTL, then optional shared tier."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = TRIAGE_CACHE_TTL_SECONDS,
+        max_entries: int = TRIAGE_CACHE_MAX_ENTRIES,
+        bypass_critical: bool = TRIAGE_CACHE_BYPASS_CRITICAL,
+        shared: SharedCacheTier | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bypass_critical = bypass_critical
+        self.shared = shared
+        self._lru: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"lru_hits": 0, "shared_hits": 0, "misses": 0, "puts": 0, "bypassed": 0}
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _lru_get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._lru[key]
+                return None
+            self._lru.move_to_end(key)
+            return value
+
+    def _lru_put(self, key: str, value: dict, ttl_seconds: float) -> None:
+        with self._lock:
+            self._lru[key] = (time.monotonic() + ttl_seconds, value)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def get(self, request: TriageRequest) -> tuple[TriageResult, str] | None:
+        """Return (result marked cached=True, tier) on hit, else None."""
+        if request.patient_id:
+            self._incr("bypassed")
+            return None
+        key = cache_key(request)
+        tier = "lru"
+        value = self._lru_get(key)
+        if value is None and self.shared is not None:
+            try:
+                value = self.shared.get(key)
+            except Exception as e:
+                # A slow or unreachable shared tier is a miss: the model call still answers in time
+                logger.warning("Triage cache shared tier=%s get failed, treating as miss: %s", self.shared.name, e)
+                value = None
+            if value is not None:
+                tier = self.shared.name
+                self._lru_put(key, value, self.ttl_seconds)
+        if value is None:
+            self._incr("misses")
+            logger.info("Triage cache miss key=%s", key[:12])
+            return None
+        self._incr("lru_hits" if tier == "lru" else "shared_hits")
+        logger.info("Triage cache hit tier=%s key=%s", tier, key[:12])
+        result = TriageResult.model_validate({**value, "session_id": request.session_id, "cached": True})
+        return result, tier
+
+    def put(self, request: TriageRequest, result: TriageResult) -> None:
+        """Store result unless policy says not to (critical, safety fallback, patient history)."""
+        if request.patient_id or result.confidence == 0.0:
+            return
+        if self.bypass_critical and result.severity == "critical":
+            self._incr("bypassed")
+            return
+        key = cache_key(request)
+        value = result.model_dump(mode="json", exclude={"session_id", "cached"})
+        self._lru_put(key, value, self.ttl_seconds)
+        self._incr("puts")
+        if self.shared is not None:
+            try:
+                self.shared.put(key, value, self.ttl_seconds)
+            except Exception as e:
+                logger.warning("Triage cache shared tier=%s put failed: %s", self.shared.name, e)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+
+
+def _shared_tier_from_env() -> SharedCacheTier | None:
+    if TRIAGE_CACHE_SHARED_TIER == "postgres":
+        return PostgresCacheTier()
+    if TRIAGE_CACHE_SHARED_TIER == "file":
+        try:
+            return FileCacheTier(TRIAGE_CACHE_FILE_DIR)
+        except OSError as e:
+            # Read-only or full filesystem: keep caching in the in-process LRU only
+            logger.warning("Triage cache file tier unavailable dir=%s, using LRU only: %s", TRIAGE_CACHE_FILE_DIR, e)
+    return None
+
+
+_cache: TriageResultCache | None = None
+
+
+def get_result_cache() -> TriageResultCache | None:
+    """Process-wide cache built from env, or None when TRIAGE_CACHE_ENABLED is off."""
+    global _cache
+    if not TRIAGE_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = TriageResultCache(shared=_shared_tier_from_env())
+    return _cache
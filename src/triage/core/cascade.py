@@ -0,0 +1,83 @@
+"""Model cascade for Converse triage: a fast, cheap model answers first; escalate only when needed.
+
+Most requests are routine "low"/"medium" cases that a small model handles well. TRIAGE_MODEL_TIERS lists
+Bedrock model ids cheapest first (e.g. "us.anthropic.claude-3-5-haiku-20241022-v1:0,us.anthropic.claude-sonnet-4-6").
+A tier's answer is final unless escalation_reason() finds a reason to ask the next tier: no valid
+submit_triage_result (safety fallback), confidence below the force_high_priority threshold (0.85), or a
+critical/high severity, where the stronger model must confirm. The last tier's answer is always final.
+An escalated tier may confirm or raise the severity but never lower it: the most severe valid answer wins.
+Unset, the single tier is BEDROCK_MODEL_ID (no cascade).
+"""
+
+import logging
+import os
+import threading
+
+from triage.models.triage import FORCE_HIGH_PRIORITY_CONFIDENCE, SEVERITY_ORDER, TriageResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_ID = "us.anthropic.claude-3-5-sonnet-v2:0"
+TRIAGE_MODEL_TIERS = [m.strip() for m in os.environ.get("TRIAGE_MODEL_TIERS", "").split(",") if m.strip()]
+ESCALATE_SEVERITIES = ("critical", "high")
+
+# Per-tier counters for logs / tests: {model_id: {"calls", "escalations", "total_ms"}}
+CASCADE_STATS: dict[str, dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def model_tiers() -> list[str]:
+    """Model ids to try in order; [BEDROCK_MODEL_ID] when TRIAGE_MODEL_TIERS is unset."""
+    return TRIAGE_MODEL_TIERS or [os.environ.get("BEDROCK_MODEL_ID", DEFAULT_MODEL_ID)]
+
+
+def escalation_reason(result: TriageResult, safety_fallback: bool) -> str | None:
+    """Why the next tier must be asked (invalid, low_confidence, severity), or None to accept result."""
+    if safety_fallback:
+        return "invalid"
+    if result.force_high_priority or result.confidence < FORCE_HIGH_PRIORITY_CONFIDENCE:
+        return "low_confidence"
+    if result.severity in ESCALATE_SEVERITIES:
+        return "severity"
+    return None
+
+
+def replaces_answer(best: TriageResult, result: TriageResult) -> bool:
+    """True when a later tier's valid result is at least as severe as the answer kept so far."""
+    return SEVERITY_ORDER[result.severity] <= SEVERITY_ORDER[best.severity]
+
+
+def record_tier(tier: int, model_id: str, duration_ms: float, reason: str | None) -> None:
+    """Count one tier call and log its latency and escalation decision."""
+    with _stats_lock:
+        stats = CASCADE_STATS.setdefault(model_id, {"calls": 0, "escalations": 0, "total_ms": 0.0})
+        stats["calls"] += 1
+        stats["total_ms"] += duration_ms
+        if reason:
+            stats["escalations"] += 1
+    logger.info(
+        "Triage cascade tier=%d model=%s duration_ms=%.2f escalate=%s reason=%s",
+        tier,
+        model_id,
+        duration_ms,
+        reason is not None,
+        reason or "-",
+    )
+
+
+def cascade_stats() -> dict[str, dict[str, float]]:
+    """Snapshot per model: calls, escalations, escalation_rate, avg_ms."""
+    with _stats_lock:
+        return {
+            model_id: {
+                **stats,
+                "escalation_rate": stats["escalations"] / stats["calls"] if stats["calls"] else 0.0,
+                "avg_ms": stats["total_ms"] / stats["calls"] if stats["calls"] else 0.0,
+            }
+            for model_id, stats in CASCADE_STATS.items()
+        }
+
+
+def reset_cascade_stats() -> None:
+    with _stats_lock:
+        CASCADE_STATS.clear()
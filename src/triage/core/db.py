@@ -1,11 +1,23 @@
-"""Aurora persistence for triage assessments. Uses IAM auth via Secrets Manager."""
+"""Aurora persistence for triage assessments. Uses IAM auth via Secrets Manager.
 
+Every call borrows a live connection from the per-container pool (lambda_common.pool) instead of opening
+and closing its own.
+"""
+
+import io
+import itertools
 import json
 import logging
 import os
+import time
 import uuid
+from collections.abc import Iterable
 
-import boto3
+from lambda_common.breaker import get_breaker
+from lambda_common.clients import get_client
+from lambda_common.credentials import invalidate_rds_credentials, rds_auth_token, secret_json
+from lambda_common.pool import ConnectionPool
+from triage.core import aio
 
 logger = logging.getLogger(__name__)
 
@@ -13,23 +25,104 @@ RDS_CONFIG_SECRET = os.environ.get(
     "RDS_CONFIG_SECRET",
     "emergency-medical-triage-dev/rds-config",
 )
+# Rows per statement/transaction in bulk_insert_triage_assessments
+BULK_INSERT_CHUNK_ROWS = int(os.environ.get("BULK_INSERT_CHUNK_ROWS", "1000"))
+# triage_result_cache is read before every model call, so a lookup must cost far less than the call it
+# saves: a slow or unreachable Aurora raises quickly and the cache counts a miss (libpq takes whole seconds)
+CACHE_DB_CONNECT_TIMEOUT = int(os.environ.get("TRIAGE_CACHE_DB_CONNECT_TIMEOUT", "2"))
+CACHE_DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("TRIAGE_CACHE_DB_STATEMENT_TIMEOUT_MS", "250"))
 
 
 def _get_rds_config() -> dict:
-    """Fetch RDS connection config from Secrets Manager."""
-    client = boto3.client("secretsmanager", region_name=os.environ.get("AWS_REGION", "us-east-1"))
-    response = client.get_secret_value(SecretId=RDS_CONFIG_SECRET)
-    return json.loads(response["SecretString"])
+    """RDS connection config from Secrets Manager (TTL-cached, lambda_common.credentials)."""
+    return secret_json(get_client("secretsmanager", os.environ.get("AWS_REGION", "us-east-1")), RDS_CONFIG_SECRET)
 
 
 def _get_iam_token(host: str, port: int, username: str, region: str) -> str:
-    """Generate IAM database auth token."""
-    client = boto3.client("rds", region_name=region)
-    return client.generate_db_auth_token(
-        DBHostname=host,
-        Port=port,
-        DBUsername=username,
-        Region=region,
+    """IAM database auth token (TTL-cached well inside its 15-minute validity)."""
+    return rds_auth_token(get_client("rds", region), host, port, username, region)
+
+
+def _connect(connect_timeout: int = 15):
+    """
+    Open a new connection to Aurora (IAM token as password); the pool calls this, everything else uses
+    connection(). Raises CircuitOpenError without any network call while the "aurora" circuit is open.
+    """
+    import psycopg2
+
+    with get_breaker("aurora").guard():
+        config = _get_rds_config()
+        host = config["host"]
+        port = int(config.get("port", 5432))
+        database = config["database"]
+        username = config["username"]
+        region = config.get("region", os.environ.get("AWS_REGION", "us-east-1"))
+        token = _get_iam_token(host, port, username, region)
+        return psycopg2.connect(
+            host=host,
+            port=port,
+            dbname=database,
+            user=username,
+            password=token,
+            connect_timeout=connect_timeout,
+            # Detect a dead peer on pooled connections instead of waiting out the OS TCP timeout
+            keepalives=1,
+            keepalives_idle=30,
+            keepalives_interval=10,
+            keepalives_count=3,
+        )
+
+
+# Late-bound so _connect can be patched in tests. An auth rejection drops the cached token and config.
+_pool = ConnectionPool(
+    lambda connect_timeout: _connect(connect_timeout),
+    on_auth_failure=lambda: invalidate_rds_credentials(RDS_CONFIG_SECRET),
+)
+
+
+def connection(connect_timeout: int = 15):
+    """Context manager: a pooled, health-checked Aurora connection, returned to the pool after the block."""
+    return _pool.connection(connect_timeout)
+
+
+def pool_stats() -> dict[str, int]:
+    return _pool.stats()
+
+
+def reset_pool() -> None:
+    """Close idle pooled connections (tests, or after the RDS config secret changes)."""
+    _pool.close()
+
+
+_ASSESSMENT_COLUMNS = (
+    "id, symptoms, vitals, age_years, sex, "
+    "severity, confidence, recommendations, force_high_priority, safety_disclaimer, "
+    "request_id, bedrock_trace_id, model_id, submitted_by, hospital_match_id"
+)
+
+
+def _assessment_values(row_id: uuid.UUID, a: dict) -> tuple:
+    """Parameter tuple for one triage_assessments row (insert_triage_assessment keyword names), column order."""
+    from psycopg2.extras import Json
+
+    request_id = a.get("request_id")
+    hospital_match_id = a.get("hospital_match_id")
+    return (
+        str(row_id),
+        a["symptoms"],
+        Json(a.get("vitals") or {}),
+        a.get("age_years"),
+        a.get("sex"),
+        a["severity"],
+        a["confidence"],
+        a["recommendations"],
+        a["force_high_priority"],
+        a.get("safety_disclaimer"),
+        str(request_id) if request_id else None,
+        a.get("bedrock_trace_id"),
+        a.get("model_id"),
+        a.get("submitted_by"),
+        str(hospital_match_id) if hospital_match_id else None,
     )
 
 
@@ -49,66 +142,293 @@ def insert_triage_assessment(
     model_id: str | None = None,
     submitted_by: str | None = None,
     hospital_match_id: uuid.UUID | None = None,
+    connect_timeout: int = 15,
 ) -> uuid.UUID:
     """
     Insert a triage assessment into Aurora. Returns the generated id.
+    connect_timeout (seconds, libpq minimum 2) lets the handler fit the insert into the request deadline.
     Raises on DB/network errors.
     """
-    import psycopg2
-    from psycopg2.extras import Json
+    row_id = uuid.uuid4()
+    values = _assessment_values(
+        row_id,
+        {
+            "symptoms": symptoms,
+            "vitals": vitals,
+            "age_years": age_years,
+            "sex": sex,
+            "severity": severity,
+            "confidence": confidence,
+            "recommendations": recommendations,
+            "force_high_priority": force_high_priority,
+            "safety_disclaimer": safety_disclaimer,
+            "request_id": request_id,
+            "bedrock_trace_id": bedrock_trace_id,
+            "model_id": model_id,
+            "submitted_by": submitted_by,
+            "hospital_match_id": hospital_match_id,
+        },
+    )
+    with connection(connect_timeout) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"INSERT INTO triage_assessments ({_ASSESSMENT_COLUMNS}) VALUES ({', '.join(['%s'] * len(values))})",
+                values,
+            )
+        conn.commit()
 
-    config = _get_rds_config()
-    host = config["host"]
-    port = int(config.get("port", 5432))
-    database = config["database"]
-    username = config["username"]
-    region = config.get("region", os.environ.get("AWS_REGION", "us-east-1"))
+    return row_id
+
+
+def insert_triage_assessments(assessments: list[dict], connect_timeout: int = 15) -> list[uuid.UUID]:
+    """
+    Insert several triage assessments with one multi-row INSERT in one transaction (batch triage).
+    Each dict uses the insert_triage_assessment keyword names, plus an optional pre-generated "id" (the
+    write-behind spool); a row whose id already exists is skipped, so replaying a batch is safe.
+    Returns ids in input order. All-or-nothing; raises on DB/network errors.
+    """
+    from psycopg2.extras import execute_values
+
+    if not assessments:
+        return []
+    row_ids = [uuid.UUID(str(a["id"])) if a.get("id") else uuid.uuid4() for a in assessments]
+    rows = [_assessment_values(row_id, a) for row_id, a in zip(row_ids, assessments)]
+    with connection(connect_timeout) as conn:
+        with conn.cursor() as cur:
+            execute_values(
+                cur,
+                f"INSERT INTO triage_assessments ({_ASSESSMENT_COLUMNS}) VALUES %s ON CONFLICT (id) DO NOTHING",
+                rows,
+                page_size=len(rows),
+            )
+        conn.commit()
+
+    return row_ids
 
-    token = _get_iam_token(host, port, username, region)
-    row_id = uuid.uuid4()
 
-    conn = psycopg2.connect(
-        host=host,
-        port=port,
-        dbname=database,
-        user=username,
-        password=token,
-        connect_timeout=15,
+_BULK_CONFLICT = "ON CONFLICT (request_id) WHERE request_id IS NOT NULL DO NOTHING"
+_BULK_STAGING_TABLE = "_bulk_triage_assessments"
+# Rebuilds the row from one staged JSON document (the same fields _assessment_values reads)
+_BULK_FROM_STAGING = f"""
+INSERT INTO triage_assessments ({_ASSESSMENT_COLUMNS})
+SELECT
+  (p->>'id')::uuid,
+  ARRAY(SELECT jsonb_array_elements_text(p->'symptoms')),
+  COALESCE(p->'vitals', '{{}}'::jsonb),
+  (p->>'age_years')::int,
+  p->>'sex',
+  p->>'severity',
+  (p->>'confidence')::float,
+  ARRAY(SELECT jsonb_array_elements_text(p->'recommendations')),
+  (p->>'force_high_priority')::boolean,
+  p->>'safety_disclaimer',
+  (p->>'request_id')::uuid,
+  p->>'bedrock_trace_id',
+  p->>'model_id',
+  p->>'submitted_by',
+  (p->>'hospital_match_id')::uuid
+FROM {_BULK_STAGING_TABLE}
+{_BULK_CONFLICT}
+"""
+
+
+def _bulk_values_chunk(cur, chunk: list[dict]) -> int:
+    from psycopg2.extras import execute_values
+
+    rows = [_assessment_values(uuid.uuid4(), a) for a in chunk]
+    execute_values(
+        cur,
+        f"INSERT INTO triage_assessments ({_ASSESSMENT_COLUMNS}) VALUES %s {_BULK_CONFLICT}",
+        rows,
+        page_size=len(rows),
+    )
+    return cur.rowcount
+
+
+def _bulk_copy_chunk(cur, chunk: list[dict]) -> int:
+    # One JSON document per line; COPY text format treats backslash as its escape character
+    lines = []
+    for a in chunk:
+        doc = {
+            "id": str(uuid.uuid4()),
+            "symptoms": a["symptoms"],
+            "vitals": a.get("vitals") or {},
+            "age_years": a.get("age_years"),
+            "sex": a.get("sex"),
+            "severity": a["severity"],
+            "confidence": a["confidence"],
+            "recommendations": a["recommendations"],
+            "force_high_priority": a["force_high_priority"],
+            "safety_disclaimer": a.get("safety_disclaimer"),
+            "request_id": a.get("request_id"),
+            "bedrock_trace_id": a.get("bedrock_trace_id"),
+            "model_id": a.get("model_id"),
+            "submitted_by": a.get("submitted_by"),
+            "hospital_match_id": a.get("hospital_match_id"),
+        }
+        lines.append(json.dumps(doc, default=str).replace("\\", "\\\\"))
+    cur.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {_BULK_STAGING_TABLE} (p jsonb) ON COMMIT DELETE ROWS"
     )
-    try:
+    cur.copy_expert(f"COPY {_BULK_STAGING_TABLE} (p) FROM STDIN", io.StringIO("\n".join(lines) + "\n"))
+    cur.execute(_BULK_FROM_STAGING)
+    return cur.rowcount
+
+
+def bulk_insert_triage_assessments(
+    assessments: Iterable[dict],
+    *,
+    method: str = "values",
+    chunk_rows: int = BULK_INSERT_CHUNK_ROWS,
+    connect_timeout: int = 15,
+) -> dict[str, float]:
+    """
+    Insert any number of triage assessments (backfills, offline-synced records) from an iterable, reading
+    chunk_rows at a time so memory stays constant. Each dict uses the insert_triage_assessment keyword names.
+    method "values" sends one multi-row INSERT per chunk (execute_values); "copy" streams the chunk with
+    COPY FROM STDIN into a temp table and inserts from there (faster for large chunks).
+
+    Idempotent on request_id (migration 005): rows whose request_id is already stored are skipped, so a
+    failed run can simply be replayed. Rows without a request_id get a generated one and are always inserted.
+    Each chunk commits on its own; on error, earlier chunks stay committed and the exception propagates.
+    Returns rows, inserted, skipped, chunks, seconds and rows_per_second.
+    """
+    if method not in ("values", "copy"):
+        raise ValueError(f"Unknown bulk insert method: {method}")
+    write_chunk = _bulk_copy_chunk if method == "copy" else _bulk_values_chunk
+    rows = inserted = chunks = 0
+    start = time.perf_counter()
+    it = iter(assessments)
+    with connection(connect_timeout) as conn:
+        while chunk := [
+            a if a.get("request_id") else {**a, "request_id": uuid.uuid4()}
+            for a in itertools.islice(it, max(1, chunk_rows))
+        ]:
+            with conn.cursor() as cur:
+                inserted += write_chunk(cur, chunk)
+            conn.commit()
+            rows += len(chunk)
+            chunks += 1
+    seconds = time.perf_counter() - start
+    stats = {
+        "rows": rows,
+        "inserted": inserted,
+        "skipped": rows - inserted,
+        "chunks": chunks,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds, 1) if seconds > 0 else 0.0,
+    }
+    logger.info(
+        "Bulk insert method=%s rows=%d inserted=%d skipped=%d chunks=%d rows_per_s=%.0f",
+        method, rows, inserted, rows - inserted, chunks, stats["rows_per_second"],
+    )
+    return stats
+
+
+async def ainsert_triage_assessment(**kwargs) -> uuid.UUID:
+    """insert_triage_assessment on the aio executor (psycopg2 is blocking), for event-loop callers."""
+    return await aio.run_blocking(insert_triage_assessment, **kwargs)
+
+
+async def ainsert_triage_assessments(assessments: list[dict], connect_timeout: int = 15) -> list[uuid.UUID]:
+    """insert_triage_assessments on the aio executor, for event-loop callers."""
+    return await aio.run_blocking(insert_triage_assessments, assessments, connect_timeout)
+
+
+def get_cached_triage_result(cache_key: str) -> dict | None:
+    """
+    Return the cached TriageResult dict for cache_key if present and not expired (triage_result_cache).
+    Bounded by CACHE_DB_CONNECT_TIMEOUT and CACHE_DB_STATEMENT_TIMEOUT_MS; a lookup over either raises.
+    """
+    with connection(CACHE_DB_CONNECT_TIMEOUT) as conn:
         with conn.cursor() as cur:
+            # SET LOCAL is sent in the same round trip and ends with the transaction (rolled back on checkin)
             cur.execute(
-                """
-                INSERT INTO triage_assessments (
-                  id, symptoms, vitals, age_years, sex,
-                  severity, confidence, recommendations, force_high_priority, safety_disclaimer,
-                  request_id, bedrock_trace_id, model_id, submitted_by, hospital_match_id
-                ) VALUES (
-                  %s, %s, %s, %s, %s,
-                  %s, %s, %s, %s, %s,
-                  %s, %s, %s, %s, %s
-                )
+                f"SET LOCAL statement_timeout = {CACHE_DB_STATEMENT_TIMEOUT_MS}; "
+                "SELECT result FROM triage_result_cache WHERE cache_key = %s AND expires_at > now()",
+                (cache_key,),
+            )
+            row = cur.fetchone()
+        return row[0] if row else None
+
+
+def put_cached_triage_result(cache_key: str, result: dict, ttl_seconds: int) -> None:
+    """Upsert a TriageResult dict into triage_result_cache with expiry now() + ttl_seconds (same bounds as reads)."""
+    from psycopg2.extras import Json
+
+    with connection(CACHE_DB_CONNECT_TIMEOUT) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SET LOCAL statement_timeout = {CACHE_DB_STATEMENT_TIMEOUT_MS};
+                INSERT INTO triage_result_cache (cache_key, result, expires_at)
+                VALUES (%s, %s, now() + make_interval(secs => %s))
+                ON CONFLICT (cache_key) DO UPDATE SET
+                  result = EXCLUDED.result,
+                  expires_at = EXCLUDED.expires_at
                 """,
-                (
-                    str(row_id),
-                    symptoms,
-                    Json(vitals) if vitals else Json({}),
-                    age_years,
-                    sex,
-                    severity,
-                    confidence,
-                    recommendations,
-                    force_high_priority,
-                    safety_disclaimer,
-                    str(request_id) if request_id else None,
-                    bedrock_trace_id,
-                    model_id,
-                    submitted_by,
-                    str(hospital_match_id) if hospital_match_id else None,
-                ),
+                (cache_key, Json(result), ttl_seconds),
             )
         conn.commit()
-    finally:
-        conn.close()
 
-    return row_id
+
+def _history_query(
+    fields: list[str],
+    *,
+    submitted_by: str | None = None,
+    severity: str | None = None,
+    since=None,
+    until=None,
+    after: tuple[str, str] | None = None,
+    limit: int = 20,
+) -> tuple[str, list]:
+    """
+    SQL and parameters for one history page, newest first. Keyset pagination: after is the (created_at, id)
+    of the last row of the previous page, compared as a row value so Postgres seeks straight into the
+    (..., created_at DESC, id DESC) indexes of migration 006 instead of counting past an OFFSET.
+    fields must already be validated (TriageHistoryQuery); they are interpolated as column names.
+    """
+    where = ["deleted_at IS NULL"]
+    params: list = []
+    if submitted_by is not None:
+        where.append("submitted_by = %s")
+        params.append(submitted_by)
+    if severity is not None:
+        where.append("severity = %s")
+        params.append(severity)
+    if since is not None:
+        where.append("created_at >= %s")
+        params.append(since)
+    if until is not None:
+        where.append("created_at < %s")
+        params.append(until)
+    if after is not None:
+        where.append("(created_at, id) < (%s::timestamptz, %s::uuid)")
+        params.extend(after)
+    sql = (
+        f"SELECT {', '.join(fields)} FROM triage_assessments WHERE {' AND '.join(where)} "
+        "ORDER BY created_at DESC, id DESC LIMIT %s"
+    )
+    params.append(limit)
+    return sql, params
+
+
+def _json_value(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def list_triage_assessments(fields: list[str], **filters) -> list[dict]:
+    """
+    One page of triage_assessments (not soft-deleted), newest first, projected to fields. Filters and
+    keyset cursor as in _history_query. Values are JSON-ready (ids and timestamps as strings).
+    """
+    sql, params = _history_query(fields, **filters)
+    with connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+    return [{f: _json_value(v) for f, v in zip(fields, row)} for row in rows]
@@ -0,0 +1,50 @@
+"""Request-scoped deadline budget. Created in the handler, passed down so each stage sizes its timeout.
+
+API Gateway cuts the request at 29 s. A Deadline starts from the smaller of the Lambda's remaining time
+and TRIAGE_DEADLINE_CEILING_SECONDS; the Converse loop, Gateway calls and DB persistence ask it for a
+timeout instead of using fixed 10-15 s values, and the loop forces submit_triage_result when time is short.
+"""
+
+import os
+import time
+
+TRIAGE_DEADLINE_CEILING_SECONDS = float(os.environ.get("TRIAGE_DEADLINE_CEILING_SECONDS", "27"))
+# Kept back from the Lambda's remaining time for serializing the response
+DEADLINE_RESERVE_SECONDS = 0.5
+
+
+class Deadline:
+    """Monotonic deadline with helpers for per-stage timeouts."""
+
+    __slots__ = ("expires_at", "budget")
+
+    def __init__(self, budget_seconds: float):
+        self.budget = max(0.0, budget_seconds)
+        self.expires_at = time.monotonic() + self.budget
+
+    @classmethod
+    def from_context(cls, context: object, ceiling_seconds: float | None = None) -> "Deadline":
+        """Budget = min(ceiling, Lambda remaining time - reserve). Works with context=None (tests, local)."""
+        budget = TRIAGE_DEADLINE_CEILING_SECONDS if ceiling_seconds is None else ceiling_seconds
+        get_remaining = getattr(context, "get_remaining_time_in_millis", None) if context else None
+        if callable(get_remaining):
+            try:
+                budget = min(budget, get_remaining() / 1000 - DEADLINE_RESERVE_SECONDS)
+            except (TypeError, ValueError):
+                pass
+        return cls(budget)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def timeout(self, cap: float, reserve: float = 0.0) -> float:
+        """Timeout for one stage: at most cap, never past the deadline minus reserve (for later stages)."""
+        return max(0.0, min(cap, self.remaining() - reserve))
+
+
+def stage_timeout(deadline: Deadline | None, cap: float, reserve: float = 0.0) -> float:
+    """cap when there is no deadline, else deadline.timeout(cap, reserve)."""
+    return cap if deadline is None else deadline.timeout(cap, reserve)
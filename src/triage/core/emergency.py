@@ -0,0 +1,258 @@
+"""POST /emergency: triage -> hospitals -> routes in one request, yielded as events stage by stage.
+
+Mobile clients on rural 2G links used to pay three round trips (and three authorizer checks) per emergency:
+POST /triage, POST /hospitals, POST /route. This pipeline runs the chain server-side on one event loop
+(triage.core.aio) and overlaps whatever does not depend on the previous stage:
+
+- triage (assess_triage_async) and the hospital catalog lookup (Gateway get_hospitals, which carries hospital
+  coordinates) start together;
+- once severity is known, the Hospital Matcher Lambda is invoked synchronously with the body POST /hospitals
+  would get, while the assessment is persisted; if it is not configured or fails, the catalog ranking is used;
+- routes for the top hospitals (Gateway get_directions) run in parallel and are emitted as each completes.
+
+Every stage is sized from the request Deadline: triage keeps EMERGENCY_DOWNSTREAM_RESERVE_SECONDS back for the
+later stages, and a stage with less than EMERGENCY_STAGE_MIN_SECONDS left is skipped (listed in the done event)
+instead of overrunning the API Gateway cut. Events (dicts, SSE-formatted by the handler):
+
+- {"event": "triage", ...TriageResult fields, "elapsed_ms"}
+- {"event": "hospitals", "hospitals", "safety_disclaimer", "source", "elapsed_ms"}
+- {"event": "route", "hospital_id", "distance_km", "duration_minutes", "directions_url", "error"?, "elapsed_ms"}
+- {"event": "done", "id"?, "skipped", "timings_ms", "elapsed_ms"}
+
+emergency_events yields each event as soon as its stage finishes, but the handler buffers them into one
+API Gateway proxy response, so HTTP clients receive all frames together at the end.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+
+from lambda_common.clients import REGION, get_client
+from triage.core import aio
+from triage.core.agent import assess_triage_async
+from triage.core.deadline import Deadline
+from triage.core.gateway_client import acall_gateway_tool, is_gateway_configured
+from triage.core.speculative import HOSPITAL_MATCHER_FUNCTION_NAME
+from triage.models.triage import TriageRequest, TriageResult
+
+logger = logging.getLogger(__name__)
+
+CATALOG_TOOL_NAME = "get-hospitals-target___get_hospitals"
+DIRECTIONS_TOOL_NAME = "maps-target___get_directions"
+
+# Hospitals returned (and routed); same default as POST /hospitals
+EMERGENCY_HOSPITAL_LIMIT = int(os.environ.get("EMERGENCY_HOSPITAL_LIMIT", "3"))
+# Catalog rows fetched for coordinates (get_hospitals caps limit at 10)
+EMERGENCY_CATALOG_LIMIT = 10
+# The catalog lookup starts before severity is known. The seed catalog ignores severity; the synthetic pool
+# uses it, and "high" errs towards emergency-capable facilities when the catalog is the fallback ranking.
+CATALOG_SEVERITY = "high"
+# Triage may use the budget minus this (but always at least half of it); the rest is for matching and routes
+EMERGENCY_DOWNSTREAM_RESERVE_SECONDS = float(os.environ.get("EMERGENCY_DOWNSTREAM_RESERVE_SECONDS", "8"))
+EMERGENCY_MATCH_TIMEOUT_SECONDS = float(os.environ.get("EMERGENCY_MATCH_TIMEOUT_SECONDS", "12"))
+EMERGENCY_ROUTE_TIMEOUT_SECONDS = float(os.environ.get("EMERGENCY_ROUTE_TIMEOUT_SECONDS", "6"))
+# Kept back from hospital matching so the routes still have time
+ROUTE_RESERVE_SECONDS = 3.0
+EMERGENCY_STAGE_MIN_SECONDS = 1.0
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def tool_json(result: dict) -> dict:
+    """JSON payload of an MCP tools/call result: the first text block parsed, else structuredContent, else {}."""
+    if not isinstance(result, dict):
+        return {}
+    content = result.get("content")
+    if isinstance(content, list) and content:
+        first = content[0]
+        if isinstance(first, dict) and first.get("type") == "text" and "text" in first:
+            try:
+                data = json.loads(first["text"])
+                if isinstance(data, dict):
+                    return data
+            except json.JSONDecodeError:
+                pass
+    structured = result.get("structuredContent")
+    return structured if isinstance(structured, dict) else {}
+
+
+async def _catalog(deadline: Deadline) -> list[dict]:
+    """Gateway get_hospitals rows (with lat/lon when the seed catalog is deployed); [] when unavailable."""
+    try:
+        if not await aio.run_blocking(is_gateway_configured):
+            return []
+        result = await acall_gateway_tool(
+            CATALOG_TOOL_NAME,
+            {"severity": CATALOG_SEVERITY, "limit": EMERGENCY_CATALOG_LIMIT},
+            timeout=deadline.timeout(EMERGENCY_MATCH_TIMEOUT_SECONDS),
+        )
+    except Exception as e:
+        logger.warning("Emergency catalog lookup failed: %s", e)
+        return []
+    hospitals = tool_json(result).get("hospitals")
+    return [h for h in hospitals if isinstance(h, dict)] if isinstance(hospitals, list) else []
+
+
+def match_request(request: TriageRequest, result: TriageResult) -> dict:
+    """HospitalMatchRequest body for the triage result (what the client would POST to /hospitals)."""
+    body = {
+        "severity": result.severity,
+        "recommendations": result.recommendations,
+        "limit": EMERGENCY_HOSPITAL_LIMIT,
+        "session_id": result.session_id or request.session_id,
+        "patient_id": request.patient_id,
+        "patient_location_lat": request.patient_location_lat,
+        "patient_location_lon": request.patient_location_lon,
+    }
+    return {k: v for k, v in body.items() if v is not None}
+
+
+def _invoke_hospital_matcher(body: dict) -> dict:
+    """Synchronous Hospital Matcher invocation with an API Gateway-shaped event. Returns the match result body."""
+    resp = get_client("lambda", REGION).invoke(
+        FunctionName=HOSPITAL_MATCHER_FUNCTION_NAME,
+        InvocationType="RequestResponse",
+        Payload=json.dumps({"httpMethod": "POST", "body": json.dumps(body)}).encode("utf-8"),
+    )
+    if resp.get("FunctionError"):
+        raise RuntimeError(f"Hospital Matcher function error: {resp['FunctionError']}")
+    out = json.loads(resp["Payload"].read() or b"{}")
+    result = json.loads(out.get("body") or "{}")
+    if out.get("statusCode") != 200:
+        raise RuntimeError(f"Hospital Matcher HTTP {out.get('statusCode')}: {result.get('error')}")
+    return result
+
+
+async def _match(request: TriageRequest, result: TriageResult, deadline: Deadline) -> dict | None:
+    """Hospital Matcher result, or None when it is not configured, failed or there is no time for it."""
+    if not HOSPITAL_MATCHER_FUNCTION_NAME:
+        return None
+    timeout = deadline.timeout(EMERGENCY_MATCH_TIMEOUT_SECONDS, reserve=ROUTE_RESERVE_SECONDS)
+    if timeout < EMERGENCY_STAGE_MIN_SECONDS:
+        logger.warning("Skipping Hospital Matcher: %.2fs left on request deadline", deadline.remaining())
+        return None
+    try:
+        body = match_request(request, result)
+        return await asyncio.wait_for(aio.run_blocking(_invoke_hospital_matcher, body), timeout)
+    except Exception as e:
+        logger.warning("Hospital Matcher failed, using catalog ranking: %s", type(e).__name__)
+        return None
+
+
+def _destination(hospital: dict, catalog: list[dict]) -> dict:
+    """get_directions destination args: catalog coordinates by hospital_id, else the hospital's own, else its name."""
+    for h in (*(c for c in catalog if c.get("hospital_id") == hospital.get("hospital_id")), hospital):
+        if h.get("lat") is not None and h.get("lon") is not None:
+            return {"dest_lat": h["lat"], "dest_lon": h["lon"]}
+    return {"dest_address": hospital.get("name") or ""}
+
+
+async def _route(request: TriageRequest, hospital: dict, catalog: list[dict], deadline: Deadline) -> dict:
+    """Route from the patient to hospital; errors are reported in the event, never raised."""
+    event = {"event": "route", "hospital_id": hospital.get("hospital_id")}
+    args = {
+        "origin_lat": request.patient_location_lat,
+        "origin_lon": request.patient_location_lon,
+        **_destination(hospital, catalog),
+    }
+    try:
+        data = tool_json(
+            await acall_gateway_tool(
+                DIRECTIONS_TOOL_NAME, args, timeout=deadline.timeout(EMERGENCY_ROUTE_TIMEOUT_SECONDS)
+            )
+        )
+    except Exception as e:
+        logger.warning("Emergency route failed hospital_id=%s: %s", hospital.get("hospital_id"), type(e).__name__)
+        data = {"error": "Route unavailable"}
+    for key in ("distance_km", "duration_minutes", "directions_url"):
+        event[key] = data.get(key)
+    if data.get("error"):
+        event["error"] = str(data["error"])
+    return event
+
+
+async def emergency_events(
+    request: TriageRequest,
+    deadline: Deadline,
+    persist: Callable[[TriageResult], object] | None = None,
+) -> AsyncIterator[dict]:
+    """
+    Run the pipeline and yield its events in order (routes in completion order). persist(result) is a
+    blocking call (Aurora insert) run alongside matching; its return value is reported as the done event's id.
+    """
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
+    skipped: list[str] = []
+
+    catalog_task = asyncio.ensure_future(_catalog(deadline))
+    triage_budget = max(deadline.remaining() - EMERGENCY_DOWNSTREAM_RESERVE_SECONDS, deadline.remaining() / 2)
+    t0 = time.perf_counter()
+    result = await assess_triage_async(request, deadline=Deadline(triage_budget))
+    timings["triage"] = _elapsed_ms(t0)
+    yield {"event": "triage", **result.model_dump(mode="json"), "elapsed_ms": _elapsed_ms(start)}
+
+    persist_task = asyncio.ensure_future(aio.run_blocking(persist, result)) if persist is not None else None
+
+    t0 = time.perf_counter()
+    matched = await _match(request, result, deadline)
+    try:
+        catalog = await asyncio.wait_for(asyncio.shield(catalog_task), max(deadline.remaining(), 0.01))
+    except asyncio.TimeoutError:
+        catalog = []
+    if matched is not None:
+        hospitals, disclaimer, source = matched.get("hospitals") or [], matched.get("safety_disclaimer"), "matcher"
+    elif catalog:
+        hospitals, disclaimer, source = catalog[:EMERGENCY_HOSPITAL_LIMIT], None, "catalog"
+    else:
+        hospitals, disclaimer, source = [], None, "none"
+        skipped.append("hospitals")
+    timings["hospitals"] = _elapsed_ms(t0)
+    yield {
+        "event": "hospitals",
+        "hospitals": hospitals,
+        "safety_disclaimer": disclaimer,
+        "source": source,
+        "elapsed_ms": _elapsed_ms(start),
+    }
+
+    # Hospitals the matcher already routed (it has the patient location too) are not routed again
+    to_route = [h for h in hospitals[:EMERGENCY_HOSPITAL_LIMIT] if h.get("duration_minutes") is None]
+    has_location = request.patient_location_lat is not None and request.patient_location_lon is not None
+    if has_location and to_route:
+        if deadline.remaining() < EMERGENCY_STAGE_MIN_SECONDS or not await aio.run_blocking(is_gateway_configured):
+            skipped.append("routes")
+        else:
+            t0 = time.perf_counter()
+            for next_route in asyncio.as_completed([_route(request, h, catalog, deadline) for h in to_route]):
+                yield {**(await next_route), "elapsed_ms": _elapsed_ms(start)}
+            timings["routes"] = _elapsed_ms(t0)
+
+    done: dict = {"event": "done"}
+    if persist_task is not None:
+        t0 = time.perf_counter()
+        try:
+            row_id = await asyncio.wait_for(persist_task, max(deadline.remaining(), 0.01))
+        except Exception as e:
+            logger.warning("Emergency persist not awaited: %s", type(e).__name__)
+            row_id = None
+        if row_id:
+            done["id"] = str(row_id)
+        timings["persist_wait"] = _elapsed_ms(t0)
+    if not catalog_task.done():
+        catalog_task.cancel()
+    elapsed = _elapsed_ms(start)
+    logger.info(
+        "Emergency pipeline severity=%s hospitals=%d source=%s skipped=%s timings_ms=%s elapsed_ms=%.2f",
+        result.severity,
+        len(hospitals),
+        source,
+        skipped or "-",
+        timings,
+        elapsed,
+    )
+    yield {**done, "skipped": skipped, "timings_ms": timings, "elapsed_ms": elapsed}
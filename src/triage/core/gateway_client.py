@@ -1,5 +1,8 @@
 """
-Gateway MCP client for Lambda (sync). Used by Triage to call Eka tools when configured.
+Gateway MCP client for Lambda. Used by Triage to call Eka tools when configured.
+
+Awaitable (triage.core.aio.http_request): acall_gateway_tool, asearch_medications and asearch_protocols
+are awaited by the Converse loop; call_gateway_tool, search_medications and search_protocols are sync adapters.
 
 Supports two modes:
 - Env vars: GATEWAY_MCP_URL, GATEWAY_CLIENT_ID, GATEWAY_CLIENT_SECRET, GATEWAY_TOKEN_ENDPOINT
@@ -11,9 +14,11 @@ import logging
 import os
 import time
 import urllib.parse
-import urllib.request
 from typing import Any
 
+from lambda_common.breaker import get_breaker
+from triage.core.aio import http_request, run, run_blocking
+
 logger = logging.getLogger(__name__)
 
 _TOKEN_BUFFER = 300
@@ -32,10 +37,10 @@ def _load_gateway_config_from_secret() -> dict | None:
     if not secret_name:
         return None
     try:
-        import boto3
-        client = boto3.client("secretsmanager")
-        resp = client.get_secret_value(SecretId=secret_name)
-        _cached_config = json.loads(resp["SecretString"])
+        from lambda_common.clients import get_client
+        from lambda_common.credentials import secret_json
+
+        _cached_config = secret_json(get_client("secretsmanager", None), secret_name)
         return _cached_config
     except Exception as e:
         logger.warning("Could not load gateway config from secret: %s", e)
@@ -71,12 +76,8 @@ def _get_gateway_url() -> str:
     return url
 
 
-def _get_token() -> str:
-    global _token, _token_expires_at
-    now = time.time()
-    if _token and _token_expires_at > now + _TOKEN_BUFFER:
-        return _token
-
+def _oauth_params() -> tuple[str, dict[str, str]]:
+    """(token endpoint, client_credentials form fields) from the gateway secret or env vars."""
     config = _load_gateway_config_from_secret()
     if config:
         ci = config.get("client_info") or {}
@@ -92,21 +93,26 @@ def _get_token() -> str:
 
     if not endpoint or not cid or not secret:
         raise ValueError("Missing Gateway OAuth config (set env vars or GATEWAY_CONFIG_SECRET_NAME)")
+    return endpoint, {"grant_type": "client_credentials", "client_id": cid, "client_secret": secret, "scope": scope}
+
+
+async def _aget_token(timeout: float = 10) -> str:
+    global _token, _token_expires_at
+    now = time.time()
+    if _token and _token_expires_at > now + _TOKEN_BUFFER:
+        return _token
 
-    data = urllib.parse.urlencode({
-        "grant_type": "client_credentials",
-        "client_id": cid,
-        "client_secret": secret,
-        "scope": scope,
-    }).encode("utf-8")
-    req = urllib.request.Request(
+    endpoint, form = await run_blocking(_oauth_params)
+    status, data = await http_request(
+        "POST",
         endpoint,
-        data=data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        method="POST",
+        urllib.parse.urlencode(form).encode("utf-8"),
+        {"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=timeout,
     )
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        body = json.loads(resp.read().decode("utf-8"))
+    if status >= 400:
+        raise RuntimeError(f"Gateway OAuth HTTP {status}")
+    body = json.loads(data.decode("utf-8"))
     _token = body.get("access_token")
     if not _token:
         raise ValueError("No access_token in OAuth response")
@@ -114,33 +120,51 @@ def _get_token() -> str:
     return _token
 
 
-def call_gateway_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-    """Call Gateway MCP tools/call. Returns result dict."""
-    token = _get_token()
-    url = _get_gateway_url()
+def _get_token(timeout: float = 10) -> str:
+    return run(_aget_token(timeout))
+
+
+async def acall_gateway_tool(tool_name: str, arguments: dict[str, Any], timeout: float = 15) -> dict[str, Any]:
+    """
+    Call Gateway MCP tools/call via triage.core.aio.http_request. Returns result dict. timeout bounds the
+    token fetch and the call (seconds). Transport failures count against the "gateway" circuit; when it is
+    open this raises CircuitOpenError at once.
+    """
+    if timeout <= 0:
+        raise TimeoutError(f"No time budget left for Gateway tool {tool_name}")
+    url = _get_gateway_url() if _cached_config is not None else await run_blocking(_get_gateway_url)
     if not url:
         raise ValueError("Gateway URL not configured")
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": arguments},
-    }
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        result = json.loads(resp.read().decode("utf-8"))
+    start = time.monotonic()
+    with get_breaker("gateway").guard():
+        token = await _aget_token(timeout=min(10, timeout))
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": tool_name, "arguments": arguments},
+        }
+        status, data = await http_request(
+            "POST",
+            url,
+            json.dumps(payload).encode("utf-8"),
+            {"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+            timeout=timeout - (time.monotonic() - start),
+        )
+        if status >= 400:
+            raise RuntimeError(f"Gateway HTTP {status}: {data[:200].decode('utf-8', errors='replace')}")
+        result = json.loads(data.decode("utf-8"))
     if "error" in result:
         raise RuntimeError(f"Gateway tool error: {result['error']}")
     return result.get("result") or {}
 
 
-def search_medications(drug_name: str | None = None, form: str | None = None, generic_names: str | None = None) -> dict:
-    """Call eka-target___search_medications."""
+def call_gateway_tool(tool_name: str, arguments: dict[str, Any], timeout: float = 15) -> dict[str, Any]:
+    """Sync adapter for acall_gateway_tool."""
+    return run(acall_gateway_tool(tool_name, arguments, timeout=timeout))
+
+
+def _medication_args(drug_name: str | None, form: str | None, generic_names: str | None) -> dict:
     args = {}
     if drug_name:
         args["drug_name"] = drug_name
@@ -148,9 +172,35 @@ def search_medications(drug_name: str | None = None, form: str | None = None, ge
         args["form"] = form
     if generic_names:
         args["generic_names"] = generic_names
-    return call_gateway_tool("eka-target___search_medications", args)
+    return args
 
 
-def search_protocols(queries: list[dict]) -> dict:
+async def asearch_medications(
+    drug_name: str | None = None,
+    form: str | None = None,
+    generic_names: str | None = None,
+    timeout: float = 15,
+) -> dict:
+    """Call eka-target___search_medications."""
+    args = _medication_args(drug_name, form, generic_names)
+    return await acall_gateway_tool("eka-target___search_medications", args, timeout=timeout)
+
+
+async def asearch_protocols(queries: list[dict], timeout: float = 15) -> dict:
     """Call eka-target___search_protocols. queries: list of {query, tag, publisher}."""
-    return call_gateway_tool("eka-target___search_protocols", {"queries": queries})
+    return await acall_gateway_tool("eka-target___search_protocols", {"queries": queries}, timeout=timeout)
+
+
+def search_medications(
+    drug_name: str | None = None,
+    form: str | None = None,
+    generic_names: str | None = None,
+    timeout: float = 15,
+) -> dict:
+    """Sync adapter for asearch_medications."""
+    return run(asearch_medications(drug_name=drug_name, form=form, generic_names=generic_names, timeout=timeout))
+
+
+def search_protocols(queries: list[dict], timeout: float = 15) -> dict:
+    """Sync adapter for asearch_protocols."""
+    return run(asearch_protocols(queries, timeout=timeout))
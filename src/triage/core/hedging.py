@@ -0,0 +1,111 @@
+"""Hedged requests: start the primary backend, add a secondary after a delay, first valid result wins.
+
+A slow AgentCore cold session otherwise blocks the user for its whole duration. With hedging, if the
+primary has not produced a valid result within hedge_delay (e.g. the observed p90), the secondary is
+launched in parallel. The loser is ignored (threads cannot be cancelled); when it finishes its latency is
+logged so the saved time can be measured.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Counters for logs / tests: requests, hedges launched, wins per role, total ms saved by secondary wins
+HEDGE_STATS = {"requests": 0, "hedged": 0, "primary_wins": 0, "secondary_wins": 0, "no_valid": 0, "saved_ms": 0.0}
+_stats_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="triage-hedge")
+    return _executor
+
+
+def _count(name: str, value: float = 1) -> None:
+    with _stats_lock:
+        HEDGE_STATS[name] += value
+
+
+def _valid_result(future: Future, is_valid: Callable[[T], bool]) -> T | None:
+    try:
+        result = future.result()
+    except Exception as e:
+        logger.warning("Hedged backend raised: %s", e)
+        return None
+    return result if is_valid(result) else None
+
+
+def hedged_call(
+    primary: tuple[str, Callable[[], T]],
+    secondary: tuple[str, Callable[[], T]],
+    hedge_delay: float,
+    is_valid: Callable[[T], bool],
+) -> tuple[T | None, str | None, T | None]:
+    """
+    Run primary; if it has no valid result after hedge_delay seconds, also run secondary.
+    Returns (winning result, winner name, last invalid result seen). Winner is None when neither produced
+    a valid result; callers can then fall back to the invalid result (e.g. a safety fallback).
+    """
+    start = time.perf_counter()
+    _count("requests")
+    primary_name, primary_fn = primary
+    secondary_name, secondary_fn = secondary
+    pool = _get_executor()
+    names: dict[Future, str] = {pool.submit(primary_fn): primary_name}
+    pending = set(names)
+    invalid: T | None = None
+    hedged = False
+
+    done, pending = wait(pending, timeout=hedge_delay)
+    while True:
+        for future in done:
+            result = _valid_result(future, is_valid)
+            name = names[future]
+            if result is not None:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                role = "primary" if name == primary_name else "secondary"
+                _count(f"{role}_wins")
+                logger.info("Triage hedge winner=%s role=%s hedged=%s duration_ms=%.2f", name, role, hedged, elapsed_ms)
+                if role == "secondary":
+                    # Saved time is known once the ignored primary eventually completes
+                    for loser in pending:
+                        loser.add_done_callback(lambda _f, ms=elapsed_ms: _log_saved(primary_name, ms, start))
+                return result, name, invalid
+            if not future.exception():
+                invalid = future.result()
+        if not hedged:
+            # Primary finished invalid or hedge delay elapsed: launch secondary now
+            hedged = True
+            _count("hedged")
+            logger.info(
+                "Triage hedge launched secondary=%s after_ms=%.2f",
+                secondary_name,
+                (time.perf_counter() - start) * 1000,
+            )
+            future = pool.submit(secondary_fn)
+            names[future] = secondary_name
+            pending.add(future)
+        if not pending:
+            break
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    _count("no_valid")
+    logger.warning("Triage hedge: no valid result from %s or %s", primary_name, secondary_name)
+    return None, None, invalid
+
+
+def _log_saved(loser: str, winner_ms: float, start: float) -> None:
+    loser_ms = (time.perf_counter() - start) * 1000
+    saved = max(0.0, loser_ms - winner_ms)
+    if saved:
+        _count("saved_ms", saved)
+    logger.info("Triage hedge loser=%s finished_ms=%.2f saved_ms=%.2f", loser, loser_ms, saved)
@@ -0,0 +1,227 @@
+"""START / JumpSTART mass-casualty triage without an LLM, vectorized with NumPy when available.
+
+Incident commanders need an instant sort of hundreds of patients. Each patient is tagged by the START
+algorithm (adults) or JumpSTART (children under PEDIATRIC_MAX_AGE_YEARS, from age_years):
+
+  ambulatory                                   -> green
+  apneic: breathes after airway repositioning  -> red, else black
+          (JumpSTART: with a peripheral pulse, 5 rescue breaths; breathing -> red, else black)
+  respiratory rate > 30 (child: < 15 or > 45)  -> red
+  perfusion: capillary refill > 2 s or no radial pulse (child: no peripheral pulse) -> red
+  mental status: cannot obey commands, AVPU P/U (child: inappropriate P or U)        -> red
+  otherwise                                    -> yellow
+
+Unmeasured values (NaN / None) in a non-ambulatory patient tag red, and black needs an explicit failed
+airway (and, for children, pulse or rescue-breath) check: missing data never under-triages. Tags map onto SeverityLevel; black keeps "critical" so no automated path lowers the
+severity of an expectant patient (the tag carries the resource decision).
+
+NumPy is optional (pip install .[mci]); without it the same rules run per patient in pure Python.
+"""
+
+import math
+import os
+from collections.abc import Sequence
+
+from triage.models.triage import SeverityLevel
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only where numpy is missing
+    np = None
+
+GREEN, YELLOW, RED, BLACK = 0, 1, 2, 3
+TAG_NAMES = ("green", "yellow", "red", "black")
+SEVERITY_BY_TAG: tuple[SeverityLevel, ...] = ("low", "medium", "critical", "critical")
+# Treatment / transport rank per tag code: red first, then yellow, green, black
+TAG_PRIORITY = (2, 1, 0, 3)
+
+# AVPU mental status codes
+MENTAL_ALERT, MENTAL_VERBAL, MENTAL_PAIN, MENTAL_PAIN_INAPPROPRIATE, MENTAL_UNRESPONSIVE = range(5)
+MENTAL_CODES = {
+    "a": MENTAL_ALERT,
+    "v": MENTAL_VERBAL,
+    "p": MENTAL_PAIN,
+    "p_inappropriate": MENTAL_PAIN_INAPPROPRIATE,
+    "u": MENTAL_UNRESPONSIVE,
+}
+
+PEDIATRIC_MAX_AGE_YEARS = 8.0
+ADULT_MAX_RR = 30.0
+CHILD_MIN_RR, CHILD_MAX_RR = 15.0, 45.0
+MAX_CAPILLARY_REFILL_S = 2.0
+
+# POST /triage/mci body limit (API Gateway caps payloads at 10 MB; ~200 bytes per patient)
+MCI_MAX_PATIENTS = int(os.environ.get("MCI_MAX_PATIENTS", "20000"))
+
+
+def has_numpy() -> bool:
+    return np is not None
+
+
+def _tag_one(
+    rr: float,
+    ambulatory: float,
+    mental: float,
+    cap_refill: float,
+    pulse: float,
+    age: float,
+    airway: float,
+    rescue: float,
+) -> int:
+    """Reference implementation for one patient (NaN = unknown for every argument)."""
+    if ambulatory == 1:
+        return GREEN
+    child = age < PEDIATRIC_MAX_AGE_YEARS  # NaN compares False: unknown age is adult
+    if rr == 0:
+        # Black only on an explicit "did not breathe"; an unrecorded check stays red
+        if airway != 0:
+            return RED
+        if not child:
+            return BLACK
+        return BLACK if pulse == 0 or rescue == 0 else RED
+    if math.isnan(rr):
+        return RED
+    if child:
+        if rr < CHILD_MIN_RR or rr > CHILD_MAX_RR or pulse != 1:
+            return RED
+        return RED if not mental < MENTAL_PAIN_INAPPROPRIATE else YELLOW
+    if rr > ADULT_MAX_RR:
+        return RED
+    perfusion_ok = pulse != 0 and (cap_refill <= MAX_CAPILLARY_REFILL_S or (math.isnan(cap_refill) and pulse == 1))
+    if not perfusion_ok:
+        return RED
+    return RED if not mental < MENTAL_PAIN else YELLOW
+
+
+def _vectorized(rr, ambulatory, mental, cap_refill, pulse, age, airway, rescue):
+    """Same rules as _tag_one on float64 arrays; first matching condition wins (np.select order)."""
+    child = age < PEDIATRIC_MAX_AGE_YEARS
+    apneic = rr == 0
+    adult_perfusion_ok = (pulse != 0) & ((cap_refill <= MAX_CAPILLARY_REFILL_S) | (np.isnan(cap_refill) & (pulse == 1)))
+    conditions = [
+        ambulatory == 1,
+        apneic & (airway != 0),
+        apneic & ~child,
+        apneic & ((pulse == 0) | (rescue == 0)),
+        apneic,
+        np.isnan(rr),
+        child & ((rr < CHILD_MIN_RR) | (rr > CHILD_MAX_RR) | (pulse != 1) | ~(mental < MENTAL_PAIN_INAPPROPRIATE)),
+        child,
+        (rr > ADULT_MAX_RR) | ~adult_perfusion_ok | ~(mental < MENTAL_PAIN),
+    ]
+    choices = [GREEN, RED, BLACK, BLACK, RED, RED, RED, YELLOW, RED]
+    return np.select(conditions, choices, default=YELLOW).astype(np.uint8)
+
+
+def _column(values, n: int) -> list[float]:
+    """Floats with NaN for None / missing; booleans become 1.0 / 0.0."""
+    if values is None:
+        return [math.nan] * n
+    return [math.nan if v is None else float(v) for v in values]
+
+
+def start_jumpstart(
+    respiratory_rate: Sequence,
+    ambulatory: Sequence,
+    mental_status: Sequence,
+    capillary_refill_s: Sequence | None = None,
+    radial_pulse: Sequence | None = None,
+    age_years: Sequence | None = None,
+    breathes_after_airway: Sequence | None = None,
+    rescue_breaths_effective: Sequence | None = None,
+):
+    """
+    Tag codes (GREEN/YELLOW/RED/BLACK) for n patients from parallel arrays. mental_status holds AVPU codes
+    (MENTAL_*); radial_pulse is the peripheral pulse for children. Returns a uint8 numpy array when NumPy
+    is installed (arrays in, no per-patient Python), else a list of ints.
+    """
+    n = len(respiratory_rate)
+    if np is not None:
+        def col(values):
+            if values is None:
+                return np.full(n, np.nan)
+            arr = np.asarray(values)
+            return arr.astype(np.float64) if arr.dtype != object else np.asarray(_column(values, n))
+
+        return _vectorized(
+            col(respiratory_rate),
+            col(ambulatory),
+            col(mental_status),
+            col(capillary_refill_s),
+            col(radial_pulse),
+            col(age_years),
+            col(breathes_after_airway),
+            col(rescue_breaths_effective),
+        )
+    columns = [
+        _column(c, n)
+        for c in (
+            respiratory_rate,
+            ambulatory,
+            mental_status,
+            capillary_refill_s,
+            radial_pulse,
+            age_years,
+            breathes_after_airway,
+            rescue_breaths_effective,
+        )
+    ]
+    return [_tag_one(*row) for row in zip(*columns)]
+
+
+def _mental_code(value) -> float | None:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    code = MENTAL_CODES.get(str(value).strip().lower().replace("-", "_").replace(" ", "_"))
+    if code is None:
+        raise ValueError(f"mental_status must be one of A, V, P, P_inappropriate, U (got {value!r})")
+    return code
+
+
+PATIENT_FIELDS = (
+    "respiratory_rate",
+    "ambulatory",
+    "mental_status",
+    "capillary_refill_s",
+    "radial_pulse",
+    "age_years",
+    "breathes_after_airway",
+    "rescue_breaths_effective",
+)
+
+
+def patient_codes(patients: list[dict]):
+    """
+    Tag codes for patient dicts with the PATIENT_FIELDS keys (all but respiratory_rate, ambulatory and
+    mental_status optional). mental_status is "A", "V", "P", "P_inappropriate", "U" or a MENTAL_* code.
+    Raises ValueError / TypeError on non-numeric values.
+    """
+    columns = {field: [p.get(field) for p in patients] for field in PATIENT_FIELDS}
+    columns["mental_status"] = [_mental_code(v) for v in columns["mental_status"]]
+    return start_jumpstart(**columns)
+
+
+def triage_patients(patients: list[dict]) -> list[dict]:
+    """[{"index", "tag", "severity"}] for each patient dict, in input order."""
+    return [
+        {"index": i, "tag": TAG_NAMES[code], "severity": SEVERITY_BY_TAG[code]}
+        for i, code in enumerate(int(c) for c in patient_codes(patients))
+    ]
+
+
+def priority_order(codes) -> list[int]:
+    """Patient indices in treatment order (red, yellow, green, black), stable within a tag."""
+    if np is not None and isinstance(codes, np.ndarray):
+        return np.argsort(np.asarray(TAG_PRIORITY, dtype=np.uint8)[codes], kind="stable").tolist()
+    return sorted(range(len(codes)), key=lambda i: TAG_PRIORITY[int(codes[i])])
+
+
+def tag_counts(codes) -> dict[str, int]:
+    """Patients per tag name, e.g. {"red": 12, "yellow": 30, "green": 51, "black": 2}."""
+    if np is not None and isinstance(codes, np.ndarray):
+        counts = np.bincount(codes, minlength=len(TAG_NAMES)).tolist()
+    else:
+        counts = [0] * len(TAG_NAMES)
+        for code in codes:
+            counts[int(code)] += 1
+    return dict(zip(TAG_NAMES, counts))
@@ -0,0 +1,167 @@
+"""Deterministic red-flag pre-triage. Answers obvious critical cases in microseconds, before the LLM.
+
+Rules are data (RED_FLAG_RULES, or a JSON file via RED_FLAG_RULES_PATH) compiled once into per-vital
+threshold lists, a single keyword regex and a canonical symptom code table (triage.core.symptoms, so
+"behosh" or "மயக்கம்" match the same rule as "unconscious"). Vital keys are the VITALS_RANGES keys; aliases
+(bp / blood_pressure_systolic, heart_rate / heartRateBpm) are listed as separate keys on one rule.
+"""
+
+import json
+import logging
+import operator
+import os
+import re
+
+from triage.core.symptoms import symptom_codes
+from triage.models.triage import TriageRequest, TriageResult
+
+logger = logging.getLogger(__name__)
+
+RED_FLAG_RULES_PATH = os.environ.get("RED_FLAG_RULES_PATH", "").strip()
+
+# severity: critical (ESI 1) or high (ESI 2). Highest matched severity wins.
+RED_FLAG_RULES = [
+    {"id": "hypoxia", "vitals": ["spo2"], "op": "<", "value": 90, "severity": "critical",
+     "reason": "SpO2 below 90%"},
+    {"id": "hypotension", "vitals": ["blood_pressure_systolic", "bp"], "op": "<", "value": 90, "severity": "critical",
+     "reason": "Systolic BP below 90 mmHg"},
+    {"id": "tachypnea", "vitals": ["respiratory_rate"], "op": ">", "value": 30, "severity": "high",
+     "reason": "Respiratory rate above 30/min"},
+    {"id": "bradypnea", "vitals": ["respiratory_rate"], "op": "<", "value": 8, "severity": "critical",
+     "reason": "Respiratory rate below 8/min"},
+    {"id": "tachycardia", "vitals": ["heart_rate", "heartRateBpm"], "op": ">", "value": 130, "severity": "high",
+     "reason": "Heart rate above 130 bpm"},
+    {"id": "bradycardia", "vitals": ["heart_rate", "heartRateBpm"], "op": "<", "value": 40, "severity": "critical",
+     "reason": "Heart rate below 40 bpm"},
+    {"id": "altered_consciousness", "severity": "critical", "reason": "Altered consciousness", "codes": ["unconscious"],
+     "keywords": ["unconscious", "unresponsive", "not responding", "comatose", "coma", "fainted", "passed out"]},
+    {"id": "airway_breathing", "severity": "critical", "reason": "Airway or breathing compromise",
+     "keywords": ["not breathing", "stopped breathing", "choking", "gasping", "blue lips", "cyanosis"]},
+    {"id": "seizure", "severity": "critical", "reason": "Active seizure", "codes": ["seizure"],
+     "keywords": ["seizure", "seizing", "convulsion", "convulsions", "fits"]},
+    {"id": "major_bleeding", "severity": "critical", "reason": "Severe bleeding",
+     "keywords": ["severe bleeding", "heavy bleeding", "uncontrolled bleeding", "haemorrhage", "hemorrhage"]},
+]
+
+_OPS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+_SEVERITY_RANK = {"high": 0, "critical": 1}
+
+RED_FLAG_DISCLAIMER = "This is rule-based triage from red-flag vitals/symptoms. Seek professional medical care immediately."
+RED_FLAG_CONFIDENCE = 0.95
+
+
+def _check_rule(rule) -> None:
+    """Raise ValueError unless rule has everything match() and evaluate_red_flags() read."""
+    if not isinstance(rule, dict):
+        raise ValueError(f"Red-flag rule must be an object, got {type(rule).__name__}")
+    rule_id = rule.get("id")
+    if not isinstance(rule_id, str) or not rule_id:
+        raise ValueError("Red-flag rule: id is required")
+    if rule.get("severity") not in _SEVERITY_RANK:
+        raise ValueError(f"Red-flag rule {rule_id}: severity must be critical or high")
+    if not isinstance(rule.get("reason"), str):
+        raise ValueError(f"Red-flag rule {rule_id}: reason is required")
+    for key in ("vitals", "codes", "keywords"):
+        values = rule.get(key)
+        if values is not None and (not isinstance(values, list) or not all(isinstance(v, str) for v in values)):
+            raise ValueError(f"Red-flag rule {rule_id}: {key} must be a list of strings")
+    if rule.get("vitals"):
+        if rule.get("op") not in _OPS:
+            raise ValueError(f"Red-flag rule {rule_id}: op must be one of {', '.join(_OPS)}")
+        value = rule.get("value")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Red-flag rule {rule_id}: value must be a number")
+
+
+class CompiledRules:
+    """Rules compiled for fast evaluation: vital key -> [(op, value, rule)], one keyword regex, code -> rule."""
+
+    __slots__ = ("by_vital", "keyword_re", "keyword_rules", "code_rules")
+
+    def __init__(self, rules: list[dict]):
+        self.by_vital: dict[str, list[tuple]] = {}
+        self.keyword_rules: dict[str, dict] = {}
+        self.code_rules: dict[str, dict] = {}
+        patterns = []
+        for rule in rules:
+            _check_rule(rule)
+            if rule.get("vitals"):
+                op = _OPS[rule["op"]]
+                for key in rule["vitals"]:
+                    self.by_vital.setdefault(key, []).append((op, float(rule["value"]), rule))
+            for code in rule.get("codes") or []:
+                self.code_rules[code] = rule
+            for kw in rule.get("keywords") or []:
+                kw = kw.strip().lower()
+                self.keyword_rules[kw] = rule
+                patterns.append(re.escape(kw))
+        # Longest first so "not breathing" wins over shorter overlaps
+        patterns.sort(key=len, reverse=True)
+        self.keyword_re = re.compile(r"\b(?:" + "|".join(patterns) + r")\b") if patterns else None
+
+    def match(self, symptoms: list[str], vitals: dict[str, float]) -> list[dict]:
+        """Return matched rules (deduplicated, in match order)."""
+        hits: dict[str, dict] = {}
+        by_vital = self.by_vital
+        for key, val in vitals.items():
+            checks = by_vital.get(key)
+            if checks:
+                for op, threshold, rule in checks:
+                    if op(val, threshold):
+                        hits.setdefault(rule["id"], rule)
+        if self.keyword_re is not None and symptoms:
+            for m in self.keyword_re.finditer(" | ".join(symptoms).lower()):
+                rule = self.keyword_rules[m.group(0)]
+                hits.setdefault(rule["id"], rule)
+        if self.code_rules and symptoms:
+            for code in symptom_codes(symptoms):
+                rule = self.code_rules.get(code)
+                if rule:
+                    hits.setdefault(rule["id"], rule)
+        return list(hits.values())
+
+
+def load_rules() -> list[dict]:
+    """Rules from RED_FLAG_RULES_PATH (JSON list) when set and every rule is valid, else the built-in table."""
+    if RED_FLAG_RULES_PATH:
+        try:
+            with open(RED_FLAG_RULES_PATH, encoding="utf-8") as f:
+                rules = json.load(f)
+            if not isinstance(rules, list):
+                raise ValueError("rules file must hold a JSON list")
+            for rule in rules:
+                _check_rule(rule)
+            return rules
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load red-flag rules from %s, using built-in: %s", RED_FLAG_RULES_PATH, e)
+    return RED_FLAG_RULES
+
+
+_compiled: CompiledRules | None = None
+
+
+def _get_compiled() -> CompiledRules:
+    global _compiled
+    if _compiled is None:
+        _compiled = CompiledRules(load_rules())
+    return _compiled
+
+
+def evaluate_red_flags(request: TriageRequest, rules: CompiledRules | None = None) -> TriageResult | None:
+    """Return a critical/high TriageResult with force_high_priority=True if any red flag matches, else None."""
+    hits = (rules or _get_compiled()).match(request.symptoms, request.vitals)
+    if not hits:
+        return None
+    severity = max((r["severity"] for r in hits), key=_SEVERITY_RANK.__getitem__)
+    recommendations = [f"Red flag: {r['reason']}" for r in hits]
+    recommendations.append("Immediate transport to nearest emergency facility; alert receiving facility.")
+    if severity == "critical":
+        recommendations.append("Assess and support airway, breathing and circulation now.")
+    return TriageResult(
+        severity=severity,
+        confidence=RED_FLAG_CONFIDENCE,
+        recommendations=recommendations,
+        force_high_priority=True,
+        safety_disclaimer=RED_FLAG_DISCLAIMER,
+        session_id=request.session_id,
+    )
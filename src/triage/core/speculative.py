@@ -0,0 +1,70 @@
+"""Speculative hospital matching: start the POST /hospitals work as soon as triage severity is known.
+
+The E2E flow triage -> hospitals -> route used to start matching only after the client had the triage
+response. With SPECULATIVE_HOSPITAL_MATCH on and a session_id, the triage handler invokes the Hospital
+Matcher Lambda asynchronously (InvocationType=Event, fire-and-forget) with the request the client is
+expected to send next: the result's severity and recommendations, the patient location when supplied,
+and the default limit. The Hospital Matcher stores the match per session_id (hospital_matcher.core.speculative);
+POST /hospitals returns it instantly when its inputs match and computes fresh when they do not.
+"""
+
+import json
+import logging
+import os
+
+from lambda_common.clients import REGION, get_client
+from triage.core.deadline import Deadline
+from triage.models.triage import TriageRequest, TriageResult
+
+logger = logging.getLogger(__name__)
+
+SPECULATIVE_HOSPITAL_MATCH = os.environ.get("SPECULATIVE_HOSPITAL_MATCH", "").lower() in ("1", "true", "yes")
+HOSPITAL_MATCHER_FUNCTION_NAME = os.environ.get("HOSPITAL_MATCHER_FUNCTION_NAME", "").strip()
+# Same as the HospitalMatchRequest default, which is what clients send
+SPECULATIVE_MATCH_LIMIT = int(os.environ.get("SPECULATIVE_MATCH_LIMIT", "3"))
+# The async invoke is one short API call; skip it when the response itself is at risk
+SPECULATIVE_MIN_SECONDS = 1.0
+
+
+def speculative_match_request(request: TriageRequest, result: TriageResult) -> dict | None:
+    """HospitalMatchRequest body the client is expected to send for this result; None without a session_id."""
+    session_id = result.session_id or request.session_id
+    if not session_id:
+        return None
+    body = {
+        "severity": result.severity,
+        "recommendations": result.recommendations,
+        "limit": SPECULATIVE_MATCH_LIMIT,
+        "session_id": session_id,
+        "patient_id": request.patient_id,
+        "patient_location_lat": request.patient_location_lat,
+        "patient_location_lon": request.patient_location_lon,
+    }
+    return {k: v for k, v in body.items() if v is not None}
+
+
+def start_speculative_match(request: TriageRequest, result: TriageResult, deadline: Deadline | None = None) -> bool:
+    """Fire-and-forget Hospital Matcher invocation. Returns True when started; failures are logged, not raised."""
+    if not SPECULATIVE_HOSPITAL_MATCH or not HOSPITAL_MATCHER_FUNCTION_NAME:
+        return False
+    body = speculative_match_request(request, result)
+    if body is None:
+        return False
+    if deadline is not None and deadline.remaining() < SPECULATIVE_MIN_SECONDS:
+        logger.warning("Skipping speculative hospital match: %.2fs left on request deadline", deadline.remaining())
+        return False
+    try:
+        get_client("lambda", REGION).invoke(
+            FunctionName=HOSPITAL_MATCHER_FUNCTION_NAME,
+            InvocationType="Event",
+            Payload=json.dumps({"speculative_match": body}).encode("utf-8"),
+        )
+    except Exception as e:
+        logger.warning("Speculative hospital match not started: %s", e)
+        return False
+    logger.info(
+        "Speculative hospital match started severity=%s location=%s",
+        result.severity,
+        "patient_location_lat" in body,
+    )
+    return True
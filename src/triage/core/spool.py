@@ -0,0 +1,303 @@
+"""Write-behind persistence for triage assessments with a local spool.
+
+Persisting inline makes every response wait for connect + insert + commit, although a failed insert is
+not fatal. With TRIAGE_WRITE_BEHIND on, the handler enqueues the row instead and returns its pre-generated
+id at once:
+
+- enqueue() commits the row to a SQLite spool in /tmp (WAL, synchronous=FULL) before returning, so a
+  crashed or restarted runtime finds it again;
+- a background worker flushes ready rows in batches of SPOOL_BATCH_SIZE with one multi-row insert (each
+  with a SPOOL_FLUSH_CONNECT_TIMEOUT connect timeout) and deletes them from the spool only after the
+  commit;
+- a failed flush keeps the rows and retries them with exponential backoff (SPOOL_RETRY_BASE_SECONDS
+  doubling up to SPOOL_RETRY_MAX_SECONDS, with jitter). Rows are never dropped; rows that already failed
+  are retried one at a time so a single bad row cannot hold back the rest;
+- the insert is idempotent on the pre-generated id, so a flush that committed but was cut off before the
+  spool delete does not duplicate the row.
+
+Lambda freezes the process once the handler returns, so a row the worker has not written by then waits
+for the next warm invocation: resume_spool() at the start of each invocation restarts the worker on rows
+left by an earlier invocation or process, and logs how many there are.
+
+The spool is durable only within one execution environment: /tmp goes away with it, so rows still
+pending when Lambda reaps the environment (no later invocation, or Aurora unreachable for all of them)
+are lost. Deployments that cannot accept that window can set TRIAGE_SPOOL_SYNC_FLUSH, which makes
+flush_spool() drain the spool before the response within SPOOL_FLUSH_SECONDS; that puts a bounded
+Aurora write back on the response path, so it is off by default.
+"""
+
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+
+from triage.core.deadline import Deadline, stage_timeout
+
+logger = logging.getLogger(__name__)
+
+TRIAGE_WRITE_BEHIND = os.environ.get("TRIAGE_WRITE_BEHIND", "").lower() in ("1", "true", "yes")
+TRIAGE_SPOOL_PATH = os.environ.get("TRIAGE_SPOOL_PATH", "/tmp/triage-spool.sqlite3")
+SPOOL_BATCH_SIZE = int(os.environ.get("SPOOL_BATCH_SIZE", "25"))
+SPOOL_RETRY_BASE_SECONDS = 0.5
+SPOOL_RETRY_MAX_SECONDS = 60.0
+# Opt-in: also drain the spool before each response, bounded by SPOOL_FLUSH_SECONDS
+TRIAGE_SPOOL_SYNC_FLUSH = os.environ.get("TRIAGE_SPOOL_SYNC_FLUSH", "").lower() in ("1", "true", "yes")
+# Synchronous flush budget, and the Aurora connect timeout of every flush (libpq takes whole seconds)
+SPOOL_FLUSH_SECONDS = float(os.environ.get("SPOOL_FLUSH_SECONDS", "3"))
+SPOOL_FLUSH_CONNECT_TIMEOUT = int(os.environ.get("SPOOL_FLUSH_CONNECT_TIMEOUT", "2"))
+# Rows failing this many times are logged at error level on every further attempt (still kept)
+_ALERT_ATTEMPTS = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending (
+  id              TEXT PRIMARY KEY,
+  payload         TEXT NOT NULL,
+  enqueued_at     REAL NOT NULL,
+  attempts        INTEGER NOT NULL DEFAULT 0,
+  next_attempt_at REAL NOT NULL DEFAULT 0
+)
+"""
+
+
+class WriteBehindSpool:
+    """
+    Durable queue of rows flushed by flush(rows, connect_timeout) -> anything (raises on failure), on a
+    worker thread and by drain(). Each row is a dict with a str "id". Clock injectable for tests.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush: Callable[[list[dict]], object],
+        *,
+        batch_size: int = SPOOL_BATCH_SIZE,
+        retry_base_seconds: float = SPOOL_RETRY_BASE_SECONDS,
+        retry_max_seconds: float = SPOOL_RETRY_MAX_SECONDS,
+        connect_timeout: int = SPOOL_FLUSH_CONNECT_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self._flush = flush
+        self.connect_timeout = connect_timeout
+        self.batch_size = max(1, batch_size)
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._clock = clock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.execute(_SCHEMA)
+        self._lock = threading.Lock()
+        # Serialises flushes (worker vs drain) so a batch is never sent twice concurrently
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._stats = {"enqueued": 0, "flushed": 0, "batches": 0, "failures": 0}
+
+    def enqueue(self, row: dict) -> uuid.UUID:
+        """Durably spool row (an "id" is generated when missing) and wake the worker. Returns the row id."""
+        row_id = uuid.UUID(str(row["id"])) if row.get("id") else uuid.uuid4()
+        payload = json.dumps({**row, "id": str(row_id)}, default=str)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO pending (id, payload, enqueued_at) VALUES (?, ?, ?)",
+                (str(row_id), payload, self._clock()),
+            )
+            self._stats["enqueued"] += 1
+        self.resume()
+        return row_id
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM pending").fetchone()[0]
+
+    def resume(self) -> None:
+        """Make sure the worker is running and awake (call at the start of each invocation)."""
+        with self._lock:
+            if self._closed:
+                return
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="triage-spool", daemon=True)
+                self._worker.start()
+        self._wake.set()
+
+    def flush_once(self, *, ignore_backoff: bool = False, wait: float = -1) -> int:
+        """
+        Flush one batch of ready rows. Returns rows written (0 when nothing was ready, the flush failed, or
+        another flush still held the spool after wait seconds; -1 waits for it).
+        """
+        if not self._flush_lock.acquire(timeout=wait):
+            return 0
+        try:
+            batch = self._ready_batch(ignore_backoff)
+            if not batch:
+                return 0
+            ids = [row["id"] for row in batch]
+            try:
+                self._flush(batch, self.connect_timeout)
+            except Exception as e:
+                self._failed(ids, e)
+                return 0
+            with self._lock:
+                self._db.executemany("DELETE FROM pending WHERE id = ?", [(i,) for i in ids])
+                self._stats["flushed"] += len(ids)
+                self._stats["batches"] += 1
+            return len(ids)
+        finally:
+            self._flush_lock.release()
+
+    def drain(self, timeout: float) -> int:
+        """
+        Flush until the spool is empty, a flush fails or timeout seconds pass, ignoring backoff. A batch
+        started inside the budget can overrun it by up to connect_timeout plus the insert. Returns rows
+        still pending.
+        """
+        end = time.monotonic() + timeout
+        while (left := end - time.monotonic()) > 0:
+            if not self.flush_once(ignore_backoff=True, wait=left):
+                break
+        return self.pending()
+
+    def stats(self) -> dict[str, int]:
+        """Counters (enqueued, flushed, batches, failures) plus rows still pending."""
+        pending = self.pending()
+        with self._lock:
+            return {**self._stats, "pending": pending}
+
+    def close(self) -> None:
+        """Stop the worker and close the spool file (rows stay on disk for the next process)."""
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=1)
+        with self._flush_lock, self._lock:
+            self._db.close()
+
+    def _ready_batch(self, ignore_backoff: bool) -> list[dict]:
+        now = float("inf") if ignore_backoff else self._clock()
+        with self._lock:
+            if self._closed:
+                return []
+            rows = self._db.execute(
+                "SELECT payload, attempts FROM pending WHERE next_attempt_at <= ? "
+                "ORDER BY attempts, enqueued_at LIMIT ?",
+                (now, self.batch_size),
+            ).fetchall()
+        if rows and rows[0][1] > 0:
+            # Only previously failed rows are ready: isolate them
+            rows = rows[:1]
+        return [json.loads(payload) for payload, _ in rows]
+
+    def _failed(self, ids: list[str], exc: Exception) -> None:
+        now = self._clock()
+        with self._lock:
+            self._stats["failures"] += 1
+            attempts = dict(
+                self._db.execute(
+                    f"SELECT id, attempts + 1 FROM pending WHERE id IN ({', '.join('?' * len(ids))})", ids
+                ).fetchall()
+            )
+            for row_id, n in attempts.items():
+                delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (n - 1))
+                self._db.execute(
+                    "UPDATE pending SET attempts = ?, next_attempt_at = ? WHERE id = ?",
+                    (n, now + delay * random.uniform(0.5, 1.0), row_id),
+                )
+        worst = max(attempts.values(), default=0)
+        log = logger.error if worst >= _ALERT_ATTEMPTS else logger.warning
+        log("Spool flush failed rows=%d attempts=%d, will retry: %s", len(ids), worst, type(exc).__name__)
+
+    def _next_wait(self) -> float | None:
+        with self._lock:
+            if self._closed:
+                return 0.0
+            due = self._db.execute("SELECT min(next_attempt_at) FROM pending").fetchone()[0]
+        return None if due is None else max(0.0, due - self._clock())
+
+    def _run(self) -> None:
+        while True:
+            try:
+                while self.flush_once():
+                    pass
+                wait = self._next_wait()
+            except sqlite3.ProgrammingError:
+                return  # closed
+            except Exception:
+                logger.exception("Spool worker error")
+                wait = self.retry_base_seconds
+            with self._lock:
+                if self._closed:
+                    return
+            self._wake.wait(timeout=wait)
+            self._wake.clear()
+
+
+def _flush_assessments(rows: list[dict], connect_timeout: int) -> None:
+    from triage.core.db import insert_triage_assessments
+
+    insert_triage_assessments(rows, connect_timeout=connect_timeout)
+
+
+_spool: WriteBehindSpool | None = None
+_spool_lock = threading.Lock()
+
+
+def get_spool() -> WriteBehindSpool:
+    """Process-wide spool of triage_assessments rows at TRIAGE_SPOOL_PATH (created on first use)."""
+    global _spool
+    with _spool_lock:
+        if _spool is None:
+            _spool = WriteBehindSpool(TRIAGE_SPOOL_PATH, _flush_assessments)
+        return _spool
+
+
+def resume_spool() -> None:
+    """Restart flushing rows left by an earlier invocation or process. No-op when write-behind is off."""
+    if not TRIAGE_WRITE_BEHIND:
+        return
+    if _spool is None and not os.path.exists(TRIAGE_SPOOL_PATH):
+        return
+    spool = get_spool()
+    left = spool.pending()
+    if left:
+        logger.info("Spool resuming rows=%d from earlier invocations", left)
+    spool.resume()
+
+
+def flush_spool(deadline: Deadline | None = None) -> None:
+    """
+    With TRIAGE_SPOOL_SYNC_FLUSH, drain the spool before the invocation returns, within SPOOL_FLUSH_SECONDS
+    and the request deadline. No-op otherwise (the worker and resume_spool() write the rows); failures are
+    logged, never raised.
+    """
+    spool = _spool
+    if not (TRIAGE_WRITE_BEHIND and TRIAGE_SPOOL_SYNC_FLUSH) or spool is None:
+        return
+    try:
+        left = spool.drain(stage_timeout(deadline, SPOOL_FLUSH_SECONDS))
+    except Exception as e:
+        logger.warning("Spool flush failed: %s", type(e).__name__)
+        return
+    if left:
+        logger.warning("Spool flush left rows=%d in %s (retried next invocation)", left, spool.path)
+
+
+def spool_stats() -> dict[str, int]:
+    return _spool.stats() if _spool is not None else {}
+
+
+def reset_spool() -> None:
+    """Close the process-wide spool (tests). Its file is left in place."""
+    global _spool
+    with _spool_lock:
+        spool, _spool = _spool, None
+    if spool is not None:
+        spool.close()
+
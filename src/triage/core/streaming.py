@@ -0,0 +1,277 @@
+"""Streaming triage via Bedrock converse_stream. Emits severity as soon as it is known.
+
+The submit_triage_result tool input arrives as partial JSON deltas. SeverityScanner watches the growing
+buffer and fires once both "severity" and a complete "confidence" value have been seen, so a consumer of
+the generator gets the severity colour before recommendations finish generating. (triage.api.handler's
+stream_handler returns a buffered proxy response, so its HTTP clients receive every frame at the end.)
+Events (dicts):
+
+- {"event": "severity", "severity", "confidence", "elapsed_ms"}  (early, partial)
+- {"event": "result", ...TriageResult fields, "elapsed_ms"}        (final, validated)
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import time
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import suppress
+
+from lambda_common.breaker import get_breaker
+from lambda_common.clients import get_client
+from triage.core.agent import (
+    RED_FLAG_PRETRIAGE,
+    REGION,
+    _build_user_prompt,
+    _call_within_deadline,
+    _eka_available,
+    _get_model_call_executor,
+    _round_tool_config,
+    _run_tool_uses,
+    _safety_fallback,
+    _tool_input_to_result,
+)
+from triage.core.cache import get_result_cache
+from triage.core.deadline import Deadline
+from triage.core.instructions import TRIAGE_SYSTEM_PROMPT, TRIAGE_SYSTEM_PROMPT_WITH_EKA
+from triage.core.prompt_cache import cached_messages, cached_tool_config, log_usage, system_blocks
+from triage.core.red_flags import evaluate_red_flags
+from triage.core.tools import get_triage_tool_config, get_triage_tool_config_with_eka
+from triage.models.triage import TriageRequest, TriageResult
+
+logger = logging.getLogger(__name__)
+
+_SEVERITY_RE = re.compile(r'"severity"\s*:\s*"(critical|high|medium|low)"')
+# Number must be followed by a delimiter, otherwise "0.8" may still be growing into "0.85"
+_CONFIDENCE_RE = re.compile(r'"confidence"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)\s*[,}\s]')
+# Re-scan this many chars of the previous buffer so keys split across deltas still match
+_SCAN_OVERLAP = 64
+
+
+class SeverityScanner:
+    """Incrementally scans partial tool-input JSON for severity and confidence."""
+
+    __slots__ = ("_buf", "_scanned", "severity", "confidence")
+
+    def __init__(self):
+        self._buf: list[str] = []
+        self._scanned = ""
+        self.severity: str | None = None
+        self.confidence: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.severity is not None and self.confidence is not None
+
+    def feed(self, chunk: str) -> bool:
+        """Add a delta. Returns True the first time both severity and confidence are known."""
+        self._buf.append(chunk)
+        if self.ready:
+            return False
+        window = self._scanned[-_SCAN_OVERLAP:] + chunk
+        self._scanned = window
+        if self.severity is None:
+            m = _SEVERITY_RE.search(window)
+            if m:
+                self.severity = m.group(1)
+        if self.confidence is None:
+            m = _CONFIDENCE_RE.search(window)
+            if m:
+                self.confidence = max(0.0, min(1.0, float(m.group(1))))
+        return self.ready
+
+    def text(self) -> str:
+        return "".join(self._buf)
+
+
+def _result_event(result: TriageResult, start: float) -> dict:
+    return {
+        "event": "result",
+        **result.model_dump(mode="json"),
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
+
+
+def _severity_event(severity: str, confidence: float, start: float) -> dict:
+    return {
+        "event": "severity",
+        "severity": severity,
+        "confidence": confidence,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
+
+
+_STREAM_END = object()
+
+
+def _events_within_deadline(stream: Iterable[dict], deadline: Deadline | None) -> Iterator[dict]:
+    """
+    Events of a ConverseStream response, raising TimeoutError once the deadline passes. botocore bounds only
+    each socket read (read_timeout), not the whole stream, so a reader thread pumps events through a queue
+    and the caller waits on it for at most the remaining budget.
+    """
+    if deadline is None:
+        yield from stream
+        return
+    events: queue.Queue = queue.Queue()
+
+    def pump():
+        try:
+            for ev in stream:
+                events.put(ev)
+            events.put(_STREAM_END)
+        except Exception as e:
+            events.put(e)
+
+    _get_model_call_executor().submit(pump)
+    while True:
+        try:
+            ev = events.get(timeout=deadline.remaining())
+        except queue.Empty:
+            with suppress(Exception):
+                stream.close()
+            raise TimeoutError("ConverseStream exceeded the remaining time budget") from None
+        if ev is _STREAM_END:
+            return
+        if isinstance(ev, Exception):
+            raise ev
+        yield ev
+
+
+def assess_triage_stream(request: TriageRequest, client=None, deadline: Deadline | None = None) -> Iterator[dict]:
+    """
+    Streaming counterpart of assess_triage (Converse backend). Yields a severity event as early as possible,
+    then exactly one result event. Red-flag (when RED_FLAG_PRETRIAGE is on) and cached results are emitted
+    immediately.
+    """
+    start = time.perf_counter()
+    flagged = evaluate_red_flags(request) if RED_FLAG_PRETRIAGE else None
+    if flagged is None:
+        cache = get_result_cache()
+        hit = cache.get(request) if cache is not None else None
+        if hit:
+            flagged = hit[0]
+    if flagged is not None:
+        yield _severity_event(flagged.severity, flagged.confidence, start)
+        yield _result_event(flagged, start)
+        return
+
+    client = client or get_client("bedrock-runtime", REGION)
+    model_id = os.environ.get("BEDROCK_MODEL_ID", "us.anthropic.claude-3-5-sonnet-v2:0")
+    result = yield from _converse_stream_rounds(request, client, model_id, start, deadline)
+    result.model_id = model_id
+    logger.info("Triage stream total_ms=%.2f", (time.perf_counter() - start) * 1000)
+    yield _result_event(result, start)
+    cache = get_result_cache()
+    if cache is not None:
+        cache.put(request, result)
+
+
+def _converse_stream_rounds(
+    request: TriageRequest, client, model_id: str, start: float, deadline: Deadline | None = None
+) -> Generator[dict, None, TriageResult]:
+    """Run Converse stream rounds (executing Eka tools between rounds); yields severity, returns the result."""
+    gateway_ok = _eka_available()
+    tool_config = get_triage_tool_config_with_eka() if gateway_ok else get_triage_tool_config()
+    system_prompt = TRIAGE_SYSTEM_PROMPT_WITH_EKA if gateway_ok else TRIAGE_SYSTEM_PROMPT
+    messages = [{"role": "user", "content": [{"text": _build_user_prompt(request)}]}]
+    severity_sent = False
+
+    max_rounds = 8
+    for round_no in range(max_rounds):
+        round_tool_config = _round_tool_config(tool_config, deadline, round_no)
+        if round_tool_config is None:
+            return _safety_fallback("Time budget exhausted before assessment completed")
+        try:
+            response = _call_within_deadline(
+                deadline,
+                get_breaker("converse").call,
+                client.converse_stream,
+                modelId=model_id,
+                messages=cached_messages(messages),
+                system=system_blocks(system_prompt),
+                toolConfig=cached_tool_config(round_tool_config),
+                inferenceConfig={"maxTokens": 1024},
+            )
+        except Exception as e:
+            logger.error("ConverseStream invocation failed: %s", e)
+            return _safety_fallback(str(e))
+
+        # contentBlockIndex -> {"toolUse": {...}, "scanner": SeverityScanner} or {"text": [...]}
+        blocks: dict[int, dict] = {}
+        stop_reason = ""
+        try:
+            for ev in _events_within_deadline(response.get("stream", []), deadline):
+                if "contentBlockStart" in ev:
+                    cbs = ev["contentBlockStart"]
+                    tool = (cbs.get("start") or {}).get("toolUse")
+                    if tool:
+                        blocks[cbs.get("contentBlockIndex", 0)] = {"toolUse": dict(tool), "scanner": SeverityScanner()}
+                elif "contentBlockDelta" in ev:
+                    cbd = ev["contentBlockDelta"]
+                    idx = cbd.get("contentBlockIndex", 0)
+                    delta = cbd.get("delta") or {}
+                    if "toolUse" in delta:
+                        block = blocks.setdefault(idx, {"toolUse": {}, "scanner": SeverityScanner()})
+                        ready = block["scanner"].feed(delta["toolUse"].get("input", ""))
+                        if ready and not severity_sent and block["toolUse"].get("name") == "submit_triage_result":
+                            severity_sent = True
+                            scanner = block["scanner"]
+                            logger.info(
+                                "Triage stream ttfs_ms=%.2f severity=%s",
+                                (time.perf_counter() - start) * 1000,
+                                scanner.severity,
+                            )
+                            yield _severity_event(scanner.severity, scanner.confidence, start)
+                    elif "text" in delta:
+                        blocks.setdefault(idx, {"text": []}).setdefault("text", []).append(delta["text"])
+                elif "messageStop" in ev:
+                    stop_reason = ev["messageStop"].get("stopReason", "")
+                elif "metadata" in ev:
+                    log_usage("converse_stream", ev["metadata"].get("usage"))
+        except TimeoutError as e:
+            logger.error("ConverseStream timed out: %s", e)
+            return _safety_fallback(str(e))
+
+        content = []
+        tool_uses = []
+        for idx in sorted(blocks):
+            block = blocks[idx]
+            if "toolUse" in block:
+                raw = block["scanner"].text()
+                try:
+                    tool_input = json.loads(raw) if raw else {}
+                except json.JSONDecodeError:
+                    tool_input = {}
+                tool = {**block["toolUse"], "input": tool_input}
+                tool_uses.append(tool)
+                content.append({"toolUse": tool})
+            elif block.get("text"):
+                content.append({"text": "".join(block["text"])})
+
+        if stop_reason != "tool_use" or not tool_uses:
+            break
+        for tool in tool_uses:
+            if tool.get("name") == "submit_triage_result":
+                result = _tool_input_to_result(tool["input"])
+                if result:
+                    result.session_id = request.session_id
+                    return result
+        tool_results = _run_tool_uses(tool_uses, gateway_ok, deadline)
+        messages.append({"role": "assistant", "content": content})
+        messages.append({
+            "role": "user",
+            "content": [
+                {"toolResult": {"toolUseId": tr["toolUseId"], "content": [{"text": tr["text"]}]}}
+                for tr in tool_results
+            ],
+        })
+
+    return _safety_fallback("Model did not call submit_triage_result tool")
+
+
+def format_sse(event: dict) -> str:
+    """Format one event as a Server-Sent Events frame."""
+    return f"event: {event.get('event', 'message')}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
@@ -0,0 +1,226 @@
+"""Symptom canonicalization: synonyms, misspellings and regional terms -> canonical symptom codes.
+
+TriageRequest.symptoms is free text, so "chest pain", "Chest-Pain", "pain in chest" and "seene mein dard"
+look different to the cache key, the red-flag rules and the prompt. SYMPTOM_LEXICON maps canonical codes
+to the phrases that mean them (English variants and common misspellings, plus romanized and native-script
+Hindi, Tamil and Kannada terms). Phrases are compiled once into a word-level trie; canonicalize() walks it
+left to right with longest match, so a symptom string is processed in O(length) no matter how large the
+lexicon grows. canonicalize() (cache key) keeps words outside the lexicon lower-cased and drops punctuation,
+so "severe seene mein dard since 2 hours" becomes "severe chest_pain since 2 hours"; numbers such as 38.5
+and 80/50 stay one token. rewrite() (model prompt) replaces only the matched phrases and keeps every other
+character as written, so "Temp 38.5 C, seene mein dard" reaches the model as "Temp 38.5 C, chest pain".
+
+SYMPTOM_LEXICON_PATH (JSON {code: [phrases]}) extends or overrides entries of the built-in table.
+"""
+
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+SYMPTOM_LEXICON_PATH = os.environ.get("SYMPTOM_LEXICON_PATH", "").strip()
+
+SYMPTOM_LEXICON: dict[str, list[str]] = {
+    "chest_pain": [
+        "chest pain", "chest ache", "pain in chest", "pain in the chest", "chest tightness", "tight chest",
+        "chest pian", "chestpain", "seene mein dard", "seene me dard", "sine mein dard", "chhati mein dard",
+        "chhati me dard", "chati dard", "nenju vali", "nenjuvali", "nenju valli", "ede novu", "edenovu",
+        "सीने में दर्द", "छाती में दर्द", "நெஞ்சு வலி", "ಎದೆ ನೋವು",
+    ],
+    "shortness_of_breath": [
+        "shortness of breath", "short of breath", "breathlessness", "breathlesness", "breathless",
+        "difficulty breathing", "difficulty in breathing", "breathing difficulty", "trouble breathing",
+        "cant breathe", "can't breathe", "cannot breathe", "dyspnea", "dyspnoea", "saans phoolna",
+        "saans phulna", "sans phulna", "saans lene mein takleef", "saans ki takleef", "moochu thinaral",
+        "moochu vida mudiyala", "usiraata kashta", "usiru kattuvudu", "सांस फूलना", "மூச்சு திணறல்",
+    ],
+    "fever": [
+        "fever", "feaver", "fevr", "high temperature", "pyrexia", "febrile", "bukhar", "bukhaar",
+        "bukar", "taap", "jwar", "kaichal", "kaaichal", "juram", "jwara", "jvara", "बुखार", "காய்ச்சல்", "ಜ್ವರ",
+    ],
+    "headache": [
+        "headache", "head ache", "headach", "hedache", "head pain", "sir dard", "sar dard", "sirdard", "sardard",
+        "thalai vali", "thalaivali", "tale novu", "talenovu", "सिर दर्द", "தலை வலி", "ತಲೆ ನೋವು",
+    ],
+    "abdominal_pain": [
+        "abdominal pain", "abdomen pain", "stomach pain", "stomach ache", "stomachache", "stomache ache",
+        "tummy ache", "belly pain", "pain in abdomen", "pet dard", "pet mein dard", "pet me dard", "vayiru vali",
+        "vayitru vali", "hotte novu", "पेट दर्द", "पेट में दर्द", "வயிறு வலி", "ಹೊಟ್ಟೆ ನೋವು",
+    ],
+    "vomiting": [
+        "vomiting", "vomitting", "vomit", "vomits", "throwing up", "emesis", "ulti", "ultiyan",
+        "vaanthi", "vanthi", "vanti", "उल्टी", "வாந்தி", "ವಾಂತಿ",
+    ],
+    "diarrhea": [
+        "diarrhea", "diarrhoea", "diarhea", "diarrea", "diarrohea", "loose motion", "loose motions",
+        "loose stools", "dast", "dasth", "vayitru pokku", "bedhi", "दस्त", "பேதி", "ಭೇದಿ",
+    ],
+    "cough": ["cough", "coughing", "caugh", "cogh", "khansi", "khaansi", "irumal", "kemmu", "खांसी", "இருமல்", "ಕೆಮ್ಮು"],
+    "dizziness": [
+        "dizziness", "dizzy", "dizzyness", "giddiness", "giddy", "vertigo", "lightheaded", "light headed",
+        "chakkar", "chakkar aana", "chakkar aa raha", "thalai suthal", "thale suttu", "चक्कर", "தலை சுற்றல்",
+    ],
+    "unconscious": [
+        "unconscious", "unconcious", "unresponsive", "not responding", "passed out", "fainted", "fainting",
+        "syncope", "behosh", "behoshi", "mayakkam", "mayangi vittar", "prajne illa", "बेहोश", "மயக்கம்",
+    ],
+    "seizure": [
+        "seizure", "seizures", "siezure", "fits", "convulsion", "convulsions", "epileptic attack", "mirgi",
+        "daura", "valippu", "moorchhe", "मिर्गी", "வலிப்பு",
+    ],
+    "bleeding": [
+        "bleeding", "haemorrhage", "hemorrhage", "blood loss", "khoon behna", "khoon nikalna",
+        "khoon aa raha", "iratha pokku", "raktasrava", "खून बहना", "இரத்தப்போக்கு",
+    ],
+    "weakness": [
+        "weakness", "weekness", "generalized weakness", "fatigue", "tiredness", "kamzori", "kamjori", "sorvu",
+        "sustu", "कमजोरी", "சோர்வு",
+    ],
+    "stroke_signs": [
+        "facial droop", "face drooping", "slurred speech", "one sided weakness", "weakness on one side",
+        "paralysis", "lakwa", "lakva", "pakkavatham", "pakshaghata", "लकवा",
+    ],
+    "burns": ["burns", "burn injury", "burnt", "jal gaya", "jalna", "theekkayam", "sutta gaaya", "जल गया"],
+    "snake_bite": [
+        "snake bite", "snakebite", "snake bit", "saanp ne kaata", "saanp kata", "saap kata", "pambu kadi",
+        "haavu kachchide", "havu kadita", "सांप ने काटा", "பாம்பு கடி",
+    ],
+    "dysuria": [
+        "burning urination", "burning micturition", "painful urination", "peshab mein jalan", "peshab me jalan",
+        "neer erichal", "moothra urige",
+    ],
+    "back_pain": ["back pain", "backache", "back ache", "kamar dard", "muthugu vali", "bennu novu", "कमर दर्द"],
+    "sore_throat": [
+        "sore throat", "throat pain", "gale mein dard", "gala kharab", "thondai vali", "gantalu novu", "गले में दर्द",
+    ],
+    "runny_nose": ["runny nose", "common cold", "nasal congestion", "zukam", "jukam", "jalathosham", "negadi", "जुकाम"],
+    "body_ache": [
+        "body ache", "body pain", "bodyache", "body aches", "badan dard", "udal vali", "mai kai novu", "बदन दर्द",
+    ],
+}
+
+# Separators: whitespace and punctuation (hyphens, slashes, apostrophes); letters and combining marks of
+# any script stay inside the token, so Devanagari / Tamil / Kannada words are not split. Numbers with a
+# decimal point, slash or colon (38.5, 80/50, 8/10, 10:30) are one token.
+_TOKEN_RE = re.compile(r"\d+(?:[./:]\d+)+|[^\s\-_/\\,.;:!?()\[\]{}'\"`*+&|।]+")
+_END = "\0"
+
+
+def tokenize(text: str) -> list[str]:
+    return [m.group().casefold() for m in _TOKEN_RE.finditer(text)]
+
+
+class SymptomIndex:
+    """Word-level trie over lexicon phrases: token -> child node; node[_END] = canonical code."""
+
+    __slots__ = ("root", "codes")
+
+    def __init__(self, lexicon: dict[str, list[str]]):
+        self.root: dict = {}
+        self.codes = tuple(lexicon)
+        for code, phrases in lexicon.items():
+            for phrase in [code.replace("_", " "), *phrases]:
+                tokens = tokenize(phrase)
+                if not tokens:
+                    continue
+                node = self.root
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[_END] = code
+
+    def _scan_spans(self, text: str) -> list[tuple[str, bool, int, int]]:
+        """(term, is_code, start, end) for each longest lexicon match or unmatched word; spans index text."""
+        matches = list(_TOKEN_RE.finditer(text))
+        tokens = [m.group().casefold() for m in matches]
+        out = []
+        i, n, root = 0, len(tokens), self.root
+        while i < n:
+            node, j, match, match_end = root, i, None, i
+            while j < n:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                code = node.get(_END)
+                if code is not None:
+                    match, match_end = code, j
+            if match is None:
+                out.append((tokens[i], False, matches[i].start(), matches[i].end()))
+                i += 1
+            else:
+                out.append((match, True, matches[i].start(), matches[match_end - 1].end()))
+                i = match_end
+        return out
+
+    def scan(self, text: str) -> list[tuple[str, bool]]:
+        """(term, is_code) for each longest lexicon match or unmatched word, in text order."""
+        return [(term, is_code) for term, is_code, _, _ in self._scan_spans(text)]
+
+    def canonicalize(self, text: str) -> str:
+        """Lower-cased text with every lexicon phrase replaced by its code ("" for blank input)."""
+        return " ".join(term for term, _ in self.scan(text))
+
+    def rewrite(self, text: str) -> str:
+        """text as written, with only the lexicon phrases replaced by their code spelled as words."""
+        parts, pos = [], 0
+        for term, is_code, start, end in self._scan_spans(text):
+            if is_code:
+                parts.append(text[pos:start])
+                parts.append(term.replace("_", " "))
+                pos = end
+        parts.append(text[pos:])
+        return "".join(parts).strip()
+
+    def codes_in(self, text: str) -> list[str]:
+        """Canonical codes found in text, in order, without duplicates."""
+        return list(dict.fromkeys(term for term, is_code in self.scan(text) if is_code))
+
+
+def load_lexicon() -> dict[str, list[str]]:
+    """Built-in lexicon, extended / overridden per code by SYMPTOM_LEXICON_PATH when set."""
+    lexicon = dict(SYMPTOM_LEXICON)
+    if SYMPTOM_LEXICON_PATH:
+        try:
+            with open(SYMPTOM_LEXICON_PATH, encoding="utf-8") as f:
+                lexicon.update(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load symptom lexicon from %s, using built-in: %s", SYMPTOM_LEXICON_PATH, e)
+    return lexicon
+
+
+_index: SymptomIndex | None = None
+
+
+def get_symptom_index() -> SymptomIndex:
+    global _index
+    if _index is None:
+        _index = SymptomIndex(load_lexicon())
+    return _index
+
+
+def canonical_symptoms(symptoms: list[str]) -> list[str]:
+    """Canonical form of each symptom, blanks and duplicates dropped, input order kept."""
+    index = get_symptom_index()
+    return list(dict.fromkeys(c for c in (index.canonicalize(s) for s in symptoms) if c))
+
+
+def symptom_codes(symptoms: list[str]) -> list[str]:
+    """All canonical codes mentioned across symptoms, in order, without duplicates."""
+    index = get_symptom_index()
+    return list(dict.fromkeys(code for s in symptoms for code in index.codes_in(s)))
+
+
+def prompt_symptoms(symptoms: list[str]) -> list[str]:
+    """
+    Symptoms for the model prompt: lexicon phrases replaced by their code as words ("seene mein dard" ->
+    "chest pain"), everything else as written; blanks and canonical duplicates dropped, input order kept.
+    """
+    index = get_symptom_index()
+    out: dict[str, str] = {}
+    for s in symptoms:
+        key = index.canonicalize(s)
+        if key and key not in out:
+            out[key] = index.rewrite(s)
+    return list(out.values())
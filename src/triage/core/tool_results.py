@@ -0,0 +1,110 @@
+"""Compact Eka tool results before they are fed back into the Converse loop.
+
+Every toolResult stays in the conversation and is re-sent on each following round, so a broad
+search_indian_medications hit list (pretty-printed, with manufacturer names and URLs) inflates input
+tokens for the rest of the request. Results are unwrapped from the MCP envelope, projected to the fields
+the model uses, de-duplicated, ranked by overlap with the tool query, capped to EKA_RESULT_TOP_K, and
+serialized as minified JSON. Each result must fit its share of EKA_ROUND_TOKEN_BUDGET (chars/4 estimate).
+"""
+
+import json
+import os
+import re
+
+EKA_RESULT_TOP_K = int(os.environ.get("EKA_RESULT_TOP_K", "5"))
+# Token budget for all Eka results of one Converse round, split evenly between the calls in that round
+EKA_ROUND_TOKEN_BUDGET = int(os.environ.get("EKA_ROUND_TOKEN_BUDGET", "1200"))
+# Long free-text fields (protocol summaries etc.) are cut to this many characters
+EKA_FIELD_MAX_CHARS = 240
+
+MEDICATION_FIELDS = ("name", "generic_name", "product_type")
+PROTOCOL_FIELDS = ("title", "conditions", "publisher", "author", "summary")
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Fast token estimate (~4 characters per token for English/JSON); no tokenizer needed."""
+    return (len(text) + 3) // 4
+
+
+def _minify(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _unwrap(out) -> dict | list:
+    """Gateway MCP results arrive as {"content": [{"type": "text", "text": "<json>"}]}; return the inner JSON."""
+    if isinstance(out, dict) and isinstance(out.get("content"), list):
+        for block in out["content"]:
+            text = block.get("text") if isinstance(block, dict) else None
+            if text:
+                try:
+                    return json.loads(text)
+                except json.JSONDecodeError:
+                    return {"text": text}
+    return out
+
+
+def _items(out, key: str) -> list:
+    out = _unwrap(out)
+    if isinstance(out, dict):
+        out = out.get(key, [])
+    return [item for item in out if isinstance(item, dict)] if isinstance(out, list) else []
+
+
+def _project(item: dict, fields: tuple[str, ...]) -> dict:
+    projected = {}
+    for field in fields:
+        value = item.get(field)
+        if value in (None, "", []):
+            continue
+        if isinstance(value, str) and len(value) > EKA_FIELD_MAX_CHARS:
+            value = value[:EKA_FIELD_MAX_CHARS] + "…"
+        projected[field] = value
+    return projected
+
+
+def _words(value) -> set[str]:
+    if isinstance(value, list):
+        value = " ".join(str(v) for v in value)
+    return set(_WORD_RE.findall(str(value or "").lower()))
+
+
+def _rank(items: list[dict], query_words: set[str]) -> list[dict]:
+    """De-duplicate on the projected content, then sort by query overlap (stable: Eka order breaks ties)."""
+    seen = set()
+    unique = []
+    for item in items:
+        key = _minify(item).lower()
+        if item and key not in seen:
+            seen.add(key)
+            unique.append(item)
+    if not query_words:
+        return unique
+    return sorted(unique, key=lambda item: -len(query_words & _words(list(item.values()))))
+
+
+def _fit(items: list[dict], key: str, token_budget: int) -> str:
+    """Minified {key: items}, dropping lowest-ranked items until it fits token_budget."""
+    n = min(len(items), EKA_RESULT_TOP_K)
+    while True:
+        text = _minify({key: items[:n]} if n == len(items) else {key: items[:n], "omitted": len(items) - n})
+        if n == 0 or estimate_tokens(text) <= token_budget:
+            return text
+        n -= 1
+
+
+def compact_tool_result(name: str, out, tool_input: dict, token_budget: int = EKA_ROUND_TOKEN_BUDGET) -> str:
+    """Compact text for one Eka toolResult (search_indian_medications or search_treatment_protocols)."""
+    if name == "search_indian_medications":
+        key, fields = "medications", MEDICATION_FIELDS
+        query_words = _words([tool_input.get("drug_name"), tool_input.get("generic_names"), tool_input.get("form")])
+    else:
+        key, fields = "protocols", PROTOCOL_FIELDS
+        query_words = _words([q.get("query") for q in tool_input.get("queries", []) if isinstance(q, dict)])
+    items = _rank([_project(item, fields) for item in _items(out, key)], query_words)
+    if not items:
+        # Unknown shape or no hits: keep whatever came back, minified and cut to the budget
+        text = _minify(_unwrap(out))
+        return text if estimate_tokens(text) <= token_budget else text[: token_budget * 4] + "…"
+    return _fit(items, key, token_budget)
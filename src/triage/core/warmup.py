@@ -0,0 +1,76 @@
+"""Warmup steps for the triage Lambda: boto3 clients, Secrets Manager configs, rule indexes, the
+Gateway OAuth token and a pooled Aurora connection. Event detection and timing live in
+lambda_common.warmup.
+"""
+
+import os
+
+from lambda_common.warmup import run_warmup
+
+# Bounds the Aurora step so a warmup returns quickly even when the cluster is unreachable (libpq minimum 2)
+WARMUP_DB_CONNECT_TIMEOUT = int(os.environ.get("WARMUP_DB_CONNECT_TIMEOUT", "3"))
+
+
+def _warm_clients() -> None:
+    from lambda_common.clients import REGION, get_client
+    from triage.core import agent, speculative
+
+    get_client("bedrock-runtime", REGION)
+    get_client("secretsmanager", REGION)
+    get_client("rds", REGION)
+    if agent.USE_AGENTCORE_TRIAGE and agent.TRIAGE_AGENT_RUNTIME_ARN:
+        get_client("bedrock-agentcore", REGION)
+    if agent.AGENT_ID:
+        get_client("bedrock-agent-runtime", REGION)
+    if speculative.SPECULATIVE_HOSPITAL_MATCH:
+        get_client("lambda", REGION)
+
+
+def _warm_secrets() -> None:
+    """RDS and Gateway configs with one BatchGetSecretValue call (lambda_common.credentials)."""
+    from lambda_common.clients import REGION, get_client
+    from lambda_common.credentials import prefetch_secrets
+    from triage.core.db import RDS_CONFIG_SECRET
+
+    gateway_secret = os.environ.get("GATEWAY_CONFIG_SECRET_NAME", "").strip()
+    prefetch_secrets(get_client("secretsmanager", REGION), [RDS_CONFIG_SECRET, gateway_secret])
+
+
+def _warm_rules() -> None:
+    from triage.core.cache import get_result_cache
+    from triage.core.red_flags import _get_compiled
+    from triage.core.symptoms import get_symptom_index
+
+    get_symptom_index()
+    _get_compiled()
+    get_result_cache()
+
+
+def _warm_gateway() -> None:
+    """Load the gateway-config secret and fetch the OAuth token (skipped when Gateway is not configured)."""
+    from triage.core.gateway_client import _get_token, is_gateway_configured
+
+    if is_gateway_configured():
+        _get_token(timeout=5)
+
+
+def _warm_aurora() -> None:
+    """Open (or health-check) a pooled connection and leave it in the pool for the next request."""
+    from triage.core.db import connection
+
+    with connection(WARMUP_DB_CONNECT_TIMEOUT):
+        pass
+
+
+def warm_triage() -> dict:
+    """Warmup for the triage Lambda (POST /triage, /triage/batch, /triage/mci and the streaming mode)."""
+    return run_warmup(
+        "triage",
+        [
+            ("clients", _warm_clients),
+            ("secrets", _warm_secrets),
+            ("rules", _warm_rules),
+            ("gateway_token", _warm_gateway),
+            ("aurora", _warm_aurora),
+        ],
+    )
@@ -2,8 +2,9 @@
 
 from triage.models.triage import (
     SeverityLevel,
+    TriageBatchItem,
     TriageRequest,
     TriageResult,
 )
 
-__all__ = ["SeverityLevel", "TriageRequest", "TriageResult"]
+__all__ = ["SeverityLevel", "TriageBatchItem", "TriageRequest", "TriageResult"]
@@ -1,10 +1,13 @@
 """Triage request and result models. Strict schema aligned with WHO IITT / ESI."""
 
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
 SeverityLevel = Literal["critical", "high", "medium", "low"]
+# Most urgent first
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 
 # G1: Input validation bounds
 SYMPTOMS_MAX_ITEMS = 50
@@ -23,6 +26,8 @@ VITALS_RANGES = {
 RECOMMENDATIONS_MAX_ITEMS = 30
 RECOMMENDATION_MAX_LENGTH = 500
 SAFETY_DISCLAIMER_MAX_LENGTH = 1000
+# Below this confidence the assessment must set force_high_priority (treat as high priority)
+FORCE_HIGH_PRIORITY_CONFIDENCE = 0.85
 
 
 class TriageRequest(BaseModel):
@@ -40,6 +45,10 @@ class TriageRequest(BaseModel):
     submitted_by: str | None = Field(default=None, max_length=256, description="RMP ID or user identifier")
     session_id: str | None = Field(default=None, max_length=256, description="Optional: reuse AgentCore session")
     patient_id: str | None = Field(default=None, max_length=256, description="Optional: patient identifier")
+    patient_location_lat: float | None = Field(
+        default=None, ge=-90, le=90, description="Optional: lets speculative hospital matching include routes"
+    )
+    patient_location_lon: float | None = Field(default=None, ge=-180, le=180)
 
     @field_validator("symptoms", mode="before")
     @classmethod
@@ -101,6 +110,15 @@ class TriageResult(BaseModel):
         max_length=256,
         description="Session ID used for AgentCore (echo or generated); use for /hospitals and /route.",
     )
+    cached: bool = Field(
+        default=False,
+        description="True when served from the triage result cache (no model call for this request).",
+    )
+    model_id: str | None = Field(
+        default=None,
+        max_length=256,
+        description="Bedrock model whose answer was kept (its cascade tier); None for rule-based results.",
+    )
 
     @field_validator("recommendations", mode="before")
     @classmethod
@@ -119,3 +137,64 @@ class TriageResult(BaseModel):
         if v is not None and isinstance(v, str) and len(v) > SAFETY_DISCLAIMER_MAX_LENGTH:
             return v[:SAFETY_DISCLAIMER_MAX_LENGTH]
         return v
+
+
+BatchItemStatus = Literal["ok", "degraded", "invalid", "error"]
+
+
+class TriageBatchItem(BaseModel):
+    """Per-patient outcome of POST /triage/batch. degraded = safety fallback (re-submit when possible)."""
+
+    index: int = Field(..., ge=0, description="Position of the patient in the request items")
+    status: BatchItemStatus
+    result: TriageResult | None = None
+    error: str | None = None
+    id: str | None = Field(default=None, description="triage_assessments row id when persisted")
+
+
+# GET /triage/history: columns a caller may project; id and created_at are always returned (the cursor)
+HISTORY_FIELDS = (
+    "id",
+    "created_at",
+    "severity",
+    "confidence",
+    "force_high_priority",
+    "submitted_by",
+    "symptoms",
+    "vitals",
+    "age_years",
+    "sex",
+    "recommendations",
+    "safety_disclaimer",
+    "request_id",
+    "model_id",
+    "hospital_match_id",
+)
+# Covered by the migration 006 indexes, so the default page is answered by an index-only scan
+HISTORY_DEFAULT_FIELDS = ("id", "created_at", "severity", "confidence", "force_high_priority", "submitted_by")
+HISTORY_MAX_LIMIT = 100
+
+
+class TriageHistoryQuery(BaseModel):
+    """Query string of GET /triage/history. submitted_by "me" means the caller's Cognito identity."""
+
+    submitted_by: str | None = Field(default=None, max_length=256)
+    severity: SeverityLevel | None = None
+    since: datetime | None = Field(default=None, description="created_at >= since")
+    until: datetime | None = Field(default=None, description="created_at < until")
+    cursor: str | None = Field(default=None, max_length=256, description="next_cursor of the previous page")
+    limit: int = Field(default=20, ge=1, le=HISTORY_MAX_LIMIT)
+    fields: list[str] = Field(default_factory=lambda: list(HISTORY_DEFAULT_FIELDS))
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def fields_projection(cls, v):
+        if isinstance(v, str):
+            v = [f.strip() for f in v.split(",") if f.strip()]
+        if not isinstance(v, list):
+            return v
+        unknown = [f for f in v if f not in HISTORY_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        # id and created_at first (the cursor), then the requested columns in request order
+        return list(dict.fromkeys(["id", "created_at", *v]))
@@ -3,5 +3,38 @@
 import sys
 from pathlib import Path
 
-# Add src to path so `import triage` works when running pytest from project root
+# Add src to path so `import triage` (and lambda_common) works when running pytest from project root
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit_breakers():
+    """Circuit breakers are per-process; keep injected failures from leaking between tests."""
+    from lambda_common.breaker import reset_breakers
+
+    reset_breakers()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_db_pools():
+    """Pooled connections are per-process; keep a mock connection from one test out of the next."""
+    from hospital_matcher.core.db import reset_pool as reset_hospital_pool
+    from rmp_learning.core.db import reset_pool as reset_rmp_pool
+    from triage.core.db import reset_pool
+
+    reset_pool()
+    reset_hospital_pool()
+    reset_rmp_pool()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_credential_caches():
+    """Cached secrets and IAM tokens are per-process; a stubbed secret must not leak into the next test."""
+    from lambda_common.credentials import reset_credentials
+
+    reset_credentials()
+    yield
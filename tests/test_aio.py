@@ -0,0 +1,240 @@
+"""Tests for the asyncio orchestration core (triage.core.aio) and the async Gateway client."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from triage.core import aio, gateway_client
+
+
+async def _serve(handler):
+    """Local HTTP server: handler(method, path, body) -> raw response bytes. Returns (server, base_url)."""
+
+    async def on_connect(reader, writer):
+        request_line = await reader.readline()
+        length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            key, _, value = line.decode().partition(":")
+            if key.strip().lower() == "content-length":
+                length = int(value)
+        body = await reader.readexactly(length)
+        method, path, _ = request_line.decode().split(" ", 2)
+        writer.write(await handler(method, path, body))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(on_connect, "127.0.0.1", 0)
+    return server, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+def _response(body: bytes, status: str = "200 OK") -> bytes:
+    return f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+def test_http_request_content_length_and_chunked():
+    async def handler(method, path, body):
+        if path == "/chunked":
+            return b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n6;x=1\r\n world\r\n0\r\n\r\n"
+        return _response(json.dumps({"method": method, "path": path, "body": body.decode()}).encode(), "201 Created")
+
+    async def main():
+        server, base = await _serve(handler)
+        async with server:
+            echoed = await aio.http_request("POST", f"{base}/echo?q=1", b"payload")
+            chunked = await aio.http_request("GET", f"{base}/chunked")
+        return echoed, chunked
+
+    (status, data), chunked = asyncio.run(main())
+    assert status == 201
+    assert json.loads(data) == {"method": "POST", "path": "/echo?q=1", "body": "payload"}
+    assert chunked == (200, b"hello world")
+
+
+def test_http_request_reads_to_eof_and_follows_redirects():
+    """A body framed only by connection close is read in full, not just its first chunk."""
+
+    async def on_connect(reader, writer):
+        request_line = await reader.readline()
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        if b" /old " in request_line:
+            writer.write(b"HTTP/1.1 302 Found\r\nLocation: /eof\r\nContent-Length: 0\r\n\r\n")
+        else:
+            writer.write(b"HTTP/1.1 200 OK\r\nConnection: close\r\n\r\n")
+            for part in (b"first,", b"second,", b"third"):
+                await writer.drain()
+                await asyncio.sleep(0.02)
+                writer.write(part)
+        await writer.drain()
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(on_connect, "127.0.0.1", 0)
+        base = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        async with server:
+            return await aio.http_request("GET", f"{base}/eof"), await aio.http_request("GET", f"{base}/old")
+
+    direct, redirected = asyncio.run(main())
+    assert direct == (200, b"first,second,third")
+    assert redirected == (200, b"first,second,third")
+
+
+def test_http_request_timeout():
+    async def handler(method, path, body):
+        await asyncio.sleep(1)
+        return _response(b"late")
+
+    async def main():
+        server, base = await _serve(handler)
+        async with server:
+            with pytest.raises(TimeoutError):
+                await aio.http_request("GET", base, timeout=0.1)
+            with pytest.raises(TimeoutError):
+                await aio.http_request("GET", base, timeout=0)
+
+    asyncio.run(main())
+
+
+def test_run_adapter_inside_running_loop():
+    async def inner():
+        await asyncio.sleep(0)
+        return "ok"
+
+    async def outer():
+        # A sync caller on a thread that already runs a loop gets the result from a fresh loop
+        return aio.run(inner())
+
+    assert aio.run(inner()) == "ok"
+    assert asyncio.run(outer()) == "ok"
+
+
+def test_nested_run_does_not_starve_the_blocking_pool():
+    """Sync stages that call run() again never hold the run_blocking workers their inner calls need."""
+    def sync_stage(i):
+        return aio.run(aio.run_blocking(lambda: i))
+
+    async def main():
+        return await asyncio.gather(*(aio.run_reentrant(sync_stage, i) for i in range(8)))
+
+    blocked = threading.Event()
+    leaf = ThreadPoolExecutor(max_workers=2)
+    with patch.object(aio, "_executor", leaf):
+        assert asyncio.run(asyncio.wait_for(main(), 5)) == list(range(8))
+
+        # run() from inside a loop does not need a free run_blocking worker either
+        leaf.submit(blocked.wait, 5)
+        leaf.submit(blocked.wait, 5)
+
+        async def outer():
+            return aio.run(asyncio.sleep(0, result="ok"))
+
+        try:
+            assert asyncio.run(outer()) == "ok"
+        finally:
+            blocked.set()
+    leaf.shutdown()
+
+
+def test_gather_limited_bounds_concurrency_and_keeps_order():
+    in_flight = 0
+    peak = 0
+
+    async def job(i):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (5 - i % 5))
+        in_flight -= 1
+        return i
+
+    out = asyncio.run(aio.gather_limited([lambda i=i: job(i) for i in range(20)], limit=4))
+    assert out == list(range(20))
+    assert peak == 4
+
+
+def test_gateway_calls_overlap_on_one_loop(monkeypatch):
+    calls = []
+
+    async def handler(method, path, body):
+        if path == "/token":
+            calls.append("token")
+            return _response(json.dumps({"access_token": "t", "expires_in": 3600}).encode())
+        calls.append(json.loads(body)["params"]["name"])
+        await asyncio.sleep(0.2)
+        return _response(json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"content": []}}).encode())
+
+    async def main():
+        server, base = await _serve(handler)
+        monkeypatch.setenv("GATEWAY_MCP_URL", base)
+        monkeypatch.setenv("GATEWAY_TOKEN_ENDPOINT", f"{base}/token")
+        monkeypatch.setenv("GATEWAY_CLIENT_ID", "cid")
+        monkeypatch.setenv("GATEWAY_CLIENT_SECRET", "secret")
+        async with server:
+            await gateway_client._aget_token()
+            start = time.perf_counter()
+            results = await asyncio.gather(*(gateway_client.asearch_medications(drug_name=f"d{i}") for i in range(10)))
+            return results, time.perf_counter() - start
+
+    with patch.object(gateway_client, "_cached_config", None), patch.object(
+        gateway_client, "_token", None
+    ), patch.object(gateway_client, "_token_expires_at", 0):
+        results, elapsed = asyncio.run(main())
+    assert results == [{"content": []}] * 10
+    assert calls.count("token") == 1
+    assert elapsed < 1.0  # ten 200 ms calls overlap instead of taking 2 s
+
+
+def test_gateway_http_error_raises(monkeypatch):
+    async def handler(method, path, body):
+        if path == "/token":
+            return _response(json.dumps({"access_token": "t"}).encode())
+        return _response(b"boom", "502 Bad Gateway")
+
+    async def main():
+        server, base = await _serve(handler)
+        monkeypatch.setenv("GATEWAY_MCP_URL", base)
+        monkeypatch.setenv("GATEWAY_TOKEN_ENDPOINT", f"{base}/token")
+        monkeypatch.setenv("GATEWAY_CLIENT_ID", "cid")
+        monkeypatch.setenv("GATEWAY_CLIENT_SECRET", "secret")
+        async with server:
+            with pytest.raises(RuntimeError, match="HTTP 502"):
+                await gateway_client.acall_gateway_tool("eka-target___search_protocols", {"queries": []})
+
+    with patch.object(gateway_client, "_cached_config", None), patch.object(gateway_client, "_token", None):
+        asyncio.run(main())
+
+
+def test_assess_triage_async_overlaps_converse_calls():
+    from triage.core import agent
+
+    class SlowClient:
+        def converse(self, **kwargs):
+            time.sleep(0.2)
+            return {
+                "stopReason": "tool_use",
+                "output": {"message": {"content": [{"toolUse": {
+                    "toolUseId": "t1",
+                    "name": "submit_triage_result",
+                    "input": {"severity": "low", "confidence": 0.9, "recommendations": ["rest"],
+                              "safety_disclaimer": "x"},
+                }}]}},
+            }
+
+    async def main():
+        from triage.models.triage import TriageRequest
+
+        return await asyncio.gather(*(agent.assess_triage_async(TriageRequest(symptoms=["cough"])) for _ in range(16)))
+
+    with patch.object(agent, "_eka_available", return_value=False), patch.object(
+        agent, "get_client", return_value=SlowClient()
+    ):
+        start = time.perf_counter()
+        results = asyncio.run(main())
+        elapsed = time.perf_counter() - start
+    assert [r.severity for r in results] == ["low"] * 16
+    assert elapsed < 1.5  # 16 x 200 ms model calls overlap on the executor
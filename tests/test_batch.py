@@ -0,0 +1,117 @@
+"""Tests for batch triage (triage.core.batch, POST /triage/batch)."""
+
+import json
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+from triage.models.triage import TriageRequest, TriageResult
+
+
+def _result(severity: str, confidence: float = 0.9, force: bool = False) -> TriageResult:
+    return TriageResult(
+        severity=severity,
+        confidence=confidence,
+        recommendations=["x"],
+        force_high_priority=force,
+        model_id=f"{severity}-tier-model",
+    )
+
+
+def _fake_assess(request: TriageRequest, deadline=None) -> TriageResult:
+    symptom = request.symptoms[0]
+    if symptom == "boom":
+        raise RuntimeError("backend exploded")
+    if symptom == "fallback":
+        return _result("high", confidence=0.0, force=True)
+    return _result(symptom)
+
+
+def test_bounded_concurrency_and_severity_order():
+    from triage.core import batch
+
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_assess(request, deadline=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return _fake_assess(request)
+
+    requests = [TriageRequest(symptoms=[s]) for s in ["low", "medium", "critical", "low", "high", "medium"] * 2]
+    with patch.object(batch, "assess_triage", side_effect=slow_assess):
+        items = batch.assess_batch(requests, max_workers=3)
+
+    assert peak <= 3
+    assert [i.result.severity for i in items] == ["critical"] * 2 + ["high"] * 2 + ["medium"] * 4 + ["low"] * 4
+    assert [i.index for i in items[:2]] == [2, 8]
+
+
+def test_partial_failures_are_per_item():
+    from triage.core import batch
+
+    requests = [TriageRequest(symptoms=["low"]), "symptoms: field required", TriageRequest(symptoms=["boom"]),
+                TriageRequest(symptoms=["fallback"])]
+    with patch.object(batch, "assess_triage", side_effect=_fake_assess):
+        items = batch.assess_batch(requests)
+
+    by_index = {i.index: i for i in items}
+    assert by_index[0].status == "ok"
+    assert by_index[1].status == "invalid" and "required" in by_index[1].error
+    assert by_index[2].status == "error" and by_index[2].error == "backend exploded"
+    assert by_index[3].status == "degraded"
+    # Unassessed patients are ordered as high priority, ahead of low
+    assert items[-1].index == 0
+
+
+def test_batch_handler_bulk_persists_and_reports_status():
+    from triage.api import handler as handler_mod
+    from triage.core import batch
+
+    body = {"items": [{"symptoms": ["low"]}, {"symptoms": []}, {"symptoms": ["critical"]}]}
+    event = {"httpMethod": "POST", "resource": "/triage/batch", "body": json.dumps(body)}
+    with patch.object(batch, "assess_triage", side_effect=_fake_assess), patch.object(
+        handler_mod, "insert_triage_assessments", side_effect=lambda rows, **kw: [uuid.uuid4() for _ in rows]
+    ) as bulk:
+        r = handler_mod.handler(event, None)
+
+    assert r["statusCode"] == 200
+    out = json.loads(r["body"])
+    assert bulk.call_count == 1
+    assert [row["severity"] for row in bulk.call_args[0][0]] == ["critical", "low"]
+    # Each row records the model that answered that patient, not the BEDROCK_MODEL_ID default
+    assert [row["model_id"] for row in bulk.call_args[0][0]] == ["critical-tier-model", "low-tier-model"]
+    assert [i["index"] for i in out["items"]] == [2, 1, 0]
+    assert out["items"][0]["result"]["severity"] == "critical" and "id" in out["items"][0]
+    assert out["items"][1]["status"] == "invalid" and "id" not in out["items"][1]
+    assert out["summary"] == {"total": 3, "ok": 2, "degraded": 0, "invalid": 1, "error": 0}
+
+
+def test_batch_handler_survives_db_failure():
+    from triage.api import handler as handler_mod
+    from triage.core import batch
+
+    event = {"httpMethod": "POST", "resource": "/triage/batch", "body": json.dumps({"items": [{"symptoms": ["low"]}]})}
+    with patch.object(batch, "assess_triage", side_effect=_fake_assess), patch.object(
+        handler_mod, "insert_triage_assessments", side_effect=RuntimeError("no db")
+    ):
+        r = handler_mod.batch_handler(event, None)
+    out = json.loads(r["body"])
+    assert r["statusCode"] == 200
+    assert out["items"][0]["status"] == "ok" and "id" not in out["items"][0]
+
+
+def test_batch_handler_rejects_bad_body_and_oversize():
+    from triage.api import handler as handler_mod
+
+    assert handler_mod.batch_handler({"httpMethod": "POST", "body": '{"items": []}'}, None)["statusCode"] == 400
+    with patch.object(handler_mod, "TRIAGE_BATCH_MAX_ITEMS", 2):
+        body = json.dumps({"items": [{"symptoms": ["a"]}] * 3})
+        assert handler_mod.batch_handler({"httpMethod": "POST", "body": body}, None)["statusCode"] == 400
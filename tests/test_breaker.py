@@ -0,0 +1,169 @@
+"""Tests for per-downstream circuit breakers (lambda_common.breaker) and failover."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lambda_common.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    breaker_states,
+    get_breaker,
+)
+from triage.models.triage import TriageRequest, TriageResult
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail():
+    raise ConnectionError("downstream unavailable")
+
+
+def _trip(breaker: CircuitBreaker, n: int = 5) -> None:
+    for _ in range(n):
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+
+def test_opens_on_error_rate_and_rejects_immediately():
+    breaker = CircuitBreaker("test", min_calls=5, failure_rate=0.5, clock=_Clock())
+    _trip(breaker, 4)
+    assert breaker.state == CLOSED  # below min_calls
+    _trip(breaker, 1)
+    assert breaker.state == OPEN
+    fn = MagicMock()
+    with pytest.raises(CircuitOpenError):
+        breaker.call(fn)
+    fn.assert_not_called()
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_successes_keep_circuit_closed():
+    breaker = CircuitBreaker("test", min_calls=5, failure_rate=0.5, clock=_Clock())
+    for _ in range(6):
+        breaker.call(lambda: "ok")
+    _trip(breaker, 4)
+    assert breaker.state == CLOSED
+
+
+def test_opens_on_slow_call_rate():
+    clock = _Clock()
+    breaker = CircuitBreaker("test", min_calls=3, slow_call_seconds=2, slow_rate=0.6, clock=clock)
+
+    def slow():
+        clock.now += 3
+        return "late"
+
+    for _ in range(3):
+        assert breaker.call(slow) == "late"
+    assert breaker.state == OPEN
+
+
+def test_half_open_probe_closes_or_reopens():
+    clock = _Clock()
+    breaker = CircuitBreaker("test", min_calls=2, open_seconds=30, clock=clock)
+    _trip(breaker, 2)
+    clock.now += 31
+    assert breaker.state == HALF_OPEN
+    _trip(breaker, 1)  # failed probe
+    assert breaker.state == OPEN
+
+    clock.now += 31
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # single probe in flight
+    breaker.record(0.1, failed=False)
+    assert breaker.state == CLOSED
+
+
+def test_old_calls_leave_the_window():
+    clock = _Clock()
+    breaker = CircuitBreaker("test", min_calls=3, window_seconds=60, clock=clock)
+    _trip(breaker, 2)
+    clock.now += 120
+    breaker.call(lambda: "ok")
+    assert breaker.snapshot()["calls"] == 1
+    assert breaker.state == CLOSED
+
+
+def test_triage_fails_over_to_converse_when_agentcore_open():
+    from triage.core import agent
+
+    good = TriageResult(severity="medium", confidence=0.9, recommendations=["Rest"])
+    _trip(get_breaker("agentcore"))
+    with patch.object(agent, "USE_AGENTCORE_TRIAGE", True), patch.object(
+        agent, "TRIAGE_AGENT_RUNTIME_ARN", "arn:test"
+    ), patch.object(agent, "RED_FLAG_PRETRIAGE", False), patch.object(
+        agent, "_assess_via_agentcore"
+    ) as agentcore, patch.object(agent, "_assess_via_converse", return_value=good):
+        result = agent.assess_triage(TriageRequest(symptoms=["cough"]))
+    assert result is good
+    agentcore.assert_not_called()
+    assert breaker_states()["agentcore"]["state"] == OPEN
+
+
+def test_half_open_with_probe_in_flight_fails_over():
+    """would_allow() is False once the half-open probe is taken, so concurrent requests fail over."""
+    from triage.core import agent
+
+    clock = _Clock()
+    breaker = CircuitBreaker("agentcore", min_calls=2, open_seconds=30, clock=clock)
+    _trip(breaker, 2)
+    clock.now += 31
+    assert breaker.state == HALF_OPEN and breaker.would_allow() is True
+    assert breaker.allow() is True  # the probe
+    assert breaker.would_allow() is False
+
+    good = TriageResult(severity="medium", confidence=0.9, recommendations=["Rest"])
+    with patch.dict("lambda_common.breaker._breakers", {"agentcore": breaker}), patch.object(
+        agent, "USE_AGENTCORE_TRIAGE", True
+    ), patch.object(agent, "TRIAGE_AGENT_RUNTIME_ARN", "arn:test"), patch.object(
+        agent, "RED_FLAG_PRETRIAGE", False
+    ), patch.object(agent, "_assess_via_agentcore") as agentcore, patch.object(
+        agent, "_assess_via_converse", return_value=good
+    ):
+        assert agent.assess_triage(TriageRequest(symptoms=["cough"])) is good
+    agentcore.assert_not_called()
+
+
+def test_triage_safety_fallback_when_all_backends_open():
+    from triage.core import agent
+
+    _trip(get_breaker("converse"))
+    with patch.object(agent, "RED_FLAG_PRETRIAGE", False), patch.object(agent, "get_client") as get_client:
+        result = agent.assess_triage(TriageRequest(symptoms=["cough"]))
+    get_client.assert_not_called()
+    assert result.force_high_priority is True
+    assert result.confidence == 0.0
+
+
+def test_converse_failures_trip_breaker_via_injected_client():
+    from triage.core import agent
+
+    client = MagicMock()
+    client.converse.side_effect = ConnectionError("throttled")
+    with patch.object(agent, "get_client", return_value=client):
+        for _ in range(5):
+            agent._assess_via_converse(TriageRequest(symptoms=["cough"]))
+        assert get_breaker("converse").state == OPEN
+        agent._assess_via_converse(TriageRequest(symptoms=["cough"]))
+    assert client.converse.call_count == 5
+
+
+def test_hospital_matcher_returns_stub_when_circuit_open():
+    from hospital_matcher.core import agent
+    from hospital_matcher.models.hospital import HospitalMatchRequest
+
+    _trip(get_breaker("converse"))
+    with patch.object(agent, "get_client") as get_client:
+        result = agent.match_hospitals(HospitalMatchRequest(severity="high", recommendations=[]))
+    get_client.assert_not_called()
+    assert result.hospitals[0].hospital_id == "stub-1"
@@ -0,0 +1,134 @@
+"""Tests for the streaming bulk insert (triage.core.db.bulk_insert_triage_assessments)."""
+
+import io
+import json
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from triage.core import db
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(sql)
+        if sql.lstrip().startswith("INSERT"):
+            self.rowcount = self.conn.insert(len(self.conn.staged))
+            self.conn.staged = []
+
+    def copy_expert(self, sql, file: io.StringIO):
+        self.conn.statements.append(sql)
+        self.conn.staged = file.read().splitlines()
+        self.conn.copied.extend(self.conn.staged)
+
+
+class FakeConnection:
+    """Records statements, staged COPY lines, commits and rows inserted per chunk."""
+
+    closed = 0
+
+    def __init__(self):
+        self.statements = []
+        self.staged = []
+        self.copied = []
+        self.commits = 0
+        self.inserted_per_chunk = []
+
+    def insert(self, n):
+        self.inserted_per_chunk.append(n)
+        return n
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def _assessment(i, request_id=None):
+    return {
+        "symptoms": ["cough", "fever"],
+        "vitals": {"note": 'back\\slash "quoted"'},
+        "severity": "low",
+        "confidence": 0.9,
+        "recommendations": ["Rest"],
+        "force_high_priority": False,
+        "request_id": request_id,
+        "submitted_by": f"rmp-{i}",
+    }
+
+
+def _execute_values(seen):
+    def execute_values(cur, sql, rows, page_size):
+        assert page_size == len(rows)
+        cur.conn.statements.append(sql)
+        fresh = [r for r in rows if r[10] not in seen]
+        seen.update(r[10] for r in rows)
+        cur.rowcount = cur.conn.insert(len(fresh))
+
+    return execute_values
+
+
+def test_values_method_streams_in_chunks_and_skips_known_request_ids():
+    conn = FakeConnection()
+    seen = set()
+    pulled = []
+    known = uuid.uuid4()
+    seen.add(str(known))
+
+    def source():
+        for i in range(25):
+            pulled.append(i)
+            # The iterable is read one chunk at a time, not materialised up front
+            assert len(pulled) <= len(conn.inserted_per_chunk) * 10 + 10
+            yield _assessment(i, request_id=known if i == 3 else None)
+
+    with patch.object(db, "_connect", return_value=conn), patch(
+        "psycopg2.extras.execute_values", side_effect=_execute_values(seen)
+    ):
+        stats = db.bulk_insert_triage_assessments(source(), chunk_rows=10)
+
+    assert (stats["rows"], stats["inserted"], stats["skipped"], stats["chunks"]) == (25, 24, 1, 3)
+    assert conn.commits == 3 and stats["rows_per_second"] > 0
+    assert all(s.endswith("ON CONFLICT (request_id) WHERE request_id IS NOT NULL DO NOTHING") for s in conn.statements)
+    # Rows without a request_id were given one
+    assert len(seen) == 25
+
+
+def test_copy_method_stages_escaped_json_lines():
+    conn = FakeConnection()
+    request_id = uuid.uuid4()
+    with patch.object(db, "_connect", return_value=conn):
+        stats = db.bulk_insert_triage_assessments(
+            [_assessment(i, request_id=request_id if i == 0 else None) for i in range(5)], method="copy", chunk_rows=2
+        )
+
+    assert (stats["rows"], stats["chunks"]) == (5, 3)
+    assert any(s.startswith("COPY _bulk_triage_assessments") for s in conn.statements)
+    docs = [json.loads(line.replace("\\\\", "\\")) for line in conn.copied]
+    assert docs[0]["request_id"] == str(request_id)
+    assert docs[0]["vitals"] == {"note": 'back\\slash "quoted"'}
+    assert all(d["request_id"] and d["id"] for d in docs)
+
+
+def test_empty_input_and_unknown_method():
+    conn = FakeConnection()
+    with patch.object(db, "_connect", return_value=conn):
+        assert db.bulk_insert_triage_assessments(iter([]))["rows"] == 0
+    assert conn.statements == []
+    with pytest.raises(ValueError):
+        db.bulk_insert_triage_assessments([], method="csv")
@@ -0,0 +1,132 @@
+"""Tests for the triage result cache (canonical keys, LRU/TTL, shared tier, policy)."""
+
+from unittest.mock import patch
+
+from triage.core.cache import FileCacheTier, TriageResultCache, cache_key
+from triage.models.triage import TriageRequest, TriageResult
+
+
+def _result(severity="medium", confidence=0.9):
+    return TriageResult(severity=severity, confidence=confidence, recommendations=["Rest"], session_id="orig")
+
+
+def test_cache_key_canonicalizes_request():
+    """Case, order, hyphens, vital aliases and nearby values in the same band share a key."""
+    a = TriageRequest(symptoms=["Fever", "body-ache"], vitals={"heart_rate": 88, "bp": 120}, age_years=30, sex="Male")
+    b = TriageRequest(symptoms=["body ache", "fever "], vitals={"heartRateBpm": 95, "blood_pressure_systolic": 125},
+                      age_years=35, sex="m")
+    c = TriageRequest(symptoms=["fever", "body ache"], vitals={"heart_rate": 125}, age_years=30, sex="m")
+    assert cache_key(a) == cache_key(b)
+    assert cache_key(a) != cache_key(c)
+
+
+def test_lru_hit_marked_cached_and_echoes_session():
+    cache = TriageResultCache(ttl_seconds=60, max_entries=10)
+    cache.put(TriageRequest(symptoms=["fever"]), _result())
+    hit = cache.get(TriageRequest(symptoms=["FEVER"], session_id="new-session"))
+    assert hit is not None
+    result, tier = hit
+    assert tier == "lru"
+    assert result.cached is True
+    assert result.session_id == "new-session"
+    assert cache.stats["lru_hits"] == 1
+
+
+def test_lru_eviction_and_ttl():
+    cache = TriageResultCache(ttl_seconds=60, max_entries=2)
+    for s in ("a", "b", "c"):
+        cache.put(TriageRequest(symptoms=[s]), _result())
+    assert cache.get(TriageRequest(symptoms=["a"])) is None
+    assert cache.get(TriageRequest(symptoms=["c"])) is not None
+
+    expired = TriageResultCache(ttl_seconds=0, max_entries=2)
+    expired.put(TriageRequest(symptoms=["a"]), _result())
+    assert expired.get(TriageRequest(symptoms=["a"])) is None
+
+
+def test_policy_bypasses():
+    """Critical results, safety fallbacks and patient_id requests are not cached."""
+    cache = TriageResultCache(ttl_seconds=60, max_entries=10)
+    cache.put(TriageRequest(symptoms=["x"]), _result(severity="critical"))
+    cache.put(TriageRequest(symptoms=["y"]), _result(severity="high", confidence=0.0))
+    cache.put(TriageRequest(symptoms=["z"], patient_id="p1"), _result())
+    assert cache.stats["puts"] == 0
+    assert cache.get(TriageRequest(symptoms=["x"])) is None
+    assert cache.get(TriageRequest(symptoms=["y"])) is None
+
+
+def test_file_shared_tier(tmp_path):
+    """A second process (fresh LRU) hits the shared file tier."""
+    TriageResultCache(shared=FileCacheTier(str(tmp_path))).put(TriageRequest(symptoms=["cough"]), _result())
+    other = TriageResultCache(shared=FileCacheTier(str(tmp_path)))
+    result, tier = other.get(TriageRequest(symptoms=["cough"]))
+    assert tier == "file"
+    assert result.cached is True
+    assert other.stats["shared_hits"] == 1
+
+
+def test_unwritable_file_tier_falls_back_to_lru(tmp_path):
+    """A file tier directory that cannot be created leaves the cache running on the LRU only."""
+    from triage.core import cache as cache_mod
+
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    with patch.object(cache_mod, "TRIAGE_CACHE_ENABLED", True), patch.object(
+        cache_mod, "TRIAGE_CACHE_SHARED_TIER", "file"
+    ), patch.object(cache_mod, "TRIAGE_CACHE_FILE_DIR", str(blocker / "cache")), patch.object(cache_mod, "_cache", None):
+        cache = cache_mod.get_result_cache()
+        assert cache is not None and cache.shared is None
+        cache.put(TriageRequest(symptoms=["cough"]), _result())
+        assert cache.get(TriageRequest(symptoms=["cough"]))[1] == "lru"
+
+
+def test_assess_triage_uses_cache():
+    """Second identical request is served from cache without a backend call."""
+    from triage.core import agent
+
+    cache = TriageResultCache(ttl_seconds=60, max_entries=10)
+    with patch.object(agent, "get_result_cache", return_value=cache), patch.object(
+        agent, "_assess_via_converse", return_value=_result()
+    ) as converse:
+        first = agent.assess_triage(TriageRequest(symptoms=["fever"]))
+        second = agent.assess_triage(TriageRequest(symptoms=["Fever"]))
+    assert converse.call_count == 1
+    assert first.cached is False
+    assert second.cached is True
+
+
+def test_postgres_tier_lookup_is_bounded_and_a_timeout_is_a_miss():
+    """The Aurora lookup uses a short connect timeout and statement_timeout; a cancelled query is a miss."""
+    from contextlib import contextmanager
+    from unittest.mock import MagicMock
+
+    from triage.core import db
+    from triage.core.cache import PostgresCacheTier
+
+    cur = MagicMock()
+    cur.__enter__.return_value = cur
+    cur.execute.side_effect = RuntimeError("canceling statement due to statement timeout")
+    timeouts = []
+
+    @contextmanager
+    def connection(connect_timeout=15):
+        timeouts.append(connect_timeout)
+        yield MagicMock(cursor=lambda: cur)
+
+    cache = TriageResultCache(ttl_seconds=60, max_entries=10, shared=PostgresCacheTier())
+    with patch.object(db, "connection", connection):
+        assert cache.get(TriageRequest(symptoms=["cough"])) is None
+    assert timeouts == [db.CACHE_DB_CONNECT_TIMEOUT] and db.CACHE_DB_CONNECT_TIMEOUT <= 2
+    assert f"SET LOCAL statement_timeout = {db.CACHE_DB_STATEMENT_TIMEOUT_MS};" in cur.execute.call_args[0][0]
+    assert cache.stats["misses"] == 1
+
+
+def test_unreachable_postgres_tier_is_a_miss():
+    from triage.core import db
+    from triage.core.cache import PostgresCacheTier
+
+    cache = TriageResultCache(ttl_seconds=60, max_entries=10, shared=PostgresCacheTier())
+    with patch.object(db, "connection", side_effect=TimeoutError("connect timed out")):
+        assert cache.get(TriageRequest(symptoms=["cough"])) is None
+        cache.put(TriageRequest(symptoms=["cough"]), _result())
+    assert cache.stats["misses"] == 1 and cache.stats["puts"] == 1
@@ -0,0 +1,110 @@
+"""Tests for the Converse model cascade (triage.core.cascade)."""
+
+from unittest.mock import patch
+
+import pytest
+
+from triage.core import cascade
+from triage.core.deadline import Deadline
+from triage.models.triage import TriageRequest
+
+SMALL, LARGE = "small-model", "large-model"
+
+
+class _TierClient:
+    """Answers submit_triage_result with the input configured per modelId (None = no tool call)."""
+
+    def __init__(self, answers, on_call=None):
+        self.answers = answers
+        self.on_call = on_call
+        self.models = []
+
+    def converse(self, **kwargs):
+        self.models.append(kwargs["modelId"])
+        if self.on_call:
+            self.on_call()
+        answer = self.answers[kwargs["modelId"]]
+        if answer is None:
+            return {"stopReason": "end_turn", "output": {"message": {"content": [{"text": "unsure"}]}}}
+        return {
+            "stopReason": "tool_use",
+            "output": {"message": {"content": [{"toolUse": {
+                "toolUseId": "t1",
+                "name": "submit_triage_result",
+                "input": {"recommendations": ["x"], "safety_disclaimer": "x", **answer},
+            }}]}},
+        }
+
+
+@pytest.fixture(autouse=True)
+def _tiers():
+    cascade.reset_cascade_stats()
+    with patch.object(cascade, "TRIAGE_MODEL_TIERS", [SMALL, LARGE]):
+        yield
+
+
+def _assess(answers, deadline=None, on_call=None):
+    from triage.core import agent
+
+    client = _TierClient(answers, on_call)
+    with patch.object(agent, "_eka_available", return_value=False), patch.object(agent, "get_client", return_value=client):
+        return agent._assess_via_converse(TriageRequest(symptoms=["cough"]), deadline=deadline), client.models
+
+
+def test_confident_low_severity_stays_on_small_model():
+    result, models = _assess({SMALL: {"severity": "low", "confidence": 0.95}, LARGE: None})
+    assert result.severity == "low" and models == [SMALL]
+    assert result.model_id == SMALL
+    assert cascade.cascade_stats()[SMALL]["escalation_rate"] == 0.0
+
+
+@pytest.mark.parametrize(
+    "small, severity",
+    [
+        ({"severity": "low", "confidence": 0.84, "force_high_priority": True}, "medium"),
+        ({"severity": "high", "confidence": 0.95}, "high"),
+        (None, "medium"),
+    ],
+)
+def test_escalates_on_low_confidence_high_severity_or_invalid(small, severity):
+    result, models = _assess({SMALL: small, LARGE: {"severity": "medium", "confidence": 0.9}})
+    assert models == [SMALL, LARGE]
+    assert result.severity == severity
+    stats = cascade.cascade_stats()
+    assert stats[SMALL]["escalations"] == 1 and stats[LARGE]["calls"] == 1
+
+
+def test_escalation_never_lowers_severity():
+    result, models = _assess({SMALL: {"severity": "critical", "confidence": 0.95}, LARGE: {"severity": "low", "confidence": 0.9}})
+    assert models == [SMALL, LARGE]
+    assert result.severity == "critical" and result.confidence == 0.95
+    assert result.model_id == SMALL
+
+
+def test_escalation_confirming_severity_takes_stronger_answer():
+    result, _ = _assess({SMALL: {"severity": "high", "confidence": 0.9}, LARGE: {"severity": "high", "confidence": 0.97}})
+    assert result.severity == "high" and result.confidence == 0.97
+    assert result.model_id == LARGE
+
+
+def test_failed_escalation_keeps_valid_lower_tier_answer():
+    result, models = _assess({SMALL: {"severity": "critical", "confidence": 0.9}, LARGE: None})
+    assert models == [SMALL, LARGE]
+    assert result.severity == "critical" and result.confidence == 0.9
+
+
+def test_no_escalation_without_time_left():
+    deadline = Deadline(20)
+
+    def spend_budget():
+        deadline.expires_at -= 19.5
+
+    result, models = _assess({SMALL: {"severity": "high", "confidence": 0.95}, LARGE: None}, deadline, spend_budget)
+    assert models == [SMALL]
+    assert result.severity == "high"
+
+
+def test_single_tier_defaults_to_bedrock_model_id(monkeypatch):
+    monkeypatch.setattr(cascade, "TRIAGE_MODEL_TIERS", [])
+    monkeypatch.setenv("BEDROCK_MODEL_ID", LARGE)
+    assert cascade.model_tiers() == [LARGE]
@@ -0,0 +1,23 @@
+"""Tests for the shared boto3 client registry."""
+
+from lambda_common.clients import CLIENT_CONFIG, get_client, reset_clients
+
+
+def test_get_client_reuses_instance():
+    """Same service/region returns the same client; different region gets its own."""
+    reset_clients()
+    a = get_client("bedrock-runtime", "us-east-1")
+    b = get_client("bedrock-runtime", "us-east-1")
+    c = get_client("bedrock-runtime", "ap-south-1")
+    assert a is b
+    assert a is not c
+    reset_clients()
+    assert get_client("bedrock-runtime", "us-east-1") is not a
+
+
+def test_client_config_tuned():
+    """Clients use keep-alive, bounded timeouts and adaptive retries."""
+    client = get_client("bedrock-runtime", "us-east-1")
+    assert client.meta.config.tcp_keepalive is True
+    assert client.meta.config.retries["mode"] == "adaptive"
+    assert CLIENT_CONFIG.connect_timeout <= client.meta.config.read_timeout
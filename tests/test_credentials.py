@@ -0,0 +1,134 @@
+"""Tests for the secrets / IAM token TTL cache (lambda_common.credentials) and its callers."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lambda_common import credentials
+from lambda_common.credentials import CredentialCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _secrets_client(values: dict[str, dict]):
+    client = MagicMock()
+    client.get_secret_value.side_effect = lambda SecretId: {"SecretString": json.dumps(values[SecretId])}
+    return client
+
+
+def test_hit_within_ttl_and_reload_after_expiry():
+    clock = Clock()
+    cache = CredentialCache(clock=clock, background=False)
+    loads = []
+    loader = lambda: loads.append(1) or len(loads)  # noqa: E731
+    assert cache.get("k", loader, ttl=100) == 1
+    clock.now += 50
+    assert cache.get("k", loader, ttl=100) == 1
+    clock.now += 51
+    assert cache.get("k", loader, ttl=100) == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+
+
+def test_refresh_ahead_serves_cached_value_and_keeps_it_on_failure():
+    clock = Clock()
+    cache = CredentialCache(clock=clock, refresh_ahead=0.2, background=False)
+    values = iter(["v1", "v2"])
+    assert cache.get("k", lambda: next(values), ttl=100) == "v1"
+    clock.now += 85  # inside the last 20% of the TTL
+    assert cache.get("k", lambda: next(values), ttl=100) == "v1"
+    assert cache.get("k", lambda: "unused", ttl=100) == "v2"  # refreshed in the background
+    assert cache.stats()["refreshes"] == 1
+
+    clock.now += 85
+
+    def fail():
+        raise ConnectionError("secrets manager down")
+
+    assert cache.get("k", fail, ttl=100) == "v2"  # failed refresh keeps the old value
+    assert cache.stats()["errors"] == 1
+
+
+def test_concurrent_misses_load_once():
+    cache = CredentialCache()
+    loads = []
+
+    def slow():
+        loads.append(1)
+        time.sleep(0.05)
+        return "token"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("k", slow, ttl=60))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["token"] * 8 and len(loads) == 1
+
+
+def test_loader_error_is_not_cached():
+    cache = CredentialCache()
+    with pytest.raises(KeyError):
+        cache.get("k", lambda: {}["missing"], ttl=60)
+    assert cache.get("k", lambda: "ok", ttl=60) == "ok"
+
+
+def test_secret_json_calls_secrets_manager_once():
+    client = _secrets_client({"rds": {"host": "db"}})
+    for _ in range(5):
+        assert credentials.secret_json(client, "rds") == {"host": "db"}
+    assert client.get_secret_value.call_count == 1
+
+
+def test_prefetch_batches_and_falls_back_per_secret():
+    client = _secrets_client({"rds": {"host": "db"}, "gateway": {"gateway_url": "u"}})
+    client.batch_get_secret_value.return_value = {
+        "SecretValues": [{"Name": "rds", "ARN": "arn:rds", "SecretString": json.dumps({"host": "db"})}],
+        "Errors": [{"SecretId": "gateway", "ErrorCode": "AccessDeniedException"}],
+    }
+    assert credentials.prefetch_secrets(client, ["rds", "gateway", "", "rds"]) == 2
+    client.batch_get_secret_value.assert_called_once_with(SecretIdList=["rds", "gateway"])
+    # Only the secret missing from the batch response was fetched individually
+    client.get_secret_value.assert_called_once_with(SecretId="gateway")
+    assert credentials.secret_json(client, "rds") == {"host": "db"}
+    assert credentials.prefetch_secrets(client, ["rds", "gateway"]) == 0
+
+    credentials.reset_credentials()
+    client.batch_get_secret_value.side_effect = RuntimeError("not authorized")
+    assert credentials.prefetch_secrets(client, ["rds"]) == 1
+
+
+def test_rds_token_cached_and_invalidated_on_auth_failure():
+    from triage.core import db
+
+    secrets = _secrets_client({db.RDS_CONFIG_SECRET: {"host": "h", "database": "d", "username": "u"}})
+    rds = MagicMock()
+    rds.generate_db_auth_token.side_effect = lambda **kw: f"token-{rds.generate_db_auth_token.call_count}"
+    clients = {"secretsmanager": secrets, "rds": rds}
+    attempts = []
+
+    def connect(**kwargs):
+        attempts.append(kwargs["password"])
+        if len(attempts) == 2:
+            raise RuntimeError('FATAL:  PAM authentication failed for user "u"')
+        return MagicMock(closed=0)
+
+    with patch.object(db, "get_client", side_effect=lambda service, region=None: clients[service]), patch(
+        "psycopg2.connect", side_effect=connect
+    ):
+        db._connect(5).close()
+        with db.connection(5):
+            pass
+    # Second connect reused the cached token, was rejected, and retried with a freshly signed one
+    assert attempts == ["token-1", "token-1", "token-2"]
+    assert secrets.get_secret_value.call_count == 2
@@ -0,0 +1,175 @@
+"""Tests for request deadline propagation (triage.core.deadline)."""
+
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+from triage.core.deadline import Deadline, stage_timeout
+from triage.models.triage import TriageRequest
+
+
+class _FakeContext:
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+class _FakeConverseClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def converse(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+
+def _submit_response():
+    return {
+        "stopReason": "tool_use",
+        "output": {"message": {"role": "assistant", "content": [{"toolUse": {
+            "toolUseId": "t1",
+            "name": "submit_triage_result",
+            "input": {"severity": "medium", "confidence": 0.8, "recommendations": ["Rest"],
+                      "force_high_priority": False, "safety_disclaimer": "x"},
+        }}]}},
+    }
+
+
+def _eka_tool_config():
+    return {
+        "tools": [{"toolSpec": {"name": "search_indian_medications"}}, {"toolSpec": {"name": "submit_triage_result"}}],
+        "toolChoice": {"any": {}},
+    }
+
+
+def test_from_context_uses_smaller_of_ceiling_and_lambda_remaining():
+    assert Deadline.from_context(_FakeContext(10_000), ceiling_seconds=27).budget <= 9.5
+    assert Deadline.from_context(_FakeContext(60_000), ceiling_seconds=27).budget == 27
+    assert Deadline.from_context(None, ceiling_seconds=5).budget == 5
+
+
+def test_stage_timeout_caps_and_reserves():
+    assert stage_timeout(None, 12) == 12
+    d = Deadline(5)
+    assert 3.9 < stage_timeout(d, 12, reserve=1) <= 4
+    assert stage_timeout(d, 2) == 2
+    assert stage_timeout(Deadline(0), 12) == 0
+
+
+def test_converse_forces_submit_when_time_is_short():
+    """Below FORCE_SUBMIT_SECONDS the round is sent with toolChoice pinned to submit_triage_result."""
+    from triage.core import agent, gateway_client
+
+    client = _FakeConverseClient([_submit_response()])
+    with patch.object(gateway_client, "is_gateway_configured", return_value=True), patch.object(
+        agent, "get_triage_tool_config_with_eka", return_value=_eka_tool_config()
+    ), patch.object(agent, "get_client", return_value=client), patch.object(agent, "FORCE_SUBMIT_SECONDS", 8.0):
+        result = agent._assess_via_converse(TriageRequest(symptoms=["fever"]), deadline=Deadline(5))
+
+    assert result.severity == "medium"
+    assert client.calls[0]["toolConfig"]["toolChoice"] == {"tool": {"name": "submit_triage_result"}}
+
+
+def test_converse_keeps_tool_choice_with_ample_budget():
+    from triage.core import agent, gateway_client
+
+    client = _FakeConverseClient([_submit_response()])
+    with patch.object(gateway_client, "is_gateway_configured", return_value=True), patch.object(
+        agent, "get_triage_tool_config_with_eka", return_value=_eka_tool_config()
+    ), patch.object(agent, "get_client", return_value=client):
+        agent._assess_via_converse(TriageRequest(symptoms=["fever"]), deadline=Deadline(25))
+
+    assert client.calls[0]["toolConfig"]["toolChoice"] == {"any": {}}
+
+
+def test_converse_returns_degraded_result_when_budget_exhausted():
+    """No model call is started without MIN_MODEL_CALL_SECONDS left; a safety result is returned instead."""
+    from triage.core import agent
+
+    client = _FakeConverseClient([])
+    with patch.object(agent, "get_client", return_value=client):
+        result = agent._assess_via_converse(TriageRequest(symptoms=["fever"]), deadline=Deadline(0.5))
+
+    assert client.calls == []
+    assert result.force_high_priority is True
+    assert result.confidence == 0.0
+
+
+def test_handler_skips_persist_when_deadline_nearly_spent():
+    from triage.api import handler as handler_mod
+    from triage.models.triage import TriageResult
+
+    result = TriageResult(severity="low", confidence=0.9, recommendations=["Rest"])
+    with patch.object(handler_mod, "insert_triage_assessment") as insert:
+        row_id = handler_mod._persist_assessment(TriageRequest(symptoms=["cough"]), result, None, Deadline(0.5))
+    assert row_id is None
+    insert.assert_not_called()
+
+
+class _SlowClient:
+    """converse / converse_stream / invoke_agent_runtime that block well past a short deadline."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.released = threading.Event()
+
+    def _block(self):
+        self.released.wait(self.seconds)
+
+    def converse(self, **kwargs):
+        self._block()
+        return _submit_response()
+
+    def invoke_agent_runtime(self, **kwargs):
+        self._block()
+        return {"response": iter([])}
+
+    def converse_stream(self, **kwargs):
+        def stream():
+            yield {"messageStart": {"role": "assistant"}}
+            self._block()
+            yield {"messageStop": {"stopReason": "end_turn"}}
+
+        return {"stream": stream()}
+
+
+def test_slow_model_calls_end_at_the_deadline():
+    """A model call still running when the deadline passes is abandoned for the safety result, on every backend."""
+    from triage.core import agent
+    from triage.core.streaming import assess_triage_stream
+
+    client = _SlowClient(5)
+    request = TriageRequest(symptoms=["fever"])
+    try:
+        with patch.object(agent, "get_client", return_value=client), patch.object(
+            agent, "MIN_MODEL_CALL_SECONDS", 0.0
+        ), patch.object(agent, "TRIAGE_AGENT_RUNTIME_ARN", "arn:runtime"):
+            for call in (
+                lambda: agent._assess_via_converse(request, deadline=Deadline(0.2)),
+                lambda: agent._assess_via_agentcore(request, deadline=Deadline(0.2)),
+                lambda: list(assess_triage_stream(request, client=client, deadline=Deadline(0.2)))[-1],
+            ):
+                start = time.monotonic()
+                result = call()
+                assert time.monotonic() - start < 1.5
+                confidence = result["confidence"] if isinstance(result, dict) else result.confidence
+                assert confidence == 0.0
+    finally:
+        client.released.set()
+
+
+def test_handler_persists_the_answering_model(monkeypatch):
+    from triage.api import handler as handler_mod
+    from triage.models.triage import TriageResult
+
+    monkeypatch.setenv("BEDROCK_MODEL_ID", "default-model")
+    result = TriageResult(severity="high", confidence=0.9, recommendations=["Refer"], model_id="escalated-model")
+    with patch.object(handler_mod, "TRIAGE_WRITE_BEHIND", False), patch.object(
+        handler_mod, "insert_triage_assessment", return_value=uuid.uuid4()
+    ) as insert:
+        handler_mod._persist_assessment(TriageRequest(symptoms=["cough"]), result, None)
+    assert insert.call_args.kwargs["model_id"] == "escalated-model"
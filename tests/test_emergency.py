@@ -0,0 +1,143 @@
+"""Tests for the POST /emergency pipeline (triage.core.emergency) and its handler."""
+
+import asyncio
+import io
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from triage.core import emergency
+from triage.core.deadline import Deadline
+from triage.models.triage import TriageRequest, TriageResult
+
+RESULT = TriageResult(severity="critical", confidence=0.9, recommendations=["Emergency department"])
+CATALOG = [
+    {"hospital_id": "h1", "name": "City Hospital", "match_score": 0.9, "lat": 12.9, "lon": 77.6},
+    {"hospital_id": "h2", "name": "Mission Hospital", "match_score": 0.88, "lat": 13.0, "lon": 77.5},
+    {"hospital_id": "h3", "name": "District Hospital", "match_score": 0.86},
+]
+LOCATED = TriageRequest(symptoms=["chest pain"], patient_location_lat=12.97, patient_location_lon=77.59)
+
+
+def _text_result(data: dict) -> dict:
+    return {"content": [{"type": "text", "text": json.dumps(data)}]}
+
+
+def _collect(request: TriageRequest, deadline: Deadline, persist=None) -> list[dict]:
+    async def main():
+        return [ev async for ev in emergency.emergency_events(request, deadline, persist=persist)]
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def fake_backends():
+    """Triage and every Gateway call take 200 ms; records the order in which work started."""
+    started = []
+
+    async def triage(request, deadline=None):
+        started.append("triage")
+        await asyncio.sleep(0.2)
+        return RESULT
+
+    async def tool(name, args, timeout=15):
+        started.append(name)
+        await asyncio.sleep(0.2)
+        if name == emergency.CATALOG_TOOL_NAME:
+            return _text_result({"hospitals": CATALOG})
+        return _text_result({"distance_km": 4.2, "duration_minutes": 12, "directions_url": f"u/{args}"})
+
+    with patch.object(emergency, "assess_triage_async", triage), patch.object(
+        emergency, "acall_gateway_tool", tool
+    ), patch.object(emergency, "is_gateway_configured", return_value=True), patch.object(
+        emergency, "HOSPITAL_MATCHER_FUNCTION_NAME", ""
+    ):
+        yield started
+
+
+def test_tool_json_text_then_structured():
+    assert emergency.tool_json(_text_result({"a": 1})) == {"a": 1}
+    assert emergency.tool_json({"content": [{"type": "text", "text": "not json"}], "structuredContent": {"b": 2}}) == {
+        "b": 2
+    }
+    assert emergency.tool_json({}) == {}
+
+
+def test_stages_overlap_and_stream_in_order(fake_backends):
+    start = time.perf_counter()
+    events = _collect(LOCATED, Deadline(20), persist=lambda result: "row-1")
+    elapsed = time.perf_counter() - start
+
+    assert [e["event"] for e in events] == ["triage", "hospitals", "route", "route", "route", "done"]
+    assert fake_backends[:2] == ["triage", emergency.CATALOG_TOOL_NAME]
+    assert events[0]["severity"] == "critical"
+    assert events[1]["source"] == "catalog" and [h["hospital_id"] for h in events[1]["hospitals"]] == ["h1", "h2", "h3"]
+    assert {e["hospital_id"] for e in events[2:5]} == {"h1", "h2", "h3"}
+    assert events[-1]["id"] == "row-1" and events[-1]["skipped"] == []
+    # triage || catalog (200 ms) + three routes in parallel (200 ms), not 200 + 200 + 3 x 200
+    assert elapsed < 0.7
+
+
+def test_route_destination_uses_catalog_coordinates_else_name():
+    assert emergency._destination({"hospital_id": "h1"}, CATALOG) == {"dest_lat": 12.9, "dest_lon": 77.6}
+    assert emergency._destination({"hospital_id": "x", "name": "PHC"}, CATALOG) == {"dest_address": "PHC"}
+
+
+def test_matcher_result_used_and_routed_hospitals_not_routed_again(fake_backends):
+    body = {
+        "statusCode": 200,
+        "body": json.dumps({
+            "hospitals": [
+                {"hospital_id": "h2", "name": "Mission Hospital", "match_score": 0.95, "duration_minutes": 9},
+                {"hospital_id": "h1", "name": "City Hospital", "match_score": 0.9},
+            ],
+            "safety_disclaimer": "Confirm by phone",
+        }),
+    }
+    client = MagicMock()
+    client.invoke.return_value = {"StatusCode": 200, "Payload": io.BytesIO(json.dumps(body).encode())}
+    with patch.object(emergency, "HOSPITAL_MATCHER_FUNCTION_NAME", "hospital-matcher"), patch.object(
+        emergency, "get_client", return_value=client
+    ):
+        events = _collect(LOCATED, Deadline(20))
+
+    sent = json.loads(client.invoke.call_args.kwargs["Payload"])
+    assert sent["httpMethod"] == "POST"
+    assert json.loads(sent["body"])["severity"] == "critical"
+    assert events[1]["source"] == "matcher" and events[1]["safety_disclaimer"] == "Confirm by phone"
+    assert [e["hospital_id"] for e in events if e["event"] == "route"] == ["h1"]
+
+
+def test_matcher_failure_falls_back_to_catalog(fake_backends):
+    client = MagicMock()
+    client.invoke.return_value = {"FunctionError": "Unhandled", "Payload": io.BytesIO(b"{}")}
+    with patch.object(emergency, "HOSPITAL_MATCHER_FUNCTION_NAME", "hospital-matcher"), patch.object(
+        emergency, "get_client", return_value=client
+    ):
+        events = _collect(TriageRequest(symptoms=["fever"]), Deadline(20))
+    assert events[1]["source"] == "catalog"
+    # No patient location: no route stage
+    assert [e["event"] for e in events] == ["triage", "hospitals", "done"]
+
+
+def test_routes_skipped_when_deadline_spent(fake_backends):
+    with patch.object(emergency, "EMERGENCY_DOWNSTREAM_RESERVE_SECONDS", 0):
+        events = _collect(LOCATED, Deadline(0.3))
+    assert [e["event"] for e in events] == ["triage", "hospitals", "done"]
+    assert events[-1]["skipped"] == ["routes"]
+
+
+def test_emergency_handler_streams_sse(fake_backends):
+    from triage.api import handler as handler_mod
+
+    event = {"httpMethod": "POST", "resource": "/emergency", "body": json.dumps({"symptoms": ["chest pain"]})}
+    with patch.object(handler_mod, "_persist_assessment", return_value="row-9") as persist:
+        resp = handler_mod.handler(event, None)
+    assert resp["statusCode"] == 200
+    assert resp["headers"]["Content-Type"] == "text/event-stream"
+    frames = [f for f in resp["body"].split("\n\n") if f]
+    assert [f.split("\n", 1)[0] for f in frames] == ["event: triage", "event: hospitals", "event: done"]
+    assert json.loads(frames[-1].split("data: ", 1)[1])["id"] == "row-9"
+    assert persist.call_args.args[1] == RESULT
@@ -61,3 +61,90 @@ def test_gateway_client_configured():
     finally:
         for key in ("GATEWAY_MCP_URL", "GATEWAY_CLIENT_ID", "GATEWAY_CLIENT_SECRET", "GATEWAY_TOKEN_ENDPOINT"):
             os.environ.pop(key, None)
+
+
+class _FakeConverseClient:
+    """Scripted Bedrock Converse client: returns queued responses and records the messages sent."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def converse(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+
+def _tool_use_response(*tool_uses):
+    return {
+        "stopReason": "tool_use",
+        "output": {"message": {"role": "assistant", "content": [{"toolUse": t} for t in tool_uses]}},
+    }
+
+
+def test_converse_runs_eka_tools_in_parallel_in_order():
+    """Two Eka toolUse blocks in one round run concurrently; toolResults keep toolUseId order."""
+    import asyncio
+    import time
+    from unittest.mock import patch
+
+    from triage.core import agent, gateway_client
+    from triage.models.triage import TriageRequest
+
+    async def slow_meds(**kwargs):
+        await asyncio.sleep(0.3)
+        return {"medications": ["Dolo 650"]}
+
+    async def slow_protocols(**kwargs):
+        await asyncio.sleep(0.3)
+        return {"protocols": ["ICMR fever"]}
+
+    client = _FakeConverseClient([
+        _tool_use_response(
+            {"toolUseId": "t1", "name": "search_indian_medications", "input": {"drug_name": "paracetamol"}},
+            {"toolUseId": "t2", "name": "search_treatment_protocols", "input": {"queries": []}},
+        ),
+        _tool_use_response({
+            "toolUseId": "t3",
+            "name": "submit_triage_result",
+            "input": {"severity": "low", "confidence": 0.9, "recommendations": ["Rest"],
+                      "force_high_priority": False, "safety_disclaimer": "x"},
+        }),
+    ])
+    with patch.object(gateway_client, "is_gateway_configured", return_value=True), patch.object(
+        gateway_client, "asearch_medications", slow_meds
+    ), patch.object(gateway_client, "asearch_protocols", slow_protocols), patch.object(
+        agent, "get_client", return_value=client
+    ):
+        t0 = time.perf_counter()
+        result = agent._assess_via_converse(TriageRequest(symptoms=["fever"]))
+        elapsed = time.perf_counter() - t0
+
+    assert result.severity == "low"
+    assert elapsed < 0.55
+    tool_results = client.calls[1]["messages"][-1]["content"]
+    assert [tr["toolResult"]["toolUseId"] for tr in tool_results] == ["t1", "t2"]
+    assert "Dolo 650" in tool_results[0]["toolResult"]["content"][0]["text"]
+    assert "ICMR fever" in tool_results[1]["toolResult"]["content"][0]["text"]
+
+
+def test_converse_tool_timeout_returns_error_text():
+    """A tool exceeding TOOL_CALL_TIMEOUT_SECONDS yields an error toolResult instead of blocking the round."""
+    import asyncio
+    from unittest.mock import patch
+
+    from triage.core import agent, gateway_client
+    from triage.models.triage import TriageRequest
+
+    client = _FakeConverseClient([
+        _tool_use_response({"toolUseId": "t1", "name": "search_indian_medications", "input": {}}),
+        {"stopReason": "end_turn", "output": {"message": {"role": "assistant", "content": [{"text": "done"}]}}},
+    ])
+    with patch.object(gateway_client, "is_gateway_configured", return_value=True), patch.object(
+        gateway_client, "asearch_medications", lambda **kw: asyncio.sleep(0.5, result={})
+    ), patch.object(agent, "get_client", return_value=client), patch.object(agent, "TOOL_CALL_TIMEOUT_SECONDS", 0.05):
+        result = agent._assess_via_converse(TriageRequest(symptoms=["fever"]))
+
+    assert result.force_high_priority is True
+    text = client.calls[1]["messages"][-1]["content"][0]["toolResult"]["content"][0]["text"]
+    assert "timed out" in text
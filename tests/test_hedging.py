@@ -0,0 +1,59 @@
+"""Tests for hedged triage backends (first valid result wins)."""
+
+import time
+from unittest.mock import patch
+
+from triage.core import hedging
+from triage.core.hedging import hedged_call
+from triage.models.triage import TriageRequest, TriageResult
+
+
+def _slow(value, seconds):
+    def fn():
+        time.sleep(seconds)
+        return value
+    return fn
+
+
+def test_fast_primary_never_hedges():
+    before = dict(hedging.HEDGE_STATS)
+    result, winner, _ = hedged_call(("a", _slow("A", 0)), ("b", _slow("B", 0)), 0.5, is_valid=bool)
+    assert (result, winner) == ("A", "a")
+    assert hedging.HEDGE_STATS["hedged"] == before["hedged"]
+    assert hedging.HEDGE_STATS["primary_wins"] == before["primary_wins"] + 1
+
+
+def test_slow_primary_secondary_wins():
+    before = dict(hedging.HEDGE_STATS)
+    t0 = time.perf_counter()
+    result, winner, _ = hedged_call(("a", _slow("A", 0.5)), ("b", _slow("B", 0.01)), 0.05, is_valid=bool)
+    assert (result, winner) == ("B", "b")
+    assert time.perf_counter() - t0 < 0.3
+    assert hedging.HEDGE_STATS["hedged"] == before["hedged"] + 1
+    assert hedging.HEDGE_STATS["secondary_wins"] == before["secondary_wins"] + 1
+    time.sleep(0.6)  # loser completes; saved time recorded
+    assert hedging.HEDGE_STATS["saved_ms"] > before["saved_ms"]
+
+
+def test_invalid_primary_hedges_immediately_and_raises_are_ignored():
+    def boom():
+        raise RuntimeError("down")
+
+    result, winner, invalid = hedged_call(("a", _slow("", 0)), ("b", _slow("B", 0)), 5.0, is_valid=bool)
+    assert (result, winner, invalid) == ("B", "b", "")
+    result, winner, invalid = hedged_call(("a", boom), ("b", _slow("", 0)), 0.01, is_valid=bool)
+    assert (result, winner, invalid) == (None, None, "")
+
+
+def test_assess_triage_hedges_agentcore_with_converse():
+    """Slow AgentCore primary loses to Converse; safety fallbacks are not accepted as valid."""
+    from triage.core import agent
+
+    good = TriageResult(severity="medium", confidence=0.9, recommendations=["Rest"])
+    with patch.object(agent, "USE_AGENTCORE_TRIAGE", True), patch.object(
+        agent, "TRIAGE_AGENT_RUNTIME_ARN", "arn:test"
+    ), patch.object(agent, "TRIAGE_HEDGE_ENABLED", True), patch.object(agent, "TRIAGE_HEDGE_DELAY_MS", 20), patch.object(
+        agent, "_assess_via_agentcore", side_effect=lambda r, deadline=None: time.sleep(0.3) or agent._safety_fallback("slow")
+    ), patch.object(agent, "_assess_via_converse", return_value=good):
+        result = agent.assess_triage(TriageRequest(symptoms=["cough"]))
+    assert result is good
@@ -0,0 +1,111 @@
+"""Tests for persisting POST /hospitals results (hospital_matcher.core.db)."""
+
+import json
+import uuid
+from unittest.mock import patch
+
+from hospital_matcher.api import handler as handler_mod
+from hospital_matcher.core import db
+from hospital_matcher.models.hospital import HospitalMatchResult, MatchedHospital
+
+RESULT = HospitalMatchResult(
+    hospitals=[MatchedHospital(hospital_id="h1", name="City Hospital", match_score=0.9, match_reasons=["ICU"])],
+    safety_disclaimer="Call emergency services if the patient deteriorates.",
+)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((sql, params))
+        # The assessment sub-select finds only rows already in Aurora
+        self.rowcount = 1 if params[1] and params[1] in self.conn.assessments else 0
+
+
+class FakeConnection:
+    closed = 0
+
+    def __init__(self, assessments=()):
+        self.assessments = set(assessments)
+        self.executed = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def test_insert_and_link_in_one_statement():
+    conn = FakeConnection()
+    assessment_id = str(uuid.uuid4())
+    with patch.object(db, "_connect", return_value=conn):
+        match_id = db.insert_hospital_match(RESULT, assessment_id)
+        db.insert_hospital_match(RESULT, "not-a-uuid")
+
+    (sql, params), (_, unlinked) = conn.executed
+    assert "WITH match AS" in sql and "UPDATE triage_assessments" in sql
+    assert "SET LOCAL statement_timeout" in sql
+    assert params[0] == str(match_id) and params[1] == assessment_id
+    assert params[2].adapted[0]["hospital_id"] == "h1"
+    assert params[3] == RESULT.safety_disclaimer
+    assert unlinked[1] is None
+    assert conn.commits == 2
+
+
+def test_handler_persists_before_responding():
+    assessment_id = str(uuid.uuid4())
+    conn = FakeConnection([assessment_id])
+    body = {"severity": "high", "triage_assessment_id": assessment_id}
+    with patch.object(db, "PERSIST_HOSPITAL_MATCHES", True), patch.object(db, "_connect", return_value=conn), patch.object(
+        handler_mod, "load_match", return_value=None
+    ), patch.object(handler_mod, "match_hospitals", return_value=RESULT):
+        r = handler_mod.handler({"httpMethod": "POST", "body": json.dumps(body)}, None)
+        # Written (and committed) by the time the handler returns
+        assert conn.commits == 1
+
+    assert r["statusCode"] == 200
+    assert json.loads(r["body"])["hospitals"][0]["hospital_id"] == "h1"
+    assert conn.executed[0][1][1] == assessment_id
+    assert db.match_stats()["linked"] >= 1
+
+
+def test_unknown_assessment_is_stored_unlinked_and_counted(caplog):
+    conn = FakeConnection()
+    assessment_id = str(uuid.uuid4())  # e.g. still in the triage Lambda's write-behind spool
+    before = db.match_stats()
+    with patch.object(db, "PERSIST_HOSPITAL_MATCHES", True), patch.object(db, "_connect", return_value=conn):
+        match_id = db.record_match(RESULT, assessment_id)
+        db.record_match(RESULT, None)
+
+    after = db.match_stats()
+    assert match_id is not None and conn.commits == 2
+    assert after["stored"] - before["stored"] == 2
+    assert after["unlinked"] - before["unlinked"] == 1  # only the one that named an assessment
+    assert f"triage_assessment_id={assessment_id} not found" in caplog.text
+
+
+def test_persist_failure_or_flag_off_does_not_affect_response():
+    with patch.object(db, "PERSIST_HOSPITAL_MATCHES", True), patch.object(
+        db, "_connect", side_effect=OSError("timeout expired")
+    ):
+        assert db.record_match(RESULT, None) is None
+
+    with patch.object(db, "_connect") as connect, patch.object(handler_mod, "load_match", return_value=RESULT):
+        assert db.record_match(RESULT, None) is None
+        r = handler_mod.handler({"httpMethod": "POST", "body": '{"severity": "low"}'}, None)
+    assert r["statusCode"] == 200
+    connect.assert_not_called()
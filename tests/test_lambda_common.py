@@ -0,0 +1,96 @@
+"""Tests that every Lambda package ships the one shared copy of lambda_common."""
+
+import ast
+import filecmp
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+COMMON = ROOT / "src" / "lambda_common"
+SHARED = sorted(p.name for p in COMMON.glob("*.py"))
+STDLIB_LAMBDAS = [
+    "config",
+    "gateway_eka",
+    "gateway_get_hospitals",
+    "gateway_maps",
+    "gateway_routing",
+    "route",
+]
+
+
+def _same_files(left: Path, right: Path) -> bool:
+    match, mismatch, errors = filecmp.cmpfiles(left, right, SHARED, shallow=False)
+    return match == SHARED and not mismatch and not errors
+
+
+def _top_level_names(path: Path) -> set[str]:
+    tree = ast.parse(path.read_text())
+    return {n.name for n in tree.body if isinstance(n, (ast.FunctionDef, ast.ClassDef))}
+
+
+def test_no_package_keeps_its_own_copy():
+    # A same-named module is fine (e.g. each Lambda's core/warmup.py steps) as long as it does not
+    # redefine what lambda_common provides
+    copies = [
+        p.relative_to(ROOT)
+        for pattern in ("src/*/{}", "src/*/core/{}", "infrastructure/*_lambda_src/{}")
+        for name in SHARED
+        if name != "__init__.py"
+        for p in ROOT.glob(pattern.format(name))
+        if "lambda_common" not in p.parts and _top_level_names(p) & _top_level_names(COMMON / name)
+    ]
+    assert copies == []
+
+
+def test_no_lambda_redefines_warmup_helpers():
+    shared = _top_level_names(COMMON / "warmup.py")
+    handlers = [
+        *ROOT.glob("src/*/api/handler.py"),
+        *ROOT.glob("infrastructure/*_lambda_src/lambda_handler.py"),
+    ]
+    redefined = {
+        str(p.relative_to(ROOT)): names
+        for p in handlers
+        if (names := _top_level_names(p) & (shared | {"_is_warmup_event", "_warmup"}))
+    }
+    assert redefined == {}
+
+
+@pytest.mark.parametrize("package", ["triage", "hospital_matcher", "rmp_learning"])
+def test_package_build_scripts_copy_lambda_common(package):
+    script = (ROOT / "scripts" / f"build_{package}_lambda.sh").read_text()
+    assert 'cp -r "${ROOT}/src/lambda_common" "$OUT_DIR/"' in script
+
+
+@pytest.mark.parametrize("name", STDLIB_LAMBDAS)
+def test_stdlib_lambda_terraform_runs_the_build_script(name):
+    tf = (ROOT / "infrastructure" / f"{name}.tf").read_text()
+    assert f"scripts/build_stdlib_lambda.sh {name}" in tf
+    assert re.search(rf'source_dir\s*=\s*"\$\{{path.module\}}/{name}_lambda_src"', tf)
+
+
+@pytest.mark.parametrize("name", STDLIB_LAMBDAS)
+def test_stdlib_lambda_ships_identical_copy_and_imports(tmp_path, name):
+    (tmp_path / "scripts").mkdir()
+    shutil.copy(ROOT / "scripts" / "build_stdlib_lambda.sh", tmp_path / "scripts")
+    shutil.copytree(COMMON, tmp_path / "src" / "lambda_common")
+    out_dir = tmp_path / "infrastructure" / f"{name}_lambda_src"
+    out_dir.mkdir(parents=True)
+    shutil.copy(ROOT / "infrastructure" / f"{name}_lambda_src" / "lambda_handler.py", out_dir)
+
+    script = tmp_path / "scripts" / "build_stdlib_lambda.sh"
+    subprocess.run(["bash", str(script), name], check=True, capture_output=True)
+
+    assert _same_files(COMMON, out_dir / "lambda_common")
+    # The handler resolves lambda_common from its own package, not from src/
+    check = "import lambda_common, lambda_handler; print(lambda_common.__file__)"
+    shipped = subprocess.run(
+        [sys.executable, "-E", "-c", check], cwd=out_dir, check=True, capture_output=True, text=True
+    )
+    assert Path(shipped.stdout.strip()).parent == out_dir / "lambda_common"
+
@@ -0,0 +1,107 @@
+"""Tests for START/JumpSTART mass-casualty tagging (triage.core.mci, POST /triage/mci)."""
+
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+
+from triage.core import mci
+
+ADULT = {"respiratory_rate": 20, "ambulatory": False, "mental_status": "A", "capillary_refill_s": 1.5,
+         "radial_pulse": True, "age_years": 40}
+CHILD = {**ADULT, "respiratory_rate": 30, "age_years": 5, "capillary_refill_s": None}
+
+
+@pytest.mark.parametrize(
+    "changes, tag",
+    [
+        ({"ambulatory": True, "respiratory_rate": 0}, "green"),
+        ({}, "yellow"),
+        ({"respiratory_rate": 34}, "red"),
+        ({"capillary_refill_s": 3}, "red"),
+        ({"radial_pulse": False}, "red"),
+        ({"capillary_refill_s": None, "radial_pulse": None}, "red"),
+        ({"mental_status": "P"}, "red"),
+        ({"mental_status": "V"}, "yellow"),
+        ({"respiratory_rate": None}, "red"),
+        ({"respiratory_rate": 0, "breathes_after_airway": True}, "red"),
+        ({"respiratory_rate": 0, "breathes_after_airway": False}, "black"),
+        ({"respiratory_rate": 0}, "red"),
+    ],
+)
+def test_start_adult(changes, tag):
+    assert mci.triage_patients([{**ADULT, **changes}])[0]["tag"] == tag
+
+
+@pytest.mark.parametrize(
+    "changes, tag",
+    [
+        ({}, "yellow"),
+        ({"respiratory_rate": 12}, "red"),
+        ({"respiratory_rate": 50}, "red"),
+        ({"radial_pulse": False}, "red"),
+        ({"mental_status": "P"}, "yellow"),
+        ({"mental_status": "P_inappropriate"}, "red"),
+        ({"respiratory_rate": 0, "breathes_after_airway": False, "radial_pulse": False}, "black"),
+        ({"respiratory_rate": 0, "breathes_after_airway": False, "rescue_breaths_effective": True}, "red"),
+        ({"respiratory_rate": 0, "breathes_after_airway": False, "rescue_breaths_effective": False}, "black"),
+    ],
+)
+def test_jumpstart_child(changes, tag):
+    assert mci.triage_patients([{**CHILD, **changes}])[0]["tag"] == tag
+
+
+def test_severity_mapping_and_priority_order():
+    patients = [{**ADULT, "ambulatory": True}, {**ADULT, "respiratory_rate": 0, "breathes_after_airway": False},
+                ADULT, {**ADULT, "respiratory_rate": 40}]
+    out = mci.triage_patients(patients)
+    assert [p["severity"] for p in out] == ["low", "critical", "medium", "critical"]
+    codes = mci.patient_codes(patients)
+    assert mci.priority_order(codes) == [3, 2, 0, 1]
+    assert mci.tag_counts(codes) == {"green": 1, "yellow": 1, "red": 1, "black": 1}
+
+
+def test_rejects_unknown_mental_status():
+    with pytest.raises(ValueError):
+        mci.patient_codes([{**ADULT, "mental_status": "confused"}])
+
+
+def test_numpy_matches_reference_rules():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(3)
+    choices = {
+        "respiratory_rate": [0, 10, 14, 20, 31, 46, None], "ambulatory": [True, False, False],
+        "mental_status": [0, 1, 2, 3, 4, None], "capillary_refill_s": [1, 2, 2.5, None],
+        "radial_pulse": [True, False, None], "age_years": [0.5, 3, 7.9, 8, 45, None],
+        "breathes_after_airway": [True, False, None], "rescue_breaths_effective": [True, False, None],
+    }
+    cols = {k: [rng.choice(v) for _ in range(5000)] for k, v in choices.items()}
+    vectorized = mci.start_jumpstart(**cols)
+    assert isinstance(vectorized, np.ndarray)
+    with patch.object(mci, "np", None):
+        assert vectorized.tolist() == mci.start_jumpstart(**cols)
+
+
+def test_mci_handler_sorts_and_counts():
+    from triage.api import handler as handler_mod
+
+    body = {"patients": [{**ADULT, "ambulatory": True, "patient_id": "p1"}, {**ADULT, "respiratory_rate": 40}]}
+    r = handler_mod.handler({"httpMethod": "POST", "resource": "/triage/mci", "body": json.dumps(body)}, None)
+    assert r["statusCode"] == 200
+    out = json.loads(r["body"])
+    assert out["patients"] == [{"index": 1, "tag": "red", "severity": "critical"},
+                               {"index": 0, "tag": "green", "severity": "low", "patient_id": "p1"}]
+    assert out["counts"] == {"green": 1, "yellow": 0, "red": 1, "black": 0}
+
+
+def test_mci_handler_rejects_bad_body():
+    from triage.api import handler as handler_mod
+
+    def post(body):
+        return handler_mod.mci_handler({"httpMethod": "POST", "body": json.dumps(body)}, None)["statusCode"]
+
+    assert post({"patients": []}) == 400
+    assert post({"patients": [{**ADULT, "respiratory_rate": "fast"}]}) == 400
+    with patch.object(handler_mod, "MCI_MAX_PATIENTS", 1):
+        assert post({"patients": [ADULT, ADULT]}) == 400
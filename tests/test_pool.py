@@ -0,0 +1,198 @@
+"""Tests for the per-container Aurora connection pool (lambda_common.pool) and its use in triage.core.db."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from lambda_common.pool import ConnectionPool, PoolExhaustedError
+from triage.core import db
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.conn.broken:
+            self.conn.closed = 2
+            raise ConnectionError("server closed the connection unexpectedly")
+        self.conn.executed.append(sql)
+
+    def fetchone(self):
+        return (1,)
+
+
+class FakeConnection:
+    def __init__(self, n):
+        self.n = n
+        self.closed = 0
+        self.broken = False
+        self.executed = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        if self.closed:
+            raise ConnectionError("connection already closed")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pool(**kwargs):
+    opened = []
+
+    def connect(timeout):
+        opened.append(FakeConnection(len(opened)))
+        return opened[-1]
+
+    return ConnectionPool(connect, **kwargs), opened
+
+
+def test_connection_is_reused_across_calls():
+    pool, opened = _pool()
+    for _ in range(5):
+        with pool.connection() as conn:
+            conn.cursor().execute("INSERT 1")
+    assert len(opened) == 1
+    assert pool.stats() == {"opened": 1, "reused": 4, "pinged": 0, "discarded": 0, "auth_retries": 0, "idle": 1}
+
+
+def test_idle_connection_is_pinged_and_replaced_when_dead():
+    clock = Clock()
+    pool, opened = _pool(ping_idle_seconds=10, clock=clock)
+    with pool.connection():
+        pass
+    clock.now += 5
+    with pool.connection() as conn:
+        assert conn is opened[0]  # recently used: no ping
+    clock.now += 60
+    opened[0].broken = True
+    with pool.connection() as conn:
+        assert conn is opened[1]
+    assert opened[0].closed
+    stats = pool.stats()
+    assert stats["pinged"] == 1 and stats["discarded"] == 1 and stats["opened"] == 2
+
+
+def test_old_connection_is_retired():
+    clock = Clock()
+    pool, opened = _pool(max_age_seconds=900, ping_idle_seconds=1e9, clock=clock)
+    with pool.connection():
+        pass
+    clock.now += 901
+    with pool.connection() as conn:
+        assert conn is opened[1]
+    assert opened[0].closed
+
+
+def test_error_in_block_rolls_back_and_keeps_healthy_connection():
+    pool, opened = _pool()
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("constraint violation")
+    assert opened[0].rollbacks == 1 and not opened[0].closed
+    with pytest.raises(ConnectionError):
+        with pool.connection() as conn:
+            conn.broken = True
+            conn.cursor().execute("INSERT 1")
+    # Broken connection is dropped, not returned
+    assert opened[0].closed and pool.stats()["idle"] == 0
+
+
+def test_auth_failure_reconnects_with_fresh_credentials():
+    attempts = []
+    invalidated = []
+
+    def connect(timeout):
+        attempts.append(timeout)
+        if len(attempts) == 1:
+            raise RuntimeError('FATAL:  PAM authentication failed for user "triage"')
+        return FakeConnection(1)
+
+    pool = ConnectionPool(connect, on_auth_failure=lambda: invalidated.append(True))
+    with pool.connection(5):
+        pass
+    assert attempts == [5, 5] and invalidated == [True]
+    assert pool.stats()["auth_retries"] == 1
+
+    failing = ConnectionPool(lambda t: (_ for _ in ()).throw(OSError("timeout expired")))
+    with pytest.raises(OSError):
+        with failing.connection(2):
+            pass
+    # The slot is released after a failed connect
+    assert failing._slots.acquire(blocking=False)
+
+
+def test_threads_share_at_most_max_size_connections():
+    pool, opened = _pool(max_size=2)
+    in_use = []
+    peak = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            with pool.connection():
+                with lock:
+                    in_use.append(1)
+                    peak.append(len(in_use))
+                time.sleep(0.001)
+                with lock:
+                    in_use.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max(peak) <= 2
+    assert len(opened) <= 2
+
+
+def test_exhausted_pool_times_out():
+    pool, _ = _pool(max_size=1)
+    with pool.connection():
+        with pytest.raises(PoolExhaustedError):
+            with pool.connection(0):
+                pass
+
+
+def test_db_calls_share_the_pooled_connection():
+    conn = FakeConnection(0)
+    with patch.object(db, "_connect", return_value=conn) as connect:
+        db.put_cached_triage_result("k", {"severity": "low"}, 60)
+        db.insert_triage_assessment(
+            symptoms=["cough"],
+            vitals={},
+            age_years=None,
+            sex=None,
+            severity="low",
+            confidence=0.9,
+            recommendations=["rest"],
+            force_high_priority=False,
+            safety_disclaimer=None,
+        )
+    connect.assert_called_once()
+    assert len(conn.executed) == 2 and not conn.closed
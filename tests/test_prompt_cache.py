@@ -0,0 +1,115 @@
+"""Tests for Bedrock prompt caching checkpoints (triage.core.prompt_cache)."""
+
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from triage.core import prompt_cache
+from triage.core.prompt_cache import CACHE_POINT
+from triage.models.triage import TriageRequest
+
+
+class _FakeConverseClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def converse(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.responses.pop(0)
+
+
+def _tool_use_response(tool_use, usage=None):
+    return {
+        "stopReason": "tool_use",
+        "output": {"message": {"role": "assistant", "content": [{"toolUse": tool_use}]}},
+        "usage": usage or {"inputTokens": 10, "outputTokens": 5},
+    }
+
+
+def _two_round_client():
+    return _FakeConverseClient([
+        _tool_use_response({"toolUseId": "t1", "name": "search_indian_medications", "input": {"drug_name": "dolo"}}),
+        _tool_use_response(
+            {
+                "toolUseId": "t2",
+                "name": "submit_triage_result",
+                "input": {"severity": "low", "confidence": 0.9, "recommendations": ["Rest"],
+                          "force_high_priority": False, "safety_disclaimer": "x"},
+            },
+            usage={"inputTokens": 40, "cacheReadInputTokens": 2048, "cacheWriteInputTokens": 300, "outputTokens": 20},
+        ),
+    ])
+
+
+@pytest.fixture
+def gateway_env(monkeypatch):
+    monkeypatch.setenv("GATEWAY_MCP_URL", "https://x/mcp")
+    monkeypatch.setenv("GATEWAY_CLIENT_ID", "c")
+    monkeypatch.setenv("GATEWAY_CLIENT_SECRET", "s")
+    monkeypatch.setenv("GATEWAY_TOKEN_ENDPOINT", "https://t/token")
+
+
+def _run(client):
+    from triage.core import agent, gateway_client
+
+    with patch.object(
+        gateway_client, "asearch_medications", AsyncMock(return_value={"medications": ["Dolo 650"]})
+    ), patch.object(
+        agent, "get_client", return_value=client
+    ):
+        return agent._assess_via_converse(TriageRequest(symptoms=["fever"]))
+
+
+def _count_cache_points(call: dict) -> int:
+    blocks = list(call["system"]) + list(call["toolConfig"]["tools"])
+    for message in call["messages"]:
+        blocks.extend(message["content"])
+    return sum(1 for b in blocks if "cachePoint" in b)
+
+
+def test_checkpoints_on_system_tools_and_prior_turns(gateway_env):
+    client = _two_round_client()
+    with patch.object(prompt_cache, "BEDROCK_PROMPT_CACHE_ENABLED", True):
+        result = _run(client)
+
+    assert result.severity == "low"
+    first, second = client.calls
+    for call in (first, second):
+        assert call["system"][-1] == CACHE_POINT
+        assert call["toolConfig"]["tools"][-1] == CACHE_POINT
+        assert all("toolSpec" in t for t in call["toolConfig"]["tools"][:-1])
+    # Round 1: only the user prompt, no message checkpoint
+    assert _count_cache_points(first) == 2
+    # Round 2: checkpoint closes the prior turns (the toolResult message), at most 4 per request
+    assert second["messages"][-1]["content"][-1] == CACHE_POINT
+    assert "toolResult" in second["messages"][-1]["content"][0]
+    assert _count_cache_points(second) == 3
+
+
+def test_history_does_not_accumulate_checkpoints(gateway_env):
+    client = _two_round_client()
+    with patch.object(prompt_cache, "BEDROCK_PROMPT_CACHE_ENABLED", True):
+        _run(client)
+    # calls[0]["messages"] is the live history list the loop appended to
+    history = client.calls[0]["messages"]
+    assert len(history) == 3
+    assert not any("cachePoint" in block for m in history for block in m["content"])
+
+
+def test_no_checkpoints_when_disabled(gateway_env):
+    client = _two_round_client()
+    with patch.object(prompt_cache, "BEDROCK_PROMPT_CACHE_ENABLED", False):
+        _run(client)
+    assert all(_count_cache_points(call) == 0 for call in client.calls)
+
+
+def test_usage_logged_with_cached_tokens(gateway_env, caplog):
+    client = _two_round_client()
+    with caplog.at_level(logging.INFO, logger="triage.core.prompt_cache"):
+        _run(client)
+    lines = [r.getMessage() for r in caplog.records if r.getMessage().startswith("Bedrock usage")]
+    assert len(lines) == 2
+    assert "cache_read_tokens=2048" in lines[1]
+    assert "cache_write_tokens=300" in lines[1]
@@ -0,0 +1,105 @@
+"""Tests for red-flag pre-triage rules and the assess_triage short-circuit."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from triage.core.red_flags import CompiledRules, evaluate_red_flags
+from triage.models.triage import TriageRequest, TriageResult
+
+
+@pytest.mark.parametrize(
+    "vitals",
+    [
+        {"spo2": 85},
+        {"blood_pressure_systolic": 80},
+        {"bp": 80},
+        {"heart_rate": 35},
+    ],
+)
+def test_critical_vitals(vitals):
+    """Critical vital thresholds return critical with force_high_priority."""
+    r = evaluate_red_flags(TriageRequest(symptoms=["weakness"], vitals=vitals, session_id="s1"))
+    assert r is not None
+    assert r.severity == "critical"
+    assert r.force_high_priority is True
+    assert r.session_id == "s1"
+
+
+def test_high_vitals():
+    """Tachycardia / tachypnea alone are high, not critical."""
+    r = evaluate_red_flags(TriageRequest(symptoms=["fever"], vitals={"heartRateBpm": 140, "respiratory_rate": 35}))
+    assert r.severity == "high"
+    assert any("Heart rate" in rec for rec in r.recommendations)
+    assert any("Respiratory rate" in rec for rec in r.recommendations)
+
+
+def test_symptom_keywords_case_insensitive():
+    """Keywords match on word boundaries regardless of case."""
+    assert evaluate_red_flags(TriageRequest(symptoms=["Patient UNCONSCIOUS"])).severity == "critical"
+    assert evaluate_red_flags(TriageRequest(symptoms=["profits down"])) is None
+
+
+def test_normal_patient_not_flagged():
+    """Normal vitals and non-red-flag symptoms fall through to the LLM."""
+    req = TriageRequest(
+        symptoms=["fever", "body ache"],
+        vitals={"spo2": 97, "heart_rate": 88, "blood_pressure_systolic": 120, "respiratory_rate": 16},
+    )
+    assert evaluate_red_flags(req) is None
+
+
+def test_custom_rules_table():
+    """Rules are data: a custom table compiles and evaluates."""
+    rules = CompiledRules([
+        {"id": "fever", "vitals": ["temp_c"], "op": ">=", "value": 41, "severity": "high", "reason": "Hyperpyrexia"},
+    ])
+    assert evaluate_red_flags(TriageRequest(symptoms=["x"], vitals={"temp_c": 41.5}), rules).severity == "high"
+    assert evaluate_red_flags(TriageRequest(symptoms=["unconscious"]), rules) is None
+    with pytest.raises(ValueError):
+        CompiledRules([{"id": "bad", "severity": "low", "keywords": ["x"]}])
+
+
+@pytest.mark.parametrize(
+    "bad_rule",
+    [
+        {"id": "op", "vitals": ["spo2"], "op": "=<", "value": 90, "severity": "critical", "reason": "x"},
+        {"id": "no_value", "vitals": ["spo2"], "op": "<", "severity": "critical", "reason": "x"},
+        {"id": "no_reason", "severity": "critical", "keywords": ["x"]},
+        "not-a-rule",
+    ],
+)
+def test_invalid_rules_file_falls_back_to_built_in(tmp_path, bad_rule):
+    """A rules file with any invalid rule is rejected at load time, not on the first request."""
+    from triage.core import red_flags
+
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps([red_flags.RED_FLAG_RULES[0], bad_rule]))
+    with patch.object(red_flags, "RED_FLAG_RULES_PATH", str(path)), patch.object(red_flags, "_compiled", None):
+        assert red_flags.load_rules() is red_flags.RED_FLAG_RULES
+        assert evaluate_red_flags(TriageRequest(symptoms=["unconscious"])).severity == "critical"
+
+
+def test_assess_triage_skips_llm_for_red_flag():
+    """assess_triage returns the rule result without calling any backend."""
+    from triage.core import agent
+
+    with patch.object(agent, "_assess_via_converse") as converse:
+        r = agent.assess_triage(TriageRequest(symptoms=["chest pain"], vitals={"spo2": 82}))
+    converse.assert_not_called()
+    assert r.severity == "critical"
+
+
+def test_red_flag_enrichment_merges_llm_recommendations():
+    """With enrichment on, LLM recommendations are appended and severity never drops."""
+    from triage.core import agent
+
+    llm = TriageResult(severity="medium", confidence=0.9, recommendations=["Give oxygen"], force_high_priority=False)
+    with patch.object(agent, "RED_FLAG_ENRICH_TIMEOUT_MS", 2000), patch.object(
+        agent, "_assess_via_converse", return_value=llm
+    ):
+        r = agent.assess_triage(TriageRequest(symptoms=["cough"], vitals={"spo2": 82}))
+    assert r.severity == "critical"
+    assert r.force_high_priority is True
+    assert "Give oxygen" in r.recommendations
@@ -0,0 +1,149 @@
+"""Tests for speculative hospital matching (triage.core.speculative, hospital_matcher.core.speculative)."""
+
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from hospital_matcher.api import handler as hm_handler
+from hospital_matcher.core import speculative as hm_speculative
+from hospital_matcher.models.hospital import HospitalMatchResult, MatchedHospital
+from triage.core import speculative
+from triage.core.deadline import Deadline
+from triage.models.triage import TriageRequest, TriageResult
+
+RESULT = TriageResult(
+    severity="high", confidence=0.9, recommendations=["Emergency department"], session_id="sess-1"
+)
+
+
+class _FakeS3:
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+
+@pytest.fixture
+def triage_enabled():
+    with patch.object(speculative, "SPECULATIVE_HOSPITAL_MATCH", True), patch.object(
+        speculative, "HOSPITAL_MATCHER_FUNCTION_NAME", "hospital-matcher"
+    ):
+        yield
+
+
+def test_start_invokes_hospital_matcher_async(triage_enabled):
+    client = MagicMock()
+    request = TriageRequest(symptoms=["chest pain"], patient_location_lat=12.97, patient_location_lon=77.59)
+    with patch.object(speculative, "get_client", return_value=client):
+        assert speculative.start_speculative_match(request, RESULT) is True
+    kwargs = client.invoke.call_args.kwargs
+    assert kwargs["FunctionName"] == "hospital-matcher" and kwargs["InvocationType"] == "Event"
+    assert json.loads(kwargs["Payload"])["speculative_match"] == {
+        "severity": "high",
+        "recommendations": ["Emergency department"],
+        "limit": 3,
+        "session_id": "sess-1",
+        "patient_location_lat": 12.97,
+        "patient_location_lon": 77.59,
+    }
+
+
+def test_start_skipped_without_session_flag_or_time(triage_enabled):
+    client = MagicMock()
+    no_session = RESULT.model_copy(update={"session_id": None})
+    with patch.object(speculative, "get_client", return_value=client):
+        assert speculative.start_speculative_match(TriageRequest(symptoms=["x"]), no_session) is False
+        assert speculative.start_speculative_match(TriageRequest(symptoms=["x"]), RESULT, Deadline(0.5)) is False
+        with patch.object(speculative, "SPECULATIVE_HOSPITAL_MATCH", False):
+            assert speculative.start_speculative_match(TriageRequest(symptoms=["x"]), RESULT) is False
+    client.invoke.assert_not_called()
+
+
+def test_start_failure_is_not_fatal(triage_enabled):
+    client = MagicMock()
+    client.invoke.side_effect = RuntimeError("throttled")
+    with patch.object(speculative, "get_client", return_value=client):
+        assert speculative.start_speculative_match(TriageRequest(symptoms=["x"]), RESULT) is False
+
+
+def test_triage_handler_starts_speculative_match():
+    from triage.api import handler as handler_mod
+
+    with patch.object(handler_mod, "assess_triage", return_value=RESULT), patch.object(
+        handler_mod, "_persist_assessment", return_value=None
+    ), patch.object(handler_mod, "start_speculative_match") as start:
+        r = handler_mod.handler({"httpMethod": "POST", "body": json.dumps({"symptoms": ["chest pain"]})}, None)
+    assert r["statusCode"] == 200
+    assert start.call_args.args[1] == RESULT
+
+
+@pytest.fixture
+def s3():
+    fake = _FakeS3()
+    with patch.object(hm_speculative, "SPECULATIVE_MATCH_BUCKET", "bucket"), patch.object(
+        hm_speculative, "get_client", return_value=fake
+    ):
+        yield fake
+
+
+def _match(hospital_id="h1"):
+    return HospitalMatchResult(
+        hospitals=[MatchedHospital(hospital_id=hospital_id, name="District Hospital", match_score=0.9)],
+        safety_disclaimer="Confirm with facility.",
+    )
+
+
+def _post(body):
+    r = hm_handler.handler({"httpMethod": "POST", "body": json.dumps(body)}, None)
+    assert r["statusCode"] == 200
+    return json.loads(r["body"])
+
+
+def test_hospitals_returns_precomputed_match_when_inputs_match(s3):
+    body = {"severity": "high", "recommendations": ["Emergency department"], "session_id": "sess-1",
+            "patient_location_lat": 12.97001, "patient_location_lon": 77.59}
+    with patch.object(hm_handler, "match_hospitals", return_value=_match("spec")) as match:
+        assert hm_handler.handler({"speculative_match": {**body, "patient_location_lat": 12.97}}, None) == {"stored": True}
+        match.return_value = _match("fresh")
+        out = _post({**body, "triage_assessment_id": "a1", "recommendations": [" emergency department "]})
+    assert out["precomputed"] is True and out["hospitals"][0]["hospital_id"] == "spec"
+    assert match.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [{"severity": "critical"}, {"recommendations": ["ICU"]}, {"limit": 5}, {"session_id": "other"}, {"session_id": None}],
+)
+def test_hospitals_computes_fresh_when_inputs_differ(s3, changes):
+    body = {"severity": "high", "recommendations": ["Emergency department"], "session_id": "sess-1"}
+    with patch.object(hm_handler, "match_hospitals", return_value=_match("spec")) as match:
+        hm_handler.speculative_handler({"speculative_match": body}, None)
+        match.return_value = _match("fresh")
+        out = _post({k: v for k, v in {**body, **changes}.items() if v is not None})
+    assert out["precomputed"] is False and out["hospitals"][0]["hospital_id"] == "fresh"
+
+
+def test_expired_speculative_match_is_ignored(s3):
+    body = {"severity": "low", "recommendations": [], "session_id": "sess-2"}
+    with patch.object(hm_handler, "match_hospitals", return_value=_match("spec")):
+        hm_handler.speculative_handler({"speculative_match": body}, None)
+    with patch.object(hm_speculative, "SPECULATIVE_MATCH_TTL_SECONDS", -1), patch.object(
+        hm_handler, "match_hospitals", return_value=_match("fresh")
+    ):
+        assert _post(body)["hospitals"][0]["hospital_id"] == "fresh"
+
+
+def test_speculative_event_requires_session_id(s3):
+    with patch.object(hm_handler, "match_hospitals") as match:
+        out = hm_handler.handler({"speculative_match": {"severity": "low"}}, None)
+    assert out["stored"] is False
+    match.assert_not_called()
@@ -0,0 +1,202 @@
+"""Tests for write-behind persistence (triage.core.spool) and its use by the triage handler."""
+
+import json
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from triage.core.spool import WriteBehindSpool
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _wait_for(predicate, timeout=5.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return
+        time.sleep(0.005)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture
+def spools(tmp_path):
+    opened = []
+
+    def make(flush, **kwargs):
+        opened.append(WriteBehindSpool(str(tmp_path / "spool.sqlite3"), flush, **kwargs))
+        return opened[-1]
+
+    yield make
+    for spool in opened:
+        spool.close()
+
+
+def test_enqueued_rows_are_flushed_in_batches(spools):
+    batches = []
+    spool = spools(lambda rows, connect_timeout: batches.append([r["id"] for r in rows]), batch_size=25)
+    with spool._flush_lock:  # hold the worker back until everything is queued
+        ids = [spool.enqueue({"severity": "low", "n": i}) for i in range(30)]
+    _wait_for(lambda: spool.pending() == 0)
+    assert [len(b) for b in batches] == [25, 5]
+    assert [uuid.UUID(i) for b in batches for i in b] == ids
+    assert spool.stats() == {"enqueued": 30, "flushed": 30, "batches": 2, "failures": 0, "pending": 0}
+
+
+def test_failed_rows_are_kept_and_retried_one_at_a_time_after_backoff(spools):
+    clock = Clock()
+    calls = []
+
+    def flush(rows, connect_timeout):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise ConnectionError("Aurora unavailable")
+
+    spool = spools(flush, retry_base_seconds=0.5, clock=clock)
+    with spool._flush_lock:
+        for i in range(3):
+            spool.enqueue({"n": i})
+    _wait_for(lambda: spool.stats()["failures"] == 1)
+    assert spool.pending() == 3
+    assert spool.flush_once() == 0  # still backing off
+
+    clock.now += 1
+    spool.resume()
+    _wait_for(lambda: spool.pending() == 0)
+    assert calls == [3, 1, 1, 1]
+
+
+def test_rows_survive_a_restart(spools):
+    down = spools(lambda rows, connect_timeout: (_ for _ in ()).throw(ConnectionError("Aurora unavailable")))
+    row_id = down.enqueue({"severity": "high", "request_id": uuid.uuid4()})
+    _wait_for(lambda: down.stats()["failures"] >= 1)
+    down.close()
+
+    flushed = []
+    restarted = spools(lambda rows, connect_timeout: flushed.extend(rows))
+    assert restarted.pending() == 1
+    restarted.resume()
+    _wait_for(lambda: restarted.pending() == 0)
+    assert flushed[0]["id"] == str(row_id) and flushed[0]["severity"] == "high"
+
+
+def test_drain_ignores_backoff(spools):
+    clock = Clock()
+    healthy = threading.Event()
+
+    def flush(rows, connect_timeout):
+        if not healthy.is_set():
+            raise ConnectionError("Aurora unavailable")
+
+    spool = spools(flush, retry_base_seconds=60, clock=clock)
+    spool.enqueue({"n": 1})
+    _wait_for(lambda: spool.stats()["failures"] == 1)
+    healthy.set()
+    assert spool.drain(1.0) == 0
+
+
+def _triage_with_spool(spool, sync_flush=False):
+    from triage.api import handler as handler_mod
+    from triage.core import spool as spool_mod
+    from triage.models.triage import TriageResult
+
+    result = TriageResult(severity="medium", confidence=0.8, recommendations=["See a doctor"])
+    with patch.object(handler_mod, "TRIAGE_WRITE_BEHIND", True), patch.object(
+        spool_mod, "TRIAGE_WRITE_BEHIND", True
+    ), patch.object(spool_mod, "TRIAGE_SPOOL_SYNC_FLUSH", sync_flush), patch.object(
+        spool_mod, "_spool", spool
+    ), patch.object(handler_mod, "get_spool", return_value=spool), patch.object(
+        handler_mod, "assess_triage", return_value=result
+    ), patch.object(spool_mod, "SPOOL_FLUSH_SECONDS", 0.3), patch.object(
+        handler_mod, "insert_triage_assessment", side_effect=AssertionError("inline insert")
+    ):
+        return handler_mod.handler({"httpMethod": "POST", "body": '{"symptoms": ["cough"]}'}, None)
+
+
+def test_handler_returns_id_before_row_is_written(spools):
+    release = threading.Event()
+    written = []
+
+    def flush(rows, connect_timeout):
+        release.wait(5)
+        written.extend(rows)
+
+    spool = spools(flush)
+    start = time.monotonic()
+    r = _triage_with_spool(spool)
+    body = json.loads(r["body"])
+    assert time.monotonic() - start < 1  # the response does not wait for the 5 s write
+    assert r["statusCode"] == 200 and written == [] and spool.pending() == 1
+    release.set()
+    _wait_for(lambda: spool.pending() == 0)
+    assert written[0]["id"] == body["id"]
+    assert written[0]["symptoms"] == ["cough"] and written[0]["severity"] == "medium"
+
+
+def test_opt_in_sync_flush_writes_before_returning_within_its_budget(spools):
+    written = []
+    spool = spools(lambda rows, connect_timeout: written.extend({**r, "timeout": connect_timeout} for r in rows))
+    r = _triage_with_spool(spool, sync_flush=True)
+    body = json.loads(r["body"])
+    # Written before the response, with the short flush connect timeout
+    assert r["statusCode"] == 200 and spool.pending() == 0
+    assert written[0]["id"] == body["id"] and written[0]["timeout"] == spool.connect_timeout
+
+
+def test_opt_in_sync_flush_is_bounded_when_aurora_is_slow(spools):
+    def unreachable(rows, connect_timeout):
+        time.sleep(connect_timeout)
+        raise TimeoutError("connect timed out")
+
+    spool = spools(unreachable, connect_timeout=1)
+    start = time.monotonic()
+    _triage_with_spool(spool, sync_flush=True)
+    # At most the flush budget plus one connect timeout, however long Aurora stays away
+    assert time.monotonic() - start < 2
+    assert spool.pending() == 1
+
+
+def test_bulk_insert_keeps_spooled_ids_and_skips_duplicates():
+    from triage.core import db
+
+    row_id = uuid.uuid4()
+    captured = {}
+
+    def execute_values(cur, sql, rows, page_size):
+        captured["sql"], captured["rows"] = sql, rows
+
+    class Conn:
+        closed = 0
+
+        def cursor(self):
+            return self
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+    row = {"id": str(row_id), "symptoms": ["cough"], "severity": "low", "confidence": 0.9,
+           "recommendations": [], "force_high_priority": False}
+    with patch.object(db, "_connect", return_value=Conn()), patch(
+        "psycopg2.extras.execute_values", side_effect=execute_values
+    ):
+        assert db.insert_triage_assessments([row]) == [row_id]
+    assert captured["sql"].endswith("ON CONFLICT (id) DO NOTHING")
+    assert captured["rows"][0][0] == str(row_id)
@@ -0,0 +1,83 @@
+"""Tests for the incremental AgentCore SSE/JSON decoder."""
+
+import json
+
+from lambda_common.sse import first_valid_payload, iter_sse_data
+
+
+def _chunked(body: bytes, size: int):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def test_iter_sse_data_across_chunk_boundaries():
+    """Frames split mid-line and mid-UTF-8 character decode correctly; CRLF and multi-line data supported."""
+    body = 'data: "Namaste – hello"\r\n\r\n: comment\ndata: {"a": 1,\ndata:  "b": 2}\n\ndata: [DONE]'.encode()
+    for size in (1, 3, 7, len(body)):
+        assert list(iter_sse_data(_chunked(body, size))) == ['"Namaste – hello"', '{"a": 1,\n "b": 2}', "[DONE]"]
+
+
+class _Stream:
+    """botocore StreamingBody stand-in that records how many chunks were read and whether it was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        for c in self.chunks:
+            self.read += 1
+            yield c
+
+    def close(self):
+        self.closed = True
+
+
+def test_first_valid_payload_stops_early_and_closes():
+    frames = [b'data: "thinking"\n\n', b'data: {"other": 1}\n\n', b'data: {"severity": "low"}\n\n'] + [
+        b'data: "trailing"\n\n'
+    ] * 100
+    stream = _Stream(frames)
+    out = first_valid_payload(
+        {"contentType": "text/event-stream", "response": stream},
+        lambda d: d if "severity" in d else None,
+    )
+    assert out == {"severity": "low"}
+    assert stream.read == 3
+    assert stream.closed
+
+
+def test_first_valid_payload_tolerates_missing_blank_lines():
+    """Consecutive data lines without separators still yield each JSON object."""
+    body = b'data: {"x": 1}\ndata: {"hospitals": []}\n\n'
+    out = first_valid_payload(
+        {"contentType": "text/event-stream", "response": [body]},
+        lambda d: d if "hospitals" in d else None,
+    )
+    assert out == {"hospitals": []}
+
+
+def test_first_valid_payload_plain_json_uses_parse_body():
+    body = json.dumps({"distance_km": 3.2}).encode()
+    resp = {"contentType": "application/json", "response": _chunked(body, 4)}
+    assert first_valid_payload(resp, lambda d: None, parse_body=lambda d: d) == {"distance_km": 3.2}
+    assert first_valid_payload({"contentType": "application/json", "response": [b"not json"]}, lambda d: d) is None
+
+
+def test_agentcore_triage_uses_decoder():
+    """_assess_via_agentcore returns the first valid TriageResult from an SSE stream."""
+    from unittest.mock import MagicMock, patch
+
+    from triage.core import agent
+    from triage.models.triage import TriageRequest
+
+    payload = {"severity": "medium", "confidence": 0.9, "recommendations": ["Rest"], "force_high_priority": False}
+    client = MagicMock()
+    client.invoke_agent_runtime.return_value = {
+        "contentType": "text/event-stream",
+        "response": [b'data: "hi"\n\n', f"data: {json.dumps(payload)}\n\n".encode()],
+    }
+    with patch.object(agent, "get_client", return_value=client):
+        result = agent._assess_via_agentcore(TriageRequest(symptoms=["cough"]))
+    assert result.severity == "medium"
+    assert result.session_id and len(result.session_id) >= 33
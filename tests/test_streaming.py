@@ -0,0 +1,109 @@
+"""Tests for streaming triage (converse_stream) with a local fake stream."""
+
+import json
+from unittest.mock import patch
+
+from triage.core.streaming import SeverityScanner, assess_triage_stream, format_sse
+from triage.models.triage import TriageRequest
+
+SUBMIT_INPUT = json.dumps({
+    "severity": "medium",
+    "confidence": 0.88,
+    "recommendations": ["Oral rehydration", "Transport within 60 minutes"],
+    "force_high_priority": False,
+    "safety_disclaimer": "This is AI-assisted guidance. Seek professional medical care.",
+})
+
+
+def fake_stream(tool_input: str = SUBMIT_INPUT, chunk_size: int = 7):
+    """converse_stream-shaped events for one submit_triage_result toolUse split into small deltas."""
+    yield {"messageStart": {"role": "assistant"}}
+    yield {"contentBlockStart": {"contentBlockIndex": 0, "start": {"toolUse": {"toolUseId": "t1", "name": "submit_triage_result"}}}}
+    for i in range(0, len(tool_input), chunk_size):
+        yield {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"toolUse": {"input": tool_input[i:i + chunk_size]}}}}
+    yield {"contentBlockStop": {"contentBlockIndex": 0}}
+    yield {"messageStop": {"stopReason": "tool_use"}}
+
+
+class FakeStreamClient:
+    def __init__(self, stream_factory):
+        self.stream_factory = stream_factory
+
+    def converse_stream(self, **kwargs):
+        return {"stream": self.stream_factory()}
+
+
+def test_scanner_waits_for_complete_confidence():
+    """Confidence split mid-number ("0.8" + "5") is not reported until delimited."""
+    s = SeverityScanner()
+    assert s.feed('{"severity": "hi') is False
+    assert s.feed('gh", "confidence": 0.8') is False
+    assert s.severity == "high"
+    assert s.confidence is None
+    assert s.feed("5, ") is True
+    assert s.confidence == 0.85
+    assert s.feed('"recommendations": []}') is False
+
+
+def test_stream_emits_severity_before_result():
+    """Severity event arrives while recommendations are still streaming, then one validated result."""
+    consumed = []
+
+    def tracking_stream():
+        for ev in fake_stream():
+            consumed.append(ev)
+            yield ev
+
+    events = []
+    for ev in assess_triage_stream(TriageRequest(symptoms=["vomiting"]), client=FakeStreamClient(tracking_stream)):
+        events.append((ev, len(consumed)))
+
+    (sev, consumed_at_sev), (res, consumed_at_res) = events
+    assert sev["event"] == "severity"
+    assert sev["severity"] == "medium"
+    assert sev["confidence"] == 0.88
+    assert consumed_at_sev < consumed_at_res
+    assert res["event"] == "result"
+    assert res["recommendations"][0] == "Oral rehydration"
+    assert sev["elapsed_ms"] <= res["elapsed_ms"]
+
+
+def test_stream_red_flag_short_circuits():
+    """Red-flag requests never open a model stream."""
+    client = FakeStreamClient(lambda: (_ for _ in ()).throw(AssertionError("should not stream")))
+    events = list(assess_triage_stream(TriageRequest(symptoms=["unconscious"]), client=client))
+    assert [e["event"] for e in events] == ["severity", "result"]
+    assert events[0]["severity"] == "critical"
+
+
+def test_stream_honours_red_flag_kill_switch():
+    """With RED_FLAG_PRETRIAGE off the red-flag request goes to the model, as on the buffered path."""
+    from triage.core import streaming
+
+    with patch.object(streaming, "RED_FLAG_PRETRIAGE", False):
+        events = list(assess_triage_stream(TriageRequest(symptoms=["unconscious"]), client=FakeStreamClient(fake_stream)))
+    assert [e["event"] for e in events] == ["severity", "result"]
+    assert events[1]["severity"] == "medium" and events[1]["force_high_priority"] is False
+
+
+def test_stream_handler_returns_sse_body():
+    """stream_handler returns text/event-stream with severity then result frames."""
+    from triage.api import handler as handler_mod
+
+    with patch.object(handler_mod, "assess_triage_stream", side_effect=lambda req, deadline=None: assess_triage_stream(
+        req, client=FakeStreamClient(fake_stream)
+    )), patch.object(handler_mod, "insert_triage_assessment", side_effect=RuntimeError("no db")):
+        r = handler_mod.stream_handler({"httpMethod": "POST", "body": '{"symptoms": ["cough"]}'}, None)
+
+    assert r["statusCode"] == 200
+    assert r["headers"]["Content-Type"] == "text/event-stream"
+    frames = [f for f in r["body"].split("\n\n") if f]
+    assert frames[0].startswith("event: severity\n")
+    assert frames[1].startswith("event: result\n")
+    assert json.loads(frames[1].split("data: ", 1)[1])["severity"] == "medium"
+
+
+def test_format_sse():
+    assert format_sse({"event": "severity", "severity": "low"}) == (
+        'event: severity\ndata: {"event":"severity","severity":"low"}\n\n'
+    )
@@ -0,0 +1,62 @@
+"""Tests for symptom canonicalization (triage.core.symptoms) and its use by cache, rules and prompts."""
+
+import pytest
+
+from triage.core.symptoms import SymptomIndex, canonical_symptoms, prompt_symptoms, symptom_codes
+from triage.models.triage import TriageRequest
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ["chest pain", "Chest-Pain", "pain in the chest", "seene mein dard", "सीने में दर्द", "நெஞ்சு வலி", "ಎದೆ ನೋವು"],
+)
+def test_variants_map_to_one_code(raw):
+    assert canonical_symptoms([raw]) == ["chest_pain"]
+
+
+def test_longest_match_and_unmatched_words_are_kept():
+    index = SymptomIndex({"pain": ["pain"], "chest_pain": ["chest pain"]})
+    assert index.canonicalize("Severe CHEST pain, since 2 hours") == "severe chest_pain since 2 hours"
+    assert index.codes_in("pain then chest pain") == ["pain", "chest_pain"]
+
+
+def test_duplicates_and_blanks_collapse():
+    assert canonical_symptoms(["Fever", "bukhar", "  ", "body-ache", "fever"]) == ["fever", "body_ache"]
+    assert prompt_symptoms(["saans phoolna", "dizzy"]) == ["shortness of breath", "dizziness"]
+    assert symptom_codes(["vomiting blood", "khansi"]) == ["vomiting", "cough"]
+
+
+def test_prompt_keeps_numbers_and_unmatched_text_as_written():
+    """Only lexicon phrases are rewritten; decimals, slashes and punctuation reach the model unchanged."""
+    assert prompt_symptoms(["Temp 38.5 C, BP 80/50", "pain 8/10 after fall"]) == [
+        "Temp 38.5 C, BP 80/50",
+        "pain 8/10 after fall",
+    ]
+    assert prompt_symptoms(["Severe seene mein dard (since 2.5 hrs)", "Chest-Pain"]) == [
+        "Severe chest pain (since 2.5 hrs)",
+        "chest pain",
+    ]
+    assert canonical_symptoms(["BP 80/50, temp 38.5"]) == ["bp 80/50 temp 38.5"]
+
+
+def test_cache_key_shared_across_regional_terms():
+    from triage.core.cache import cache_key
+
+    assert cache_key(TriageRequest(symptoms=["Chest Pain", "fever"])) == cache_key(
+        TriageRequest(symptoms=["bukhar", "seene mein dard"])
+    )
+
+
+def test_red_flag_rules_match_transliterations():
+    from triage.core.red_flags import evaluate_red_flags
+
+    result = evaluate_red_flags(TriageRequest(symptoms=["patient behosh hai"]))
+    assert result is not None and result.severity == "critical"
+    assert evaluate_red_flags(TriageRequest(symptoms=["mild khansi"])) is None
+
+
+def test_prompt_uses_canonical_symptoms():
+    from triage.core.agent import _build_user_prompt
+
+    prompt = _build_user_prompt(TriageRequest(symptoms=["Fever", "bukhar", "sir dard"]))
+    assert "Symptoms: fever, headache\n" in prompt
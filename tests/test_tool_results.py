@@ -0,0 +1,70 @@
+"""Tests for Eka tool-result compaction (triage.core.tool_results)."""
+
+import json
+import logging
+from unittest.mock import AsyncMock, patch
+
+from triage.core.tool_results import compact_tool_result, estimate_tokens
+
+
+def _medications(n: int) -> list[dict]:
+    return [
+        {
+            "name": f"Brand {i} 500mg Tablet",
+            "generic_name": "Paracetamol" if i % 2 else "Ibuprofen",
+            "manufacturer_name": f"Manufacturer {i} Pharmaceuticals Private Limited",
+            "product_type": "Tablet",
+            "source_url": f"https://example.invalid/drugs/{i}?ref=search&utm=triage",
+        }
+        for i in range(n)
+    ]
+
+
+def test_projects_dedupes_and_minifies():
+    meds = _medications(2)
+    text = compact_tool_result("search_indian_medications", {"medications": meds + meds}, {"drug_name": "brand"})
+    data = json.loads(text)
+    assert len(data["medications"]) == 2
+    assert set(data["medications"][0]) == {"name", "generic_name", "product_type"}
+    assert text == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def test_unwraps_mcp_envelope():
+    out = {"content": [{"type": "text", "text": json.dumps({"medications": _medications(1)})}], "isError": False}
+    data = json.loads(compact_tool_result("search_indian_medications", out, {}))
+    assert data["medications"][0]["name"] == "Brand 0 500mg Tablet"
+
+
+def test_ranks_by_query_and_caps_top_k():
+    meds = _medications(12)
+    with patch("triage.core.tool_results.EKA_RESULT_TOP_K", 3):
+        data = json.loads(compact_tool_result("search_indian_medications", {"medications": meds}, {"generic_names": "Ibuprofen"}))
+    assert [m["generic_name"] for m in data["medications"]] == ["Ibuprofen"] * 3
+    assert data["omitted"] == 9
+
+
+def test_enforces_token_budget():
+    protocols = [{"title": f"Protocol {i}", "conditions": ["Fever"], "summary": "x " * 400} for i in range(10)]
+    text = compact_tool_result("search_treatment_protocols", {"protocols": protocols}, {"queries": []}, token_budget=150)
+    assert estimate_tokens(text) <= 150
+    assert json.loads(text)["protocols"]
+
+
+def test_round_budget_is_split_and_savings_logged(caplog):
+    from triage.core import agent, gateway_client
+
+    tool_uses = [
+        {"toolUseId": "t1", "name": "search_indian_medications", "input": {"drug_name": "brand"}},
+        {"toolUseId": "t2", "name": "search_indian_medications", "input": {"generic_names": "Ibuprofen"}},
+    ]
+    with patch.object(
+        gateway_client, "asearch_medications", AsyncMock(return_value={"medications": _medications(40)})
+    ), patch.object(
+        agent, "EKA_ROUND_TOKEN_BUDGET", 400
+    ), caplog.at_level(logging.INFO, logger="triage.core.agent"):
+        results = agent._run_tool_uses(tool_uses, gateway_ok=True)
+
+    assert [r["toolUseId"] for r in results] == ["t1", "t2"]
+    assert all(estimate_tokens(r["text"]) <= 200 for r in results)
+    assert all(r["tokens_saved"] > 0 for r in results)
+    assert any("tokens_saved=" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,139 @@
+"""Tests for GET /triage/history (keyset pagination, filters, projection)."""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from triage.api import handler as handler_mod
+from triage.core import db
+
+FIELDS = ["id", "created_at", "severity"]
+RMP = {"sub": "rmp-42"}
+
+
+def _event(params=None, method="GET", claims=None):
+    event = {"httpMethod": method, "resource": "/triage/history", "queryStringParameters": params}
+    if claims:
+        event["requestContext"] = {"authorizer": {"claims": claims}}
+    return event
+
+
+def _rows(n, start=0):
+    return [
+        {"id": str(uuid.UUID(int=1000 - i)), "created_at": f"2026-10-{18 - i // 24:02d}T{23 - i % 24:02d}:00:00+00:00"}
+        for i in range(start, start + n)
+    ]
+
+
+def test_query_uses_keyset_and_only_requested_filters():
+    sql, params = db._history_query(FIELDS)
+    assert sql == (
+        "SELECT id, created_at, severity FROM triage_assessments WHERE deleted_at IS NULL "
+        "ORDER BY created_at DESC, id DESC LIMIT %s"
+    )
+    assert params == [20]
+
+    since = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    after = ("2026-10-18T12:00:00+00:00", str(uuid.UUID(int=7)))
+    sql, params = db._history_query(
+        FIELDS, submitted_by="rmp-1", severity="critical", since=since, after=after, limit=51
+    )
+    assert "submitted_by = %s AND severity = %s AND created_at >= %s" in sql
+    assert "(created_at, id) < (%s::timestamptz, %s::uuid)" in sql
+    assert "OFFSET" not in sql
+    assert params == ["rmp-1", "critical", since, *after, 51]
+
+
+def test_rows_are_projected_and_json_ready():
+    row_id = uuid.uuid4()
+    created = datetime(2026, 10, 18, 9, 30, tzinfo=timezone.utc)
+
+    class Conn:
+        closed = 0
+        executed = []
+
+        def cursor(self):
+            return self
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql, params):
+            self.executed.append((sql, params))
+
+        def fetchall(self):
+            return [(row_id, created, "high")]
+
+        def rollback(self):
+            pass
+
+    with patch.object(db, "_connect", return_value=Conn()):
+        rows = db.list_triage_assessments(FIELDS, severity="high", limit=2)
+    assert rows == [{"id": str(row_id), "created_at": "2026-10-18T09:30:00+00:00", "severity": "high"}]
+
+
+def test_pages_follow_the_cursor():
+    calls = []
+
+    def fake_list(fields, **filters):
+        calls.append((fields, filters))
+        start = 0 if filters["after"] is None else 3
+        return _rows(filters["limit"] if start == 0 else 2, start)
+
+    with patch.object(handler_mod, "list_triage_assessments", side_effect=fake_list):
+        first = handler_mod.handler(_event({"limit": "3", "severity": "critical"}, claims=RMP), None)
+        page1 = json.loads(first["body"])
+        params = {"limit": "3", "severity": "critical", "cursor": page1["next_cursor"]}
+        second = handler_mod.handler(_event(params, claims=RMP), None)
+        page2 = json.loads(second["body"])
+
+    assert first["statusCode"] == 200 and len(page1["items"]) == 3
+    assert calls[0][1]["limit"] == 4 and calls[0][1]["severity"] == "critical"
+    assert calls[0][1]["submitted_by"] == "rmp-42"  # forced to the caller
+    last = page1["items"][-1]
+    assert calls[1][1]["after"] == (last["created_at"], last["id"])
+    assert len(page2["items"]) == 2 and page2["next_cursor"] is None
+
+
+def test_me_projection_and_validation():
+    with patch.object(handler_mod, "list_triage_assessments", return_value=[]) as list_mock:
+        r = handler_mod.handler(_event({"submitted_by": "me", "fields": "vitals,severity"}, claims={"sub": "rmp-42"}), None)
+    assert r["statusCode"] == 200
+    fields, filters = list_mock.call_args.args[0], list_mock.call_args.kwargs
+    assert fields == ["id", "created_at", "vitals", "severity"] and filters["submitted_by"] == "rmp-42"
+
+    with patch.object(handler_mod, "list_triage_assessments") as list_mock:
+        for params in ({"fields": "password"}, {"cursor": "not-a-cursor"}, {"limit": "500"}):
+            assert handler_mod.handler(_event(params, claims=RMP), None)["statusCode"] == 400
+        assert handler_mod.handler(_event({"submitted_by": "me"}), None)["statusCode"] == 401
+        assert handler_mod.handler(_event(method="POST"), None)["statusCode"] == 405
+    list_mock.assert_not_called()
+
+
+def test_rmp_cannot_read_another_rmps_rows():
+    rows = {"rmp-42": _rows(2), "rmp-7": _rows(3, 10)}
+
+    def fake_list(fields, **filters):
+        return rows[filters["submitted_by"]] if filters["submitted_by"] else rows["rmp-42"] + rows["rmp-7"]
+
+    with patch.object(handler_mod, "list_triage_assessments", side_effect=fake_list) as list_mock:
+        denied = handler_mod.handler(_event({"submitted_by": "rmp-7"}, claims=RMP), None)
+        unfiltered = handler_mod.handler(_event(claims=RMP), None)
+        spoofed_group = handler_mod.handler(_event(claims={**RMP, "custom:role": "admin"}), None)
+    assert denied["statusCode"] == 403
+    # Without a filter an RMP still only gets their own rows
+    assert json.loads(unfiltered["body"])["items"] == rows["rmp-42"]
+    assert json.loads(spoofed_group["body"])["items"] == rows["rmp-42"]
+    assert {c.kwargs["submitted_by"] for c in list_mock.call_args_list} == {"rmp-42"}
+
+
+def test_admin_group_reads_any_rmp():
+    admin = {"sub": "lead-1", "cognito:groups": "[rmp admin]"}
+    with patch.object(handler_mod, "list_triage_assessments", return_value=[]) as list_mock:
+        assert handler_mod.handler(_event({"submitted_by": "rmp-7"}, claims=admin), None)["statusCode"] == 200
+        assert handler_mod.handler(_event(claims=admin), None)["statusCode"] == 200
+    assert [c.kwargs["submitted_by"] for c in list_mock.call_args_list] == ["rmp-7", None]
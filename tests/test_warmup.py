@@ -0,0 +1,118 @@
+"""Tests for warmup events (lambda_common.warmup and each Lambda's warmup steps)."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lambda_common import warmup
+from triage.core import warmup as triage_warmup
+
+
+@pytest.mark.parametrize(
+    "event, expected",
+    [
+        ({"warmup": True}, True),
+        ({"source": "aws.events", "detail-type": "Scheduled Event"}, True),
+        ({"source": "serverless-plugin-warmup"}, True),
+        ({"warmup": "true"}, False),
+        ({"source": "aws.events", "detail-type": "EC2 Instance State-change Notification"}, False),
+        ({"httpMethod": "POST", "body": "{\"warmup\": true}"}, False),
+        ("warmup", False),
+    ],
+)
+def test_is_warmup_event(event, expected):
+    assert warmup.is_warmup_event(event) is expected
+
+
+def test_run_warmup_times_steps_and_reports_errors():
+    calls = []
+
+    def broken():
+        raise ConnectionError("db down")
+
+    with patch.object(warmup, "_cold", True):
+        out = warmup.run_warmup("triage", [("a", lambda: calls.append("a")), ("db", broken), ("b", lambda: calls.append("b"))])
+        again = warmup.run_warmup("triage", [])
+    assert calls == ["a", "b"]
+    assert set(out["steps"]) == {"a", "db", "b"}
+    assert out["errors"] == {"db": "ConnectionError: db down"}
+    assert out["cold_start"] is True and again["cold_start"] is False
+
+
+def test_triage_warmup_primes_without_calling_a_model():
+    from lambda_common import clients
+    from triage.api import handler as handler_mod
+    from triage.core import agent, db, gateway_client
+
+    conn = MagicMock(closed=0)
+    with patch.object(clients, "get_client") as get_client, patch.object(
+        gateway_client, "is_gateway_configured", return_value=True
+    ), patch.object(gateway_client, "_get_token", return_value="tok") as get_token, patch(
+        "triage.core.db._connect", return_value=conn
+    ) as connect, patch.object(agent, "assess_triage") as assess, patch.object(handler_mod, "assess_triage") as h_assess:
+        r = handler_mod.handler({"warmup": True}, None)
+    assert r["statusCode"] == 200
+    body = json.loads(r["body"])
+    assert body["warmup"] is True and body["errors"] == {}
+    assert set(body["steps"]) == {"clients", "secrets", "rules", "gateway_token", "aurora"}
+    assert {c.args[0] for c in get_client.call_args_list} >= {"bedrock-runtime", "secretsmanager", "rds"}
+    get_token.assert_called_once()
+    connect.assert_called_once_with(triage_warmup.WARMUP_DB_CONNECT_TIMEOUT)
+    # The warmed connection stays in the pool for the next request
+    conn.close.assert_not_called()
+    assert db.pool_stats()["idle"] == 1
+    assess.assert_not_called()
+    h_assess.assert_not_called()
+
+
+def test_triage_warmup_reports_unreachable_aurora():
+    from lambda_common import clients
+    from triage.api import handler as handler_mod
+    from triage.core import gateway_client
+
+    with patch.object(clients, "get_client"), patch.object(
+        gateway_client, "is_gateway_configured", return_value=False
+    ), patch("triage.core.db._connect", side_effect=OSError("timeout")):
+        r = handler_mod.stream_handler({"source": "aws.events", "detail-type": "Scheduled Event"}, None)
+    assert r["statusCode"] == 200
+    assert json.loads(r["body"])["errors"] == {"aurora": "OSError: timeout"}
+
+
+def test_hospital_matcher_and_rmp_learning_warmups():
+    from hospital_matcher.api import handler as hm_handler
+    from lambda_common import clients
+    from rmp_learning.api import handler as rmp_handler
+
+    with patch.object(clients, "get_client") as hm_get, patch(
+        "hospital_matcher.api.handler.match_hospitals"
+    ) as match:
+        r = hm_handler.handler({"warmup": True}, None)
+    assert r["statusCode"] == 200 and json.loads(r["body"])["steps"].keys() == {"clients"}
+    assert "bedrock-runtime" in {c.args[0] for c in hm_get.call_args_list}
+    match.assert_not_called()
+
+    conn = MagicMock(closed=0)
+    with patch.object(clients, "get_client"), patch("rmp_learning.core.db._conn", return_value=conn), patch(
+        "rmp_learning.api.handler.invoke_rmp_quiz"
+    ) as quiz:
+        r = rmp_handler.handler({"warmup": True}, None)
+    assert r["statusCode"] == 200 and json.loads(r["body"])["errors"] == {}
+    conn.close.assert_not_called()
+    quiz.assert_not_called()
+
+
+def test_stdlib_lambdas_share_the_warmup_helpers(monkeypatch):
+    """The infrastructure/*_lambda_src handlers answer warmups through lambda_common.warmup."""
+    import importlib.util
+    from pathlib import Path
+
+    src = Path(__file__).resolve().parent.parent / "infrastructure" / "gateway_get_hospitals_lambda_src"
+    spec = importlib.util.spec_from_file_location("get_hospitals_handler", src / "lambda_handler.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    assert mod.is_warmup_event is warmup.is_warmup_event and mod.run_warmup is warmup.run_warmup
+
+    monkeypatch.setattr(mod, "_HOSPITALS_SEED", None)
+    out = mod.handler({"source": "aws.events", "detail-type": "Scheduled Event"}, None)
+    assert out["warmup"] is True and out["steps"].keys() == {"seed_hospitals"} and out["errors"] == {}